@@ -1,3 +1,11 @@
 from .api_client import PortClient
 
-__all__ = ['PortClient']
+__all__ = ['PortClient', 'AsyncPortClient']
+
+
+def __getattr__(name):
+    # AsyncPortClient pulls in asyncio; import it only when it is used
+    if name == 'AsyncPortClient':
+        from .client.async_client import AsyncPortClient
+        return AsyncPortClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
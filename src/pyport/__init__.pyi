@@ -1,5 +1,6 @@
 """Type stub file for the main package."""
 
 from .api_client import PortClient
+from .client.async_client import AsyncPortClient
 
-__all__ = ["PortClient"]
+__all__ = ["PortClient", "AsyncPortClient"]
@@ -1,6 +1,7 @@
-from typing import Dict, List, Any, Optional, cast
+from typing import Dict, Iterator, List, Any, Optional, Union, cast
 
 from ..services.base_api_service import BaseAPIService
+from ..streaming import stream_json_array
 from ..types import Blueprint
 
 
@@ -377,8 +378,73 @@ class Blueprints(BaseAPIService):
             ... )
         """
         endpoint = self._build_endpoint("blueprints", blueprint_identifier, "entities")
+        params = self._blueprint_entities_params(
+            exclude_calculated_properties, include, exclude, compact,
+            attach_title_to_relation, attach_identifier_to_title_mirror_properties
+        )
 
-        # Build query parameters
+        response = self._client.make_request('GET', endpoint, params=params)
+        return response.json()
+
+    def stream_blueprint_entities(
+        self,
+        blueprint_identifier: str,
+        exclude_calculated_properties: Optional[bool] = None,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        compact: Optional[bool] = None,
+        attach_title_to_relation: Optional[bool] = None,
+        attach_identifier_to_title_mirror_properties: Optional[bool] = None,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Stream all entities of a blueprint.
+
+        Accepts the same filters as `get_blueprint_entities`, but reads the response
+        incrementally and decodes each entity as it arrives, so memory use stays
+        constant however many entities the blueprint has. The connection is released
+        when the iterator is exhausted or closed.
+
+        Args:
+            blueprint_identifier: The identifier of the blueprint to operate on.
+            exclude_calculated_properties: If true, calculated properties will be excluded from the entities.
+            include: An array of values from the entity JSON. Only these values will be returned in the response.
+            exclude: An array of values from the entity JSON to be omitted from the response.
+            compact: Compact response format.
+            attach_title_to_relation: Attach title to relation.
+            attach_identifier_to_title_mirror_properties: Attach identifier to title mirror properties.
+            chunk_size: If set, yield lists of up to this many entities instead of single entities.
+
+        Returns:
+            An iterator over entity dictionaries, or lists of them if chunk_size is set.
+
+        Raises:
+            PortResourceNotFoundError: If the blueprint does not exist.
+            PortApiError: If another API error occurs.
+
+        Examples:
+            >>> for chunk in client.blueprints.stream_blueprint_entities("service", chunk_size=500):
+            ...     index(chunk)
+        """
+        endpoint = self._build_endpoint("blueprints", blueprint_identifier, "entities")
+        params = self._blueprint_entities_params(
+            exclude_calculated_properties, include, exclude, compact,
+            attach_title_to_relation, attach_identifier_to_title_mirror_properties
+        )
+
+        response = self._client.make_request('GET', endpoint, params=params, stream=True)
+        return stream_json_array(response, "entities", chunk_size=chunk_size)
+
+    @staticmethod
+    def _blueprint_entities_params(
+        exclude_calculated_properties: Optional[bool],
+        include: Optional[List[str]],
+        exclude: Optional[List[str]],
+        compact: Optional[bool],
+        attach_title_to_relation: Optional[bool],
+        attach_identifier_to_title_mirror_properties: Optional[bool]
+    ) -> Dict[str, Any]:
+        """Build the query parameters of the blueprint entities endpoint, omitting unset filters."""
         params = {}
         if exclude_calculated_properties is not None:
             params["exclude_calculated_properties"] = exclude_calculated_properties
@@ -392,9 +458,7 @@ class Blueprints(BaseAPIService):
             params["attach_title_to_relation"] = attach_title_to_relation
         if attach_identifier_to_title_mirror_properties is not None:
             params["attach_identifier_to_title_mirror_properties"] = attach_identifier_to_title_mirror_properties
-
-        response = self._client.make_request('GET', endpoint, params=params)
-        return response.json()
+        return params
 
     def get_blueprint_entities_count(self, blueprint_identifier: str) -> Dict[str, Any]:
         """
@@ -1,6 +1,6 @@
 """Type stub file for the Blueprints API service."""
 
-from typing import Dict, List, Any, Optional, cast
+from typing import Dict, Iterator, List, Any, Optional, Union, cast
 
 from ..services.base_api_service import BaseAPIService
 from ..types import Blueprint
@@ -31,3 +31,15 @@ class Blueprints(BaseAPIService):
     def rename_blueprint_relation(self, blueprint_identifier: str, relation_identifier: str, rename_data: Dict[str, Any]) -> Dict[str, Any]: ...
     
     def get_blueprint_system_structure(self, blueprint_identifier: str) -> Dict[str, Any]: ...
+    
+    def stream_blueprint_entities(
+        self,
+        blueprint_identifier: str,
+        exclude_calculated_properties: Optional[bool] = None,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        compact: Optional[bool] = None,
+        attach_title_to_relation: Optional[bool] = None,
+        attach_identifier_to_title_mirror_properties: Optional[bool] = None,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]: ...
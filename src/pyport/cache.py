@@ -0,0 +1,369 @@
+"""
+HTTP response caching for the PyPort client library.
+
+This module provides an opt-in cache for GET responses. Resources such as
+blueprints, actions, pages and scorecards change rarely but are read on
+almost every request an integration handles; caching them removes most of
+that read traffic. Responses of the read-only POST routes, such as entity
+search, are cached too, keyed on their JSON body.
+
+Features:
+- Per-endpoint TTLs configured with glob patterns
+- LRU eviction bounded by the total size of the cached bodies
+- Revalidation of expired entries with If-None-Match / If-Modified-Since
+- Invalidation of a resource path, its children and the listing it belongs to when the same
+  client writes to it
+- Hit, miss and revalidation counters
+
+Example usage:
+
+```python
+from pyport import PortClient
+from pyport.cache import ResponseCache
+
+client = PortClient(
+    client_id="your-client-id",
+    client_secret="your-client-secret",
+    response_cache=ResponseCache(
+        default_ttl=0,
+        ttls={"blueprints*": 300, "actions*": 300, "pages*": 300, "scorecards*": 300}
+    )
+)
+```
+"""
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .client.endpoints import SAFE_READ_ROUTES, SEARCH, WRITE, body_digest, endpoint_class, endpoint_template
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...], Optional[str]]
+
+# Headers describing the body of a 304 response rather than the cached body
+_BODY_HEADERS = {"content-length", "content-encoding", "transfer-encoding"}
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached response.
+
+    Only the parts needed to rebuild the response are stored, so every hit
+    returns a fresh `requests.Response` that callers are free to consume.
+
+    Attributes:
+        endpoint: The API endpoint the response was fetched from.
+        url: The full URL of the response.
+        content: The raw response body.
+        headers: The response headers.
+        encoding: The response encoding.
+        expires_at: Monotonic time after which the entry must be revalidated.
+    """
+    endpoint: str
+    url: str
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    encoding: Optional[str] = None
+    expires_at: float = 0.0
+
+    @property
+    def size(self) -> int:
+        """The size of the cached body in bytes."""
+        return len(self.content)
+
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without contacting the API."""
+        return time.monotonic() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Get the conditional request headers for revalidating the entry.
+
+        Returns:
+            A dictionary with If-None-Match and/or If-Modified-Since, possibly empty.
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        validators = {}
+        if headers.get("ETag"):
+            validators["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+    def to_response(self) -> requests.Response:
+        """
+        Build a response object from the entry.
+
+        Returns:
+            A new requests.Response with status 200 and the cached body and headers.
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = self.url
+        response.encoding = self.encoding
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        return response
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache for GET responses.
+
+    The cache belongs to the request layer of a single client: `RequestManager`
+    serves fresh entries directly, revalidates expired entries with a
+    conditional GET, and invalidates entries after any write through the same
+    client. Do not share a cache between clients that use different
+    credentials, since entries are not keyed by identity.
+
+    Attributes:
+        max_bytes: Maximum total size of the cached bodies.
+        default_ttl: Time-to-live in seconds for endpoints without a matching pattern.
+        ttls: Time-to-live in seconds per endpoint glob pattern; the first match wins.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, default_ttl: float = 60.0,
+                 ttls: Optional[Mapping[str, float]] = None):
+        """
+        Initialize a ResponseCache.
+
+        Args:
+            max_bytes: Maximum total size of the cached bodies (default: 16 MiB).
+            default_ttl: TTL in seconds for endpoints without a matching pattern (default: 60.0).
+                Set to 0 to cache only the endpoints listed in ttls.
+            ttls: TTL in seconds per endpoint glob pattern, e.g. {"blueprints*": 300}.
+                A TTL of 0 disables caching for the matching endpoints.
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "revalidations": 0, "stores": 0,
+                       "evictions": 0, "invalidations": 0}
+
+    def ttl_for(self, endpoint: str) -> float:
+        """
+        Get the TTL for an endpoint.
+
+        Args:
+            endpoint: The API endpoint.
+
+        Returns:
+            The TTL in seconds; 0 means the endpoint is not cached.
+        """
+        path = _resource_path(endpoint)
+        for pattern, ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    def is_cacheable(self, method: str, endpoint: str) -> bool:
+        """
+        Check whether a request may be served from the cache.
+
+        Args:
+            method: The HTTP method of the request.
+            endpoint: The API endpoint of the request.
+
+        Returns:
+            True for GET requests and read-only POST requests (see
+            pyport.client.endpoints.SAFE_READ_ROUTES) to endpoints with a positive TTL.
+        """
+        method = method.upper()
+        if method != "GET" and (method, endpoint_template(endpoint)) not in SAFE_READ_ROUTES:
+            return False
+        return self.ttl_for(endpoint) > 0
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Any] = None, json_body: Any = None) -> CacheKey:
+        """
+        Build the cache key for a request.
+
+        Args:
+            url: The full request URL.
+            params: The query parameters of the request.
+            json_body: The JSON body of the request, for read-only POST routes.
+
+        Returns:
+            A hashable key combining the URL, the sorted query parameters and a
+            canonical hash of the body.
+        """
+        digest = body_digest(json_body)
+        if not params:
+            return url, (), digest
+        items = params.items() if isinstance(params, Mapping) else params
+        pairs = []
+        for name, value in items:
+            values = value if isinstance(value, (list, tuple)) else [value]
+            pairs.extend((str(name), str(v)) for v in values)
+        return url, tuple(sorted(pairs)), digest
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Look up an entry, fresh or expired.
+
+        A fresh entry counts as a hit; a missing or expired entry counts as a miss.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The entry, or None if nothing is cached for the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            if entry is not None and entry.is_fresh():
+                self._stats["hits"] += 1
+            else:
+                self._stats["misses"] += 1
+            return entry
+
+    def store(self, key: CacheKey, endpoint: str, response: requests.Response) -> Optional[CacheEntry]:
+        """
+        Cache a successful response.
+
+        Responses that are not 200, are marked `Cache-Control: no-store`, or are
+        larger than the whole cache are not stored.
+
+        Args:
+            key: The cache key.
+            endpoint: The API endpoint of the request.
+            response: The response to cache.
+
+        Returns:
+            The new entry, or None if the response was not cached.
+        """
+        if response.status_code != 200:
+            return None
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return None
+        content = response.content
+        if content is None or len(content) > self.max_bytes:
+            return None
+
+        entry = CacheEntry(
+            endpoint=endpoint,
+            url=response.url,
+            content=content,
+            headers=dict(response.headers),
+            encoding=response.encoding,
+            expires_at=time.monotonic() + self.ttl_for(endpoint)
+        )
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._size += entry.size
+            self._stats["stores"] += 1
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self._stats["evictions"] += 1
+        return entry
+
+    def revalidate(self, key: CacheKey, entry: CacheEntry, response: requests.Response) -> CacheEntry:
+        """
+        Extend the lifetime of an entry after a 304 Not Modified response.
+
+        Args:
+            key: The cache key.
+            entry: The entry that was revalidated.
+            response: The 304 response, whose headers replace the cached ones.
+
+        Returns:
+            The refreshed entry.
+        """
+        with self._lock:
+            entry.headers.update({name: value for name, value in response.headers.items()
+                                  if name.lower() not in _BODY_HEADERS})
+            entry.expires_at = time.monotonic() + self.ttl_for(entry.endpoint)
+            self._stats["revalidations"] += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return entry
+
+    def invalidate(self, method: str, endpoint: str) -> int:
+        """
+        Drop the entries affected by a write.
+
+        A write invalidates the written path and everything below it. A POST
+        creates an item in the written path, which is itself the collection
+        listing; a PUT, PATCH or DELETE changes an item, so the listing
+        directly above it is invalidated too. Other ancestors, such as the
+        blueprint an entity belongs to, are unaffected. Since a
+        search or aggregation can cover any entity, every write also drops the
+        cached query results. Reads and search queries invalidate nothing.
+
+        Args:
+            method: The HTTP method of the request.
+            endpoint: The API endpoint of the request.
+
+        Returns:
+            The number of entries removed.
+        """
+        if endpoint_class(method, endpoint) != WRITE:
+            return 0
+        path = _resource_path(endpoint)
+        listing = path.rsplit('/', 1)[0] if method.upper() != "POST" and '/' in path else None
+        with self._lock:
+            stale = [
+                key for key, entry in self._entries.items()
+                if _is_related(_resource_path(entry.endpoint), path, listing)
+                or endpoint_class("GET", entry.endpoint) == SEARCH
+            ]
+            for key in stale:
+                self._remove(key)
+            self._stats["invalidations"] += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            A dictionary with hit, miss, revalidation, store, eviction and
+            invalidation counters, the number of entries and their total size.
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["size_bytes"] = self._size
+            return stats
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove an entry if present. Must be called with the lock held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def __len__(self) -> int:
+        """The number of cached entries."""
+        return len(self._entries)
+
+
+def _resource_path(endpoint: str) -> str:
+    """Strip the query string and surrounding slashes from an endpoint."""
+    return endpoint.split('?', 1)[0].strip('/')
+
+
+def _is_related(cached: str, written: str, listing: Optional[str] = None) -> bool:
+    """Whether a cached path is the written path, below it, or the listing of the written item."""
+    return cached == written or cached.startswith(written + '/') or cached == listing
@@ -7,10 +7,29 @@ It is split into multiple modules for better organization:
 - auth.py: Authentication and token management
 - request.py: Request handling and processing
 - client.py: Main client class and initialization
+- async_client.py: Asyncio client built on httpx
+- pool.py: Connection pool shared by sessions and clients
+- batch.py: Concurrent execution of service calls (map / batch)
+- endpoints.py: Endpoint classification shared by request-layer features
+- services.py: Registry of the API services, imported on first use
+- token_cache.py: Token caches shared between clients and processes
+- transport.py: HTTP transports (requests, httpx/HTTP/2, in-process)
 
 The PortClient class is the main entry point for the library.
 """
 
 from .client import PortClient
+from .batch import BatchExecutor, BatchResult
+from .pool import ConnectionPool
+from .transport import HttpxTransport, InProcessTransport, RequestsTransport, Transport
 
-__all__ = ["PortClient"]
+__all__ = ["PortClient", "AsyncPortClient", "BatchExecutor", "BatchResult", "ConnectionPool",
+           "Transport", "RequestsTransport", "HttpxTransport", "InProcessTransport"]
+
+
+def __getattr__(name):
+    # AsyncPortClient pulls in asyncio; import it only when it is used
+    if name == "AsyncPortClient":
+        from .async_client import AsyncPortClient
+        return AsyncPortClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
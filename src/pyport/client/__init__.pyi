@@ -1,5 +1,10 @@
 """Type stub file for the client package."""
 
+from .async_client import AsyncPortClient
+from .batch import BatchExecutor, BatchResult
 from .client import PortClient
+from .pool import ConnectionPool
+from .transport import HttpxTransport, InProcessTransport, RequestsTransport, Transport
 
-__all__ = ["PortClient"]
+__all__ = ["PortClient", "AsyncPortClient", "BatchExecutor", "BatchResult", "ConnectionPool",
+           "Transport", "RequestsTransport", "HttpxTransport", "InProcessTransport"]
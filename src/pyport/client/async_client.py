@@ -0,0 +1,579 @@
+"""
+Asyncio client module for the Port API.
+
+This module provides the AsyncPortClient class, a non-blocking counterpart of
+PortClient built on httpx. It exposes the same service surface
+(`client.entities`, `client.blueprints`, ...) with every service method
+returning a coroutine, so a single event loop can keep hundreds of requests
+in flight.
+
+httpx is an optional dependency. Install it with `pip install pyport[async]`.
+
+Example:
+    ```python
+    import asyncio
+    from pyport import AsyncPortClient
+
+    async def main():
+        async with AsyncPortClient(client_id="...", client_secret="...") as client:
+            services = await asyncio.gather(
+                *(client.entities.get_entity("service", name) for name in ["api", "web", "worker"])
+            )
+
+    asyncio.run(main())
+    ```
+"""
+
+import asyncio
+import collections.abc
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import typing
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
+
+from .auth import AsyncAuthManager
+from .batch import BatchResult, _split_item, use_map_runner
+from .request import AsyncRequestManager
+from .services import SERVICES, ServiceRegistry
+from ..constants import PORT_API_URL, PORT_API_US_URL, GENERIC_HEADERS
+from ..exceptions import PortConfigurationError
+from ..logging import configure_logging, logger
+from ..metrics import RequestMetrics
+from ..retry import CircuitBreakerRegistry, RetryBudget, RetryConfig, RetryStrategy
+
+
+#: Identifies a request by its method, endpoint and arguments
+_RequestKey = Tuple[str, str, str]
+
+
+def _request_key(method: str, endpoint: str, kwargs: Dict[str, Any]) -> _RequestKey:
+    """Return the key under which the outcome of a request is recorded."""
+    return method.upper(), endpoint, json.dumps(kwargs, sort_keys=True, default=repr)
+
+
+class _PendingRequests(BaseException):
+    """
+    Raised by `_ReplayClient` when a service method needs responses that have not been fetched yet.
+
+    It derives from BaseException so that `except Exception` blocks inside
+    service methods do not swallow it.
+
+    Attributes:
+        requests: The (key, method, endpoint, kwargs) of each request to make.
+        max_concurrency: How many of the requests may be in flight at the same time.
+    """
+
+    def __init__(self, requests: List[Tuple[_RequestKey, str, str, Dict[str, Any]]], max_concurrency: int = 1):
+        super().__init__(len(requests))
+        self.requests = requests
+        self.max_concurrency = max_concurrency
+
+
+def _run_on_loop(awaitable: Any, loop: asyncio.AbstractEventLoop) -> Any:
+    """Await a coroutine on the event loop from a worker thread and return its result."""
+    async def run():
+        return await awaitable
+    return asyncio.run_coroutine_threadsafe(run(), loop).result()
+
+
+def _returns_iterator(method: Callable) -> bool:
+    """Return True if a service method returns an iterator (a generator or an Iterator annotation)."""
+    if inspect.isgeneratorfunction(method):
+        return True
+    annotation = inspect.signature(method).return_annotation
+    return typing.get_origin(annotation) in (collections.abc.Iterator, collections.abc.Generator)
+
+
+class _StreamedResponse:
+    """
+    Synchronous view of a streamed httpx response for service code running on a worker thread.
+
+    `iter_content` fetches each chunk of the body on the event loop, so a
+    streamed list is decoded as it arrives, as with PortClient.
+    """
+
+    def __init__(self, response: Any, loop: asyncio.AbstractEventLoop):
+        self._response = response
+        self._loop = loop
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Yield the body in chunks of about chunk_size bytes."""
+        chunks = self._response.aiter_bytes(chunk_size)
+        while True:
+            try:
+                yield _run_on_loop(chunks.__anext__(), self._loop)
+            except StopAsyncIteration:
+                return
+
+    def close(self) -> None:
+        """Close the response, releasing its connection."""
+        _run_on_loop(self._response.aclose(), self._loop)
+
+    def __getattr__(self, name: str):
+        """Delegate everything else (status_code, headers, is_closed, ...) to the httpx response."""
+        return getattr(self._response, name)
+
+
+class _ReplayClient:
+    """
+    Stand-in client handed to a synchronous service class by the async client.
+
+    Calls to `make_request` return (or raise) the outcomes recorded for the
+    same request, in the order they were recorded. Without a `loop`, a
+    request with no outcome left raises `_PendingRequests` so the async
+    client can perform it without blocking. With a `loop`, the service method
+    runs on a worker thread and such requests are awaited on that event loop,
+    blocking only the worker thread. Any other attribute lookup is delegated
+    to the owning AsyncPortClient.
+    """
+
+    def __init__(self, owner: "AsyncPortClient", outcomes: Dict[_RequestKey, List[Any]],
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        self._owner = owner
+        self._outcomes = outcomes
+        self._loop = loop
+        # Number of recorded outcomes used so far, per request
+        self._used: Dict[_RequestKey, int] = {}
+
+    def make_request(self, method: str, endpoint: str, **kwargs):
+        """Return the next outcome recorded for this request, or fetch it."""
+        if self._loop is not None:
+            response = _run_on_loop(self._owner.make_request(method, endpoint, **kwargs), self._loop)
+            return _StreamedResponse(response, self._loop) if kwargs.get('stream') else response
+
+        key = _request_key(method, endpoint, kwargs)
+        used = self._used.get(key, 0)
+        recorded = self._outcomes.get(key, [])
+        if used == len(recorded):
+            raise _PendingRequests([(key, method, endpoint, kwargs)])
+        self._used[key] = used + 1
+        if isinstance(recorded[used], Exception):
+            raise recorded[used]
+        return recorded[used]
+
+    def __getattr__(self, name: str):
+        """Delegate everything except make_request to the owning client."""
+        return getattr(self._owner, name)
+
+
+def _replay_map(func: Callable[..., Any], items: Iterable[Any], max_concurrency: int) -> List[BatchResult]:
+    """
+    Run the calls of a `run_map` in turn, collecting the requests none of them could replay.
+
+    Every call runs until it needs a response that has not been fetched, so
+    the missing responses of all calls are requested together and fetched
+    concurrently by `AsyncService._call`.
+
+    Raises:
+        _PendingRequests: If any call needs a response that has not been fetched.
+    """
+    results: List[BatchResult] = []
+    pending: List[Tuple[_RequestKey, str, str, Dict[str, Any]]] = []
+    for index, item in enumerate(items):
+        args, kwargs = _split_item(item)
+        try:
+            results.append(BatchResult(index=index, args=args, kwargs=kwargs, value=func(*args, **kwargs)))
+        except _PendingRequests as e:
+            pending.extend(e.requests)
+        except Exception as e:
+            results.append(BatchResult(index=index, args=args, kwargs=kwargs, error=e))
+    if pending:
+        raise _PendingRequests(pending, max_concurrency)
+    return results
+
+
+class AsyncService:
+    """
+    Asynchronous view of a PortClient service class.
+
+    Every public method of the wrapped service is exposed as a coroutine
+    function with the same signature and return value. The service's own
+    code is reused: it runs against a `_ReplayClient`, and when it needs an
+    HTTP response the call is suspended, the request is awaited on the event
+    loop, and the method is replayed with the recorded response. Service
+    methods are deterministic in the requests they build, and almost all of
+    them make a single request, so the replay costs one extra call of plain
+    Python code. The calls of a `run_map` (`fetch_all`, `get_entities_by_ids`,
+    ...) are replayed together, so their requests are awaited concurrently
+    and the method is replayed once per round of requests, not per request.
+
+    Methods returning iterators (`iter_all`, `stream_all_entities`, ...) are
+    exposed as async iterators instead: the synchronous iterator is advanced
+    on a worker thread and streamed responses are read with httpx streaming.
+    """
+
+    def __init__(self, client: "AsyncPortClient", service_cls: type):
+        """
+        Initialize an AsyncService.
+
+        Args:
+            client: The AsyncPortClient used to perform requests.
+            service_cls: The synchronous service class to expose.
+        """
+        self._client = client
+        self._service_cls = service_cls
+
+    def __getattr__(self, name: str):
+        """Return a coroutine function wrapping the service method `name`."""
+        if name.startswith('_'):
+            raise AttributeError(name)
+        attribute = getattr(self._service_cls, name, None)
+        if not callable(attribute):
+            raise AttributeError(f"'{self._service_cls.__name__}' has no method '{name}'")
+        if name in getattr(self._service_cls, "SYNC_ONLY_METHODS", ()):
+            raise AttributeError(f"'{self._service_cls.__name__}.{name}' is not available on AsyncPortClient; "
+                                 f"use PortClient")
+
+        if _returns_iterator(attribute):
+            @functools.wraps(attribute)
+            def method(*args, **kwargs):
+                return self._iterate(name, args, kwargs)
+        else:
+            @functools.wraps(attribute)
+            async def method(*args, **kwargs):
+                return await self._call(name, args, kwargs)
+
+        # Cache the coroutine function so later lookups skip __getattr__
+        self.__dict__[name] = method
+        return method
+
+    async def _call(self, name: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """
+        Run a service method, awaiting each HTTP request it makes.
+
+        Args:
+            name: The name of the service method.
+            args: Positional arguments for the method.
+            kwargs: Keyword arguments for the method.
+
+        Returns:
+            The return value of the service method.
+        """
+        outcomes: Dict[_RequestKey, List[Any]] = {}
+        with use_map_runner(_replay_map):
+            while True:
+                service = self._service_cls(_ReplayClient(self._client, outcomes))
+                try:
+                    return getattr(service, name)(*args, **kwargs)
+                except _PendingRequests as pending:
+                    await self._fetch(pending, outcomes)
+
+    async def _fetch(self, pending: _PendingRequests, outcomes: Dict[_RequestKey, List[Any]]) -> None:
+        """Perform the pending requests of a replay, recording their responses or errors."""
+        slots = asyncio.Semaphore(max(1, pending.max_concurrency))
+
+        async def fetch(method: str, endpoint: str, kwargs: Dict[str, Any]) -> Any:
+            async with slots:
+                try:
+                    return await self._client.make_request(method, endpoint, **kwargs)
+                except Exception as e:
+                    # Raised again at the same call site when the method is replayed,
+                    # so error handling inside the service behaves as in the sync client
+                    return e
+
+        results = await asyncio.gather(*(fetch(method, endpoint, kwargs)
+                                         for _, method, endpoint, kwargs in pending.requests))
+        for (key, _, _, _), outcome in zip(pending.requests, results):
+            outcomes.setdefault(key, []).append(outcome)
+
+    async def _iterate(self, name: str, args: tuple, kwargs: Dict[str, Any]) -> AsyncIterator[Any]:
+        """
+        Run a service method returning an iterator, yielding its items.
+
+        Each step of the iterator runs on a worker thread, in a copy of the
+        caller's context, while its requests are awaited on the event loop.
+
+        Args:
+            name: The name of the service method.
+            args: Positional arguments for the method.
+            kwargs: Keyword arguments for the method.
+
+        Yields:
+            The items of the iterator.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        service = self._service_cls(_ReplayClient(self._client, {}, loop))
+        call = functools.partial(getattr(service, name), *args, **kwargs)
+        iterator = iter(await loop.run_in_executor(None, context.run, call))
+        done = object()
+        try:
+            while True:
+                item = await loop.run_in_executor(None, context.run, next, iterator, done)
+                if item is done:
+                    return
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await loop.run_in_executor(None, context.run, close)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the service."""
+        return f"AsyncService({self._service_cls.__name__})"
+
+
+class AsyncPortClient:
+    """
+    Asyncio client for interacting with the Port API.
+
+    AsyncPortClient mirrors PortClient: it accepts the same authentication,
+    logging and retry options and exposes the same services as attributes.
+    Service methods return coroutines, requests are sent with an
+    `httpx.AsyncClient`, retries back off with `asyncio.sleep`, and the
+    access token is fetched and refreshed without blocking the event loop.
+
+    Attributes:
+        blueprints, entities, actions, action_runs, pages, integrations,
+        organizations, teams, users, roles, audit, migrations, search,
+        sidebars, checklist, apps, scorecards, webhooks (AsyncService):
+            Asynchronous views of the corresponding PortClient services.
+
+    Examples:
+        >>> async with AsyncPortClient(client_id="...", client_secret="...") as client:
+        ...     blueprint = await client.blueprints.get_blueprint("service")
+        ...     entities = await client.entities.get_entities("service")
+    """
+
+    blueprints: AsyncService
+    entities: AsyncService
+    actions: AsyncService
+    pages: AsyncService
+    integrations: AsyncService
+    action_runs: AsyncService
+    organizations: AsyncService
+    teams: AsyncService
+    users: AsyncService
+    roles: AsyncService
+    audit: AsyncService
+    migrations: AsyncService
+    search: AsyncService
+    sidebars: AsyncService
+    checklist: AsyncService
+    apps: AsyncService
+    scorecards: AsyncService
+    webhooks: AsyncService
+
+    def __init__(self, client_id: str, client_secret: str, us_region: bool = False,
+                 auto_refresh: bool = True, refresh_interval: int = 900, refresh_margin: float = 60.0,
+                 log_level: int = logging.INFO, log_format: Optional[str] = None,
+                 log_handler: Optional[logging.Handler] = None,
+                 # Retry configuration
+                 max_retries: int = 3,
+                 retry_delay: float = 1.0,
+                 max_delay: float = 10.0,
+                 retry_strategy: Union[str, RetryStrategy] = RetryStrategy.EXPONENTIAL,
+                 retry_jitter: bool = True,
+                 retry_status_codes: Optional[Set[int]] = None,
+                 retry_on: Optional[Union[Type[Exception], Set[Type[Exception]]]] = None,
+                 idempotent_methods: Optional[Set[str]] = None,
+                 # Transport configuration
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 timeout: float = 30.0,
+                 timeout_budget: Optional[float] = None,
+                 http_client: Optional[Any] = None,
+                 # Metrics configuration
+                 request_metrics: Optional[RequestMetrics] = None,
+                 # Retry budget configuration
+                 retry_budget: Optional[RetryBudget] = None,
+                 # Idempotency configuration
+                 idempotency_keys: bool = True,
+                 retry_keyed_writes: bool = False,
+                 # Testing configuration
+                 skip_auth: bool = False):
+        """
+        Initialize the AsyncPortClient.
+
+        No network call is made here; the access token is fetched on the first request.
+
+        Args:
+            client_id: API client ID obtained from Port.
+            client_secret: API client secret obtained from Port.
+            us_region: Whether to use the US region API URL (default: False).
+            auto_refresh: Whether to refresh the token before it expires (default: True).
+            refresh_interval: Token refresh interval in seconds (default: 900 sec = 15 minutes).
+                Only used when the token carries no JWT expiry; otherwise the token is refreshed
+                refresh_margin seconds before it expires.
+            refresh_margin: Seconds before the token's JWT expiry at which it is refreshed (default: 60.0).
+            log_level: The logging level to use (default: logging.INFO).
+            log_format: The format string to use for log messages (default: None).
+            log_handler: A logging handler to use (default: None).
+            max_retries: Maximum number of retry attempts for transient errors (default: 3).
+            retry_delay: Initial delay between retries in seconds (default: 1.0).
+            max_delay: Maximum delay between retries in seconds (default: 10.0).
+            retry_strategy: Strategy for calculating retry delays (default: RetryStrategy.EXPONENTIAL).
+            retry_jitter: Whether to add random jitter to retry delays (default: True).
+            retry_status_codes: HTTP status codes that should trigger retries (default: {429, 500, 502, 503, 504}).
+            retry_on: Exception types or a function that returns True if the exception should be retried.
+            idempotent_methods: HTTP methods that are safe to retry
+                (default: {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}).
+            max_connections: Maximum number of concurrent connections (default: 100).
+            max_keepalive_connections: Maximum number of idle keep-alive connections (default: 20).
+            timeout: Default request timeout in seconds (default: 30.0).
+            timeout_budget: Default total time in seconds for a call, including retries
+                (default: None, unbounded). See `pyport.deadline`.
+            http_client: An existing httpx.AsyncClient to use instead of creating one.
+                The client is not closed by `aclose()` when it is provided.
+            request_metrics: The RequestMetrics registry requests are recorded in (default: None,
+                a registry for this client).
+            retry_budget: A RetryBudget shared by all of this client's requests (default: None, no limit).
+            idempotency_keys: Whether to send an Idempotency-Key header, kept across retries, with
+                non-idempotent requests such as POST (default: True).
+            retry_keyed_writes: Whether to retry non-idempotent requests that carry an
+                Idempotency-Key on transient errors (default: False).
+            skip_auth: Whether to skip authentication (default: False).
+                This is primarily used for testing.
+
+        Raises:
+            PortConfigurationError: If httpx is not installed.
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise PortConfigurationError(
+                "AsyncPortClient requires the optional 'httpx' dependency. "
+                "Install it with `pip install pyport[async]`."
+            ) from e
+
+        self.api_url = PORT_API_US_URL if us_region else PORT_API_URL
+
+        configure_logging(level=log_level, format_string=log_format, handler=log_handler)
+        self._logger = logger
+
+        if isinstance(retry_strategy, str):
+            retry_strategy = RetryStrategy(retry_strategy)
+        self.retry_config = RetryConfig(
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            max_delay=max_delay,
+            strategy=retry_strategy,
+            jitter=retry_jitter,
+            retry_status_codes=retry_status_codes or {429, 500, 502, 503, 504},
+            retry_on=retry_on,
+            idempotent_methods=idempotent_methods or {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"},
+            circuit_breakers=CircuitBreakerRegistry(),
+            retry_budget=retry_budget,
+            retry_keyed_writes=retry_keyed_writes
+        )
+
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                headers=GENERIC_HEADERS,
+                timeout=timeout,
+                limits=httpx.Limits(max_connections=max_connections,
+                                    max_keepalive_connections=max_keepalive_connections)
+            )
+        self._http_client = http_client
+
+        self._auth_manager = AsyncAuthManager(
+            client_id=client_id,
+            client_secret=client_secret,
+            api_url=self.api_url,
+            auto_refresh=auto_refresh,
+            refresh_interval=refresh_interval,
+            refresh_margin=refresh_margin,
+            skip_auth=skip_auth
+        )
+
+        self._request_manager = AsyncRequestManager(
+            api_url=self.api_url,
+            http_client=self._http_client,
+            retry_config=self.retry_config,
+            token_provider=self._get_token,
+            token_refresher=self._refresh_token,
+            # A caller-provided http_client keeps its own timeout
+            timeout=timeout if self._owns_http_client else None,
+            timeout_budget=timeout_budget,
+            request_metrics=request_metrics if request_metrics is not None else RequestMetrics(),
+            idempotency_keys=idempotency_keys
+        )
+
+        self._services = ServiceRegistry(self, factory=AsyncService)
+
+    def __getattr__(self, name: str) -> Any:
+        """Create the async wrapper for a service on first access."""
+        if name in SERVICES:
+            return self._services.get(name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    @property
+    def token(self) -> Optional[str]:
+        """The current access token, or None if it has not been fetched yet."""
+        return self._auth_manager.token
+
+    @property
+    def request_metrics(self) -> RequestMetrics:
+        """The registry recording the latency, sizes and outcomes of this client's requests."""
+        return self._request_manager.request_metrics
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get the request metrics of each endpoint (see `PortClient.metrics`)."""
+        return self.request_metrics.snapshot()
+
+    async def _get_token(self) -> str:
+        """Return a valid access token, fetching or refreshing it if needed."""
+        return await self._auth_manager.get_token(self._http_client)
+
+    async def _refresh_token(self, stale_token: Optional[str]) -> Optional[str]:
+        """Refresh an access token the API rejected, unless it was already replaced."""
+        return await self._auth_manager.arefresh_if_current(self._http_client, stale_token)
+
+    def default_headers(self) -> dict:
+        """Return a copy of the default request headers."""
+        headers = dict(self._http_client.headers)
+        if self._auth_manager.token:
+            headers["Authorization"] = f"Bearer {self._auth_manager.token}"
+        return headers
+
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        retries: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        correlation_id: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Make an HTTP request to the API with error handling and retry logic.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST', 'PUT', 'DELETE').
+            endpoint: API endpoint appended to the base URL.
+            retries: Number of retry attempts for transient errors.
+            retry_delay: Initial delay between retries in seconds.
+            correlation_id: A correlation ID for tracking the request.
+            **kwargs: Additional request parameters (params, json, data, headers, timeout).
+
+        Returns:
+            An httpx.Response object containing the API response.
+
+        Raises:
+            PortApiError: If the request fails.
+        """
+        return await self._request_manager.make_request(
+            method=method,
+            endpoint=endpoint,
+            retries=retries,
+            retry_delay=retry_delay,
+            correlation_id=correlation_id,
+            **kwargs
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client if it is owned by this client."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncPortClient":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the client when leaving the async context manager."""
+        await self.aclose()
@@ -7,8 +7,11 @@ This module handles authentication with the Port API, including:
 - Credential validation
 """
 
+import base64
+import contextlib
 import json
 import os
+import random
 import threading
 import time
 from typing import Dict, Any, Optional, Tuple, Callable
@@ -16,9 +19,30 @@ from typing import Dict, Any, Optional, Tuple, Callable
 import requests
 
 # No need to import PORT_API_URL and PORT_API_US_URL as they're not used directly
-from ..error_handling import handle_request_exception
+from ..error_handling import handle_httpx_exception, handle_request_exception
 from ..exceptions import PortApiError, PortAuthenticationError, PortConfigurationError
 from ..logging import log_request, log_response, log_error, get_correlation_id, logger
+from .token_cache import TokenCache, token_cache_key
+
+
+def token_expiry(token: Optional[str]) -> Optional[float]:
+    """
+    Read the expiry time from a JWT access token.
+
+    The signature is not verified; the claim is only used to schedule refreshes.
+
+    Args:
+        token: The access token.
+
+    Returns:
+        The `exp` claim as a Unix timestamp, or None if the token is not a JWT with an expiry.
+    """
+    try:
+        payload = token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
 
 
 class AuthManager:
@@ -30,7 +54,9 @@ class AuthManager:
 
     def __init__(self, client_id: str, client_secret: str, api_url: str,
                  auto_refresh: bool = True, refresh_interval: int = 900,
-                 skip_auth: bool = False, token_update_callback: Optional[Callable[[str], None]] = None):
+                 skip_auth: bool = False, token_update_callback: Optional[Callable[[str], None]] = None,
+                 session: Optional[requests.Session] = None, lazy: bool = False,
+                 refresh_margin: float = 60.0, token_cache: Optional[TokenCache] = None):
         """
         Initialize the AuthManager.
 
@@ -39,30 +65,77 @@ class AuthManager:
             client_secret: API client secret obtained from Port.
             api_url: The base URL for the Port API.
             auto_refresh: Whether to automatically refresh the token.
-            refresh_interval: Token refresh interval in seconds.
+            refresh_interval: Token refresh interval in seconds, used when the token
+                carries no JWT expiry.
             skip_auth: Whether to skip authentication (for testing).
             token_update_callback: Optional callback function to call when token is updated.
                 The callback will be called with the new token as an argument.
+            session: Optional session used to send authentication requests, so that they reuse
+                pooled connections. If None, a new connection is opened for every request.
+            lazy: Whether to defer fetching the token until `ensure_token` is first called.
+                The refresh thread is started once the first token has been fetched.
+            refresh_margin: Seconds before the JWT expiry at which the token is refreshed (default: 60.0).
+            token_cache: Optional cache shared with other clients and processes. A cached token
+                that is still valid is reused instead of fetching a new one, and only one
+                client sharing the cache refreshes it at a time.
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.api_url = api_url
         self._auto_refresh = auto_refresh
         self._refresh_interval = refresh_interval
+        self._refresh_margin = refresh_margin
+        self._skip_auth = skip_auth
         self._logger = logger
         self._lock = threading.Lock()
         self._token_update_callback = token_update_callback
+        self._session = session
+        self._token_cache = token_cache
+        # Consecutive failed background refreshes, reset by the next success
+        self._refresh_failures = 0
+        self._refresh_error: Optional[Exception] = None
 
         # Initialize token
         if skip_auth:
             # Use a dummy token for testing
             self.token = "dummy_token"
+        elif lazy:
+            # Fetched by ensure_token() before the first request
+            self.token = None
         else:
-            self.token = self._get_access_token()
+            self.token = self._obtain_token()
 
         # Start token refresh thread if enabled and not skipping auth
-        if self._auto_refresh and not skip_auth:
+        if self._auto_refresh and not skip_auth and not lazy:
+            self._start_token_refresh_thread()
+
+    def ensure_token(self) -> str:
+        """
+        Return the access token, fetching it first if authentication was deferred.
+
+        Concurrent callers share a single fetch.
+
+        Returns:
+            The access token.
+
+        Raises:
+            PortAuthenticationError: If authentication fails.
+            PortApiError: If another API error occurs.
+        """
+        if self.token is not None:
+            return self.token
+
+        with self._lock:
+            if self.token is not None:
+                return self.token
+            token = self._obtain_token()
+            self.token = token
+
+        if self._token_update_callback:
+            self._token_update_callback(token)
+        if self._auto_refresh:
             self._start_token_refresh_thread()
+        return token
 
     def _start_token_refresh_thread(self):
         """Start a background thread to refresh the token periodically."""
@@ -75,22 +148,89 @@ class AuthManager:
         Background thread that periodically refreshes the access token.
         """
         while True:
-            # Wait for the refresh interval
-            time.sleep(self._refresh_interval)
+            # Wait until the token is about to expire
+            token = self.token
+            time.sleep(self._next_refresh_delay())
+
+            # Attempt to refresh the token, unless a rejected request already did
+            self._refresh_token(stale_token=token)
+
+    def _next_refresh_delay(self) -> float:
+        """
+        Compute how long to wait before the next refresh.
+
+        Tokens that are JWTs with an `exp` claim are refreshed `refresh_margin`
+        seconds before they expire; other tokens every `refresh_interval` seconds.
+        After a failed refresh the next attempt is delayed with exponential
+        backoff (1, 2, 4, ... seconds up to `refresh_interval`, with 10% jitter),
+        but never beyond the expiry of the current token.
+
+        Returns:
+            The delay in seconds (at least 1 second, or 0.1 seconds when backing off).
+        """
+        expiry = token_expiry(self.token)
+        if self._refresh_error is not None:
+            delay = min(2.0 ** min(self._refresh_failures - 1, 32), self._refresh_interval)
+            delay *= random.uniform(0.9, 1.1)
+            if expiry is not None and expiry > time.time():
+                delay = min(delay, expiry - time.time())
+            return max(0.1, delay)
+        if expiry is None:
+            return self._refresh_interval
+        return max(1.0, expiry - time.time() - self._refresh_margin)
+
+    def refresh_if_current(self, stale_token: Optional[str]) -> Optional[str]:
+        """
+        Refresh the token after it was rejected, unless another thread already did.
+
+        Threads that hit a 401 with the same token share a single refresh: the
+        first one fetches a new token while holding the lock, and the others
+        return that token once they acquire it.
 
-            # Attempt to refresh the token
-            self._refresh_token()
+        Args:
+            stale_token: The token the rejected request was sent with.
+
+        Returns:
+            The new token, or None if authentication is skipped.
 
-    def _refresh_token(self):
+        Raises:
+            PortAuthenticationError: If authentication fails.
+            PortApiError: If another API error occurs.
+        """
+        if self._skip_auth:
+            return None
+
+        with self._lock:
+            if self.token is not None and self.token != stale_token:
+                return self.token
+            self._logger.info("Access token was rejected; refreshing it.")
+            new_token = self._obtain_token(stale_token=stale_token)
+            self.token = new_token
+            if self._token_update_callback:
+                self._token_update_callback(new_token)
+            return new_token
+
+    def _refresh_token(self, stale_token: Optional[str] = None):
         """
         Refresh the access token.
+
+        The token is fetched while holding the lock, as in `refresh_if_current`,
+        so a scheduled refresh and a refresh after a 401 never run at once.
+
+        Args:
+            stale_token: The token this refresh was scheduled for. If another thread
+                has replaced it in the meantime, nothing is fetched. None refreshes
+                the current token.
         """
         try:
-            self._logger.debug("Refreshing access token...")
-            new_token = self._get_access_token()
-
-            # Update the token
             with self._lock:
+                if stale_token is not None and self.token != stale_token:
+                    self._logger.debug("Access token was already refreshed; skipping the scheduled refresh.")
+                    self._refresh_failures = 0
+                    self._refresh_error = None
+                    return
+                self._logger.debug("Refreshing access token...")
+                new_token = self._obtain_token(stale_token=self.token)
                 self.token = new_token
 
             # Call the callback to notify about token update
@@ -100,8 +240,12 @@ class AuthManager:
                 except Exception as callback_error:
                     self._logger.error(f"Error in token update callback: {str(callback_error)}")
 
+            self._refresh_failures = 0
+            self._refresh_error = None
             self._logger.info("Access token refreshed successfully.")
         except Exception as e:
+            self._refresh_failures += 1
+            self._refresh_error = e
             self._handle_token_refresh_error(e)
 
     def _handle_token_refresh_error(self, error):
@@ -121,6 +265,71 @@ class AuthManager:
             # Unexpected errors
             self._logger.error(f"Unexpected error during token refresh: {str(error)}")
 
+    def _obtain_token(self, stale_token: Optional[str] = None) -> str:
+        """
+        Get a valid access token, from the token cache if possible.
+
+        Without a token cache this always fetches a new token. With one, a
+        cached token is reused while it is valid for more than `refresh_margin`
+        seconds and is not `stale_token`; otherwise the cache lock is taken, the
+        cache is checked again (another process may have refreshed it), and only
+        then is a new token fetched and stored. If the lock cannot be taken
+        (e.g. the cache directory is not writable), the token is fetched without it.
+
+        Args:
+            stale_token: A token that must not be reused, e.g. one the API rejected.
+
+        Returns:
+            The access token.
+        """
+        if self._token_cache is None:
+            return self._get_access_token()
+
+        key = token_cache_key(self.client_id, self.api_url)
+        token = self._usable_cached_token(key, stale_token)
+        if token is not None:
+            return token
+
+        with contextlib.ExitStack() as stack:
+            try:
+                stack.enter_context(self._token_cache.lock(key))
+            except OSError as e:
+                self._logger.warning(f"Could not lock the token cache, fetching a token without it: {str(e)}")
+            token = self._usable_cached_token(key, stale_token)
+            if token is not None:
+                return token
+            token = self._get_access_token()
+            expires_at = token_expiry(token) or time.time() + self._refresh_interval
+            try:
+                self._token_cache.set(key, token, expires_at)
+            except Exception as e:
+                self._logger.warning(f"Could not write the token cache: {str(e)}")
+            return token
+
+    def _usable_cached_token(self, key: str, stale_token: Optional[str]) -> Optional[str]:
+        """
+        Return the cached token if it can still be used.
+
+        Args:
+            key: The token cache key.
+            stale_token: A token that must not be reused.
+
+        Returns:
+            The cached token, or None if there is none, it is stale, or it expires soon.
+        """
+        try:
+            cached = self._token_cache.get(key)
+        except Exception as e:
+            self._logger.warning(f"Could not read the token cache: {str(e)}")
+            return None
+        if cached is None:
+            return None
+        token, expires_at = cached
+        if token == stale_token or expires_at - self._refresh_margin <= time.time():
+            return None
+        self._logger.debug("Using access token from the token cache.")
+        return token
+
     def _get_access_token(self) -> str:
         """
         Get an access token from the API.
@@ -172,7 +381,8 @@ class AuthManager:
 
         try:
             # Make the request
-            response = requests.post(url, headers=headers, data=payload, timeout=10)
+            http = self._session if self._session is not None else requests
+            response = http.post(url, headers=headers, data=payload, timeout=10)
 
             # Log the response
             log_response(response, correlation_id)
@@ -339,3 +549,160 @@ class AuthManager:
         if not client_id or not client_secret:
             self._logger.error(f"Missing credentials from {source}.")
             raise PortConfigurationError(f"Client ID or client secret not found in {source}")
+
+
+class AsyncAuthManager(AuthManager):
+    """
+    Manages authentication with the Port API for the asyncio client.
+
+    Unlike `AuthManager`, no network call is made from the constructor and no
+    background thread is started. The token is fetched on the first request
+    and refreshed from the request path: `refresh_margin` seconds before its
+    JWT expiry, or once `refresh_interval` has elapsed for tokens without one.
+    A token the API rejects is refreshed by `arefresh_if_current`. Concurrent
+    coroutines that need a token share a single in-flight fetch.
+    """
+
+    def __init__(self, client_id: str, client_secret: str, api_url: str,
+                 auto_refresh: bool = True, refresh_interval: int = 900,
+                 skip_auth: bool = False, token_update_callback: Optional[Callable[[str], None]] = None,
+                 refresh_margin: float = 60.0):
+        """
+        Initialize the AsyncAuthManager.
+
+        Args:
+            client_id: API client ID obtained from Port.
+            client_secret: API client secret obtained from Port.
+            api_url: The base URL for the Port API.
+            auto_refresh: Whether to refresh the token before it expires.
+            refresh_interval: Token refresh interval in seconds, used when the token
+                carries no JWT expiry.
+            skip_auth: Whether to skip authentication (for testing).
+            token_update_callback: Optional callback function to call when token is updated.
+            refresh_margin: Seconds before the JWT expiry at which the token is refreshed (default: 60.0).
+        """
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.api_url = api_url
+        self._auto_refresh = auto_refresh
+        self._refresh_interval = refresh_interval
+        self._refresh_margin = refresh_margin
+        self._skip_auth = skip_auth
+        self._logger = logger
+        self._async_lock = None
+        self._token_update_callback = token_update_callback
+        self._token_acquired_at = 0.0
+        self._session = None
+
+        self.token = "dummy_token" if skip_auth else None
+
+    def _token_is_fresh(self) -> bool:
+        """Return True if the current token can be used without refreshing it."""
+        if self.token is None:
+            return False
+        if not self._auto_refresh:
+            return True
+        expiry = token_expiry(self.token)
+        if expiry is not None:
+            return expiry - time.time() > self._refresh_margin
+        return time.monotonic() - self._token_acquired_at < self._refresh_interval
+
+    def _get_async_lock(self):
+        """Return the lock serializing token fetches, created lazily so that it binds to the running loop."""
+        if self._async_lock is None:
+            import asyncio
+            self._async_lock = asyncio.Lock()
+        return self._async_lock
+
+    def _set_token(self, token: str) -> None:
+        """Store a newly fetched token and notify the token update callback."""
+        self.token = token
+        self._token_acquired_at = time.monotonic()
+        if self._token_update_callback:
+            try:
+                self._token_update_callback(token)
+            except Exception as callback_error:
+                self._logger.error(f"Error in token update callback: {str(callback_error)}")
+
+    async def get_token(self, http_client) -> str:
+        """
+        Return a valid access token, fetching or refreshing it if needed.
+
+        Args:
+            http_client: The httpx.AsyncClient used to send the authentication request.
+
+        Returns:
+            The access token.
+
+        Raises:
+            PortAuthenticationError: If authentication fails.
+            PortApiError: If another API error occurs.
+        """
+        if self._skip_auth or self._token_is_fresh():
+            return self.token
+
+        async with self._get_async_lock():
+            # Another coroutine may have refreshed the token while we waited
+            if not self._token_is_fresh():
+                self._set_token(await self._aget_access_token(http_client))
+            return self.token
+
+    async def arefresh_if_current(self, http_client, stale_token: Optional[str]) -> Optional[str]:
+        """
+        Refresh the token after it was rejected, unless another coroutine already did.
+
+        The asynchronous counterpart of `AuthManager.refresh_if_current`.
+
+        Args:
+            http_client: The httpx.AsyncClient used to send the authentication request.
+            stale_token: The token the rejected request was sent with.
+
+        Returns:
+            The new token, or None if authentication is skipped.
+
+        Raises:
+            PortAuthenticationError: If authentication fails.
+            PortApiError: If another API error occurs.
+        """
+        if self._skip_auth:
+            return None
+
+        async with self._get_async_lock():
+            if self.token is not None and self.token != stale_token:
+                return self.token
+            self._logger.info("Access token was rejected; refreshing it.")
+            self._set_token(await self._aget_access_token(http_client))
+            return self.token
+
+    async def _aget_access_token(self, http_client) -> str:
+        """
+        Get an access token from the API without blocking the event loop.
+
+        Args:
+            http_client: The httpx.AsyncClient used to send the request.
+
+        Returns:
+            The access token.
+        """
+        import httpx
+
+        correlation_id = get_correlation_id()
+        endpoint, headers, payload = self._prepare_auth_request()
+        url = f'{self.api_url}/{endpoint}'
+
+        self._logger.debug("Sending authentication request to obtain access token...")
+        log_request("POST", url, headers=headers, json_data=json.loads(payload),
+                    correlation_id=correlation_id)
+
+        try:
+            response = await http_client.post(url, headers=headers, content=payload, timeout=10)
+            log_response(response, correlation_id)
+            return self._handle_auth_response(response, endpoint)
+        except httpx.HTTPError as e:
+            error = handle_httpx_exception(e, endpoint, "POST")
+            log_error(error, correlation_id)
+            raise error
+        except (PortApiError, PortConfigurationError):
+            raise
+        except Exception as e:
+            return self._handle_unexpected_auth_error(e, correlation_id)
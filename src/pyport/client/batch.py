@@ -0,0 +1,239 @@
+"""
+Concurrent request execution for the Port API client.
+
+This module provides the building blocks behind `PortClient.map` and
+`PortClient.batch`: a thread pool with a bounded submission queue, results
+that keep the input order, and per-item error reporting so one failing call
+does not abort the rest of the run.
+
+Example:
+    ```python
+    results = client.map(client.entities.get_entity, [("service", "api"), ("service", "web")],
+                         max_concurrency=32)
+    for result in results:
+        if result.ok:
+            print(result.value["identifier"])
+        else:
+            print(f"{result.args} failed: {result.error}")
+
+    with client.batch(max_concurrency=8) as batch:
+        futures = [batch.submit(client.blueprints.get_blueprint, bp) for bp in ["service", "team"]]
+    blueprints = [future.result() for future in futures]
+    ```
+"""
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..logging import logger
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of a single call made by a batch or map.
+
+    Attributes:
+        index: Position of the call in the input (or submission order).
+        args: Positional arguments the call was made with.
+        kwargs: Keyword arguments the call was made with.
+        value: The return value of the call, if it succeeded.
+        error: The exception raised by the call, if it failed.
+    """
+    index: int
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    value: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """
+        Return the value of the call, raising its error if it failed.
+
+        Returns:
+            The return value of the call.
+
+        Raises:
+            Exception: The exception raised by the call.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def _split_item(item: Any) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """
+    Convert a map input item into call arguments.
+
+    Tuples are unpacked as positional arguments, dicts as keyword arguments,
+    and any other value is passed as the single positional argument.
+
+    Args:
+        item: The input item.
+
+    Returns:
+        A tuple of (args, kwargs).
+    """
+    if isinstance(item, tuple):
+        return item, {}
+    if isinstance(item, dict):
+        return (), item
+    return (item,), {}
+
+
+class BatchExecutor:
+    """
+    Runs calls concurrently on a bounded thread pool.
+
+    At most `max_concurrency` calls run at the same time and at most
+    `max_pending` further calls wait in the queue; `submit` blocks once the
+    queue is full, which keeps memory bounded when feeding a large generator.
+    Use it as a context manager: leaving the block waits for all submitted
+    calls to finish.
+
+    Attributes:
+        max_concurrency: Maximum number of calls running at the same time.
+        max_pending: Maximum number of calls waiting to run.
+    """
+
+    def __init__(self, max_concurrency: int = 10, max_pending: Optional[int] = None):
+        """
+        Initialize the BatchExecutor.
+
+        Args:
+            max_concurrency: Maximum number of calls running at the same time (default: 10).
+            max_pending: Maximum number of queued calls (default: same as max_concurrency).
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending if max_pending is not None else max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="pyport-batch")
+        self._slots = threading.BoundedSemaphore(self.max_concurrency + self.max_pending)
+        self._futures: List[Future] = []
+        self._calls: List[Tuple[Tuple[Any, ...], Dict[str, Any]]] = []
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Schedule a call, blocking while the queue is full.
+
+        The call runs in a copy of the caller's context, so an active
+        `pyport.deadline.deadline()` block also bounds it.
+
+        Args:
+            func: The function to call, typically a service method.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            A Future for the return value of the call.
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+        self._calls.append((args, kwargs))
+        return future
+
+    def results(self) -> List[BatchResult]:
+        """
+        Wait for all submitted calls and return their outcomes in submission order.
+
+        Returns:
+            A list of BatchResult objects, one per submitted call.
+        """
+        results = []
+        for index, (future, (args, kwargs)) in enumerate(zip(self._futures, self._calls)):
+            error = future.exception()
+            results.append(BatchResult(index=index, args=args, kwargs=kwargs,
+                                       value=None if error else future.result(), error=error))
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the thread pool.
+
+        Args:
+            wait: Whether to wait for running calls to finish.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "BatchExecutor":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Wait for all submitted calls and stop the thread pool."""
+        self.shutdown(wait=True)
+
+
+#: A replacement for the thread pool of run_map: (func, items, max_concurrency) -> results
+MapRunner = Callable[[Callable[..., Any], Iterable[Any], int], List[BatchResult]]
+
+_map_runner: contextvars.ContextVar[Optional[MapRunner]] = contextvars.ContextVar("pyport_map_runner",
+                                                                                  default=None)
+
+
+@contextmanager
+def use_map_runner(runner: MapRunner) -> Iterator[None]:
+    """
+    Run the maps made by service code inside the block with `runner` instead of a thread pool.
+
+    AsyncPortClient uses this to make the concurrent requests of service
+    methods such as `fetch_all` on its event loop.
+
+    Args:
+        runner: Called as runner(func, items, max_concurrency) and returning the BatchResults of run_map.
+    """
+    token = _map_runner.set(runner)
+    try:
+        yield
+    finally:
+        _map_runner.reset(token)
+
+
+def run_map(func: Callable[..., Any], items: Iterable[Any], max_concurrency: int = 10) -> List[BatchResult]:
+    """
+    Call a function for every item concurrently, preserving input order.
+
+    Items are consumed lazily, so `items` may be a generator; at most about
+    twice `max_concurrency` calls are scheduled at any time. Inside a
+    `use_map_runner` block the calls are made by that block's runner.
+
+    Args:
+        func: The function to call, typically a service method.
+        items: Call arguments. Tuples are unpacked as positional arguments, dicts as
+            keyword arguments, and other values are passed as a single argument.
+        max_concurrency: Maximum number of calls running at the same time (default: 10).
+
+    Returns:
+        A list of BatchResult objects in the same order as items.
+    """
+    runner = _map_runner.get()
+    if runner is not None:
+        return runner(func, items, max_concurrency)
+
+    with BatchExecutor(max_concurrency=max_concurrency) as executor:
+        for item in items:
+            args, kwargs = _split_item(item)
+            executor.submit(func, *args, **kwargs)
+        results = executor.results()
+
+    failures = sum(1 for result in results if not result.ok)
+    if failures:
+        logger.warning(f"{failures} of {len(results)} calls failed in map of "
+                       f"{getattr(func, '__name__', str(func))}.")
+    return results
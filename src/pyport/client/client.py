@@ -7,32 +7,50 @@ for interacting with the Port API.
 
 import logging
 import requests
-from typing import Optional, Set, Type, Union
-
-from ..action_runs.action_runs_api_svc import ActionRuns
-from ..actions.actions_api_svc import Actions
-from ..apps.apps_api_svc import Apps
-from ..audit.audit_api_svc import Audit
-from ..blueprints.blueprint_api_svc import Blueprints
-from ..checklist.checklist_api_svc import Checklist
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Type, Union
+
 from .auth import AuthManager
+from .batch import BatchExecutor, BatchResult, run_map
+from .pool import ConnectionPool
 from .request import RequestManager
+from .services import ServiceRegistry
 from ..constants import PORT_API_URL, PORT_API_US_URL, GENERIC_HEADERS
-from ..entities.entities_api_svc import Entities
+from ..deadline import Deadline, Timeout
 # PortApiError is not used directly
-from ..integrations.integrations_api_svc import Integrations
 from ..logging import configure_logging, logger, get_correlation_id
-from ..migrations.migrations_api_svc import Migrations
-from ..organization.organization_api_svc import Organizations
-from ..pages.pages_api_svc import Pages
-from ..retry import RetryConfig, RetryStrategy
-from ..roles.roles_api_svc import Roles
-from ..scorecards.scorecards_api_svc import Scorecards
-from ..search.search_api_svc import Search
-from ..sidebars.sidebars_api_svc import Sidebars
-from ..teams.teams_api_svc import Teams
-from ..users.users_api_svc import Users
-from ..webhooks.webhooks_api_svc import Webhooks
+from ..retry import CircuitBreakerRegistry, RetryBudget, RetryConfig, RetryStrategy
+
+if TYPE_CHECKING:
+    # Optional features are imported by the caller that configures them
+    from .token_cache import TokenCache
+    from .transport import Transport
+    from ..cache import ResponseCache
+    from ..coalesce import RequestCoalescer
+    from ..codec import JsonCodec
+    from ..hedging import HedgePolicy
+    from ..metrics import RequestMetrics
+    from ..profiling import RequestProfiler
+    from ..rate_limit import RateLimiter
+
+    # Service modules are imported on first access (see services.py)
+    from ..action_runs.action_runs_api_svc import ActionRuns
+    from ..actions.actions_api_svc import Actions
+    from ..apps.apps_api_svc import Apps
+    from ..audit.audit_api_svc import Audit
+    from ..blueprints.blueprint_api_svc import Blueprints
+    from ..checklist.checklist_api_svc import Checklist
+    from ..entities.entities_api_svc import Entities
+    from ..integrations.integrations_api_svc import Integrations
+    from ..migrations.migrations_api_svc import Migrations
+    from ..organization.organization_api_svc import Organizations
+    from ..pages.pages_api_svc import Pages
+    from ..roles.roles_api_svc import Roles
+    from ..scorecards.scorecards_api_svc import Scorecards
+    from ..search.search_api_svc import Search
+    from ..sidebars.sidebars_api_svc import Sidebars
+    from ..teams.teams_api_svc import Teams
+    from ..users.users_api_svc import Users
+    from ..webhooks.webhooks_api_svc import Webhooks
 
 
 class PortClient:
@@ -157,6 +175,38 @@ class PortClient:
                  retry_status_codes: Optional[Set[int]] = None,
                  retry_on: Optional[Union[Type[Exception], Set[Type[Exception]]]] = None,
                  idempotent_methods: Optional[Set[str]] = None,
+                 # Connection pool configuration
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 keep_alive: bool = True,
+                 connection_pool: Optional[ConnectionPool] = None,
+                 # Rate limiting configuration
+                 rate_limiter: Optional["RateLimiter"] = None,
+                 # Response cache configuration
+                 response_cache: Optional["ResponseCache"] = None,
+                 # JSON configuration
+                 json_codec: Union[str, "JsonCodec", None] = "auto",
+                 # Authentication configuration
+                 lazy_auth: bool = False,
+                 refresh_margin: float = 60.0,
+                 token_cache: Optional["TokenCache"] = None,
+                 # Timeout configuration
+                 timeout: Optional[Timeout] = (10.0, 30.0),
+                 timeout_budget: Optional[float] = None,
+                 hedge_policy: Optional["HedgePolicy"] = None,
+                 # Transport configuration
+                 transport: Optional["Transport"] = None,
+                 # Coalescing configuration
+                 request_coalescer: Optional["RequestCoalescer"] = None,
+                 # Metrics configuration
+                 request_metrics: Optional["RequestMetrics"] = None,
+                 request_profiler: Optional["RequestProfiler"] = None,
+                 # Retry budget configuration
+                 retry_budget: Optional[RetryBudget] = None,
+                 # Idempotency configuration
+                 idempotency_keys: bool = True,
+                 retry_keyed_writes: bool = False,
                  # Testing configuration
                  skip_auth: bool = False):
         """
@@ -170,7 +220,8 @@ class PortClient:
             auto_refresh: If True, a background thread will refresh the token periodically (default: True).
                 Set to False if you want to manage token refresh manually.
             refresh_interval: Token refresh interval in seconds (default: 900 sec = 15 minutes).
-                Tokens typically expire after 30 minutes, so refreshing every 15 minutes is recommended.
+                Only used when the token carries no JWT expiry; otherwise the token is refreshed
+                refresh_margin seconds before it expires.
             log_level: The logging level to use (default: logging.INFO).
                 Use logging.DEBUG for more detailed logs including request/response information.
             log_format: The format string to use for log messages (default: None).
@@ -194,6 +245,61 @@ class PortClient:
             idempotent_methods: HTTP methods that are safe to retry
                 (default: {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}).
                 Non-idempotent methods like POST are not retried by default to avoid duplicate operations.
+            pool_connections: Number of per-host connection pools to cache (default: 10).
+            pool_maxsize: Maximum number of connections kept per host (default: 10).
+                Set this to at least the number of threads sharing the client.
+            pool_block: Whether to wait for a free connection when the pool is exhausted (default: False).
+                When False, extra connections are opened and discarded after use.
+            keep_alive: Whether to keep connections open between requests (default: True).
+            connection_pool: A ConnectionPool shared with other clients (default: None).
+                When provided, the pool_* and keep_alive arguments are ignored and the pool
+                is not closed by close().
+            rate_limiter: A RateLimiter that paces requests before they are sent (default: None).
+                The limiter is shared by all threads using the client and can also be shared
+                between clients that use the same credentials.
+            response_cache: A ResponseCache for GET responses (default: None).
+                Fresh entries are served without a request, expired ones are revalidated
+                with ETag/Last-Modified, and writes through this client invalidate them.
+            json_codec: The JSON codec for request bodies, responses and debug logs (default: "auto").
+                "auto" picks orjson, then ujson, then the standard library, whichever is installed first.
+                Also accepts "orjson", "ujson", "json" or a JsonCodec instance.
+            lazy_auth: Whether to defer fetching the access token until the first request (default: False).
+                The constructor then makes no network call, which helps short-lived scripts
+                that may not need to call the API at all.
+            refresh_margin: Seconds before the token's JWT expiry at which it is refreshed (default: 60.0).
+                A request rejected with 401 also refreshes the token (once across threads) and is replayed.
+            token_cache: A TokenCache shared with other clients or processes (default: None).
+                Use FileTokenCache to let processes started with the same credentials reuse a
+                valid token instead of each calling the authentication endpoint.
+            timeout: Per-attempt timeout in seconds, or a (connect, read) tuple (default: (10.0, 30.0)).
+                Used when a call does not pass timeout=; None waits indefinitely.
+            timeout_budget: Total time in seconds for each call, including retries and the delays
+                between them (default: None, unbounded). Attempt timeouts are capped by the time
+                left, and retries that could not start before the deadline are skipped.
+                Use pyport.deadline.deadline() to share one budget between several calls.
+            hedge_policy: A HedgePolicy for idempotent requests (default: None, no hedging).
+                A request slower than a percentile of recent latencies is sent a second time
+                and the first response wins, within a budget of extra requests.
+            transport: The Transport requests are sent through (default: None, the session).
+                Use HttpxTransport for HTTP/2, or InProcessTransport to answer requests with a
+                Python function in tests and benchmarks. Authentication requests still use the
+                connection pool, so combine InProcessTransport with skip_auth=True offline.
+            request_coalescer: A RequestCoalescer for GET and HEAD requests (default: None).
+                Concurrent identical reads then share one in-flight call and its parsed response,
+                so a burst of cache misses on a hot resource reaches the API once.
+            request_metrics: The RequestMetrics registry requests are recorded in (default: None,
+                a registry for this client). Pass a shared registry to aggregate several clients.
+            request_profiler: A RequestProfiler timing the phases of a sample of requests (default: None).
+                Profiled responses carry their RequestTimings as `response.timings`.
+            retry_budget: A RetryBudget shared by all of this client's requests (default: None, no limit).
+                Retries are then allowed only up to a fraction of recent successful requests plus
+                a minimum rate, so a degraded API is not flooded with retries from many threads.
+            idempotency_keys: Whether to send an Idempotency-Key header with non-idempotent requests
+                such as POST (default: True). The key is generated once per call and sent unchanged
+                with each of its retries; pass headers={"Idempotency-Key": ...} to choose it.
+            retry_keyed_writes: Whether to retry non-idempotent requests that carry an
+                Idempotency-Key, e.g. entity creates and action runs, on transient errors (default: False).
+                Enable it when a repeated write is harmless, e.g. creates with on_conflict="upsert".
             skip_auth: Whether to skip authentication (default: False).
                 This is primarily used for testing.
         """
@@ -203,7 +309,9 @@ class PortClient:
         # Configure components
         self._setup_logging(log_level, log_format, log_handler)
         self._setup_retry_config(max_retries, retry_delay, max_delay, retry_strategy, retry_jitter,
-                                 retry_status_codes, retry_on, idempotent_methods)
+                                 retry_status_codes, retry_on, idempotent_methods, retry_budget,
+                                 retry_keyed_writes)
+        self._setup_connection_pool(pool_connections, pool_maxsize, pool_block, keep_alive, connection_pool)
 
         # Initialize authentication manager with token update callback
         self._auth_manager = AuthManager(
@@ -213,7 +321,11 @@ class PortClient:
             auto_refresh=auto_refresh,
             refresh_interval=refresh_interval,
             skip_auth=skip_auth,
-            token_update_callback=self._update_session_token
+            token_update_callback=self._update_session_token,
+            session=self._auth_session,
+            lazy=lazy_auth,
+            refresh_margin=refresh_margin,
+            token_cache=token_cache
         )
 
         # For backward compatibility
@@ -223,10 +335,24 @@ class PortClient:
         self._init_session()
 
         # Initialize request manager
+        from ..codec import get_codec
+        from ..metrics import RequestMetrics
         self._request_manager = RequestManager(
             api_url=self.api_url,
             session=self._session,
-            retry_config=self.retry_config
+            retry_config=self.retry_config,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            json_codec=get_codec(json_codec),
+            token_refresher=self._auth_manager.refresh_if_current,
+            timeout=timeout,
+            timeout_budget=timeout_budget,
+            hedge_policy=hedge_policy,
+            transport=transport,
+            request_coalescer=request_coalescer,
+            request_metrics=request_metrics if request_metrics is not None else RequestMetrics(),
+            request_profiler=request_profiler,
+            idempotency_keys=idempotency_keys
         )
 
         # Initialize API service classes
@@ -248,7 +374,9 @@ class PortClient:
                             retry_strategy: Union[str, RetryStrategy], retry_jitter: bool,
                             retry_status_codes: Optional[Set[int]],
                             retry_on: Optional[Union[Type[Exception], Set[Type[Exception]]]],
-                            idempotent_methods: Optional[Set[str]]
+                            idempotent_methods: Optional[Set[str]],
+                            retry_budget: Optional[RetryBudget] = None,
+                            retry_keyed_writes: bool = False
                             ) -> None:
         """
         Set up retry configuration.
@@ -262,6 +390,8 @@ class PortClient:
             retry_status_codes: HTTP status codes that should trigger retries.
             retry_on: Exception types or function that determines if an exception should be retried.
             idempotent_methods: HTTP methods that are safe to retry.
+            retry_budget: Budget limiting retries across all requests.
+            retry_keyed_writes: Whether to retry non-idempotent requests carrying an idempotency key.
         """
         # Convert string strategy to enum if needed
         if isinstance(retry_strategy, str):
@@ -277,14 +407,120 @@ class PortClient:
             retry_status_codes=retry_status_codes or {429, 500, 502, 503, 504},
             retry_on=retry_on,
             idempotent_methods=idempotent_methods or {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"},
-            retry_hook=self._request_manager._log_retry_attempt if hasattr(self, '_request_manager') else None
+            retry_hook=self._request_manager._log_retry_attempt if hasattr(self, '_request_manager') else None,
+            circuit_breakers=CircuitBreakerRegistry(),
+            retry_budget=retry_budget,
+            retry_keyed_writes=retry_keyed_writes
+        )
+
+    def _setup_connection_pool(self, pool_connections: int, pool_maxsize: int, pool_block: bool,
+                               keep_alive: bool, connection_pool: Optional[ConnectionPool]) -> None:
+        """
+        Set up the connection pool shared by API and authentication requests.
+
+        Args:
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum number of connections kept per host.
+            pool_block: Whether to wait for a free connection when the pool is exhausted.
+            keep_alive: Whether to keep connections open between requests.
+            connection_pool: An existing pool to share, or None to create one.
+        """
+        self._owns_connection_pool = connection_pool is None
+        self._connection_pool = connection_pool or ConnectionPool(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive
         )
+        # Authentication uses its own session so it never sends a stale Authorization header
+        self._auth_session = self._connection_pool.create_session()
+
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        """The connection pool used by this client."""
+        return self._connection_pool
+
+    @property
+    def rate_limiter(self) -> Optional["RateLimiter"]:
+        """The rate limiter used by this client, or None if requests are not paced."""
+        return self._request_manager.rate_limiter
+
+    @property
+    def response_cache(self) -> Optional["ResponseCache"]:
+        """The response cache used by this client, or None if responses are not cached."""
+        return self._request_manager.response_cache
+
+    @property
+    def json_codec(self) -> "JsonCodec":
+        """The JSON codec used for request and response bodies."""
+        return self._request_manager.json_codec
+
+    @property
+    def transport(self) -> "Transport":
+        """The transport requests are sent through."""
+        return self._request_manager.transport
+
+    @property
+    def hedge_policy(self) -> Optional["HedgePolicy"]:
+        """The policy used to hedge idempotent requests, if any."""
+        return self._request_manager.hedge_policy
+
+    @property
+    def circuit_breakers(self) -> CircuitBreakerRegistry:
+        """The per-endpoint circuit breakers guarding this client's requests."""
+        return self.retry_config.circuit_breakers
+
+    @property
+    def request_coalescer(self) -> Optional["RequestCoalescer"]:
+        """The coalescer shared by concurrent identical reads, if any."""
+        return self._request_manager.request_coalescer
+
+    @property
+    def request_metrics(self) -> "RequestMetrics":
+        """The registry recording the latency, sizes and outcomes of this client's requests."""
+        return self._request_manager.request_metrics
+
+    @property
+    def request_profiler(self) -> Optional["RequestProfiler"]:
+        """The profiler timing the phases of sampled requests, if any."""
+        return self._request_manager.request_profiler
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the request metrics of each endpoint.
+
+        Returns:
+            A dictionary keyed by "METHOD endpoint-template" (e.g. "GET blueprints/{id}") with
+            request counts by status code, retry and circuit breaker counters, and the p50, p90
+            and p99 of latency and body sizes. Use `request_metrics.to_prometheus()` for the
+            Prometheus text format.
+
+        Examples:
+            >>> client.metrics()["GET blueprints/{id}"]["latency"]["p99"]
+            0.183
+        """
+        return self.request_metrics.snapshot()
+
+    @property
+    def timeout_budget(self) -> Optional[float]:
+        """The default total time in seconds for each call, or None if calls are unbounded."""
+        return self._request_manager.timeout_budget
 
     def _init_session(self):
         """Initialize the HTTP session."""
-        self._session = requests.Session()
-        self._session.headers.update(GENERIC_HEADERS)
-        self._session.headers.update({"Authorization": f"Bearer {self._auth_manager.token}"})
+        self._session = self._connection_pool.create_session(GENERIC_HEADERS)
+        if self._auth_manager.token is not None:
+            self._session.headers.update({"Authorization": f"Bearer {self._auth_manager.token}"})
+
+    def close(self) -> None:
+        """
+        Release the client's connections.
+
+        Connections are closed only if the connection pool is owned by this client;
+        a pool passed in through `connection_pool` stays open for the other clients.
+        """
+        if self._owns_connection_pool:
+            self._connection_pool.close()
 
     def _update_session_token(self, new_token: str):
         """
@@ -307,120 +543,99 @@ class PortClient:
         return dict(self._session.headers)
 
     def _init_sub_clients(self):
-        """Initializes all API sub-clients."""
-        # Initialize each service class with proper type annotations
-        self._blueprints: Blueprints = Blueprints(self)
-        self._entities: Entities = Entities(self)
-        self._actions: Actions = Actions(self)
-        self._pages: Pages = Pages(self)
-        self._integrations: Integrations = Integrations(self)
-        self._action_runs: ActionRuns = ActionRuns(self)
-        self._organizations: Organizations = Organizations(self)
-        self._teams: Teams = Teams(self)
-        self._users: Users = Users(self)
-        self._roles: Roles = Roles(self)
-        self._audit: Audit = Audit(self)
-        self._migrations: Migrations = Migrations(self)
-        self._search: Search = Search(self)
-        self._sidebars: Sidebars = Sidebars(self)
-        self._checklist: Checklist = Checklist(self)
-        self._apps: Apps = Apps(self)
-        self._scorecards: Scorecards = Scorecards(self)
-        self._webhooks: Webhooks = Webhooks(self)
-
-        # Future services (commented out for now)
-        # self._data_sources: DataSources = DataSources(self)
+        """Set up the API sub-clients, which are imported and created on first access."""
+        self._services = ServiceRegistry(self)
 
     # Property decorators for API services with explicit return types
     @property
-    def blueprints(self) -> Blueprints:
+    def blueprints(self) -> "Blueprints":
         """Access blueprint-related operations."""
-        return self._blueprints
+        return self._services.get("blueprints")
 
     @property
-    def entities(self) -> Entities:
+    def entities(self) -> "Entities":
         """Access entity-related operations."""
-        return self._entities
+        return self._services.get("entities")
 
     @property
-    def actions(self) -> Actions:
+    def actions(self) -> "Actions":
         """Access action-related operations."""
-        return self._actions
+        return self._services.get("actions")
 
     @property
-    def pages(self) -> Pages:
+    def pages(self) -> "Pages":
         """Access page-related operations."""
-        return self._pages
+        return self._services.get("pages")
 
     @property
-    def integrations(self) -> Integrations:
+    def integrations(self) -> "Integrations":
         """Access integration-related operations."""
-        return self._integrations
+        return self._services.get("integrations")
 
     @property
-    def action_runs(self) -> ActionRuns:
+    def action_runs(self) -> "ActionRuns":
         """Access action run-related operations."""
-        return self._action_runs
+        return self._services.get("action_runs")
 
     @property
-    def organizations(self) -> Organizations:
+    def organizations(self) -> "Organizations":
         """Access organization-related operations."""
-        return self._organizations
+        return self._services.get("organizations")
 
     @property
-    def teams(self) -> Teams:
+    def teams(self) -> "Teams":
         """Access team-related operations."""
-        return self._teams
+        return self._services.get("teams")
 
     @property
-    def users(self) -> Users:
+    def users(self) -> "Users":
         """Access user-related operations."""
-        return self._users
+        return self._services.get("users")
 
     @property
-    def roles(self) -> Roles:
+    def roles(self) -> "Roles":
         """Access role-related operations."""
-        return self._roles
+        return self._services.get("roles")
 
     @property
-    def audit(self) -> Audit:
+    def audit(self) -> "Audit":
         """Access audit-related operations."""
-        return self._audit
+        return self._services.get("audit")
 
     @property
-    def migrations(self) -> Migrations:
+    def migrations(self) -> "Migrations":
         """Access migration-related operations."""
-        return self._migrations
+        return self._services.get("migrations")
 
     @property
-    def search(self) -> Search:
+    def search(self) -> "Search":
         """Access search-related operations."""
-        return self._search
+        return self._services.get("search")
 
     @property
-    def sidebars(self) -> Sidebars:
+    def sidebars(self) -> "Sidebars":
         """Access sidebar-related operations."""
-        return self._sidebars
+        return self._services.get("sidebars")
 
     @property
-    def checklist(self) -> Checklist:
+    def checklist(self) -> "Checklist":
         """Access checklist-related operations."""
-        return self._checklist
+        return self._services.get("checklist")
 
     @property
-    def apps(self) -> Apps:
+    def apps(self) -> "Apps":
         """Access app-related operations."""
-        return self._apps
+        return self._services.get("apps")
 
     @property
-    def scorecards(self) -> Scorecards:
+    def scorecards(self) -> "Scorecards":
         """Access scorecard-related operations."""
-        return self._scorecards
+        return self._services.get("scorecards")
 
     @property
-    def webhooks(self) -> Webhooks:
+    def webhooks(self) -> "Webhooks":
         """Access webhook-related operations."""
-        return self._webhooks
+        return self._services.get("webhooks")
 
     def make_request(
         self,
@@ -429,6 +644,8 @@ class PortClient:
         retries: Optional[int] = None,
         retry_delay: Optional[float] = None,
         correlation_id: Optional[str] = None,
+        timeout_budget: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
         **kwargs
     ) -> requests.Response:
         """
@@ -442,6 +659,9 @@ class PortClient:
             retries: Number of retry attempts for transient errors.
             retry_delay: Initial delay between retries in seconds.
             correlation_id: A correlation ID for tracking the request.
+            timeout_budget: Total time in seconds for this call, retries included
+                (default: the client's timeout_budget).
+            deadline: A pyport.deadline.Deadline shared with other calls.
             **kwargs: Additional parameters passed to requests.request.
 
         Returns:
@@ -450,15 +670,71 @@ class PortClient:
         Raises:
             PortApiError: If the request fails.
         """
+        # With lazy_auth, the first request fetches the token
+        if self._auth_manager.token is None:
+            self._auth_manager.ensure_token()
+
         return self._request_manager.make_request(
             method=method,
             endpoint=endpoint,
             retries=retries,
             retry_delay=retry_delay,
             correlation_id=correlation_id,
+            timeout_budget=timeout_budget,
+            deadline=deadline,
             **kwargs
         )
 
+    def map(self, func: Callable[..., Any], items: Iterable[Any],
+            max_concurrency: Optional[int] = None) -> List[BatchResult]:
+        """
+        Call a service method for every item concurrently.
+
+        Results keep the input order, and a failing call is reported in its
+        BatchResult instead of aborting the run.
+
+        Args:
+            func: The function to call, typically a service method of this client.
+            items: Call arguments. Tuples are unpacked as positional arguments, dicts as
+                keyword arguments, and other values are passed as a single argument.
+                Generators are consumed lazily.
+            max_concurrency: Maximum number of calls running at the same time.
+                Defaults to the connection pool's per-host size.
+
+        Returns:
+            A list of BatchResult objects in the same order as items.
+
+        Examples:
+            >>> results = client.map(client.entities.get_entity,
+            ...                      [("service", "api"), ("service", "web")], max_concurrency=32)
+            >>> entities = [result.value for result in results if result.ok]
+        """
+        return run_map(func, items, max_concurrency=max_concurrency or self._connection_pool.pool_maxsize)
+
+    def batch(self, max_concurrency: Optional[int] = None, max_pending: Optional[int] = None) -> BatchExecutor:
+        """
+        Create an executor for submitting calls concurrently.
+
+        Use the returned executor as a context manager; leaving the block waits
+        for every submitted call to finish.
+
+        Args:
+            max_concurrency: Maximum number of calls running at the same time.
+                Defaults to the connection pool's per-host size.
+            max_pending: Maximum number of queued calls before submit() blocks.
+                Defaults to max_concurrency.
+
+        Returns:
+            A BatchExecutor whose submit() returns futures.
+
+        Examples:
+            >>> with client.batch(max_concurrency=8) as batch:
+            ...     futures = [batch.submit(client.blueprints.get_blueprint, bp) for bp in ["service", "team"]]
+            >>> blueprints = [future.result() for future in futures]
+        """
+        return BatchExecutor(max_concurrency=max_concurrency or self._connection_pool.pool_maxsize,
+                             max_pending=max_pending)
+
     # Private methods for backward compatibility
 
     def _get_local_env_cred(self):
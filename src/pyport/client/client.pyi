@@ -1,6 +1,6 @@
 """Type stub file for the PortClient class."""
 
-from typing import Dict, List, Optional, Set, Type, Union, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Type, Union
 import logging
 import requests
 
@@ -10,14 +10,27 @@ from ..apps.apps_api_svc import Apps
 from ..audit.audit_api_svc import Audit
 from ..blueprints.blueprint_api_svc import Blueprints
 from ..checklist.checklist_api_svc import Checklist
+from ..cache import ResponseCache
+from ..codec import JsonCodec
 from ..client.auth import AuthManager
+from ..client.batch import BatchExecutor, BatchResult
+from ..client.pool import ConnectionPool
 from ..client.request import RequestManager
+from ..client.services import ServiceRegistry
+from ..client.token_cache import TokenCache
+from ..client.transport import Transport
+from ..deadline import Deadline, Timeout
+from ..hedging import HedgePolicy
+from ..coalesce import RequestCoalescer
+from ..metrics import RequestMetrics
+from ..profiling import RequestProfiler
 from ..entities.entities_api_svc import Entities
 from ..integrations.integrations_api_svc import Integrations
 from ..migrations.migrations_api_svc import Migrations
 from ..organization.organization_api_svc import Organizations
 from ..pages.pages_api_svc import Pages
-from ..retry import RetryConfig, RetryStrategy
+from ..rate_limit import RateLimiter
+from ..retry import CircuitBreakerRegistry, RetryBudget, RetryConfig, RetryStrategy
 from ..roles.roles_api_svc import Roles
 from ..scorecards.scorecards_api_svc import Scorecards
 from ..search.search_api_svc import Search
@@ -35,27 +48,14 @@ class PortClient:
     _auth_manager: AuthManager
     _request_manager: RequestManager
     _session: requests.Session
+    _auth_session: requests.Session
+    _connection_pool: ConnectionPool
+    _owns_connection_pool: bool
     _logger: logging.Logger
     
-    # Private service instances
-    _blueprints: Blueprints
-    _entities: Entities
-    _actions: Actions
-    _pages: Pages
-    _integrations: Integrations
-    _action_runs: ActionRuns
-    _organizations: Organizations
-    _teams: Teams
-    _users: Users
-    _roles: Roles
-    _audit: Audit
-    _migrations: Migrations
-    _search: Search
-    _sidebars: Sidebars
-    _checklist: Checklist
-    _apps: Apps
-    _scorecards: Scorecards
-    
+    # Service instances, created on first access
+    _services: ServiceRegistry
+
     def __init__(
         self,
         client_id: str,
@@ -74,6 +74,27 @@ class PortClient:
         retry_status_codes: Optional[Set[int]] = ...,
         retry_on: Optional[Union[Type[Exception], Set[Type[Exception]]]] = ...,
         idempotent_methods: Optional[Set[str]] = ...,
+        pool_connections: int = ...,
+        pool_maxsize: int = ...,
+        pool_block: bool = ...,
+        keep_alive: bool = ...,
+        connection_pool: Optional[ConnectionPool] = ...,
+        rate_limiter: Optional[RateLimiter] = ...,
+        response_cache: Optional[ResponseCache] = ...,
+        json_codec: Union[str, JsonCodec, None] = ...,
+        lazy_auth: bool = ...,
+        refresh_margin: float = ...,
+        token_cache: Optional[TokenCache] = ...,
+        timeout: Optional[Timeout] = ...,
+        timeout_budget: Optional[float] = ...,
+        hedge_policy: Optional[HedgePolicy] = ...,
+        transport: Optional[Transport] = ...,
+        request_coalescer: Optional[RequestCoalescer] = ...,
+        request_metrics: Optional[RequestMetrics] = ...,
+        request_profiler: Optional[RequestProfiler] = ...,
+        retry_budget: Optional[RetryBudget] = ...,
+        idempotency_keys: bool = ...,
+        retry_keyed_writes: bool = ...,
         skip_auth: bool = ...
     ) -> None: ...
     
@@ -93,10 +114,67 @@ class PortClient:
         retry_jitter: bool,
         retry_status_codes: Optional[Set[int]],
         retry_on: Optional[Union[Type[Exception], Set[Type[Exception]]]],
-        idempotent_methods: Optional[Set[str]]
+        idempotent_methods: Optional[Set[str]],
+        retry_budget: Optional[RetryBudget] = ...,
+        retry_keyed_writes: bool = ...
     ) -> None: ...
     
+    def _setup_connection_pool(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: bool,
+        connection_pool: Optional[ConnectionPool]
+    ) -> None: ...
+
+    @property
+    def connection_pool(self) -> ConnectionPool: ...
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]: ...
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]: ...
+
+    @property
+    def json_codec(self) -> JsonCodec: ...
+
+    @property
+    def transport(self) -> Transport: ...
+
+    @property
+    def hedge_policy(self) -> Optional[HedgePolicy]: ...
+
+    @property
+    def circuit_breakers(self) -> CircuitBreakerRegistry: ...
+
+    @property
+    def request_coalescer(self) -> Optional[RequestCoalescer]: ...
+
+    @property
+    def request_metrics(self) -> RequestMetrics: ...
+
+    @property
+    def request_profiler(self) -> Optional[RequestProfiler]: ...
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]: ...
+
+    @property
+    def timeout_budget(self) -> Optional[float]: ...
+
     def _init_session(self) -> None: ...
+
+    def close(self) -> None: ...
+
+    def map(
+        self,
+        func: Callable[..., Any],
+        items: Iterable[Any],
+        max_concurrency: Optional[int] = ...
+    ) -> List[BatchResult]: ...
+
+    def batch(self, max_concurrency: Optional[int] = ..., max_pending: Optional[int] = ...) -> BatchExecutor: ...
     
     def default_headers(self) -> Dict[str, str]: ...
     
@@ -161,6 +239,8 @@ class PortClient:
         retries: Optional[int] = ...,
         retry_delay: Optional[float] = ...,
         correlation_id: Optional[str] = ...,
+        timeout_budget: Optional[float] = ...,
+        deadline: Optional[Deadline] = ...,
         **kwargs
     ) -> requests.Response: ...
     
@@ -0,0 +1,160 @@
+"""
+Endpoint classification for the Port API client.
+
+This module groups API endpoints into classes with similar cost and rate
+limit behaviour, so that request-layer features such as rate limiting can
+apply different budgets to reads, writes and searches. It also lists the
+POST routes that only read (`SAFE_READ_ROUTES`), which the request layer
+retries, coalesces and caches like GET requests.
+"""
+import hashlib
+import json
+from typing import Any, Optional
+
+#: Endpoint class for plain reads (GET, HEAD, OPTIONS)
+READ = "read"
+
+#: Endpoint class for writes (POST, PUT, PATCH, DELETE)
+WRITE = "write"
+
+#: Endpoint class for search and aggregation queries, whatever their HTTP method
+SEARCH = "search"
+
+ENDPOINT_CLASSES = (READ, WRITE, SEARCH)
+
+# Final path segments of the search and aggregation routes
+_SEARCH_SEGMENTS = {"search", "aggregate", "aggregate-over-time", "properties-history"}
+
+_READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+#: Routes whose method is not idempotent but which only read, as (method, endpoint template) pairs.
+#: They are retried, hedged, coalesced and cached like GET requests, keyed on their JSON body.
+SAFE_READ_ROUTES = frozenset({
+    ("POST", "entities/search"),
+    ("POST", "blueprints/{id}/entities/search"),
+    ("POST", "entities/aggregate"),
+    ("POST", "entities/aggregate-over-time"),
+    ("POST", "entities/properties-history"),
+})
+
+
+def endpoint_class(method: str, endpoint: str) -> str:
+    """
+    Classify a request by endpoint.
+
+    Args:
+        method: The HTTP method of the request.
+        endpoint: The API endpoint, relative to the base URL (e.g. "blueprints/service/entities").
+
+    Returns:
+        One of READ, WRITE or SEARCH.
+
+    Examples:
+        >>> endpoint_class("POST", "blueprints/service/entities/search")
+        'search'
+        >>> endpoint_class("GET", "blueprints/service")
+        'read'
+    """
+    path = endpoint.split('?', 1)[0].strip('/')
+    if path.rsplit('/', 1)[-1] in _SEARCH_SEGMENTS:
+        return SEARCH
+    if method.upper() in _READ_METHODS:
+        return READ
+    return WRITE
+
+
+# Literal path segments of the API routes; any other segment is an identifier
+_ROUTE_SEGMENTS = {
+    "access_token", "actions", "aggregate", "aggregate-over-time", "all-entities", "approval", "approvers", "apps",
+    "audit", "audit-log", "auth", "blueprints", "bulk", "cancel", "checklists", "config", "data-sources",
+    "entities", "entities-count", "examples", "folders", "integration", "integrations", "invite", "items", "kinds",
+    "logs", "migrations", "mirror", "organization", "organizations", "pages", "permissions", "properties",
+    "properties-history", "relations", "rename", "roles", "rotate-secret", "runs", "scorecards", "search",
+    "secrets", "sidebars", "structure", "system", "teams", "users", "validate", "webhooks", "widgets",
+}
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Replace the identifiers in an endpoint with placeholders.
+
+    Requests to the same route get the same template whatever resource they
+    address, which makes templates suitable keys for per-route state such as
+    circuit breakers.
+
+    Args:
+        endpoint: The API endpoint, relative to the base URL (e.g. "blueprints/service/entities/api").
+
+    Returns:
+        The endpoint with every identifier segment replaced by "{id}".
+
+    Examples:
+        >>> endpoint_template("blueprints/service/entities/api")
+        'blueprints/{id}/entities/{id}'
+        >>> endpoint_template("blueprints/service/entities/search")
+        'blueprints/{id}/entities/search'
+    """
+    path = endpoint.split('?', 1)[0].strip('/')
+    return '/'.join(segment if segment in _ROUTE_SEGMENTS else "{id}" for segment in path.split('/') if segment)
+
+
+def is_safe_read(method: str, endpoint: Optional[str]) -> bool:
+    """
+    Check whether a request only reads, whatever its method.
+
+    Args:
+        method: The HTTP method of the request.
+        endpoint: The API endpoint, or None if it is unknown.
+
+    Returns:
+        True for GET, HEAD and OPTIONS requests and for the routes in SAFE_READ_ROUTES.
+
+    Examples:
+        >>> is_safe_read("POST", "blueprints/service/entities/search")
+        True
+        >>> is_safe_read("POST", "blueprints/service/entities")
+        False
+    """
+    method = method.upper()
+    if method in _READ_METHODS:
+        return True
+    return endpoint is not None and (method, endpoint_template(endpoint)) in SAFE_READ_ROUTES
+
+
+def body_digest(json_body: Any = None, data: Any = None) -> Optional[str]:
+    """
+    Hash a request body so that equal queries get equal keys.
+
+    JSON bodies are serialized with sorted keys first, so two dictionaries
+    with the same content hash the same whatever their key order.
+
+    Args:
+        json_body: The `json=` body of the request.
+        data: The `data=` body of the request, used if there is no JSON body.
+
+    Returns:
+        The SHA-256 hex digest of the body, or None if the request has no body.
+    """
+    if json_body is not None:
+        data = json.dumps(json_body, sort_keys=True, separators=(',', ':'), default=str)
+    if data is None:
+        return None
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    elif not isinstance(data, (bytes, bytearray)):
+        data = repr(data).encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def resource_family(endpoint: str) -> str:
+    """
+    Get the top-level resource of an endpoint.
+
+    Args:
+        endpoint: The API endpoint, relative to the base URL.
+
+    Returns:
+        The first path segment (e.g. "blueprints" for "blueprints/service/entities").
+    """
+    return endpoint.split('?', 1)[0].strip('/').split('/', 1)[0]
@@ -0,0 +1,110 @@
+"""
+Connection pooling module for the Port API client.
+
+This module provides the ConnectionPool class, which owns the urllib3
+connection pools used by PortClient. A pool can be shared by several
+PortClient instances (for example one client per Port organization) so that
+they reuse the same keep-alive connections, and it is also used for
+authentication requests so token fetches do not open a fresh TLS connection.
+
+Example:
+    ```python
+    from pyport import PortClient
+    from pyport.client import ConnectionPool
+
+    pool = ConnectionPool(pool_maxsize=64, pool_block=True)
+    org_a = PortClient(client_id="...", client_secret="...", connection_pool=pool)
+    org_b = PortClient(client_id="...", client_secret="...", connection_pool=pool)
+    ```
+"""
+
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class ConnectionPool:
+    """
+    HTTP connection pool shared by the sessions of one or more clients.
+
+    Each client still gets its own `requests.Session` (so headers such as the
+    Authorization token are never shared), but every session mounts the same
+    `HTTPAdapter`, which is where requests keeps its connection pools.
+
+    Attributes:
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept per host.
+        pool_block: Whether to block when the pool is exhausted instead of
+            opening (and later discarding) an extra connection.
+        keep_alive: Whether to keep connections open between requests.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, keep_alive: bool = True):
+        """
+        Initialize the ConnectionPool.
+
+        Args:
+            pool_connections: Number of per-host connection pools to cache (default: 10).
+            pool_maxsize: Maximum number of connections kept per host (default: 10).
+                Set this to at least the number of threads making requests concurrently.
+            pool_block: Whether to block when all connections are in use (default: False).
+                When False, extra connections are opened and then discarded, which
+                is what produces the "connection pool is full" warning.
+            keep_alive: Whether to keep connections open between requests (default: True).
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=0  # Retries are handled by RetryConfig
+        )
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def adapter(self) -> HTTPAdapter:
+        """The HTTPAdapter that holds the connection pools."""
+        return self._adapter
+
+    def create_session(self, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+        """
+        Create a new session that sends its requests through this pool.
+
+        Args:
+            headers: Default headers for the session.
+
+        Returns:
+            A requests.Session with this pool's adapter mounted for http and https.
+        """
+        session = requests.Session()
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        if headers:
+            session.headers.update(headers)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._lock:
+            if not self._closed:
+                self._adapter.close()
+                self._closed = True
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pool configuration."""
+        return (
+            f"ConnectionPool(pool_connections={self.pool_connections}, pool_maxsize={self.pool_maxsize}, "
+            f"pool_block={self.pool_block}, keep_alive={self.keep_alive})"
+        )
@@ -7,13 +7,30 @@ This module handles HTTP requests to the Port API, including:
 - Retry logic
 """
 
-from typing import Optional, TypeVar, Callable
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
 
 import requests
 
-from ..error_handling import handle_error_response, handle_request_exception, with_error_handling
+from ..codec import JsonCodec, get_codec, install_json_decoder
+from ..constants import IDEMPOTENCY_KEY_HEADER
+from ..deadline import Deadline, Timeout, current_deadline, deadline as deadline_scope
+from ..error_handling import (
+    handle_error_response, handle_httpx_exception, handle_request_exception, with_error_handling
+)
+from ..exceptions import PortDeadlineExceededError
 from ..logging import log_request, log_response, log_error, get_correlation_id, logger
-from ..retry import RetryConfig, with_retry
+from ..retry import RetryConfig, with_async_retry, with_retry
+from .transport import RequestsTransport, Transport
+
+if TYPE_CHECKING:
+    from ..cache import ResponseCache
+    from ..coalesce import RequestCoalescer
+    from ..hedging import HedgePolicy
+    from ..metrics import RequestMetrics
+    from ..profiling import RequestProfiler, RequestTimings
+    from ..rate_limit import RateLimiter
 
 # Type variable for generic functions
 T = TypeVar('T')
@@ -26,7 +43,19 @@ class RequestManager:
     This class handles request preparation, execution, and response processing.
     """
 
-    def __init__(self, api_url: str, session: requests.Session, retry_config: RetryConfig):
+    def __init__(self, api_url: str, session: requests.Session, retry_config: RetryConfig,
+                 rate_limiter: Optional["RateLimiter"] = None,
+                 response_cache: Optional["ResponseCache"] = None,
+                 json_codec: Optional[JsonCodec] = None,
+                 token_refresher: Optional[Callable[[Optional[str]], Optional[str]]] = None,
+                 timeout: Optional[Timeout] = None,
+                 timeout_budget: Optional[float] = None,
+                 hedge_policy: Optional["HedgePolicy"] = None,
+                 transport: Optional[Transport] = None,
+                 request_coalescer: Optional["RequestCoalescer"] = None,
+                 request_metrics: Optional["RequestMetrics"] = None,
+                 request_profiler: Optional["RequestProfiler"] = None,
+                 idempotency_keys: bool = True):
         """
         Initialize the RequestManager.
 
@@ -34,10 +63,48 @@ class RequestManager:
             api_url: The base URL for the Port API.
             session: The requests session to use.
             retry_config: The retry configuration to use.
+            rate_limiter: Optional rate limiter that paces requests before they are sent.
+            response_cache: Optional cache for GET responses.
+            json_codec: Codec for request and response bodies (default: the fastest installed one).
+            token_refresher: Optional callable invoked with the rejected token when a request gets a
+                401. It returns a new token (already applied to the session), or None, in which case
+                the 401 is raised as usual.
+            timeout: Default per-attempt timeout in seconds, or a (connect, read) tuple, used when a
+                call does not pass `timeout=`. None waits indefinitely.
+            timeout_budget: Default total time in seconds for a call, including retries and the
+                delays between them. None leaves calls unbounded.
+            hedge_policy: Optional policy for hedging requests made with an idempotent method
+                or to a read-only POST route (see RetryConfig.is_idempotent).
+            transport: The transport requests are sent through (default: a RequestsTransport
+                on the session). Other transports send the session's headers with each request.
+            request_coalescer: Optional coalescer sharing one in-flight call between concurrent
+                identical GET and HEAD requests.
+            request_metrics: Optional registry recording latency, sizes, status codes, retries
+                and circuit breaker events of each request by endpoint template.
+            request_profiler: Optional profiler recording the time spent in each phase of a
+                sample of requests (queue, connect, TTFB, download, parse, logging).
+            idempotency_keys: Whether to send an Idempotency-Key header, generated once per call
+                and kept across its retries, with requests whose method is not idempotent.
         """
         self.api_url = api_url
         self._session = session
         self.retry_config = retry_config
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.json_codec = json_codec or get_codec()
+        self.token_refresher = token_refresher
+        self.timeout = timeout
+        self.timeout_budget = timeout_budget
+        self.hedge_policy = hedge_policy
+        self.request_coalescer = request_coalescer
+        self.request_metrics = request_metrics
+        self.request_profiler = request_profiler
+        self.idempotency_keys = idempotency_keys
+        if transport is None and session is not None:
+            transport = RequestsTransport(session)
+        elif transport is not None and session is not None:
+            transport.bind(session.headers)
+        self.transport = transport
         self._logger = logger
 
     def make_request(
@@ -47,6 +114,8 @@ class RequestManager:
         retries: Optional[int] = None,
         retry_delay: Optional[float] = None,
         correlation_id: Optional[str] = None,
+        timeout_budget: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
         **kwargs
     ) -> requests.Response:
         """
@@ -76,13 +145,20 @@ class RequestManager:
             correlation_id: A correlation ID for tracking the request.
                 If None, a new ID will be generated.
                 This ID is included in logs and can be used to trace a request through the system.
+            timeout_budget: Total time in seconds for this call, including retries and the delays
+                between them. If None, uses the client's default (self.timeout_budget).
+            deadline: A `pyport.deadline.Deadline` shared with other calls. The earliest of this,
+                the timeout budget and any enclosing `pyport.deadline.deadline()` block applies.
             **kwargs: Additional parameters passed to requests.request.
                 Common parameters include:
                 - params: Dict of URL parameters
                 - json: Dict to be serialized as JSON in the request body
                 - data: Dict or string to be sent in the request body
                 - headers: Dict of HTTP headers to add/override
-                - timeout: Request timeout in seconds
+                - timeout: Per-attempt timeout in seconds (default: self.timeout), capped by the
+                  time left before the deadline
+                An Idempotency-Key header passed here is kept; otherwise one is generated for
+                non-idempotent methods when idempotency_keys is enabled.
 
         Returns:
             A requests.Response object containing the API response.
@@ -96,6 +172,7 @@ class RequestManager:
             PortRateLimitError: If the API rate limit is exceeded.
             PortServerError: If the server returns a 5xx error.
             PortTimeoutError: If the request times out.
+            PortDeadlineExceededError: If the deadline passes before the call completes.
             PortConnectionError: If there's a network connection error.
             PortApiError: Base class for all Port API errors.
         """
@@ -109,8 +186,89 @@ class RequestManager:
         # Create a retry configuration for this request
         local_config = self._create_request_retry_config(retries, retry_delay)
 
+        # Key non-idempotent writes once, so that every retry of this call sends the same key
+        kwargs = self._with_idempotency_key(method, endpoint, kwargs)
+
+        # Bound the call, retries included; the deadline is visible to the retry loop and each attempt
+        budget = timeout_budget if timeout_budget is not None else self.timeout_budget
+        with deadline_scope(deadline), deadline_scope(budget):
+            # Share the response of an identical read that is already in flight, if coalescing is enabled
+            coalescer = self.request_coalescer
+            if coalescer is not None and coalescer.is_coalescable(method, kwargs, endpoint):
+                key = coalescer.make_key(method, url, kwargs.get('params'), kwargs.get('headers'),
+                                         self._session.headers.get('Authorization'), kwargs.get('json'))
+                active = current_deadline()
+                return coalescer.execute(
+                    key, lambda: self._dispatch(method, url, endpoint, correlation_id, local_config, **kwargs),
+                    timeout=active.remaining() if active is not None else None)
+
+            return self._dispatch(method, url, endpoint, correlation_id, local_config, **kwargs)
+
+    def _dispatch(self, method: str, url: str, endpoint: str, correlation_id: str,
+                  retry_config: RetryConfig, **kwargs) -> requests.Response:
+        """
+        Execute a request through the response cache, if one is configured, with retry handling.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            url: The full URL to request.
+            endpoint: The API endpoint.
+            correlation_id: A correlation ID for tracking the request.
+            retry_config: The retry configuration to use.
+            **kwargs: Additional parameters passed to requests.request.
+
+        Returns:
+            A requests.Response object containing the API response.
+        """
+        # Serve from or populate the response cache, if one is configured
+        if self.response_cache is not None:
+            return self._make_cached_request(method, url, endpoint, correlation_id, retry_config, **kwargs)
+
         # Create a function with retry handling and execute it
-        return self._execute_request_with_retry(method, url, endpoint, correlation_id, local_config, **kwargs)
+        return self._execute_request_with_retry(method, url, endpoint, correlation_id, retry_config, **kwargs)
+
+    def _make_cached_request(self, method: str, url: str, endpoint: str,
+                             correlation_id: str, retry_config: RetryConfig,
+                             **kwargs) -> requests.Response:
+        """
+        Execute a request through the response cache.
+
+        Fresh entries are returned without contacting the API. Expired entries are
+        revalidated with a conditional GET and reused on 304 Not Modified. Writes
+        invalidate the cached entries for the resource path they touch.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            url: The full URL to request.
+            endpoint: The API endpoint.
+            correlation_id: A correlation ID for tracking the request.
+            retry_config: The retry configuration to use.
+            **kwargs: Additional parameters passed to requests.request.
+
+        Returns:
+            A requests.Response object containing the API response.
+        """
+        cache = self.response_cache
+        if kwargs.get('stream') or kwargs.get('data') is not None or not cache.is_cacheable(method, endpoint):
+            try:
+                return self._execute_request_with_retry(method, url, endpoint, correlation_id, retry_config, **kwargs)
+            finally:
+                # Invalidate even if the write failed: it may have been applied before the error
+                cache.invalidate(method, endpoint)
+
+        key = cache.make_key(url, kwargs.get('params'), kwargs.get('json'))
+        entry = cache.get(key)
+        if entry is not None and entry.is_fresh():
+            self._logger.debug(f"Cache hit for {method} {endpoint}")
+            return entry.to_response()
+        if entry is not None:
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), **entry.validators()}
+
+        response = self._execute_request_with_retry(method, url, endpoint, correlation_id, retry_config, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            return cache.revalidate(key, entry, response).to_response()
+        cache.store(key, endpoint, response)
+        return response
 
     def _build_request_url(self, endpoint: str) -> str:
         """
@@ -148,11 +306,34 @@ class RequestManager:
                 retry_status_codes=self.retry_config.retry_status_codes,
                 retry_on=self.retry_config.retry_on,
                 idempotent_methods=self.retry_config.idempotent_methods,
-                retry_hook=self.retry_config.retry_hook
+                circuit_breaker=self.retry_config.circuit_breaker,
+                retry_hook=self.retry_config.retry_hook,
+                circuit_breakers=self.retry_config.circuit_breakers,
+                retry_budget=self.retry_config.retry_budget,
+                retry_keyed_writes=self.retry_config.retry_keyed_writes
             )
         else:
             return self.retry_config
 
+    def _with_idempotency_key(self, method: str, endpoint: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add a generated Idempotency-Key header to a request that is not idempotent.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            endpoint: The API endpoint.
+            kwargs: The request parameters.
+
+        Returns:
+            The request parameters, with the key added to a copy of their headers if needed.
+        """
+        if not self.idempotency_keys or self.retry_config.is_idempotent(method, endpoint):
+            return kwargs
+        headers = kwargs.get('headers') or {}
+        if any(name.lower() == IDEMPOTENCY_KEY_HEADER.lower() for name in headers):
+            return kwargs
+        return {**kwargs, 'headers': {**headers, IDEMPOTENCY_KEY_HEADER: str(uuid.uuid4())}}
+
     def _execute_request_with_retry(self, method: str, url: str, endpoint: str,
                                     correlation_id: str, retry_config: RetryConfig,
                                     **kwargs) -> requests.Response:
@@ -176,8 +357,10 @@ class RequestManager:
             request_kwargs.pop('method', None)
             return self._make_single_request(method_arg, url, endpoint, correlation_id, **request_kwargs)
 
-        # Apply the retry decorator to the function
-        make_request_with_retry = with_retry(_make_request_impl, config=retry_config)
+        # Apply the retry decorator to the function, guarded by the endpoint's circuit breaker
+        make_request_with_retry = with_retry(_make_request_impl, config=retry_config,
+                                             circuit_breaker=retry_config.get_circuit_breaker(method, endpoint),
+                                             on_event=self._metrics_hook(method, endpoint), endpoint=endpoint)
 
         # Make a copy of kwargs to avoid modifying the original
         request_kwargs = kwargs.copy()
@@ -207,24 +390,179 @@ class RequestManager:
         Raises:
             PortApiError: If the request fails.
         """
+        timings = self.request_profiler.start(method, endpoint) if self.request_profiler is not None else None
         try:
             # Log the request
+            logged = time.perf_counter()
             log_request(method, url, params=kwargs.get('params'), json_data=kwargs.get('json'),
-                        data=kwargs.get('data'), headers=kwargs.get('headers'), correlation_id=correlation_id)
+                        data=kwargs.get('data'), headers=kwargs.get('headers'), correlation_id=correlation_id,
+                        codec=self.json_codec)
+            if timings is not None:
+                timings.log += time.perf_counter() - logged
+            kwargs = self._encode_json_body(kwargs)
 
             # Make the request
-            response = self._session.request(method, url, **kwargs)
+            authorization = self._session.headers.get('Authorization')
+            response = self._timed_send(method, url, endpoint, timings, **kwargs)
+
+            # A rejected token is refreshed (once across threads) and the request replayed once
+            if response.status_code == 401 and self.token_refresher is not None:
+                if self.token_refresher(_bearer_token(authorization)) is not None:
+                    self._logger.debug(f"Replaying {method} {endpoint} with a refreshed token")
+                    response = self._timed_send(method, url, endpoint, timings, **kwargs)
 
             # Handle the response
-            return self._handle_response(response, endpoint, method, correlation_id)
+            return self._handle_response(response, endpoint, method, correlation_id,
+                                         stream=bool(kwargs.get('stream')), timings=timings)
         except requests.RequestException as e:
             # Convert requests exceptions to Port exceptions
             error = handle_request_exception(e, endpoint, method)
             log_error(error, correlation_id)
             raise error
+        finally:
+            if timings is not None:
+                self.request_profiler.finish(timings)
+
+    def _timed_send(self, method: str, url: str, endpoint: str, timings: Optional["RequestTimings"] = None,
+                    **kwargs) -> requests.Response:
+        """
+        Send a request with `_send`, recording it in the request metrics and timings if they are enabled.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            url: The full URL to request.
+            endpoint: The API endpoint.
+            timings: The timings of a profiled request, or None.
+            **kwargs: Additional parameters passed to requests.request.
+
+        Returns:
+            The raw HTTP response.
+        """
+        if self.request_metrics is None and timings is None:
+            return self._send(method, url, endpoint, **kwargs)
+        started = time.perf_counter()
+        try:
+            response = self._send(method, url, endpoint, **kwargs)
+        except Exception:
+            if self.request_metrics is not None:
+                self.request_metrics.record_error(method, endpoint, time.perf_counter() - started,
+                                                  _body_size(kwargs.get('data')))
+            raise
+        if self.request_metrics is not None:
+            self._record_response(method, endpoint, kwargs, response, time.perf_counter() - started)
+        if timings is not None:
+            _record_send_timings(timings, response)
+        return response
+
+    def _record_response(self, method: str, endpoint: str, kwargs: Dict[str, Any], response: Any,
+                         latency: float) -> None:
+        """
+        Record a response in the request metrics.
+
+        The response size is the Content-Length of streamed responses, whose body is
+        not read here, and the length of the body otherwise.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            endpoint: The API endpoint.
+            kwargs: The request parameters, with the JSON body already encoded.
+            response: The raw HTTP response.
+            latency: Time in seconds until the response was received.
+        """
+        if kwargs.get('stream'):
+            response_bytes = int(response.headers.get('Content-Length') or 0)
+        else:
+            response_bytes = _body_size(response.content)
+        self.request_metrics.record_response(method, endpoint, response.status_code, latency,
+                                             _body_size(kwargs.get('data')), response_bytes)
+
+    def _metrics_hook(self, method: str, endpoint: str) -> Optional[Callable[[str], None]]:
+        """
+        Get the callback recording the retry and circuit breaker events of a request.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            endpoint: The API endpoint.
+
+        Returns:
+            The `on_event` callback for `with_retry`, or None if metrics are disabled.
+        """
+        if self.request_metrics is None:
+            return None
+        return lambda event: self.request_metrics.record_event(method, endpoint, event)
+
+    def _send(self, method: str, url: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Send a request, hedging it if a hedge policy is configured and the request is idempotent.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            url: The full URL to request.
+            endpoint: The API endpoint.
+            **kwargs: Additional parameters passed to requests.request.
+
+        Returns:
+            The raw HTTP response.
+        """
+        if (self.hedge_policy is not None and not kwargs.get('stream')
+                and self.retry_config.is_idempotent(method, endpoint)):
+            return self.hedge_policy.execute(lambda: self._send_once(method, url, endpoint, **kwargs))
+        return self._send_once(method, url, endpoint, **kwargs)
+
+    def _send_once(self, method: str, url: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the transport, pacing it with the rate limiter if one is configured.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            url: The full URL to request.
+            endpoint: The API endpoint.
+            **kwargs: Additional parameters passed to requests.request.
+
+        Returns:
+            The raw HTTP response.
+        """
+        queued = time.perf_counter() if self.request_profiler is not None else None
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, endpoint)
+        sent = time.perf_counter() if queued is not None else None
+        response = self.transport.request(method, url, **self._with_timeout(method, endpoint, kwargs))
+        if sent is not None:
+            # Stamp the attempt's own timings: with hedging, only the winning attempt is reported
+            response._pyport_send_timings = (sent - queued, time.perf_counter() - sent)
+        if self.rate_limiter is not None:
+            self.rate_limiter.record_response(method, endpoint, response.status_code, response.headers)
+        return response
+
+    def _with_timeout(self, method: str, endpoint: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Set the timeout for an attempt from the client default and the active deadline.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            endpoint: The API endpoint (for error reporting).
+            kwargs: The request parameters.
+
+        Returns:
+            The request parameters with `timeout` set, capped by the time left before the deadline.
+
+        Raises:
+            PortDeadlineExceededError: If the deadline has already passed.
+        """
+        timeout = kwargs.get('timeout', self.timeout)
+        deadline = current_deadline()
+        if deadline is not None:
+            if deadline.expired():
+                raise PortDeadlineExceededError("Deadline exceeded before the request was sent",
+                                                endpoint=endpoint, method=method)
+            timeout = deadline.cap_timeout(timeout)
+        if timeout is None:
+            return kwargs
+        return dict(kwargs, timeout=timeout)
 
     def _handle_response(
-        self, response: requests.Response, endpoint: str, method: str, correlation_id: str
+        self, response: requests.Response, endpoint: str, method: str, correlation_id: str,
+        stream: bool = False, timings: Optional["RequestTimings"] = None
     ) -> requests.Response:
         """
         Handle the response, returning it if successful or raising an appropriate exception.
@@ -234,6 +572,11 @@ class RequestManager:
             endpoint: The API endpoint.
             method: The HTTP method.
             correlation_id: A correlation ID for tracking the request.
+            stream: Whether the body is streamed. Successful streamed bodies are left unread
+                for the caller, so they are not logged.
+            timings: The timings of a profiled request. The body is then parsed here, so that
+                parsing and logging are timed separately, and the timings are attached to the
+                response as `response.timings`.
 
         Returns:
             The HTTP response if successful.
@@ -241,11 +584,29 @@ class RequestManager:
         Raises:
             PortApiError: If the response indicates an error.
         """
+        # Parse JSON bodies with the configured codec, once per response
+        if isinstance(response, requests.Response):
+            install_json_decoder(response, self.json_codec)
+
+        if timings is not None:
+            timings.status_code = response.status_code
+            response.timings = timings
+            if not stream and response.content:
+                parsing = time.perf_counter()
+                try:
+                    response.json()
+                    timings.parse = time.perf_counter() - parsing
+                except ValueError:
+                    pass  # Not JSON: the caller gets the error if it parses the body
+
         # Log the response
-        log_response(response, correlation_id)
+        logged = time.perf_counter()
+        log_response(response, correlation_id, include_body=not stream, codec=self.json_codec)
+        if timings is not None:
+            timings.log += time.perf_counter() - logged
 
-        # Check if the response is successful
-        if 200 <= response.status_code < 300:
+        # Check if the response is successful (304 only answers conditional requests)
+        if 200 <= response.status_code < 300 or response.status_code == 304:
             return response
         else:
             # Handle error response
@@ -253,6 +614,27 @@ class RequestManager:
             log_error(error, correlation_id)
             raise error
 
+    def _encode_json_body(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Serialize a `json=` request body with the configured codec.
+
+        Args:
+            kwargs: The request parameters.
+
+        Returns:
+            The request parameters with the body moved from `json` to `data`,
+            or the original parameters if there is no JSON body to encode.
+        """
+        if kwargs.get('json') is None or kwargs.get('data') is not None:
+            return kwargs
+        kwargs = dict(kwargs)
+        headers = dict(kwargs.get('headers') or {})
+        if not any(name.lower() == 'content-type' for name in headers):
+            headers['Content-Type'] = 'application/json'
+        kwargs['headers'] = headers
+        kwargs['data'] = self.json_codec.dumps(kwargs.pop('json'))
+        return kwargs
+
     def _log_retry_attempt(self, error: Exception, attempt: int, delay: float):
         """
         Log a retry attempt.
@@ -292,3 +674,293 @@ class RequestManager:
 
         # Execute the decorated function
         return decorated_func(*args, **kwargs)
+
+
+def _bearer_token(authorization: Optional[str]) -> Optional[str]:
+    """
+    Extract the token from an Authorization header value.
+
+    Args:
+        authorization: The header value (e.g. "Bearer <token>").
+
+    Returns:
+        The token, or None if the header is missing.
+    """
+    if not isinstance(authorization, str) or ' ' not in authorization:
+        return None
+    return authorization.split(' ', 1)[1]
+
+
+def _record_send_timings(timings: "RequestTimings", response: Any) -> None:
+    """
+    Add the phases of one send to the timings of a request.
+
+    The time to the response headers is the response's `elapsed`, when the
+    transport sets it; the rest of the transport call is the body download.
+    Connection setup is only known when the transport reports it in
+    `connect_elapsed` (HttpxTransport).
+
+    Args:
+        timings: The timings of the request.
+        response: The response, stamped by `_send_once`.
+    """
+    queue, transfer = getattr(response, '_pyport_send_timings', (0.0, 0.0))
+    elapsed = response.elapsed.total_seconds() if getattr(response, 'elapsed', None) else 0.0
+    headers = elapsed if 0 < elapsed <= transfer else transfer
+    connect = getattr(response, 'connect_elapsed', None)
+    if connect is not None:
+        connect = min(connect, headers)
+        timings.connect = (timings.connect or 0.0) + connect
+        headers -= connect
+    timings.queue += queue
+    timings.ttfb += headers
+    timings.download += transfer - headers - (connect or 0.0)
+
+
+def _body_size(data: Any) -> int:
+    """
+    Get the size in bytes of a request or response body.
+
+    Args:
+        data: The body (bytes or str), or None.
+
+    Returns:
+        The size, or 0 if there is no body or it is streamed from a file or generator.
+    """
+    if isinstance(data, str):
+        return len(data.encode('utf-8'))
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    return 0
+
+
+class AsyncRequestManager(RequestManager):
+    """
+    Manages HTTP requests to the Port API for the asyncio client.
+
+    Response handling, URL building and retry configuration are inherited from
+    `RequestManager`; only the transport (an `httpx.AsyncClient`) and the retry
+    loop (`with_async_retry`) differ.
+    """
+
+    def __init__(self, api_url: str, http_client, retry_config: RetryConfig,
+                 token_provider: Callable[[], Awaitable[str]],
+                 token_refresher: Optional[Callable[[Optional[str]], Awaitable[Optional[str]]]] = None,
+                 timeout: Optional[float] = None,
+                 timeout_budget: Optional[float] = None,
+                 request_metrics: Optional["RequestMetrics"] = None,
+                 idempotency_keys: bool = True):
+        """
+        Initialize the AsyncRequestManager.
+
+        Args:
+            api_url: The base URL for the Port API.
+            http_client: The httpx.AsyncClient to use.
+            retry_config: The retry configuration to use.
+            token_provider: Coroutine function returning a valid access token.
+            token_refresher: Optional coroutine function called with the rejected token when a
+                request gets a 401. It returns a new token, with which the request is replayed
+                once, or None, in which case the 401 is raised as usual.
+            timeout: Default per-attempt timeout in seconds, capped by the active deadline
+                (None: the http_client's own timeout).
+            timeout_budget: Default total time in seconds for a call, including retries.
+            request_metrics: Optional registry recording the metrics of each request.
+            idempotency_keys: Whether to send an Idempotency-Key header with requests whose
+                method is not idempotent.
+        """
+        super().__init__(api_url=api_url, session=None, retry_config=retry_config,
+                         timeout=timeout, timeout_budget=timeout_budget, request_metrics=request_metrics,
+                         idempotency_keys=idempotency_keys)
+        self._http_client = http_client
+        self._token_provider = token_provider
+        self.token_refresher = token_refresher
+
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        retries: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        correlation_id: Optional[str] = None,
+        timeout_budget: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
+        **kwargs
+    ):
+        """
+        Make an HTTP request to the API with error handling and retry logic.
+
+        Accepts the same arguments as `RequestManager.make_request`.
+
+        Returns:
+            An httpx.Response object containing the API response.
+
+        Raises:
+            PortApiError: If the request fails.
+        """
+        if correlation_id is None:
+            correlation_id = get_correlation_id()
+
+        url = self._build_request_url(endpoint)
+        local_config = self._create_request_retry_config(retries, retry_delay)
+        kwargs = self._with_idempotency_key(method, endpoint, kwargs)
+
+        budget = timeout_budget if timeout_budget is not None else self.timeout_budget
+        with deadline_scope(deadline), deadline_scope(budget):
+            return await self._execute_request_with_retry(method, url, endpoint, correlation_id, local_config,
+                                                          **kwargs)
+
+    async def _execute_request_with_retry(self, method: str, url: str, endpoint: str,
+                                          correlation_id: str, retry_config: RetryConfig,
+                                          **kwargs):
+        """
+        Execute a request with asynchronous retry handling.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            url: The full URL to request.
+            endpoint: The API endpoint (for error reporting).
+            correlation_id: A correlation ID for tracking the request.
+            retry_config: The retry configuration to use.
+            **kwargs: Additional request parameters.
+
+        Returns:
+            An httpx.Response object containing the API response.
+        """
+        async def _make_request_impl(method_arg, url, endpoint, correlation_id, **request_kwargs):
+            request_kwargs.pop('method', None)
+            return await self._make_single_request(method_arg, url, endpoint, correlation_id, **request_kwargs)
+
+        make_request_with_retry = with_async_retry(_make_request_impl, config=retry_config,
+                                                   circuit_breaker=retry_config.get_circuit_breaker(method, endpoint),
+                                                   on_event=self._metrics_hook(method, endpoint),
+                                                   endpoint=endpoint)
+
+        request_kwargs = kwargs.copy()
+        request_kwargs['method'] = method
+
+        return await make_request_with_retry(method, url, endpoint, correlation_id, **request_kwargs)
+
+    async def _make_single_request(self, method: str, url: str, endpoint: str, correlation_id: str, **kwargs):
+        """
+        Make a single HTTP request to the API.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            url: The full URL to request.
+            endpoint: The API endpoint (for error reporting).
+            correlation_id: A correlation ID for tracking the request.
+            **kwargs: Additional request parameters, in requests style.
+
+        Returns:
+            An httpx.Response object containing the API response.
+
+        Raises:
+            PortApiError: If the request fails.
+        """
+        import httpx
+
+        token = await self._token_provider()
+        headers = dict(kwargs.pop('headers', None) or {})
+        # A caller-provided Authorization header is sent as is, and not refreshed on a 401
+        refreshable = "Authorization" not in headers
+        headers.setdefault("Authorization", f"Bearer {token}")
+
+        started = time.perf_counter()
+        try:
+            log_request(method, url, params=kwargs.get('params'), json_data=kwargs.get('json'),
+                        data=kwargs.get('data'), headers=headers, correlation_id=correlation_id,
+                        codec=self.json_codec)
+            kwargs = self._encode_json_body(dict(kwargs, headers=headers))
+            kwargs = self._with_timeout(method, endpoint, kwargs)
+            headers = kwargs.pop('headers')
+
+            response, stream = await self._send_async(method, url, headers, kwargs)
+
+            # A rejected token is refreshed (once across coroutines) and the request replayed once
+            if response.status_code == 401 and refreshable and self.token_refresher is not None:
+                new_token = await self.token_refresher(token)
+                if new_token is not None:
+                    self._logger.debug(f"Replaying {method} {endpoint} with a refreshed token")
+                    headers["Authorization"] = f"Bearer {new_token}"
+                    response, stream = await self._send_async(method, url, headers, kwargs)
+            if self.request_metrics is not None:
+                self._record_response(method, endpoint, kwargs, response, time.perf_counter() - started)
+
+            return self._handle_response(response, endpoint, method, correlation_id, stream=stream)
+        except httpx.HTTPError as e:
+            if self.request_metrics is not None:
+                self.request_metrics.record_error(method, endpoint, time.perf_counter() - started,
+                                                  _body_size(kwargs.get('data')))
+            error = handle_httpx_exception(e, endpoint, method)
+            log_error(error, correlation_id)
+            raise error
+
+    async def _send_async(self, method: str, url: str, headers: Dict[str, str],
+                          kwargs: Dict[str, Any]) -> Tuple[Any, bool]:
+        """
+        Send a request, leaving the body of a successful streamed response unread.
+
+        Args:
+            method: HTTP method.
+            url: The full URL to request.
+            headers: The request headers.
+            kwargs: The request parameters, in requests style.
+
+        Returns:
+            A tuple of (httpx.Response, whether its body is left to be streamed).
+        """
+        if not kwargs.get('stream'):
+            response = await self._http_client.request(method, url, headers=headers, **self._to_httpx_kwargs(kwargs))
+            return response, False
+        response = await self._send_streamed(method, url, headers, kwargs)
+        # Error bodies are read here so they can be reported
+        if not 200 <= response.status_code < 300:
+            await response.aread()
+            return response, False
+        return response, True
+
+    async def _send_streamed(self, method: str, url: str, headers: Dict[str, str], kwargs: Dict[str, Any]):
+        """
+        Send a request whose response body is left unread for the caller.
+
+        Args:
+            method: HTTP method.
+            url: The full URL to request.
+            headers: The request headers.
+            kwargs: The request parameters, in requests style.
+
+        Returns:
+            An httpx.Response whose body can be read with `aiter_bytes` and must be
+            closed with `aclose`.
+        """
+        httpx_kwargs = self._to_httpx_kwargs(kwargs)
+        follow_redirects = httpx_kwargs.pop('follow_redirects', None)
+        request = self._http_client.build_request(method, url, headers=headers, **httpx_kwargs)
+        if follow_redirects is None:
+            return await self._http_client.send(request, stream=True)
+        return await self._http_client.send(request, stream=True, follow_redirects=follow_redirects)
+
+    @staticmethod
+    def _to_httpx_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Translate requests-style keyword arguments to their httpx equivalents.
+
+        Service classes are shared between the synchronous and asynchronous
+        clients, so they pass arguments in requests style.
+
+        Args:
+            kwargs: The requests-style keyword arguments.
+
+        Returns:
+            The keyword arguments accepted by httpx.AsyncClient.request.
+        """
+        httpx_kwargs = {key: value for key, value in kwargs.items()
+                        if key in ('params', 'json', 'timeout') and value is not None}
+        data = kwargs.get('data')
+        if isinstance(data, (str, bytes)):
+            httpx_kwargs['content'] = data
+        elif data is not None:
+            httpx_kwargs['data'] = data
+        if 'allow_redirects' in kwargs:
+            httpx_kwargs['follow_redirects'] = kwargs['allow_redirects']
+        return httpx_kwargs
@@ -0,0 +1,112 @@
+"""
+Service registry for the Port API clients.
+
+This module maps the service attributes exposed by `PortClient` and
+`AsyncPortClient` (`client.blueprints`, `client.entities`, ...) to the
+modules that implement them. Service modules are imported the first time a
+service is used, so importing pyport and constructing a client stay cheap
+for short-lived scripts that only touch one or two services.
+"""
+
+import importlib
+import threading
+from typing import Dict, Tuple
+
+#: Service attribute name -> (module, class name), relative to the pyport package
+SERVICES: Dict[str, Tuple[str, str]] = {
+    "blueprints": (".blueprints.blueprint_api_svc", "Blueprints"),
+    "entities": (".entities.entities_api_svc", "Entities"),
+    "actions": (".actions.actions_api_svc", "Actions"),
+    "pages": (".pages.pages_api_svc", "Pages"),
+    "integrations": (".integrations.integrations_api_svc", "Integrations"),
+    "action_runs": (".action_runs.action_runs_api_svc", "ActionRuns"),
+    "organizations": (".organization.organization_api_svc", "Organizations"),
+    "teams": (".teams.teams_api_svc", "Teams"),
+    "users": (".users.users_api_svc", "Users"),
+    "roles": (".roles.roles_api_svc", "Roles"),
+    "audit": (".audit.audit_api_svc", "Audit"),
+    "migrations": (".migrations.migrations_api_svc", "Migrations"),
+    "search": (".search.search_api_svc", "Search"),
+    "sidebars": (".sidebars.sidebars_api_svc", "Sidebars"),
+    "checklist": (".checklist.checklist_api_svc", "Checklist"),
+    "apps": (".apps.apps_api_svc", "Apps"),
+    "scorecards": (".scorecards.scorecards_api_svc", "Scorecards"),
+    "webhooks": (".webhooks.webhooks_api_svc", "Webhooks"),
+}
+
+_PACKAGE = __name__.rsplit('.', 2)[0]
+
+
+def load_service_class(name: str) -> type:
+    """
+    Import and return the class implementing a service.
+
+    Args:
+        name: The service attribute name (e.g. "blueprints").
+
+    Returns:
+        The service class.
+
+    Raises:
+        KeyError: If the name is not a registered service.
+    """
+    module_name, class_name = SERVICES[name]
+    return getattr(importlib.import_module(module_name, _PACKAGE), class_name)
+
+
+class ServiceRegistry:
+    """
+    Per-client cache of service instances, created on first access.
+
+    Attributes:
+        owner: The client passed to every service constructor.
+    """
+
+    def __init__(self, owner, factory=None):
+        """
+        Initialize the ServiceRegistry.
+
+        Args:
+            owner: The client passed to every service constructor.
+            factory: Optional callable (owner, service_cls) -> service used instead of
+                calling the service class directly.
+        """
+        self.owner = owner
+        self._factory = factory
+        self._instances: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str):
+        """
+        Get the service instance for a name, creating it on first use.
+
+        Args:
+            name: The service attribute name (e.g. "blueprints").
+
+        Returns:
+            The service instance.
+
+        Raises:
+            KeyError: If the name is not a registered service.
+        """
+        service = self._instances.get(name)
+        if service is None:
+            with self._lock:
+                service = self._instances.get(name)
+                if service is None:
+                    service_cls = load_service_class(name)
+                    if self._factory is not None:
+                        service = self._factory(self.owner, service_cls)
+                    else:
+                        service = service_cls(self.owner)
+                    self._instances[name] = service
+        return service
+
+    def loaded(self) -> Tuple[str, ...]:
+        """
+        Get the names of the services created so far.
+
+        Returns:
+            A tuple of service names.
+        """
+        return tuple(self._instances)
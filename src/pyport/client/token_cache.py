@@ -0,0 +1,213 @@
+"""
+Token caches shared between clients and processes.
+
+Every PortClient normally fetches its own access token. When many processes
+start with the same credentials (cron jobs, worker pools), a token cache lets
+them reuse a token that is still valid and makes sure only one of them
+refreshes it at a time.
+
+Two backends are provided:
+
+- `MemoryTokenCache`: shared by the clients of a single process.
+- `FileTokenCache`: a JSON file guarded by an OS file lock, shared by every
+  process of the same user on the machine.
+
+Example:
+    ```python
+    from pyport import PortClient
+    from pyport.client.token_cache import FileTokenCache
+
+    client = PortClient(client_id="...", client_secret="...", token_cache=FileTokenCache())
+    ```
+
+Custom backends (Redis, a secrets store, ...) subclass `TokenCache` and
+implement `get`, `set` and `lock`.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+#: A cached token and the Unix time at which it expires
+CachedToken = Tuple[str, float]
+
+
+class TokenCache(ABC):
+    """
+    Base class for token cache backends.
+
+    Keys identify a set of credentials (see `token_cache_key`); values are the
+    token and its expiry time. `lock` must provide mutual exclusion across every
+    client sharing the backend, so that only one of them refreshes a token.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedToken]:
+        """
+        Get the cached token for a key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            A tuple of (token, expires_at), or None if nothing is cached.
+        """
+
+    @abstractmethod
+    def set(self, key: str, token: str, expires_at: float) -> None:
+        """
+        Store a token.
+
+        Args:
+            key: The cache key.
+            token: The access token.
+            expires_at: Unix time at which the token expires.
+        """
+
+    @abstractmethod
+    def lock(self, key: str):
+        """
+        Return a context manager that holds the refresh lock for a key.
+
+        Args:
+            key: The cache key.
+        """
+
+
+def token_cache_key(client_id: str, api_url: str) -> str:
+    """
+    Build the cache key for a set of credentials.
+
+    Args:
+        client_id: The API client ID.
+        api_url: The base URL of the API, which identifies the region.
+
+    Returns:
+        The cache key.
+    """
+    return f"{client_id}@{api_url}"
+
+
+class MemoryTokenCache(TokenCache):
+    """Token cache shared by the clients of a single process."""
+
+    def __init__(self):
+        """Initialize the MemoryTokenCache."""
+        self._tokens: Dict[str, CachedToken] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedToken]:
+        """Get the cached token for a key."""
+        return self._tokens.get(key)
+
+    def set(self, key: str, token: str, expires_at: float) -> None:
+        """Store a token."""
+        self._tokens[key] = (token, expires_at)
+
+    def lock(self, key: str):
+        """Return the lock for a key."""
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+
+class FileTokenCache(TokenCache):
+    """
+    Token cache stored in a JSON file and shared between processes.
+
+    Writes replace the file atomically and the file is only readable by its
+    owner. Refreshes are serialized with an exclusive lock on a companion
+    `.lock` file (fcntl on POSIX, msvcrt on Windows).
+
+    Attributes:
+        path: The path of the cache file.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the FileTokenCache.
+
+        Args:
+            path: The cache file (default: $XDG_CACHE_HOME/pyport/tokens.json,
+                or ~/.cache/pyport/tokens.json).
+        """
+        if path is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+            path = os.path.join(cache_home, "pyport", "tokens.json")
+        self.path = path
+        self._lock_path = f"{path}.lock"
+        self._thread_lock = threading.Lock()
+
+    def _read(self) -> Dict[str, list]:
+        """Read the cache file, treating a missing or corrupt file as empty."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Optional[CachedToken]:
+        """Get the cached token for a key."""
+        entry = self._read().get(key)
+        try:
+            return str(entry[0]), float(entry[1])
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+
+    def set(self, key: str, token: str, expires_at: float) -> None:
+        """Store a token, replacing the cache file atomically."""
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        data = self._read()
+        data[key] = [token, expires_at]
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tokens-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(data, handle)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock on the cache file across threads and processes."""
+        os.makedirs(os.path.dirname(self._lock_path) or ".", mode=0o700, exist_ok=True)
+        with self._thread_lock, open(self._lock_path, "a+") as handle:
+            _lock_file(handle)
+            try:
+                yield
+            finally:
+                _unlock_file(handle)
+
+
+def _lock_file(handle) -> None:
+    """Acquire an exclusive OS lock on an open file, blocking until it is available."""
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+    else:  # pragma: no cover - Windows
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(handle) -> None:
+    """Release the OS lock taken by `_lock_file`."""
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
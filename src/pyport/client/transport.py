@@ -0,0 +1,401 @@
+"""
+HTTP transports for the Port API client.
+
+`RequestManager` sends every request through a `Transport`. Transports take
+requests-style arguments and return `requests.Response` objects, so retries,
+rate limiting, caching, hedging and response handling work the same whichever
+transport is used.
+
+Three transports are provided:
+
+- `RequestsTransport`: the default, backed by the client's `requests.Session`.
+- `HttpxTransport`: backed by a synchronous `httpx.Client`, optionally over HTTP/2.
+  Requires `pip install pyport[http2]` (or `pyport[async]` for HTTP/1.1 only).
+- `InProcessTransport`: calls a Python function instead of opening a socket. It is
+  meant for tests, for measuring the client's own per-request overhead, and for
+  load simulations with many thousands of requests.
+
+Example:
+    ```python
+    from pyport import PortClient
+    from pyport.client.transport import InProcessTransport
+
+    def handler(request):
+        if request.path.endswith("/blueprints/service"):
+            return 200, {"ok": True, "blueprint": {"identifier": "service"}}
+        return 404, {"ok": False, "error": "not_found"}
+
+    client = PortClient(client_id="...", client_secret="...", skip_auth=True,
+                        transport=InProcessTransport(handler))
+    client.blueprints.get_blueprint("service")
+    ```
+"""
+
+import io
+import json
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Any, Callable, Dict, MutableMapping, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..exceptions import PortConfigurationError
+
+
+class Transport(ABC):
+    """
+    Base class for HTTP transports.
+
+    Subclasses implement `request`. Transports that do not use the client's
+    `requests.Session` receive its headers (including the Authorization
+    header, which changes when the token is refreshed) through `bind`.
+    """
+
+    base_headers: MutableMapping[str, str] = {}
+
+    def bind(self, headers: MutableMapping[str, str]) -> None:
+        """
+        Attach the client's default headers, which are sent with every request.
+
+        Args:
+            headers: A live mapping of default headers (the session's headers).
+        """
+        self.base_headers = headers
+
+    def merge_headers(self, headers: Optional[MutableMapping[str, str]]) -> Dict[str, str]:
+        """
+        Combine the default headers with the headers of one request.
+
+        Args:
+            headers: The request's own headers, which take precedence.
+
+        Returns:
+            The headers to send.
+        """
+        merged = CaseInsensitiveDict(self.base_headers)
+        merged.update(headers or {})
+        return dict(merged)
+
+    @abstractmethod
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST').
+            url: The full URL to request.
+            **kwargs: requests-style parameters (params, data, json, headers, timeout, stream, ...).
+
+        Returns:
+            The response.
+
+        Raises:
+            requests.RequestException: If the request cannot be completed.
+        """
+
+    def close(self) -> None:
+        """Release the transport's resources."""
+
+
+class RequestsTransport(Transport):
+    """
+    Transport backed by a `requests.Session`.
+
+    Attributes:
+        session: The session requests are sent on. Its own headers are used.
+    """
+
+    def __init__(self, session: requests.Session):
+        """
+        Initialize the RequestsTransport.
+
+        Args:
+            session: The session requests are sent on.
+        """
+        self.session = session
+
+    def bind(self, headers: MutableMapping[str, str]) -> None:
+        """Ignore the default headers: the session applies its own."""
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request on the session."""
+        return self.session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """Close the session."""
+        self.session.close()
+
+
+class HttpxTransport(Transport):
+    """
+    Transport backed by a synchronous `httpx.Client`, optionally using HTTP/2.
+
+    HTTP/2 multiplexes concurrent requests over one connection, which helps
+    clients running many threads against the same host. Responses are read
+    completely and converted to `requests.Response` objects, and httpx errors
+    are raised as the equivalent requests exceptions.
+
+    Like requests responses, converted responses carry the time until the
+    response headers arrived in `elapsed`. They also carry `connect_elapsed`,
+    the seconds spent opening the connection and its TLS session (0.0 when a
+    pooled connection was reused).
+
+    Attributes:
+        client: The httpx.Client requests are sent on.
+    """
+
+    def __init__(self, client: Any = None, http2: bool = False, **client_kwargs):
+        """
+        Initialize the HttpxTransport.
+
+        Args:
+            client: An existing httpx.Client. It is not closed by `close()`.
+            http2: Whether to enable HTTP/2 when creating the client (requires the h2 package).
+            **client_kwargs: Additional arguments for httpx.Client when creating it.
+
+        Raises:
+            PortConfigurationError: If httpx (or h2, with http2=True) is not installed.
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise PortConfigurationError(
+                "HttpxTransport requires the optional 'httpx' dependency. "
+                "Install it with `pip install pyport[http2]`."
+            ) from e
+        self._httpx = httpx
+        self._owns_client = client is None
+        if client is None:
+            try:
+                client = httpx.Client(http2=http2, **client_kwargs)
+            except ImportError as e:
+                raise PortConfigurationError(
+                    "HTTP/2 requires the optional 'h2' dependency. Install it with `pip install pyport[http2]`."
+                ) from e
+        self.client = client
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with httpx and convert the response."""
+        httpx = self._httpx
+        options: Dict[str, Any] = {"headers": self.merge_headers(kwargs.get('headers'))}
+        for name in ('params', 'json'):
+            if kwargs.get(name) is not None:
+                options[name] = kwargs[name]
+        data = kwargs.get('data')
+        if isinstance(data, (str, bytes)):
+            options['content'] = data
+        elif data is not None:
+            options['data'] = data
+        if kwargs.get('timeout') is not None:
+            timeout = kwargs['timeout']
+            options['timeout'] = (httpx.Timeout(timeout[1], connect=timeout[0])
+                                  if isinstance(timeout, tuple) else timeout)
+        follow_redirects = kwargs.get('allow_redirects', True)
+        stream = bool(kwargs.get('stream'))
+
+        trace = _PhaseTrace()
+        try:
+            request = self.client.build_request(method, url, extensions={"trace": trace}, **options)
+            response = self.client.send(request, stream=stream, follow_redirects=follow_redirects)
+        except httpx.HTTPError as e:
+            raise _requests_error(httpx, e) from e
+        if stream:
+            # Leave the body unread; iter_content pulls it from httpx chunk by chunk
+            converted = build_response(response.status_code, b"", response.headers, str(response.url),
+                                       reason=response.reason_phrase)
+            converted.raw = _HttpxBody(httpx, response)
+            converted._content = False
+        else:
+            converted = build_response(response.status_code, response.content, response.headers,
+                                       str(response.url), reason=response.reason_phrase)
+        if trace.headers is not None:
+            converted.elapsed = timedelta(seconds=trace.headers)
+            converted.connect_elapsed = trace.connect
+        return converted
+
+    def close(self) -> None:
+        """Close the httpx client if this transport created it."""
+        if self._owns_client:
+            self.client.close()
+
+
+class _HttpxBody:
+    """File-like reader over a streamed httpx response, closing the response once the body is read."""
+
+    def __init__(self, httpx: Any, response: Any):
+        self._httpx = httpx
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to `size` bytes (all remaining bytes if negative); b"" at the end of the body."""
+        try:
+            while not self._response.is_closed and (size < 0 or len(self._buffer) < size):
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    self.close()
+                    break
+                self._buffer += chunk
+        except self._httpx.HTTPError as e:
+            self.close()
+            raise _requests_error(self._httpx, e) from e
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def close(self) -> None:
+        """Close the httpx response, releasing its connection."""
+        self._response.close()
+
+
+def _requests_error(httpx: Any, error: Exception) -> requests.RequestException:
+    """Convert an httpx error into the matching requests exception."""
+    if isinstance(error, httpx.TimeoutException):
+        return requests.Timeout(str(error))
+    if isinstance(error, httpx.TransportError):
+        return requests.ConnectionError(str(error))
+    return requests.RequestException(str(error))
+
+
+class _PhaseTrace:
+    """httpcore trace callback timing connection setup and the arrival of the response headers."""
+
+    __slots__ = ("started", "connect", "headers", "_opening")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.connect = 0.0
+        self.headers: Optional[float] = None
+        self._opening: Optional[float] = None
+
+    def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        if event.endswith((".connect_tcp.started", ".start_tls.started")):
+            self._opening = time.perf_counter()
+        elif event.endswith((".connect_tcp.complete", ".start_tls.complete")) and self._opening is not None:
+            self.connect += time.perf_counter() - self._opening
+        elif event.endswith(".receive_response_headers.complete"):
+            self.headers = time.perf_counter() - self.started
+
+
+@dataclass
+class InProcessRequest:
+    """
+    A request handed to an `InProcessTransport` handler.
+
+    Attributes:
+        method: The HTTP method, upper case.
+        url: The full URL.
+        path: The path component of the URL (e.g. "/v1/blueprints/service").
+        params: The query parameters.
+        headers: The request headers, including the client's default headers.
+        body: The encoded request body, or None.
+    """
+
+    method: str
+    url: str
+    path: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[bytes] = None
+
+    def json(self) -> Any:
+        """
+        Parse the request body as JSON.
+
+        Returns:
+            The parsed body, or None if there is no body.
+        """
+        return json.loads(self.body) if self.body else None
+
+
+#: What an InProcessTransport handler returns: a response, or (status, body) / (status, body, headers)
+HandlerResult = Union[requests.Response, tuple]
+
+
+class InProcessTransport(Transport):
+    """
+    Transport that calls a Python handler instead of sending the request over the network.
+
+    The handler receives an `InProcessRequest` and returns a `requests.Response`,
+    or a tuple of (status_code, body) or (status_code, body, headers). Bodies may
+    be bytes, str, None, or any JSON-serializable object.
+
+    Attributes:
+        handler: The function answering requests.
+        requests_handled: Number of requests passed to the handler.
+    """
+
+    def __init__(self, handler: Callable[[InProcessRequest], HandlerResult]):
+        """
+        Initialize the InProcessTransport.
+
+        Args:
+            handler: The function answering requests.
+        """
+        self.handler = handler
+        self.requests_handled = 0
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Build an InProcessRequest, call the handler and convert its result."""
+        body = kwargs.get('data')
+        if body is None and kwargs.get('json') is not None:
+            body = json.dumps(kwargs['json'])
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        request = InProcessRequest(method=method.upper(), url=url, path=urlsplit(url).path,
+                                   params=dict(kwargs.get('params') or {}),
+                                   headers=self.merge_headers(kwargs.get('headers')), body=body)
+        self.requests_handled += 1
+
+        result = self.handler(request)
+        if isinstance(result, requests.Response):
+            return result
+        status_code, content = result[0], result[1]
+        headers = dict(result[2]) if len(result) > 2 else {}
+        if content is not None and not isinstance(content, (bytes, str)):
+            content = json.dumps(content)
+            headers = {"Content-Type": "application/json", **headers}
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return build_response(status_code, content or b"", headers, url, stream=bool(kwargs.get('stream')))
+
+
+def build_response(status_code: int, content: bytes, headers: Optional[MutableMapping[str, str]], url: str,
+                   reason: Optional[str] = None, stream: bool = False) -> requests.Response:
+    """
+    Build a `requests.Response` from its parts.
+
+    Args:
+        status_code: The HTTP status code.
+        content: The response body.
+        headers: The response headers.
+        url: The URL that was requested.
+        reason: The reason phrase (default: derived from the status code).
+        stream: Whether the body should be left unread for `iter_content`.
+
+    Returns:
+        The response.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.url = url
+    if reason is None:
+        try:
+            reason = HTTPStatus(status_code).phrase
+        except ValueError:
+            reason = ""
+    response.reason = reason
+    response.encoding = "utf-8"
+    if stream:
+        response.raw = io.BytesIO(content)
+    else:
+        response._content = content
+    return response
@@ -0,0 +1,197 @@
+"""
+Request coalescing for the PyPort client library.
+
+When many threads ask for the same resource at the same moment (for example
+after a cache miss on a hot blueprint), each of them would normally send its
+own identical request. A `RequestCoalescer` lets the first caller send the
+request while the others wait for it, so the API sees one call and every
+caller receives the same response, whose JSON body is parsed only once.
+
+Only safe methods (GET and HEAD) without a request body are coalesced, plus
+the read-only POST routes such as entity search (see
+`pyport.client.endpoints.SAFE_READ_ROUTES`). Two requests are identical when
+they have the same method, URL, query parameters, JSON body, extra headers and
+Authorization header.
+
+Example usage:
+
+```python
+from pyport import PortClient
+from pyport.coalesce import RequestCoalescer
+
+coalescer = RequestCoalescer()
+client = PortClient(client_id="...", client_secret="...", request_coalescer=coalescer)
+
+# ... many threads calling client.blueprints.get_blueprint("service") ...
+print(coalescer.get_stats())
+```
+
+Callers sharing a response also share the object returned by `response.json()`,
+so they should treat it as read-only.
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple, TypeVar
+
+from .client.endpoints import SAFE_READ_ROUTES, body_digest, endpoint_template
+from .exceptions import PortDeadlineExceededError
+
+T = TypeVar('T')
+
+#: Methods that are coalesced
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+
+class _InFlight:
+    """A call in progress and the outcome shared with its waiters."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """
+    Shares one in-flight call between concurrent callers with the same key.
+
+    A coalescer can be shared between clients: the Authorization header is
+    part of the key, so clients with different credentials never share
+    responses.
+
+    Attributes:
+        max_tracked_keys: Maximum number of keys kept in the per-key waiter metrics.
+    """
+
+    def __init__(self, max_tracked_keys: int = 1000):
+        """
+        Initialize the RequestCoalescer.
+
+        Args:
+            max_tracked_keys: Maximum number of keys kept in the per-key waiter metrics (default: 1000).
+        """
+        self.max_tracked_keys = max_tracked_keys
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _InFlight] = {}
+        self._calls = 0
+        self._coalesced = 0
+        self._waiters_by_key: Dict[str, int] = {}
+
+    @staticmethod
+    def is_coalescable(method: str, kwargs: Mapping[str, Any], endpoint: Optional[str] = None) -> bool:
+        """
+        Check whether a request may share its response with identical requests.
+
+        Args:
+            method: HTTP method (e.g., 'GET').
+            kwargs: The request parameters.
+            endpoint: The API endpoint, if known.
+
+        Returns:
+            True for GET and HEAD requests without a body, and for requests with a
+            JSON body to read-only POST routes, that are not streamed.
+        """
+        if kwargs.get('stream') or kwargs.get('data') is not None:
+            return False
+        if method.upper() in COALESCED_METHODS:
+            return kwargs.get('json') is None
+        return endpoint is not None and (method.upper(), endpoint_template(endpoint)) in SAFE_READ_ROUTES
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Optional[Mapping[str, Any]] = None,
+                 headers: Optional[Mapping[str, str]] = None,
+                 authorization: Optional[str] = None, json_body: Any = None) -> Tuple:
+        """
+        Build the key identifying a request.
+
+        Args:
+            method: HTTP method (e.g., 'GET').
+            url: The full URL.
+            params: The query parameters.
+            headers: Headers set for this request only.
+            authorization: The Authorization header the request is sent with.
+            json_body: The JSON body, compared by a canonical hash.
+
+        Returns:
+            A hashable key.
+        """
+        def freeze(mapping):
+            return tuple(sorted((str(name), repr(value)) for name, value in (mapping or {}).items()))
+
+        return method.upper(), url, freeze(params), freeze(headers), authorization, body_digest(json_body)
+
+    def execute(self, key: Tuple, func: Callable[[], T], timeout: Optional[float] = None) -> T:
+        """
+        Run `func`, or wait for the identical call already in flight.
+
+        The first caller for a key runs `func`; callers arriving before it
+        finishes receive its result, or have its exception raised.
+
+        Args:
+            key: The request key, from `make_key`.
+            func: The call to make.
+            timeout: Longest time in seconds to wait for an in-flight call (default: no limit).
+
+        Returns:
+            The result of the shared call.
+
+        Raises:
+            PortDeadlineExceededError: If the in-flight call does not finish within timeout.
+        """
+        with self._lock:
+            self._calls += 1
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _InFlight()
+            else:
+                call.waiters += 1
+                self._coalesced += 1
+                self._track(key)
+
+        if leader:
+            try:
+                call.result = func()
+                return call.result
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+                call.done.set()
+
+        if not call.done.wait(timeout):
+            raise PortDeadlineExceededError("Deadline exceeded while waiting for an identical request",
+                                            method=key[0], endpoint=key[1])
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _track(self, key: Tuple) -> None:
+        """Count a waiter for a key in the metrics, within max_tracked_keys. Called with the lock held."""
+        label = f"{key[0]} {key[1]}"
+        if label in self._waiters_by_key or len(self._waiters_by_key) < self.max_tracked_keys:
+            self._waiters_by_key[label] = self._waiters_by_key.get(label, 0) + 1
+
+    def get_stats(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Args:
+            top: Number of keys to report in hot_keys.
+
+        Returns:
+            A dictionary with the number of calls, the number that waited for an
+            identical call, the calls in flight, and the keys with the most waiters.
+        """
+        with self._lock:
+            hot_keys = sorted(self._waiters_by_key.items(), key=lambda item: item[1], reverse=True)[:top]
+            return {
+                "calls": self._calls,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._in_flight),
+                "hot_keys": dict(hot_keys),
+            }
@@ -0,0 +1,199 @@
+"""
+JSON encoding and decoding for the PyPort client library.
+
+This module provides the JSON codec used by the request layer to serialize
+`json=` request bodies, parse response bodies and format debug logs. The
+fastest installed backend is picked automatically:
+
+1. orjson (`pip install orjson`)
+2. ujson (`pip install ujson`)
+3. the standard library `json` module
+
+Example usage:
+
+```python
+from pyport import PortClient
+from pyport.codec import get_codec
+
+client = PortClient(client_id="...", client_secret="...", json_codec="orjson")
+print(client.json_codec.name)
+
+codec = get_codec()  # the best available codec
+body = codec.dumps({"identifier": "service"})
+```
+"""
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+import requests
+
+
+class JsonCodec:
+    """
+    Standard library JSON codec, and the base class for faster backends.
+
+    Subclasses override `dumps` and `loads`; both must raise `TypeError` for
+    values that cannot be encoded and `ValueError` for invalid documents.
+
+    Attributes:
+        name: The name of the codec, as accepted by `get_codec`.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Serialize an object to a UTF-8 encoded JSON document.
+
+        Args:
+            obj: The object to serialize.
+
+        Returns:
+            The JSON document as bytes.
+        """
+        return json.dumps(obj, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    def dumps_str(self, obj: Any) -> str:
+        """
+        Serialize an object to a JSON string.
+
+        Args:
+            obj: The object to serialize.
+
+        Returns:
+            The JSON document as a str.
+        """
+        return self.dumps(obj).decode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Parse a JSON document.
+
+        Args:
+            data: The JSON document.
+
+        Returns:
+            The parsed object.
+        """
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the codec."""
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self):
+        """Initialize the codec, raising ImportError if orjson is not installed."""
+        import orjson
+        self._orjson = orjson
+        # Accept non-str dict keys, as json.dumps does
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize an object with orjson."""
+        return self._orjson.dumps(obj, option=self._options)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse a JSON document with orjson."""
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """JSON codec backed by ujson."""
+
+    name = "ujson"
+
+    def __init__(self):
+        """Initialize the codec, raising ImportError if ujson is not installed."""
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize an object with ujson."""
+        return self._ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse a JSON document with ujson."""
+        return self._ujson.loads(data)
+
+
+# Codec classes by name, fastest first
+CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+    JsonCodec.name: JsonCodec,
+}
+
+_default_codec: Optional[JsonCodec] = None
+
+
+def get_codec(codec: Union[str, JsonCodec, None] = "auto") -> JsonCodec:
+    """
+    Resolve a codec.
+
+    Args:
+        codec: A JsonCodec instance, a codec name ("orjson", "ujson", "json"),
+            or "auto"/None for the fastest installed backend.
+
+    Returns:
+        A JsonCodec instance.
+
+    Raises:
+        ValueError: If the codec name is unknown.
+        ImportError: If the named backend is not installed.
+    """
+    global _default_codec
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None or codec == "auto":
+        if _default_codec is None:
+            for factory in CODECS.values():
+                try:
+                    _default_codec = factory()
+                    break
+                except ImportError:
+                    continue
+        return _default_codec
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec {codec!r}; expected one of {', '.join(CODECS)} or 'auto'")
+    return CODECS[codec]()
+
+
+def install_json_decoder(response: Any, codec: JsonCodec) -> Any:
+    """
+    Replace `response.json()` with a codec-backed, memoized parser.
+
+    The body is parsed at most once, so debug logging, error handling and
+    the calling service share a single parse. Callers that mutate the
+    returned object will see their changes on later calls. Decoding errors
+    are raised as `requests.exceptions.JSONDecodeError`, like the original method.
+
+    Args:
+        response: A requests.Response.
+        codec: The codec to parse the body with.
+
+    Returns:
+        The same response object.
+    """
+    parsed = []
+
+    def _json(**kwargs):
+        if kwargs:
+            # Custom decoder arguments are only understood by the original implementation
+            return type(response).json(response, **kwargs)
+        if not parsed:
+            content = response.content
+            try:
+                parsed.append(codec.loads(content))
+            except ValueError as e:
+                text = content.decode("utf-8", "replace") if isinstance(content, bytes) else str(content)
+                raise requests.exceptions.JSONDecodeError(str(e), text, 0) from e
+        return parsed[0]
+
+    response.json = _json
+    return response
@@ -18,3 +18,6 @@ GENERIC_HEADERS = {
     'Content-Type': 'application/json',
     'Accept': 'application/json'
 }
+
+#: Header carrying the idempotency key of a non-idempotent write, unchanged across its retries
+IDEMPOTENCY_KEY_HEADER = 'Idempotency-Key'
@@ -0,0 +1,154 @@
+"""
+Deadlines for Port API calls.
+
+A deadline bounds the total time spent on a call, including every retry and
+the delays between them. While a deadline is active:
+
+- each attempt's connect and read timeouts are capped by the time remaining,
+- a retry whose backoff delay would end after the deadline is not attempted,
+- an attempt that would start after the deadline raises `PortDeadlineExceededError`.
+
+Deadlines are stored in a context variable, so they carry through nested
+helpers: every request made inside a `deadline()` block, including pages
+fetched by pagination helpers and calls fanned out with `client.map` or
+`client.batch`, shares the same budget.
+
+Example:
+    ```python
+    from pyport.deadline import deadline
+
+    with deadline(5.0):
+        blueprints = client.blueprints.get_blueprints()
+        entities = client.entities.get_entities("service")
+    ```
+
+Per-client and per-call budgets are set with `PortClient(timeout_budget=...)`
+and `client.make_request(..., timeout_budget=...)`.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple, Union
+
+_current: ContextVar[Optional["Deadline"]] = ContextVar("pyport_deadline", default=None)
+
+#: A requests-style timeout: seconds, or a (connect, read) tuple
+Timeout = Union[float, Tuple[Optional[float], Optional[float]]]
+
+
+class Deadline:
+    """
+    A point in time by which a call must complete.
+
+    Attributes:
+        expires_at: The `time.monotonic()` value at which the deadline expires.
+    """
+
+    def __init__(self, expires_at: float):
+        """
+        Initialize the Deadline.
+
+        Args:
+            expires_at: The `time.monotonic()` value at which the deadline expires.
+        """
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """
+        Create a deadline that expires a number of seconds from now.
+
+        Args:
+            seconds: The time budget in seconds.
+
+        Returns:
+            A new Deadline.
+        """
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """
+        Get the time left before the deadline.
+
+        Returns:
+            The remaining time in seconds, never negative.
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """
+        Check whether the deadline has passed.
+
+        Returns:
+            True if no time is left.
+        """
+        return self.remaining() <= 0.0
+
+    def cap_timeout(self, timeout: Optional[Timeout]) -> Timeout:
+        """
+        Cap a requests-style timeout by the remaining time.
+
+        Args:
+            timeout: Seconds, a (connect, read) tuple, or None for no timeout.
+
+        Returns:
+            A timeout of the same shape where no value exceeds the remaining time.
+        """
+        remaining = self.remaining()
+        if isinstance(timeout, tuple):
+            return tuple(remaining if value is None else min(value, remaining) for value in timeout)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def __repr__(self) -> str:
+        """Return a representation showing the remaining time."""
+        return f"Deadline(remaining={self.remaining():.3f}s)"
+
+
+def current_deadline() -> Optional[Deadline]:
+    """
+    Get the deadline active in the current context.
+
+    Returns:
+        The active Deadline, or None if calls are unbounded.
+    """
+    return _current.get()
+
+
+def resolve_deadline(budget: Union[float, Deadline, None]) -> Optional[Deadline]:
+    """
+    Combine a budget with the deadline active in the current context.
+
+    Args:
+        budget: Seconds from now, a Deadline, or None.
+
+    Returns:
+        The earlier of the two deadlines, or None if neither is set.
+    """
+    if budget is not None and not isinstance(budget, Deadline):
+        budget = Deadline.after(budget)
+    active = _current.get()
+    if active is None or (budget is not None and budget.expires_at < active.expires_at):
+        return budget
+    return active
+
+
+@contextmanager
+def deadline(budget: Union[float, Deadline, None]) -> Iterator[Optional[Deadline]]:
+    """
+    Bound every Port API call made inside the block.
+
+    Nested blocks can only shorten the active deadline, never extend it.
+
+    Args:
+        budget: Seconds from now, a Deadline, or None to keep the active deadline.
+
+    Yields:
+        The deadline in effect inside the block, or None if calls are unbounded.
+    """
+    active = resolve_deadline(budget)
+    token = _current.set(active)
+    try:
+        yield active
+    finally:
+        _current.reset(token)
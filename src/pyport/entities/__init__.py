@@ -1,3 +1,4 @@
+from .bulk import BulkUpsertProgress
 from .entities_api_svc import Entities
 
-__all__ = ['Entities']
+__all__ = ['BulkUpsertProgress', 'Entities']
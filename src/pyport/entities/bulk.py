@@ -0,0 +1,264 @@
+"""
+Bulk upsert pipeline for entities.
+
+This module implements `Entities.bulk_upsert`: entities are read lazily from
+any iterable, grouped into bulk requests and sent on a bounded thread pool.
+The per-entity results of each response are checked, entities that failed
+with a transient error are sent again with a later request, and progress is
+reported to an optional callback.
+"""
+
+import contextvars
+import heapq
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..exceptions import PortApiError, PortNetworkError
+from ..logging import logger
+
+#: Per-entity status codes of a bulk response that are worth sending again
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# A failed entity and the error entry reported for it
+_Failure = Tuple[Dict[str, Any], Dict[str, Any]]
+
+# An entity to send and the number of times it has already been resubmitted
+_Item = Tuple[Dict[str, Any], int]
+
+
+@dataclass
+class BulkUpsertProgress:
+    """
+    Progress of a bulk upsert, passed to its `on_progress` callback.
+
+    Attributes:
+        submitted: Entities read from the input so far.
+        succeeded: Entities the API accepted.
+        failed: Entities that failed for good.
+        resubmitted: Entities sent again after a transient failure.
+        requests: Bulk requests completed.
+        elapsed: Seconds since the upsert started.
+    """
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    resubmitted: int = 0
+    requests: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        """Entities processed (succeeded or failed) per second."""
+        return (self.succeeded + self.failed) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _is_transient(error: Exception) -> bool:
+    """Return True if a failed bulk request is worth sending again."""
+    return isinstance(error, PortNetworkError) or (isinstance(error, PortApiError) and error.is_transient())
+
+
+def _request_failures(chunk: List[Dict[str, Any]], error: Exception) -> List[_Failure]:
+    """Build the error entries of every entity of a failed bulk request."""
+    status_code = getattr(error, "status_code", None)
+    return [(entity, {"identifier": entity.get("identifier"), "statusCode": status_code,
+                      "error": error.__class__.__name__, "message": str(error), "entity": entity})
+            for entity in chunk]
+
+
+def _entity_failures(chunk: List[Dict[str, Any]], response: Dict[str, Any]) -> List[_Failure]:
+    """
+    Match the per-entity errors of a bulk response with the entities of the request.
+
+    Errors are matched by their `index` in the request, or by identifier when the
+    index is missing.
+
+    Args:
+        chunk: The entities of the request.
+        response: The bulk response.
+
+    Returns:
+        A list of (entity, error entry) pairs; the entity is an empty dict if the
+        error could not be matched.
+    """
+    by_identifier = {entity.get("identifier"): entity for entity in chunk}
+    failures = []
+    for error in response.get("errors") or []:
+        index = error.get("index")
+        if isinstance(index, int) and 0 <= index < len(chunk):
+            entity = chunk[index]
+        else:
+            entity = by_identifier.get(error.get("identifier"), {})
+        failures.append((entity, {"identifier": entity.get("identifier", error.get("identifier")),
+                                  "statusCode": error.get("statusCode"), "error": error.get("error"),
+                                  "message": error.get("message"), "entity": entity}))
+    return failures
+
+
+class BulkUpsert:
+    """
+    A single run of `Entities.bulk_upsert`.
+
+    Chunks are submitted from the calling thread, which blocks once
+    `2 * concurrency` requests are in flight, so at most that many chunks are
+    held in memory whatever the size of the input. Entities that fail with a
+    transient error wait for their backoff and are then put at the head of
+    the next chunk, sharing the same window of requests; the input is not
+    read while a full chunk of them is waiting. Responses are processed and
+    progress is reported in the calling thread as well.
+    """
+
+    def __init__(self, send: Callable[[List[Dict[str, Any]]], Dict[str, Any]], chunk_size: int,
+                 concurrency: int, max_resubmits: int, resubmit_delay: float = 0.0,
+                 on_progress: Optional[Callable[[BulkUpsertProgress], None]] = None):
+        """
+        Initialize a BulkUpsert.
+
+        Args:
+            send: Sends one bulk request and returns the parsed response.
+            chunk_size: Entities per bulk request.
+            concurrency: Maximum number of bulk requests running at the same time.
+            max_resubmits: Maximum number of times an entity is sent again after a
+                transient failure.
+            resubmit_delay: Delay before an entity is first sent again, doubled for
+                each further resubmission of that entity.
+            on_progress: Called with the progress after each completed request.
+        """
+        self._send = send
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.max_resubmits = max_resubmits
+        self.resubmit_delay = resubmit_delay
+        self.on_progress = on_progress
+        self.progress = BulkUpsertProgress()
+        self.failed: List[Dict[str, Any]] = []
+        self._started = 0.0
+        # Entities waiting to be sent again, as (not before, sequence, entity, resubmits)
+        self._resubmits: List[Tuple[float, int, Dict[str, Any], int]] = []
+        self._sequence = itertools.count()
+
+    def run(self, entities: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Upsert all entities.
+
+        Args:
+            entities: The entities to upsert.
+
+        Returns:
+            A dictionary with the number of entities that `succeeded`, the error entries
+            of those that `failed`, the number of `requests` and the `elapsed` seconds.
+        """
+        self._started = time.monotonic()
+        source = self._count(entities)
+        pending: Set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="pyport-bulk") as executor:
+            while True:
+                while len(pending) < 2 * self.concurrency:
+                    chunk = self._next_chunk(source)
+                    if not chunk:
+                        break
+                    # Run in a copy of the caller's context, so an active deadline applies to the request
+                    pending.add(executor.submit(contextvars.copy_context().run, self._send_chunk, chunk))
+
+                # With room in the window, wake up when the next resubmission is due
+                timeout = None
+                if self._resubmits and len(pending) < 2 * self.concurrency:
+                    timeout = max(self._resubmits[0][0] - time.monotonic(), 0.0)
+                if not pending:
+                    if timeout is None:
+                        break
+                    time.sleep(timeout)
+                    continue
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._process(*future.result())
+
+        self._report()
+        if self.failed:
+            logger.warning(f"{len(self.failed)} of {self.progress.submitted} entities failed in bulk upsert.")
+        return {
+            "succeeded": self.progress.succeeded,
+            "failed": self.failed,
+            "requests": self.progress.requests,
+            "elapsed": self.progress.elapsed,
+        }
+
+    def _count(self, entities: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Count the entities as they are read from the input."""
+        for entity in entities:
+            self.progress.submitted += 1
+            yield entity
+
+    def _next_chunk(self, source: Iterator[Dict[str, Any]]) -> List[_Item]:
+        """
+        Build the next chunk to send.
+
+        Entities due to be sent again come first; the rest of the chunk is read
+        from the input, unless a full chunk of entities is still waiting for
+        its backoff.
+
+        Args:
+            source: The input entities.
+
+        Returns:
+            The entities to send with their resubmit counts; empty if there is
+            nothing to send right now.
+        """
+        chunk: List[_Item] = []
+        now = time.monotonic()
+        while self._resubmits and self._resubmits[0][0] <= now and len(chunk) < self.chunk_size:
+            _, _, entity, resubmits = heapq.heappop(self._resubmits)
+            chunk.append((entity, resubmits))
+        if chunk:
+            logger.debug(f"Resubmitting {len(chunk)} entities after transient bulk upsert failures.")
+        if len(self._resubmits) < self.chunk_size:
+            chunk.extend((entity, 0) for entity in itertools.islice(source, self.chunk_size - len(chunk)))
+        return chunk
+
+    def _send_chunk(self, chunk: List[_Item]) -> Tuple[List[_Item], Any]:
+        """Send one chunk, returning it with the response or the error it raised."""
+        try:
+            return chunk, self._send([entity for entity, _ in chunk])
+        except PortApiError as e:
+            return chunk, e
+        except Exception as e:
+            # E.g. a malformed response body: fail this chunk rather than the whole run
+            logger.error(f"Bulk upsert request failed with {e.__class__.__name__}: {str(e)}")
+            return chunk, e
+
+    def _process(self, chunk: List[_Item], outcome: Any) -> None:
+        """Count the results of one request and queue its entities worth sending again."""
+        self.progress.requests += 1
+        entities = [entity for entity, _ in chunk]
+        if isinstance(outcome, Exception):
+            failures = _request_failures(entities, outcome)
+            transient = _is_transient(outcome)
+        else:
+            failures = _entity_failures(entities, outcome if isinstance(outcome, dict) else {})
+            transient = None
+        self.progress.succeeded += max(len(chunk) - len(failures), 0)
+
+        resubmits = {id(entity): count for entity, count in chunk}
+        for entity, error in failures:
+            count = resubmits.get(id(entity), self.max_resubmits)
+            if (entity and count < self.max_resubmits
+                    and (transient if transient is not None else error["statusCode"] in TRANSIENT_STATUS_CODES)):
+                not_before = time.monotonic() + self.resubmit_delay * (2 ** count)
+                heapq.heappush(self._resubmits, (not_before, next(self._sequence), entity, count + 1))
+                self.progress.resubmitted += 1
+            else:
+                self._fail(error)
+        self._report()
+
+    def _fail(self, error: Dict[str, Any]) -> None:
+        """Record an entity that failed for good."""
+        self.progress.failed += 1
+        self.failed.append(error)
+
+    def _report(self) -> None:
+        """Update the elapsed time and call the progress callback."""
+        self.progress.elapsed = time.monotonic() - self._started
+        if self.on_progress is not None:
+            self.on_progress(self.progress)
@@ -1,6 +1,12 @@
-from typing import Dict, List, Any, Optional
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Union
 
+from ..client.batch import run_map
+from ..exceptions import PortConflictError
 from ..services.base_api_service import BaseAPIService
+from ..streaming import chunked, stream_json_array
+from .bulk import BulkUpsert, BulkUpsertProgress
 
 # Comment out the types import since it doesn't exist yet
 # from .types import (
@@ -16,6 +22,15 @@ JsonDict = Dict[str, Any]
 JsonList = List[Dict[str, Any]]
 Pagination = Dict[str, Any]
 
+#: Identifiers per search request made by get_entities_by_ids
+IDS_CHUNK_SIZE = 100
+#: Largest page the blueprint entity search returns
+MAX_SEARCH_LIMIT = 1000
+#: What create_entity and create_entities_bulk do when the entities already exist
+ON_CONFLICT_POLICIES = ("raise", "upsert", "merge")
+#: Largest number of entities the bulk entity endpoint accepts per request
+MAX_BULK_SIZE = 20
+
 
 class Entities(BaseAPIService):
     """Entities API category for managing entities in Port.
@@ -44,6 +59,9 @@ class Entities(BaseAPIService):
         ... )
     """
 
+    # bulk_upsert reads its input once and sends chunks from a thread pool
+    SYNC_ONLY_METHODS = frozenset({"bulk_upsert"})
+
     def __init__(self, client):
         """Initialize the Entities API service.
 
@@ -133,6 +151,78 @@ class Entities(BaseAPIService):
         # Extract and return the entity
         return response.get("entity", {})
 
+    def get_entities_by_ids(self, blueprint_identifier: str, entity_identifiers: List[str],
+                            chunk_size: int = IDS_CHUNK_SIZE, max_concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Retrieve several entities of a blueprint by their identifiers.
+
+        The identifiers are split into chunks, and each chunk is fetched with one
+        `search_blueprint_entities` call using an identifier `in` rule. Chunks are
+        searched concurrently, so N entities take about N / chunk_size requests
+        instead of N `get_entity` calls.
+
+        Args:
+            blueprint_identifier: The unique identifier of the blueprint.
+            entity_identifiers: The identifiers of the entities to retrieve. Duplicates are ignored.
+            chunk_size: Number of identifiers per search request (default: 100, max: 1000).
+            max_concurrency: Maximum number of search requests running at the same time (default: 8).
+
+        Returns:
+            A dictionary containing:
+            - entities: The entities found, keyed by identifier
+            - missing: The requested identifiers that were not found, in request order
+
+        Raises:
+            ValueError: If chunk_size is not between 1 and 1000.
+            PortResourceNotFoundError: If the blueprint does not exist.
+            PortApiError: If another API error occurs.
+
+        Examples:
+            >>> result = client.entities.get_entities_by_ids("service", ["api", "web", "old"])
+            >>> result["entities"]["api"]["title"]
+            'API Service'
+            >>> result["missing"]
+            ['old']
+        """
+        if not 1 <= chunk_size <= MAX_SEARCH_LIMIT:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_SEARCH_LIMIT}")
+        identifiers = list(dict.fromkeys(entity_identifiers))
+        chunks = [(blueprint_identifier, chunk) for chunk in chunked(identifiers, chunk_size)]
+
+        # A single chunk is fetched in the calling thread
+        if len(chunks) <= 1 or max_concurrency <= 1:
+            found = [self._search_entities_by_ids(*chunk) for chunk in chunks]
+        else:
+            found = [result.unwrap()
+                     for result in run_map(self._search_entities_by_ids, chunks, max_concurrency=max_concurrency)]
+
+        entities = {entity["identifier"]: entity for chunk_entities in found for entity in chunk_entities}
+        return {
+            "entities": entities,
+            "missing": [identifier for identifier in identifiers if identifier not in entities],
+        }
+
+    def _search_entities_by_ids(self, blueprint_identifier: str, entity_identifiers: List[str]) -> List[Entity]:
+        """
+        Search a blueprint for the entities with the given identifiers, following pagination.
+
+        Args:
+            blueprint_identifier: The unique identifier of the blueprint.
+            entity_identifiers: At most MAX_SEARCH_LIMIT identifiers.
+
+        Returns:
+            The entities found.
+        """
+        search_data: Dict[str, Any] = {
+            "query": {
+                "combinator": "and",
+                "rules": [{"property": "$identifier", "operator": "in", "value": entity_identifiers}],
+            },
+            "limit": len(entity_identifiers),
+        }
+        pages = self._iter_search_pages(blueprint_identifier, search_data, prefetch=False)
+        return [entity for entities in pages for entity in entities]
+
     def create_entity(
         self,
         blueprint_identifier: str,
@@ -140,7 +230,8 @@ class Entities(BaseAPIService):
         upsert: bool = False,
         validation_only: bool = False,
         create_missing_related_entities: bool = False,
-        merge: bool = False
+        merge: bool = False,
+        on_conflict: str = "raise"
     ) -> Entity:
         """
         Create a new entity under the specified blueprint.
@@ -161,6 +252,10 @@ class Entities(BaseAPIService):
             validation_only: If True, only validate the entity data without creating it (default: False).
             create_missing_related_entities: If True, create any related entities that don't exist (default: False).
             merge: If True and upsert is True, merge the new data with existing data (default: False).
+            on_conflict: What to do if the entity already exists (default: "raise").
+                "upsert" repeats the request with upsert=True and the given merge, and "merge"
+                with upsert=True and merge=True. This also covers a retried create whose first
+                attempt was applied (see PortClient's retry_keyed_writes).
 
         Returns:
             A dictionary representing the created entity.
@@ -168,6 +263,7 @@ class Entities(BaseAPIService):
         Raises:
             PortResourceNotFoundError: If the blueprint does not exist.
             PortValidationError: If the entity data is invalid.
+            PortConflictError: If the entity already exists and on_conflict is "raise".
             PortApiError: If another API error occurs.
 
         Examples:
@@ -206,7 +302,7 @@ class Entities(BaseAPIService):
         }
 
         # Make the request
-        return self._make_request_with_params('POST', endpoint, params=params, json=entity_data)
+        return self._create_or_upsert(endpoint, params, entity_data, on_conflict)
 
     def update_entity(self, blueprint_identifier: str, entity_identifier: str, entity_data: Dict[str, Any]) -> Entity:
         """
@@ -274,7 +370,8 @@ class Entities(BaseAPIService):
         # Return True if the status code is 204 (No Content)
         return response.status_code == 204
 
-    def create_entities_bulk(self, blueprint_identifier: str, entities_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def create_entities_bulk(self, blueprint_identifier: str, entities_data: List[Dict[str, Any]],
+                             on_conflict: str = "raise") -> Dict[str, Any]:
         """
         Create multiple entities in bulk for the specified blueprint.
 
@@ -285,15 +382,20 @@ class Entities(BaseAPIService):
             blueprint_identifier: The unique identifier of the blueprint.
             entities_data: A list of dictionaries, each containing data for a new entity.
                 Each entity dictionary should follow the same format as in create_entity.
+            on_conflict: What to do with entities that already exist (default: "raise"):
+                "upsert" or "merge" send them again as in create_entity. This applies both
+                to a request rejected as a whole and to entities reported with a 409 among
+                the per-entity errors of the response.
 
         Returns:
             A dictionary representing the result of the bulk creation, containing:
             - created: The number of entities created
-            - errors: Any errors that occurred during creation
+            - errors: Any errors that occurred during creation, indexed by position in entities_data
 
         Raises:
             PortResourceNotFoundError: If the blueprint does not exist.
             PortValidationError: If any entity data is invalid.
+            PortConflictError: If entities already exist and on_conflict is "raise".
             PortApiError: If another API error occurs.
 
         Examples:
@@ -319,7 +421,138 @@ class Entities(BaseAPIService):
         endpoint = self._build_endpoint("blueprints", blueprint_identifier, "entities", "bulk")
 
         # Make the request
-        return self._make_request_with_params('POST', endpoint, json={"entities": entities_data})
+        response = self._create_or_upsert(endpoint, {}, {"entities": entities_data}, on_conflict)
+        if on_conflict == "raise":
+            return response
+        return self._upsert_conflicts(endpoint, entities_data, response, on_conflict)
+
+    def _upsert_conflicts(self, endpoint: str, entities_data: List[Dict[str, Any]], response: Dict[str, Any],
+                          on_conflict: str) -> Dict[str, Any]:
+        """
+        Send the entities a bulk create reported as already existing again, as an upsert.
+
+        Args:
+            endpoint: The bulk create endpoint.
+            entities_data: The entities of the create request.
+            response: The bulk create response.
+            on_conflict: "upsert" or "merge".
+
+        Returns:
+            The create response with the results of the upsert in place of the conflicts.
+        """
+        errors = response.get("errors") or []
+        conflicts = [error for error in errors
+                     if error.get("statusCode") == 409 and _error_position(error, entities_data) is not None]
+        if not conflicts:
+            return response
+
+        positions = [_error_position(error, entities_data) for error in conflicts]
+        retried = self._make_request_with_params('POST', endpoint, params=_upsert_params({}, on_conflict),
+                                                 json={"entities": [entities_data[i] for i in positions]})
+        retried_errors = []
+        for error in retried.get("errors") or []:
+            position = _error_position(error, [entities_data[i] for i in positions])
+            retried_errors.append({**error, "index": positions[position]} if position is not None else error)
+        return {
+            **response,
+            "entities": (response.get("entities") or []) + (retried.get("entities") or []),
+            "errors": [error for error in errors if error not in conflicts] + retried_errors,
+        }
+
+    def _create_or_upsert(self, endpoint: str, params: Dict[str, Any], body: Dict[str, Any],
+                          on_conflict: str) -> Dict[str, Any]:
+        """
+        Send a create request, repeating it as an upsert if it conflicts and the policy allows.
+
+        Args:
+            endpoint: The create endpoint.
+            params: Query parameters of the create request.
+            body: The request body.
+            on_conflict: One of ON_CONFLICT_POLICIES.
+
+        Returns:
+            The API response as a JSON dictionary.
+        """
+        if on_conflict not in ON_CONFLICT_POLICIES:
+            raise ValueError(f"on_conflict must be one of {ON_CONFLICT_POLICIES}, got {on_conflict!r}")
+        try:
+            return self._make_request_with_params('POST', endpoint, params=params, json=body)
+        except PortConflictError:
+            if on_conflict == "raise":
+                raise
+            return self._make_request_with_params('POST', endpoint, params=_upsert_params(params, on_conflict),
+                                                  json=body)
+
+    def bulk_upsert(
+        self,
+        blueprint_identifier: str,
+        entities: Iterable[Dict[str, Any]],
+        chunk_size: int = MAX_BULK_SIZE,
+        concurrency: int = 4,
+        merge: bool = False,
+        max_resubmits: int = 2,
+        on_progress: Optional[Callable[[BulkUpsertProgress], None]] = None,
+        resubmit_delay: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Create or update any number of entities with concurrent bulk requests.
+
+        Entities are read lazily from `entities`, which may be a generator, and sent
+        in bulk requests of `chunk_size` entities, `concurrency` at a time. Reading
+        pauses while `2 * concurrency` requests are in flight, so memory use does not
+        grow with the size of the input. The per-entity errors of each response are
+        collected; entities that failed with a transient error (429, 5xx, or a failed
+        request) are sent again with a later request, up to `max_resubmits` times each,
+        while the others are reported as failed.
+
+        Args:
+            blueprint_identifier: The unique identifier of the blueprint.
+            entities: The entities to upsert, in the format of create_entity.
+            chunk_size: Entities per bulk request (default: 20, the maximum).
+            concurrency: Maximum number of bulk requests running at the same time (default: 4).
+            merge: Whether to merge the given properties into existing entities instead of
+                replacing them (default: False).
+            max_resubmits: Maximum number of times a transiently failed entity is sent
+                again (default: 2).
+            on_progress: Called in the calling thread with a BulkUpsertProgress after each
+                completed request.
+            resubmit_delay: Seconds before a transiently failed entity is first sent again,
+                doubled for each further resubmission (default: the client's retry delay).
+
+        Returns:
+            A dictionary containing:
+            - succeeded: The number of entities created or updated
+            - failed: An error entry (identifier, statusCode, error, message, entity) for
+              each entity that could not be upserted
+            - requests: The number of bulk requests made
+            - elapsed: The duration of the upsert in seconds
+
+        Raises:
+            ValueError: If chunk_size is not between 1 and 20, or concurrency is less than 1.
+
+        Examples:
+            >>> def report(progress):
+            ...     print(f"{progress.succeeded} upserted, {progress.items_per_second:.0f}/s")
+            >>> result = client.entities.bulk_upsert("service", read_cmdb_rows(), concurrency=8,
+            ...                                      on_progress=report)
+            >>> for error in result["failed"]:
+            ...     print(error["identifier"], error["message"])
+        """
+        if not 1 <= chunk_size <= MAX_BULK_SIZE:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_BULK_SIZE}")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        endpoint = self._build_endpoint("blueprints", blueprint_identifier, "entities", "bulk")
+        params = {"upsert": "true", "merge": str(merge).lower()}
+
+        def send(chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+            return self._make_request_with_params('POST', endpoint, params=params, json={"entities": chunk})
+
+        if resubmit_delay is None:
+            resubmit_delay = self._client.retry_config.retry_delay
+        return BulkUpsert(send, chunk_size, concurrency, max_resubmits, resubmit_delay=resubmit_delay,
+                          on_progress=on_progress).run(entities)
 
     def get_entities_count(self, blueprint_identifier: str) -> int:
         """
@@ -381,6 +614,36 @@ class Entities(BaseAPIService):
         # Extract and return the entities
         return response.json().get("entities", [])
 
+    def stream_all_entities(self, blueprint_identifier: str,
+                            chunk_size: Optional[int] = None) -> Iterator[Union[Entity, List[Entity]]]:
+        """
+        Stream all entities for the specified blueprint, including related entities.
+
+        Like `get_all_entities`, but the response is read incrementally and each
+        entity is decoded as it arrives, so memory use does not grow with the
+        number of entities. The connection is released when the iterator is
+        exhausted or closed.
+
+        Args:
+            blueprint_identifier: The unique identifier of the blueprint.
+            chunk_size: If set, yield lists of up to this many entities instead of
+                single entities.
+
+        Returns:
+            An iterator over entity dictionaries, or lists of them if chunk_size is set.
+
+        Raises:
+            PortResourceNotFoundError: If the blueprint does not exist.
+            PortApiError: If another API error occurs.
+
+        Examples:
+            >>> for entity in client.entities.stream_all_entities("service"):
+            ...     print(entity["identifier"])
+        """
+        endpoint = self._build_endpoint("blueprints", blueprint_identifier, "all-entities")
+        response = self._client.make_request('GET', endpoint, stream=True)
+        return stream_json_array(response, "entities", chunk_size=chunk_size)
+
     # Entity Search and Aggregation Methods
 
     def search_entities(self, search_data: Dict[str, Any]) -> List[Entity]:
@@ -488,6 +751,106 @@ class Entities(BaseAPIService):
         # Return the full response (includes pagination info)
         return response
 
+    def iter_search_blueprint_entities(
+        self,
+        blueprint_identifier: str,
+        query: Dict[str, Any],
+        page_size: int = MAX_SEARCH_LIMIT,
+        as_chunks: bool = False,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        prefetch: bool = True
+    ) -> Iterator[Union[Entity, List[Entity]]]:
+        """
+        Iterate over every entity of a blueprint matching a search query.
+
+        The search is paginated with the `next` cursor of `search_blueprint_entities`.
+        While the caller processes a page, the next one is already being fetched on a
+        background thread, so network time overlaps with processing time. At most one
+        page is fetched ahead; if the iteration stops early, that request still completes
+        in the background and its result is dropped.
+
+        Args:
+            blueprint_identifier: The unique identifier of the blueprint.
+            query: The search query (e.g. {"combinator": "and", "rules": [...]}).
+            page_size: Number of entities per search request (default: 1000, the maximum).
+            as_chunks: If True, yield each page as a list of entities instead of single entities.
+            include: Properties/relations to include in the returned entities.
+            exclude: Properties/relations to exclude from the returned entities.
+            prefetch: Whether to fetch the next page while the current one is consumed (default: True).
+
+        Returns:
+            An iterator over entity dictionaries, or over non-empty lists of them if as_chunks is True.
+
+        Raises:
+            ValueError: If page_size is not between 1 and 1000.
+            PortResourceNotFoundError: If the blueprint does not exist.
+            PortValidationError: If the query is invalid.
+            PortApiError: If another API error occurs.
+
+        Examples:
+            >>> query = {"combinator": "and", "rules": [
+            ...     {"property": "language", "operator": "=", "value": "Python"}]}
+            >>> for entity in client.entities.iter_search_blueprint_entities("service", query):
+            ...     print(entity["identifier"])
+            >>>
+            >>> for page in client.entities.iter_search_blueprint_entities("service", query, as_chunks=True):
+            ...     export(page)
+        """
+        if not 1 <= page_size <= MAX_SEARCH_LIMIT:
+            raise ValueError(f"page_size must be between 1 and {MAX_SEARCH_LIMIT}")
+        search_data: Dict[str, Any] = {"query": query, "limit": page_size}
+        if include is not None:
+            search_data["include"] = include
+        if exclude is not None:
+            search_data["exclude"] = exclude
+        pages = self._iter_search_pages(blueprint_identifier, search_data, prefetch)
+        if as_chunks:
+            return (entities for entities in pages if entities)
+        return (entity for entities in pages for entity in entities)
+
+    def _iter_search_pages(self, blueprint_identifier: str, search_data: Dict[str, Any],
+                           prefetch: bool) -> Iterator[List[Entity]]:
+        """
+        Follow the search cursor and yield the entities of each page.
+
+        Args:
+            blueprint_identifier: The unique identifier of the blueprint.
+            search_data: The search request of the first page.
+            prefetch: Whether to fetch the next page on a background thread while
+                the current one is consumed.
+
+        Returns:
+            An iterator over the entity lists of the successive pages.
+        """
+        if not prefetch:
+            while True:
+                page = self.search_blueprint_entities(blueprint_identifier, search_data)
+                yield page.get("entities", [])
+                if not page.get("next"):
+                    return
+                search_data = {**search_data, "from": page["next"]}
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyport-prefetch")
+
+        def fetch(data: Dict[str, Any]) -> "Future[Dict[str, Any]]":
+            # Run in a copy of the caller's context, so an active deadline applies to the prefetch
+            return executor.submit(contextvars.copy_context().run, self.search_blueprint_entities,
+                                   blueprint_identifier, data)
+
+        pending: Optional["Future[Dict[str, Any]]"] = None
+        try:
+            pending = fetch(search_data)
+            while pending is not None:
+                page = pending.result()
+                pending = fetch({**search_data, "from": page["next"]}) if page.get("next") else None
+                yield page.get("entities", [])
+        finally:
+            # Drop the prefetch of a page the caller stopped before reaching
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
     def aggregate_entities(self, aggregation_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Aggregate entities based on specified criteria.
@@ -598,3 +961,20 @@ class Entities(BaseAPIService):
 
         # Make the request
         return self._make_request_with_params('POST', endpoint, json=history_data)
+
+
+def _upsert_params(params: Dict[str, Any], on_conflict: str) -> Dict[str, Any]:
+    """Return the query parameters repeating a conflicting create as an upsert under the on_conflict policy."""
+    merge = "true" if on_conflict == "merge" else params.get("merge", "false")
+    return {**params, "upsert": "true", "merge": merge}
+
+
+def _error_position(error: Dict[str, Any], entities: List[Dict[str, Any]]) -> Optional[int]:
+    """Return the position in a bulk request of the entity a per-entity error refers to, by index or identifier."""
+    index = error.get("index")
+    if isinstance(index, int) and 0 <= index < len(entities):
+        return index
+    for position, entity in enumerate(entities):
+        if entity.get("identifier") == error.get("identifier"):
+            return position
+    return None
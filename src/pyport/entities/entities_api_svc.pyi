@@ -1,8 +1,9 @@
 """Type stub file for the Entities API service."""
 
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Any, Optional, Union, Tuple
 
 from ..services.base_api_service import BaseAPIService
+from .bulk import BulkUpsertProgress
 
 # Type aliases
 Entity = Dict[str, Any]
@@ -12,9 +13,16 @@ JsonDict = Dict[str, Any]
 JsonList = List[Dict[str, Any]]
 Pagination = Dict[str, Any]
 
+IDS_CHUNK_SIZE: int
+MAX_SEARCH_LIMIT: int
+ON_CONFLICT_POLICIES: Tuple[str, ...]
+MAX_BULK_SIZE: int
+
 class Entities(BaseAPIService):
     """Entities API category for managing entities in Port."""
     
+    SYNC_ONLY_METHODS: FrozenSet[str]
+    
     def __init__(self, client) -> None: ...
     
     def get_entities(
@@ -36,9 +44,40 @@ class Entities(BaseAPIService):
         self,
         blueprint_identifier: str,
         entity_data: Dict[str, Any],
-        params: Optional[Dict[str, Any]] = None
+        upsert: bool = ...,
+        validation_only: bool = ...,
+        create_missing_related_entities: bool = ...,
+        merge: bool = ...,
+        on_conflict: str = ...
     ) -> Entity: ...
     
+    def create_entities_bulk(
+        self,
+        blueprint_identifier: str,
+        entities_data: List[Dict[str, Any]],
+        on_conflict: str = ...
+    ) -> Dict[str, Any]: ...
+    
+    def _create_or_upsert(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        body: Dict[str, Any],
+        on_conflict: str
+    ) -> Dict[str, Any]: ...
+    
+    def bulk_upsert(
+        self,
+        blueprint_identifier: str,
+        entities: Iterable[Dict[str, Any]],
+        chunk_size: int = ...,
+        concurrency: int = 4,
+        merge: bool = False,
+        max_resubmits: int = 2,
+        on_progress: Optional[Callable[[BulkUpsertProgress], None]] = None,
+        resubmit_delay: Optional[float] = None
+    ) -> Dict[str, Any]: ...
+    
     def update_entity(
         self,
         blueprint_identifier: str,
@@ -162,3 +201,41 @@ class Entities(BaseAPIService):
         entities_data: List[Dict[str, Any]],
         params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]: ...
+    
+    def get_entities_by_ids(
+        self,
+        blueprint_identifier: str,
+        entity_identifiers: List[str],
+        chunk_size: int = ...,
+        max_concurrency: int = ...
+    ) -> Dict[str, Any]: ...
+    
+    def _search_entities_by_ids(
+        self,
+        blueprint_identifier: str,
+        entity_identifiers: List[str]
+    ) -> List[Entity]: ...
+    
+    def stream_all_entities(
+        self,
+        blueprint_identifier: str,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[Union[Entity, List[Entity]]]: ...
+    
+    def iter_search_blueprint_entities(
+        self,
+        blueprint_identifier: str,
+        query: Dict[str, Any],
+        page_size: int = ...,
+        as_chunks: bool = ...,
+        include: Optional[List[str]] = ...,
+        exclude: Optional[List[str]] = ...,
+        prefetch: bool = ...
+    ) -> Iterator[Union[Entity, List[Entity]]]: ...
+    
+    def _iter_search_pages(
+        self,
+        blueprint_identifier: str,
+        search_data: Dict[str, Any],
+        prefetch: bool
+    ) -> Iterator[List[Entity]]: ...
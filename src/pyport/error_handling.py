@@ -39,6 +39,7 @@ from .exceptions import (
     PortPermissionError,
     PortResourceNotFoundError,
     PortValidationError,
+    PortConflictError,
     PortRateLimitError,
     PortServerError,
     PortTimeoutError,
@@ -114,6 +115,56 @@ def handle_request_exception(
         )
 
 
+def handle_httpx_exception(
+    exc: Exception,
+    endpoint: str,
+    method: str,
+    **kwargs
+) -> PortApiError:
+    """
+    Convert an httpx transport exception to a Port API exception.
+
+    This is the counterpart of `handle_request_exception` for the asynchronous
+    client, which uses httpx instead of requests. httpx is an optional
+    dependency, so it is only imported when this function is called.
+
+    Args:
+        exc: The httpx exception that occurred during the request.
+        endpoint: The API endpoint that was being accessed when the exception occurred.
+        method: The HTTP method that was being used (GET, POST, etc.).
+        **kwargs: Additional context for the exception.
+
+    Returns:
+        A Port API exception that corresponds to the httpx exception:
+        - httpx.TimeoutException -> PortTimeoutError
+        - httpx.TransportError -> PortConnectionError
+        - Other httpx.HTTPError -> PortApiError
+    """
+    import httpx
+
+    if isinstance(exc, httpx.TimeoutException):
+        return PortTimeoutError(
+            f"Request timed out: {str(exc)}",
+            endpoint=endpoint,
+            method=method,
+            **kwargs
+        )
+    elif isinstance(exc, httpx.TransportError):
+        return PortConnectionError(
+            f"Connection error: {str(exc)}",
+            endpoint=endpoint,
+            method=method,
+            **kwargs
+        )
+    else:
+        return PortApiError(
+            f"Request error: {str(exc)}",
+            endpoint=endpoint,
+            method=method,
+            **kwargs
+        )
+
+
 def _extract_error_detail(response: requests.Response) -> tuple[str, Optional[Dict[str, Any]]]:
     """Extract error details from an HTTP response.
 
@@ -162,6 +213,7 @@ def _get_exception_class_and_message(status_code: int, error_detail: str) -> tup
         401: (PortAuthenticationError, f"Authentication failed: {error_detail}"),
         403: (PortPermissionError, f"Permission denied: {error_detail}"),
         404: (PortResourceNotFoundError, f"Resource not found: {error_detail}"),
+        409: (PortConflictError, f"Conflict: {error_detail}"),
         429: (PortRateLimitError, f"Rate limit exceeded: {error_detail}")
     }
 
@@ -191,6 +243,7 @@ def handle_error_response(
     - 401: PortAuthenticationError (authentication failed)
     - 403: PortPermissionError (permission denied)
     - 404: PortResourceNotFoundError (resource not found)
+    - 409: PortConflictError (resource already exists)
     - 429: PortRateLimitError (rate limit exceeded)
     - 5xx: PortServerError (server-side error)
     - Other: PortApiError (generic API error)
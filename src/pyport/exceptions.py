@@ -70,6 +70,11 @@ class PortValidationError(PortApiError):
     pass
 
 
+class PortConflictError(PortApiError):
+    """Raised when a resource conflicts with an existing one, e.g. it already exists (409 Conflict)."""
+    pass
+
+
 class PortRateLimitError(PortApiError):
     """Raised when the client has exceeded the rate limit (429 Too Many Requests)."""
 
@@ -104,6 +109,14 @@ class PortTimeoutError(PortApiError):
     pass
 
 
+class PortDeadlineExceededError(PortTimeoutError):
+    """Raised when a call's deadline passes before it could complete."""
+
+    def is_transient(self) -> bool:
+        """Return False: retrying cannot help once the time budget is spent."""
+        return False
+
+
 class PortConnectionError(PortApiError):
     """Raised when there's a connection error."""
     pass
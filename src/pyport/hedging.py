@@ -0,0 +1,357 @@
+"""
+Hedged requests for the PyPort client library.
+
+A hedged request sends a second, identical copy of a slow request and uses
+whichever response arrives first. Hedging trims tail latency caused by the
+occasional slow backend, at the cost of a few extra requests. It only applies
+to idempotent methods, where sending a request twice is safe.
+
+- The hedge delay follows the observed latency: a hedge is only sent once the
+  first attempt has taken longer than a chosen percentile of recent requests.
+- A budget bounds the extra load: each request earns `budget` hedge tokens
+  (5% by default) and each hedge spends one, so hedges stay a small fraction
+  of the traffic even when the API slows down as a whole.
+
+Example usage:
+
+```python
+from pyport import PortClient
+from pyport.hedging import HedgePolicy
+
+client = PortClient(
+    client_id="your-client-id",
+    client_secret="your-client-secret",
+    hedge_policy=HedgePolicy(percentile=95, budget=0.05)
+)
+```
+"""
+import contextvars
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .window import CountWindow
+
+logger = logging.getLogger("pyport")
+
+T = TypeVar('T')
+
+
+class HedgePolicy:
+    """
+    Decides when to hedge a request and runs the competing attempts.
+
+    Both attempts run on the policy's thread pool while the calling thread
+    waits for the first one to succeed. An attempt is only handed to the pool
+    when a worker is free, so it never waits in a queue: when every worker is
+    busy, the first attempt runs on the calling thread without a hedge. The
+    hedge is sent by a timer thread once the first attempt has been running
+    for the hedge delay. The losing attempt cannot be aborted mid-flight with
+    requests, so it is cancelled if it has not started yet, and otherwise its
+    response is closed as soon as it arrives.
+
+    A policy can be shared between clients; its latency window, budget, timer
+    and thread pool are then shared as well.
+
+    Attributes:
+        percentile: The latency percentile after which a hedge is sent.
+        min_delay: The shortest hedge delay in seconds.
+        max_delay: The longest hedge delay in seconds.
+        initial_delay: The hedge delay used until min_samples latencies are known.
+        budget: Hedge tokens earned per request, i.e. the maximum long-run hedge ratio.
+        max_tokens: The largest number of hedge tokens that can be saved up.
+    """
+
+    def __init__(self, percentile: float = 95.0, min_delay: float = 0.01, max_delay: float = 2.0,
+                 initial_delay: float = 0.5, budget: float = 0.05, max_tokens: float = 10.0,
+                 window: int = 1000, min_samples: int = 20, max_workers: int = 16):
+        """
+        Initialize the HedgePolicy.
+
+        Args:
+            percentile: Latency percentile (0-100) after which a hedge is sent (default: 95).
+            min_delay: Shortest hedge delay in seconds (default: 0.01).
+            max_delay: Longest hedge delay in seconds (default: 2.0).
+            initial_delay: Hedge delay used until min_samples latencies are known (default: 0.5).
+            budget: Hedge tokens earned per request (default: 0.05, at most 5% extra requests).
+            max_tokens: Largest number of hedge tokens that can be saved up (default: 10).
+            window: Number of recent latencies the percentile is computed from (default: 1000).
+            min_samples: Latencies needed before the percentile is used (default: 20).
+            max_workers: Threads running attempts (default: 16).
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.initial_delay = initial_delay
+        self.budget = budget
+        self.max_tokens = max_tokens
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self._latencies = CountWindow(window, percentiles=True)
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._busy = 0
+        # Pending hedges as (deadline, sequence, action), run by the timer thread
+        self._timers: List[Tuple[float, int, Callable[[], None]]] = []
+        self._timer_sequence = itertools.count()
+        self._timer_wakeup = threading.Condition(self._lock)
+        self._timer_thread: Optional[threading.Thread] = None
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._denied = 0
+
+    def hedge_delay(self) -> float:
+        """
+        Get the time to wait for the first attempt before sending a hedge.
+
+        Returns:
+            The configured percentile of recent latencies, clamped to [min_delay, max_delay].
+        """
+        with self._lock:
+            if self._latencies.count < self.min_samples:
+                delay = self.initial_delay
+            else:
+                delay = self._latencies.percentile(self.percentile)
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def record_latency(self, seconds: float) -> None:
+        """
+        Record the latency of a completed attempt.
+
+        Args:
+            seconds: The time the attempt took.
+        """
+        with self._lock:
+            self._latencies.record(seconds)
+
+    def _earn(self) -> None:
+        """Count a request and add its share of hedge tokens."""
+        with self._lock:
+            self._requests += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.budget)
+
+    def _spend(self) -> bool:
+        """Take a hedge token if one is available."""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._hedges += 1
+                return True
+            self._denied += 1
+            return False
+
+    def _schedule(self, delay: float, action: Callable[[], None]) -> None:
+        """Run an action on the timer thread once `delay` seconds have passed."""
+        with self._lock:
+            if self._timer_thread is None:
+                self._timer_thread = threading.Thread(target=self._run_timers, name="pyport-hedge-timer",
+                                                      daemon=True)
+                self._timer_thread.start()
+            heapq.heappush(self._timers, (time.monotonic() + delay, next(self._timer_sequence), action))
+            self._timer_wakeup.notify()
+
+    def _run_timers(self) -> None:
+        """Run scheduled actions as they fall due, until the policy is shut down."""
+        while True:
+            with self._lock:
+                while True:
+                    if self._timer_thread is not threading.current_thread():
+                        return
+                    timeout = self._timers[0][0] - time.monotonic() if self._timers else None
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._timer_wakeup.wait(timeout)
+                _, _, action = heapq.heappop(self._timers)
+            try:
+                action()
+            except Exception as e:
+                logger.error(f"Error sending a hedged request: {str(e)}")
+
+    def _submit(self, fn: Callable[[], T], context: contextvars.Context) -> Optional[Future]:
+        """
+        Run a function on the thread pool, in the given context, if a worker is free.
+
+        Returns:
+            The future of the function, or None if every worker is busy.
+        """
+        with self._lock:
+            if self._busy >= self.max_workers:
+                return None
+            self._busy += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="pyport-hedge")
+            executor = self._executor
+
+        future = executor.submit(context.run, fn)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future: Future) -> None:
+        """Free the worker of a completed or cancelled function."""
+        with self._lock:
+            self._busy -= 1
+
+    def _timed(self, attempt: Callable[[], T]) -> T:
+        """Run an attempt, recording its latency if it succeeds."""
+        start = time.monotonic()
+        result = attempt()
+        self.record_latency(time.monotonic() - start)
+        return result
+
+    def _send_hedge(self, race: "_Race", attempt: Callable[[], T], context: contextvars.Context) -> None:
+        """Send the hedge of a request whose first attempt is still running, if the budget allows."""
+        with race.changed:
+            if race.finished or any(future.done() for future in race.attempts):
+                return
+            if not self._spend():
+                return
+            hedge = self._submit(lambda: self._timed(attempt), context)
+            if hedge is None:
+                logger.debug("Not hedging a slow request: every hedging thread is busy")
+                return
+            logger.debug("Hedging a request that has not answered in time")
+            race.add(hedge)
+
+    def execute(self, attempt: Callable[[], T]) -> T:
+        """
+        Run an attempt, sending a second copy if the first is slower than the hedge delay.
+
+        The first successful result wins and the other attempt is cancelled or
+        its response closed. If every attempt fails, the error of the last one
+        to finish is raised. The hedge delay is counted from the moment the
+        first attempt starts running.
+
+        Args:
+            attempt: A callable performing the request; it may be called twice concurrently.
+
+        Returns:
+            The result of the first attempt to succeed.
+        """
+        self._earn()
+        race = _Race()
+        context = contextvars.copy_context()
+        delay = self.hedge_delay()
+
+        def primary() -> T:
+            # Each attempt gets its own copy, as a context cannot be entered by two threads at once
+            self._schedule(delay, lambda: self._send_hedge(race, attempt, context.copy()))
+            return self._timed(attempt)
+
+        with race.changed:
+            future = self._submit(primary, context.copy())
+            if future is not None:
+                race.add(future)
+        if future is None:
+            logger.debug("Every hedging thread is busy; sending the request without a hedge")
+            return self._timed(attempt)
+
+        winner = race.wait()
+        if winner is not race.attempts[0]:
+            with self._lock:
+                self._hedge_wins += 1
+        for loser in race.attempts:
+            if loser is not winner:
+                loser.cancel()
+                loser.add_done_callback(_discard)
+        return winner.result()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hedging statistics.
+
+        Returns:
+            A dictionary with the number of requests, hedges sent, hedges that won,
+            hedges denied by the budget, the available hedge tokens and the current delay.
+        """
+        delay = self.hedge_delay()
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hedges": self._hedges,
+                "hedge_wins": self._hedge_wins,
+                "denied": self._denied,
+                "tokens": self._tokens,
+                "delay": delay,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the timer and the thread pool once the running attempts have finished."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._timer_thread = None
+            self._timers.clear()
+            self._timer_wakeup.notify_all()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+class _Race:
+    """The attempts of one request, and the calling thread waiting for the first to succeed."""
+
+    def __init__(self):
+        self.changed = threading.Condition()
+        self.attempts: List[Future] = []
+        # Failed attempts in the order they completed
+        self.failed: List[Future] = []
+        self.finished = False
+
+    def add(self, future: Future) -> None:
+        """Add an attempt. Must be called with `changed` held."""
+        self.attempts.append(future)
+        future.add_done_callback(self._completed)
+
+    def _completed(self, future: Future) -> None:
+        """Wake up the waiting thread when an attempt completes."""
+        with self.changed:
+            if _failed(future):
+                self.failed.append(future)
+            self.changed.notify_all()
+
+    def wait(self) -> Future:
+        """
+        Wait for the first attempt to succeed; no hedge is sent once this returns or raises.
+
+        Returns:
+            The winning attempt.
+
+        Raises:
+            Exception: The error of the last attempt to fail, if every attempt failed.
+        """
+        with self.changed:
+            while True:
+                done = [future for future in self.attempts if future.done()]
+                for future in done:
+                    if not _failed(future):
+                        self.finished = True
+                        return future
+                if len(done) == len(self.attempts):
+                    self.finished = True
+                    # An attempt whose callback has not run yet failed after those in self.failed
+                    last = next((future for future in done if future not in self.failed), self.failed[-1])
+                    raise last.exception()
+                self.changed.wait()
+
+
+def _failed(future: Future) -> bool:
+    """Whether a completed attempt was cancelled or raised."""
+    return future.cancelled() or future.exception() is not None
+
+
+def _discard(future: Future) -> None:
+    """Close the response of an attempt that lost the race, releasing its connection."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    close = getattr(future.result(), "close", None)
+    if close is not None:
+        close()
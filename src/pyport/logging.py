@@ -284,6 +284,25 @@ def format_response_for_logging(
     return response_info
 
 
+def _dumps(info: Dict[str, Any], codec=None) -> str:
+    """
+    Serialize a log record to JSON.
+
+    Args:
+        info: The record to serialize.
+        codec: The JsonCodec to use, or None for the standard library.
+
+    Returns:
+        The record as a JSON string.
+    """
+    if codec is not None:
+        try:
+            return codec.dumps_str(info)
+        except (TypeError, ValueError):
+            pass
+    return json.dumps(info, default=str)
+
+
 def log_request(
     method: str,
     url: str,
@@ -292,6 +311,7 @@ def log_request(
     data: Optional[Any] = None,
     json_data: Optional[Any] = None,
     correlation_id: Optional[str] = None,
+    codec=None,
     **kwargs
 ) -> str:
     """
@@ -305,6 +325,7 @@ def log_request(
         data: The request body data.
         json_data: The request body JSON data.
         correlation_id: A correlation ID for tracking the request.
+        codec: The JsonCodec used to serialize the log line (default: the standard library).
         **kwargs: Additional request parameters.
 
     Returns:
@@ -322,7 +343,7 @@ def log_request(
         )
 
         # Log the request
-        logger.debug(f"Request: {json.dumps(request_info)}")
+        logger.debug(f"Request: {_dumps(request_info, codec)}")
 
     return correlation_id
 
@@ -330,7 +351,8 @@ def log_request(
 def log_response(
     response,
     correlation_id: Optional[str] = None,
-    include_body: bool = True
+    include_body: bool = True,
+    codec=None
 ) -> None:
     """
     Log a response, masking sensitive information.
@@ -339,6 +361,7 @@ def log_response(
         response: The response object.
         correlation_id: A correlation ID for tracking the request.
         include_body: Whether to include the response body in the log.
+        codec: The JsonCodec used to serialize the log line (default: the standard library).
     """
     # Only format and log the response if debug logging is enabled
     if logger.isEnabledFor(logging.DEBUG):
@@ -346,7 +369,7 @@ def log_response(
         response_info = format_response_for_logging(response, correlation_id, include_body)
 
         # Log the response
-        logger.debug(f"Response: {json.dumps(response_info)}")
+        logger.debug(f"Response: {_dumps(response_info, codec)}")
 
 
 def log_error(
@@ -0,0 +1,273 @@
+"""
+Request metrics for the PyPort client library.
+
+`RequestMetrics` records, for each HTTP method and endpoint template
+(`blueprints/{id}/entities/{id}`, see `pyport.client.endpoints.endpoint_template`):
+
+- a latency histogram and histograms of request and response body sizes,
+- the number of responses by status code ("error" for requests that got no response),
+- the number of retries, circuit breaker trips and requests rejected by an open circuit.
+
+Histograms use fixed log-scaled buckets (`pyport.window.Histogram`), so memory
+does not grow with the number of requests, and percentiles are read without
+sorting. Metrics can be read as a dictionary or exported in the Prometheus
+text format, for example from a `/metrics` handler of the host application.
+
+Example usage:
+
+```python
+from pyport import PortClient
+
+client = PortClient(client_id="...", client_secret="...")
+client.blueprints.get_blueprints()
+
+print(client.metrics()["GET blueprints"]["latency"]["p99"])
+print(client.request_metrics.to_prometheus())
+```
+"""
+import threading
+from typing import Any, Dict, List, Tuple, Union
+
+from .client.endpoints import endpoint_template
+from .window import Histogram
+
+#: Percentiles reported for each histogram
+PERCENTILES = (50, 90, 99)
+
+#: Endpoint template under which endpoints beyond max_endpoints are recorded
+OTHER_ENDPOINTS = "{other}"
+
+
+class EndpointMetrics:
+    """
+    Metrics of the requests made with one method to one endpoint template.
+
+    Attributes:
+        latency: Histogram of request durations in seconds.
+        request_bytes: Histogram of request body sizes in bytes.
+        response_bytes: Histogram of response body sizes in bytes.
+        status_codes: Number of responses by status code, and of failed requests under "error".
+        retries: Number of retries.
+        circuit_trips: Number of times a failure opened the circuit breaker.
+        circuit_rejections: Number of requests rejected by an open circuit breaker.
+    """
+
+    def __init__(self):
+        """Initialize empty EndpointMetrics."""
+        self.latency = Histogram(min_value=1e-4, max_value=1e3)
+        self.request_bytes = Histogram(min_value=1, max_value=1e10)
+        self.response_bytes = Histogram(min_value=1, max_value=1e10)
+        self.status_codes: Dict[str, int] = {}
+        self.retries = 0
+        self.circuit_trips = 0
+        self.circuit_rejections = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the metrics as a dictionary.
+
+        Returns:
+            The request count, status codes, retry and circuit breaker counters, and
+            the count, mean and percentiles of each histogram.
+        """
+        return {
+            "requests": sum(self.status_codes.values()),
+            "status_codes": dict(self.status_codes),
+            "retries": self.retries,
+            "circuit_trips": self.circuit_trips,
+            "circuit_rejections": self.circuit_rejections,
+            "latency": _summarize(self.latency),
+            "request_bytes": _summarize(self.request_bytes),
+            "response_bytes": _summarize(self.response_bytes),
+        }
+
+
+def _summarize(histogram: Histogram) -> Dict[str, float]:
+    """Get the count, sum, mean and percentiles of a histogram."""
+    summary = {
+        "count": histogram.count,
+        "sum": histogram.total,
+        "mean": histogram.total / histogram.count if histogram.count else 0.0,
+    }
+    for percentile in PERCENTILES:
+        summary[f"p{percentile}"] = histogram.percentile(percentile)
+    return summary
+
+
+class RequestMetrics:
+    """
+    Thread-safe registry of request metrics keyed by method and endpoint template.
+
+    A registry can be shared between clients to aggregate their requests.
+
+    Attributes:
+        max_endpoints: Maximum number of (method, endpoint template) pairs tracked.
+            Further endpoints are recorded under the "{other}" template.
+    """
+
+    def __init__(self, max_endpoints: int = 500):
+        """
+        Initialize the RequestMetrics.
+
+        Args:
+            max_endpoints: Maximum number of (method, endpoint template) pairs tracked (default: 500).
+        """
+        self.max_endpoints = max_endpoints
+        self._lock = threading.Lock()
+        self._endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+
+    def _get(self, method: str, endpoint: str) -> EndpointMetrics:
+        """Get the metrics of a request, creating them if needed. Called with the lock held."""
+        key = (method.upper(), endpoint_template(endpoint))
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            if len(self._endpoints) >= self.max_endpoints:
+                key = (key[0], OTHER_ENDPOINTS)
+                metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = EndpointMetrics()
+        return metrics
+
+    def record_response(self, method: str, endpoint: str, status_code: int, latency: float,
+                        request_bytes: int = 0, response_bytes: int = 0) -> None:
+        """
+        Record a request that received a response.
+
+        Args:
+            method: HTTP method (e.g., 'GET').
+            endpoint: The API endpoint.
+            status_code: The response status code.
+            latency: Time in seconds from sending the request to receiving the response.
+            request_bytes: Size of the request body in bytes.
+            response_bytes: Size of the response body in bytes.
+        """
+        with self._lock:
+            metrics = self._get(method, endpoint)
+            status = str(status_code)
+            metrics.status_codes[status] = metrics.status_codes.get(status, 0) + 1
+            metrics.latency.record(latency)
+            metrics.request_bytes.record(request_bytes)
+            metrics.response_bytes.record(response_bytes)
+
+    def record_error(self, method: str, endpoint: str, latency: float, request_bytes: int = 0) -> None:
+        """
+        Record a request that failed without a response (e.g. a timeout or connection error).
+
+        Args:
+            method: HTTP method (e.g., 'GET').
+            endpoint: The API endpoint.
+            latency: Time in seconds until the request failed.
+            request_bytes: Size of the request body in bytes.
+        """
+        with self._lock:
+            metrics = self._get(method, endpoint)
+            metrics.status_codes["error"] = metrics.status_codes.get("error", 0) + 1
+            metrics.latency.record(latency)
+            metrics.request_bytes.record(request_bytes)
+
+    def record_event(self, method: str, endpoint: str, event: str) -> None:
+        """
+        Record a retry or circuit breaker event, as reported by `with_retry(on_event=...)`.
+
+        Args:
+            method: HTTP method (e.g., 'GET').
+            endpoint: The API endpoint.
+            event: "retry", "circuit_trip" or "circuit_open".
+        """
+        with self._lock:
+            metrics = self._get(method, endpoint)
+            if event == "retry":
+                metrics.retries += 1
+            elif event == "circuit_trip":
+                metrics.circuit_trips += 1
+            elif event == "circuit_open":
+                metrics.circuit_rejections += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the metrics of every endpoint.
+
+        Returns:
+            A dictionary keyed by "METHOD endpoint-template" (e.g. "GET blueprints/{id}"),
+            with the values described in `EndpointMetrics.snapshot`.
+        """
+        with self._lock:
+            return {f"{method} {template}": metrics.snapshot()
+                    for (method, template), metrics in sorted(self._endpoints.items())}
+
+    def to_prometheus(self, prefix: str = "pyport") -> str:
+        """
+        Export the metrics in the Prometheus text exposition format.
+
+        Histograms are exported as summaries with 0.5, 0.9 and 0.99 quantiles;
+        counters carry `method` and `endpoint` labels, and the request counter a
+        `status` label.
+
+        Args:
+            prefix: Prefix of the metric names (default: "pyport").
+
+        Returns:
+            The metrics, one sample per line.
+        """
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines: List[str] = []
+
+            def family(name: str, kind: str, description: str) -> str:
+                metric = f"{prefix}_{name}"
+                lines.append(f"# HELP {metric} {description}")
+                lines.append(f"# TYPE {metric} {kind}")
+                return metric
+
+            metric = family("requests_total", "counter", "Requests by endpoint template and status code.")
+            for (method, template), metrics in endpoints:
+                for status, count in sorted(metrics.status_codes.items()):
+                    lines.append(f"{metric}{_labels(method, template, status=status)} {count}")
+
+            for name, attribute, description in (
+                ("request_duration_seconds", "latency", "Request latency in seconds."),
+                ("request_size_bytes", "request_bytes", "Request body size in bytes."),
+                ("response_size_bytes", "response_bytes", "Response body size in bytes."),
+            ):
+                metric = family(name, "summary", description)
+                for (method, template), metrics in endpoints:
+                    histogram = getattr(metrics, attribute)
+                    for percentile in PERCENTILES:
+                        labels = _labels(method, template, quantile=percentile / 100)
+                        lines.append(f"{metric}{labels} {_number(histogram.percentile(percentile))}")
+                    lines.append(f"{metric}_sum{_labels(method, template)} {_number(histogram.total)}")
+                    lines.append(f"{metric}_count{_labels(method, template)} {histogram.count}")
+
+            for name, attribute, description in (
+                ("request_retries_total", "retries", "Retried requests."),
+                ("circuit_breaker_trips_total", "circuit_trips", "Failures that opened a circuit breaker."),
+                ("circuit_breaker_rejections_total", "circuit_rejections",
+                 "Requests rejected by an open circuit breaker."),
+            ):
+                metric = family(name, "counter", description)
+                for (method, template), metrics in endpoints:
+                    lines.append(f"{metric}{_labels(method, template)} {getattr(metrics, attribute)}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Remove all recorded metrics."""
+        with self._lock:
+            self._endpoints.clear()
+
+
+def _labels(method: str, endpoint: str, **extra: Union[str, float]) -> str:
+    """Format Prometheus labels, escaping their values."""
+    labels = {"method": method, "endpoint": endpoint, **{name: str(value) for name, value in extra.items()}}
+    escaped = (f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    """Format a sample value."""
+    return repr(float(value))
@@ -0,0 +1,194 @@
+"""
+Per-request timing breakdown for the PyPort client library.
+
+When a call is slow, a `RequestProfiler` shows where the time went. For a
+sample of requests it records how long each phase of the request took:
+
+- `queue`: waiting for the client-side rate limiter before sending.
+- `connect`: opening the connection, TLS included. Only transports that report
+  it set this (`HttpxTransport`); otherwise it is part of `ttfb`.
+- `ttfb`: from sending the request until the response headers arrived.
+- `download`: reading the response body.
+- `parse`: decoding the JSON body.
+- `log`: `log_request` and `log_response`, which serialize and mask bodies at DEBUG level.
+
+Each sampled response carries its `RequestTimings` as `response.timings`, the
+profiler's callback receives it, and `get_stats()` summarizes every phase over
+the sampled requests.
+
+Example usage:
+
+```python
+from pyport import PortClient
+from pyport.profiling import RequestProfiler
+
+def report(timings):
+    if timings.total > 1.0:
+        print("slow request", timings.as_dict())
+
+profiler = RequestProfiler(sample_rate=0.01, callback=report)
+client = PortClient(client_id="...", client_secret="...", request_profiler=profiler)
+
+# ... production traffic ...
+print(profiler.get_stats()["ttfb"]["p99"])
+```
+"""
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from .window import Histogram
+
+logger = logging.getLogger("pyport")
+
+#: Phases of a request, in the order they happen
+PHASES = ("queue", "connect", "ttfb", "download", "parse", "log")
+
+
+@dataclass
+class RequestTimings:
+    """
+    Time in seconds spent in each phase of one request.
+
+    A request sent twice (a 401 replayed with a refreshed token) adds up both
+    sends. Phases a transport does not report are None.
+
+    Attributes:
+        method: The HTTP method.
+        endpoint: The API endpoint.
+        status_code: The response status code, or None if no response was received.
+        queue: Time waiting for the rate limiter.
+        connect: Time opening connections, or None if the transport does not report it.
+        ttfb: Time from sending the request until the response headers arrived.
+        download: Time reading the response body.
+        parse: Time decoding the JSON body, or None if it was not parsed.
+        log: Time spent logging the request and response.
+        total: Time in the request, from the first log line to the handled response.
+    """
+    method: str
+    endpoint: str
+    status_code: Optional[int] = None
+    queue: float = 0.0
+    connect: Optional[float] = None
+    ttfb: float = 0.0
+    download: float = 0.0
+    parse: Optional[float] = None
+    log: float = 0.0
+    total: float = 0.0
+    started: float = field(default_factory=time.perf_counter, repr=False, compare=False)
+
+    @property
+    def other(self) -> float:
+        """Time in the request not covered by a phase (body encoding, response handling)."""
+        phases = sum(getattr(self, phase) or 0.0 for phase in PHASES)
+        return max(0.0, self.total - phases)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the timings as a dictionary.
+
+        Returns:
+            The method, endpoint, status code, each phase, other and total.
+        """
+        timings: Dict[str, Any] = {"method": self.method, "endpoint": self.endpoint,
+                                   "status_code": self.status_code}
+        for phase in PHASES:
+            timings[phase] = getattr(self, phase)
+        timings["other"] = self.other
+        timings["total"] = self.total
+        return timings
+
+
+class RequestProfiler:
+    """
+    Samples requests and records the time spent in each of their phases.
+
+    Requests that are not sampled only cost one random number. A profiler can
+    be shared between clients.
+
+    Attributes:
+        sample_rate: Fraction of requests profiled, between 0 and 1.
+        callback: Function called with the RequestTimings of each profiled request.
+    """
+
+    def __init__(self, sample_rate: float = 1.0,
+                 callback: Optional[Callable[[RequestTimings], None]] = None):
+        """
+        Initialize the RequestProfiler.
+
+        Args:
+            sample_rate: Fraction of requests profiled, between 0 and 1 (default: 1.0, every request).
+            callback: Function called with the RequestTimings of each profiled request, in the
+                thread that made it (default: None). Its exceptions are logged and ignored.
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.sample_rate = sample_rate
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._histograms = {phase: Histogram() for phase in PHASES + ("other", "total")}
+        self._samples = 0
+
+    def start(self, method: str, endpoint: str) -> Optional[RequestTimings]:
+        """
+        Decide whether to profile a request.
+
+        Args:
+            method: HTTP method (e.g., 'GET').
+            endpoint: The API endpoint.
+
+        Returns:
+            The RequestTimings to fill in, or None if the request is not sampled.
+        """
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return None
+        return RequestTimings(method=method.upper(), endpoint=endpoint)
+
+    def finish(self, timings: RequestTimings) -> None:
+        """
+        Complete the timings of a profiled request, record them and pass them to the callback.
+
+        Args:
+            timings: The timings returned by `start`.
+        """
+        timings.total = time.perf_counter() - timings.started
+        with self._lock:
+            self._samples += 1
+            for phase, value in timings.as_dict().items():
+                if phase in self._histograms and value is not None:
+                    self._histograms[phase].record(value)
+        if self.callback is not None:
+            try:
+                self.callback(timings)
+            except Exception as e:
+                logger.warning(f"Request profiler callback failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Summarize the phases of the profiled requests.
+
+        Returns:
+            The number of samples, and for each phase (plus "other" and "total")
+            the number of requests that reported it, its mean and its p50, p90 and p99.
+        """
+        with self._lock:
+            stats: Dict[str, Any] = {"samples": self._samples}
+            for phase, histogram in self._histograms.items():
+                stats[phase] = {
+                    "count": histogram.count,
+                    "mean": histogram.total / histogram.count if histogram.count else 0.0,
+                    "p50": histogram.percentile(50),
+                    "p90": histogram.percentile(90),
+                    "p99": histogram.percentile(99),
+                }
+            return stats
+
+    def reset(self) -> None:
+        """Forget the recorded timings."""
+        with self._lock:
+            self._samples = 0
+            for histogram in self._histograms.values():
+                histogram.clear()
@@ -0,0 +1,310 @@
+"""
+Client-side rate limiting for the PyPort client library.
+
+This module provides an adaptive token-bucket rate limiter that paces
+requests before they are sent, instead of only backing off after the API
+has answered with 429 Too Many Requests.
+
+Features:
+- One token bucket per endpoint class (reads, writes, search), shared by all threads
+- Multiplicative decrease when a 429 is received, honouring Retry-After
+- Tightening from X-RateLimit-Remaining / X-RateLimit-Reset headers before the limit is hit
+- Additive increase back to the configured rate on success
+
+Example usage:
+
+```python
+from pyport import PortClient
+from pyport.rate_limit import RateLimiter
+
+client = PortClient(
+    client_id="your-client-id",
+    client_secret="your-client-secret",
+    rate_limiter=RateLimiter(read_rate=50, write_rate=10, search_rate=5)
+)
+```
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from .client.endpoints import READ, SEARCH, WRITE, endpoint_class
+
+logger = logging.getLogger("pyport")
+
+#: Longest reset window honoured; larger X-RateLimit-Reset values are Unix timestamps
+MAX_RESET_WINDOW = 24 * 60 * 60.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with an adjustable refill rate.
+
+    Tokens are reserved rather than polled: each caller takes a token
+    immediately, letting the balance go negative, and then sleeps for the
+    time it takes the bucket to refill to that point. Callers are therefore
+    served in arrival order and no thread spins.
+
+    Attributes:
+        max_rate: The configured refill rate in tokens per second.
+        rate: The current refill rate, which may be lowered after rate limiting.
+        min_rate: The lowest rate the bucket will be lowered to.
+        capacity: The maximum number of tokens (the allowed burst).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, min_rate: Optional[float] = None):
+        """
+        Initialize a TokenBucket.
+
+        Args:
+            rate: Refill rate in tokens per second.
+            capacity: Maximum number of tokens (default: one second's worth, at least 1).
+            min_rate: Lowest rate after tightening (default: 5% of rate).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.min_rate = float(min_rate) if min_rate is not None else self.max_rate * 0.05
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.max_rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last refill. Must be called with the lock held."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def reserve(self) -> float:
+        """
+        Take one token and return how long the caller must wait before using it.
+
+        Returns:
+            The wait time in seconds (0.0 if a token was available).
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        Returns:
+            The time spent waiting in seconds.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def tighten(self, factor: float, pause: float = 0.0) -> None:
+        """
+        Lower the refill rate and optionally stop handing out tokens for a while.
+
+        Args:
+            factor: Multiplier applied to the current rate (0 < factor <= 1).
+            pause: Seconds during which no new token becomes available.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate * factor)
+            if pause > 0:
+                self._tokens = min(self._tokens, -pause * self.rate)
+
+    def cap_rate(self, rate: float) -> None:
+        """
+        Lower the refill rate to at most `rate`.
+
+        Args:
+            rate: The new upper bound for the current rate.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, min(self.rate, rate))
+
+    def loosen(self, step: float, limit: Optional[float] = None) -> None:
+        """
+        Raise the refill rate by `step`, up to the configured rate.
+
+        Args:
+            step: Tokens per second to add to the current rate.
+            limit: An optional lower bound to stop at, e.g. the rate a server advertised.
+        """
+        ceiling = self.max_rate if limit is None else min(self.max_rate, limit)
+        if self.rate >= ceiling:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.rate, min(ceiling, self.rate + step))
+
+
+class RateLimiter:
+    """
+    Adaptive rate limiter with separate budgets for reads, writes and searches.
+
+    A single RateLimiter is shared by every thread using a client. Before a
+    request is sent, `acquire` takes a token from the bucket for its
+    endpoint class. After the response arrives, `record_response` adjusts that
+    bucket: a 429 halves its rate (and pauses it for Retry-After seconds), a
+    low X-RateLimit-Remaining spreads the remaining budget over the reset
+    window, and every success moves the rate back towards the configured one.
+
+    Attributes:
+        buckets: The token bucket for each endpoint class.
+        decrease_factor: Multiplier applied to a bucket's rate after a 429.
+        recovery_step: Fraction of the configured rate regained per successful request.
+    """
+
+    def __init__(self, read_rate: float = 20.0, write_rate: float = 10.0, search_rate: float = 10.0,
+                 burst: Optional[float] = None, decrease_factor: float = 0.5, recovery_step: float = 0.02):
+        """
+        Initialize a RateLimiter.
+
+        Args:
+            read_rate: Requests per second for reads (default: 20.0).
+            write_rate: Requests per second for writes (default: 10.0).
+            search_rate: Requests per second for search and aggregation queries (default: 10.0).
+            burst: Maximum burst size for every bucket (default: one second's worth of requests).
+            decrease_factor: Multiplier applied to a bucket's rate after a 429 (default: 0.5).
+            recovery_step: Fraction of the configured rate regained per success (default: 0.02).
+        """
+        if not 0 < decrease_factor <= 1:
+            raise ValueError("decrease_factor must be in (0, 1]")
+        self.buckets: Dict[str, TokenBucket] = {
+            READ: TokenBucket(read_rate, capacity=burst),
+            WRITE: TokenBucket(write_rate, capacity=burst),
+            SEARCH: TokenBucket(search_rate, capacity=burst),
+        }
+        self.decrease_factor = decrease_factor
+        self.recovery_step = recovery_step
+        self._lock = threading.Lock()
+        self._waits: Dict[str, int] = {name: 0 for name in self.buckets}
+        self._wait_time: Dict[str, float] = {name: 0.0 for name in self.buckets}
+        self._throttled: Dict[str, int] = {name: 0 for name in self.buckets}
+
+    def acquire(self, method: str, endpoint: str) -> float:
+        """
+        Wait until a request to `endpoint` may be sent.
+
+        Args:
+            method: The HTTP method of the request.
+            endpoint: The API endpoint of the request.
+
+        Returns:
+            The time spent waiting in seconds.
+        """
+        name = endpoint_class(method, endpoint)
+        wait = self.buckets[name].acquire()
+        if wait > 0:
+            with self._lock:
+                self._waits[name] += 1
+                self._wait_time[name] += wait
+        return wait
+
+    def record_response(self, method: str, endpoint: str, status_code: int,
+                        headers: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        Adjust the budget for an endpoint class from a response.
+
+        Args:
+            method: The HTTP method of the request.
+            endpoint: The API endpoint of the request.
+            status_code: The HTTP status code of the response.
+            headers: The response headers.
+        """
+        name = endpoint_class(method, endpoint)
+        bucket = self.buckets[name]
+
+        if status_code == 429:
+            pause = _header_number(headers, "Retry-After") or 0.0
+            bucket.tighten(self.decrease_factor, pause=pause)
+            with self._lock:
+                self._throttled[name] += 1
+            logger.warning(f"Rate limited on {name} requests; pacing at {bucket.rate:.2f} requests/second.")
+            return
+
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        reset = _reset_seconds(_header_number(headers, "X-RateLimit-Reset"))
+        advertised = None
+        if remaining is not None and reset:
+            # Spread what is left of the server's budget over the rest of its window
+            advertised = max(remaining, 1.0) / reset
+            bucket.cap_rate(advertised)
+
+        if 200 <= status_code < 400:
+            # Recover towards the configured rate, but never past what the server advertised
+            bucket.loosen(bucket.max_rate * self.recovery_step, limit=advertised)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the current state of every bucket.
+
+        Returns:
+            A dictionary keyed by endpoint class with the current and configured rates,
+            the number of requests that had to wait, the total wait time and the number
+            of 429 responses seen.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "rate": bucket.rate,
+                    "max_rate": bucket.max_rate,
+                    "waits": self._waits[name],
+                    "wait_time": self._wait_time[name],
+                    "throttled": self._throttled[name],
+                }
+                for name, bucket in self.buckets.items()
+            }
+
+
+def _reset_seconds(reset: Optional[float], now: Optional[float] = None) -> Optional[float]:
+    """
+    Convert an X-RateLimit-Reset value to the number of seconds left in the window.
+
+    Servers send either the seconds left or the Unix time (in seconds or
+    milliseconds) at which the window resets. Values larger than
+    MAX_RESET_WINDOW are read as Unix times.
+
+    Args:
+        reset: The header value.
+        now: The current Unix time (default: time.time()).
+
+    Returns:
+        The seconds left, at most MAX_RESET_WINDOW, or None if the value is
+        missing or the window has already reset.
+    """
+    if reset is None:
+        return None
+    if reset > MAX_RESET_WINDOW:
+        if reset > 1e11:  # Milliseconds since the epoch
+            reset /= 1000.0
+        reset -= time.time() if now is None else now
+    if reset <= 0:
+        return None
+    return min(reset, MAX_RESET_WINDOW)
+
+
+def _header_number(headers: Optional[Mapping[str, Any]], name: str) -> Optional[float]:
+    """
+    Read a numeric header value.
+
+    Args:
+        headers: The response headers.
+        name: The header name.
+
+    Returns:
+        The header value as a float, or None if it is missing or not numeric.
+    """
+    if not headers:
+        return None
+    try:
+        value = headers.get(name)
+        return float(value) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
@@ -45,13 +45,18 @@ def fetch_data(url, method="GET"):
 """
 import logging
 import random
+import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Type, TypeVar, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Type, TypeVar, Union
 
 import requests
-from .exceptions import PortApiError, PortRateLimitError, PortTimeoutError, PortNetworkError
+from .client.endpoints import endpoint_template, is_safe_read
+from .constants import IDEMPOTENCY_KEY_HEADER
+from .deadline import current_deadline
+from .exceptions import PortApiError, PortDeadlineExceededError, PortRateLimitError, PortTimeoutError, PortNetworkError
+from .window import CountWindow, History, TimeWindow
 
 logger = logging.getLogger("pyport")
 
@@ -76,7 +81,11 @@ class RetryStats:
 
     This class tracks detailed statistics about retry attempts, including
     the number of attempts, successes, failures, and timing information.
-    It also keeps track of the errors that occurred during retry attempts.
+    It also keeps track of the most recent errors that occurred during retry attempts.
+
+    Counters cover the life of the statistics, while the error and retry time
+    histories keep only the last `history_size` entries, so memory stays bounded
+    in long-running processes. Updates take constant time and are thread-safe.
 
     Attributes:
         attempts: Total number of attempts (including the initial attempt).
@@ -84,11 +93,14 @@ class RetryStats:
         failures: Number of failed attempts.
         total_retry_time: Total time spent in retries (in seconds).
         last_error: The most recent error that occurred.
-        errors: List of all errors that occurred during retry attempts.
-        retry_times: List of retry times (in seconds) for each attempt.
+        errors: The most recent errors that occurred during retry attempts (at most history_size).
+        retry_times: The most recent retry times (in seconds), one per attempt (at most history_size).
         error_types: Dictionary mapping error types to counts.
         start_time: Time when the first attempt was made.
         end_time: Time when the last attempt was made.
+        history_size: Number of errors and retry times kept.
+        budget_exhausted: Number of retries refused because the retry budget was exhausted.
+        recent_seconds: Length in seconds of the window for recent error rates.
     """
     attempts: int = 0
     successes: int = 0
@@ -100,6 +112,21 @@ class RetryStats:
     error_types: Dict[str, int] = field(default_factory=dict)
     start_time: float = field(default_factory=time.time)
     end_time: float = 0.0
+    history_size: int = 100
+    recent_seconds: float = 30.0
+    budget_exhausted: int = 0
+    _delays: CountWindow = field(init=False, repr=False, compare=False)
+    _recent: TimeWindow = field(init=False, repr=False, compare=False)
+    _lock: Any = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Bound the histories and create the windows."""
+        self.errors = History(self.errors, maxlen=self.history_size)
+        self.retry_times = History(self.retry_times, maxlen=self.history_size)
+        self._delays = CountWindow(self.history_size, percentiles=True)
+        for delay in self.retry_times:
+            self._delays.record(delay)
+        self._recent = TimeWindow(self.recent_seconds)
 
     def record_attempt(self, success: bool, error: Optional[Exception] = None, retry_time: float = 0.0) -> None:
         """
@@ -110,36 +137,61 @@ class RetryStats:
             error: The error that occurred (if any).
             retry_time: The time spent in the retry (in seconds).
         """
-        self.attempts += 1
-        self.end_time = time.time()
-
-        if success:
-            self.successes += 1
-        else:
-            self.failures += 1
-            if error:
-                self.last_error = error
-                self.errors.append(error)
+        with self._lock:
+            self.attempts += 1
+            self.end_time = time.time()
 
-                # Track error types
-                error_type = type(error).__name__
-                self.error_types[error_type] = self.error_types.get(error_type, 0) + 1
+            if success:
+                self.successes += 1
+            else:
+                self.failures += 1
+                if error:
+                    self.last_error = error
+                    self.errors.append(error)
+
+                    # Track error types
+                    error_type = type(error).__name__
+                    self.error_types[error_type] = self.error_types.get(error_type, 0) + 1
+
+            self.total_retry_time += retry_time
+            self.retry_times.append(retry_time)
+            self._delays.record(retry_time)
+            self._recent.record(failed=not success)
+
+    def record_budget_exhausted(self) -> None:
+        """Record a retry refused because the retry budget was exhausted."""
+        with self._lock:
+            self.budget_exhausted += 1
+
+    def record_retry_delay(self, delay: float) -> None:
+        """
+        Set the retry time of the most recent attempt, once its backoff delay is known.
 
-        self.total_retry_time += retry_time
-        self.retry_times.append(retry_time)
+        Args:
+            delay: The delay before the next attempt (in seconds).
+        """
+        with self._lock:
+            if self.retry_times:
+                self.total_retry_time += delay - self.retry_times[-1]
+                self.retry_times[-1] = delay
+                self._delays.replace_last(delay)
 
     def reset(self) -> None:
         """Reset all statistics."""
-        self.attempts = 0
-        self.successes = 0
-        self.failures = 0
-        self.total_retry_time = 0.0
-        self.last_error = None
-        self.errors = []
-        self.retry_times = []
-        self.error_types = {}
-        self.start_time = time.time()
-        self.end_time = 0.0
+        with self._lock:
+            self.attempts = 0
+            self.successes = 0
+            self.failures = 0
+            self.total_retry_time = 0.0
+            self.last_error = None
+            self.errors = History(maxlen=self.history_size)
+            self.retry_times = History(maxlen=self.history_size)
+            self._delays.clear()
+            self._recent.clear()
+            self.error_types = {}
+            self.start_time = time.time()
+            self.end_time = 0.0
+            self.budget_exhausted = 0
 
     def get_success_rate(self) -> float:
         """
@@ -152,16 +204,38 @@ class RetryStats:
             return 0.0
         return (self.successes / self.attempts) * 100
 
+    def get_recent_error_rate(self) -> float:
+        """
+        Get the percentage of failed attempts in the last recent_seconds seconds.
+
+        Returns:
+            The recent error rate as a percentage, or 0.0 if no recent attempts were made.
+        """
+        with self._lock:
+            return self._recent.error_rate()
+
     def get_average_retry_time(self) -> float:
         """
-        Get the average retry time in seconds.
+        Get the average retry time in seconds over the retry time history.
 
         Returns:
             The average retry time in seconds, or 0.0 if no retries have been made.
         """
-        if not self.retry_times:
-            return 0.0
-        return sum(self.retry_times) / len(self.retry_times)
+        with self._lock:
+            return self._delays.mean()
+
+    def get_retry_time_percentile(self, percentile: float) -> float:
+        """
+        Get a percentile of the retry times in the history.
+
+        Args:
+            percentile: The percentile, between 0 and 100.
+
+        Returns:
+            The percentile in seconds, or 0.0 if no attempts have been made.
+        """
+        with self._lock:
+            return self._delays.percentile(percentile)
 
     def get_total_duration(self) -> float:
         """
@@ -199,9 +273,12 @@ class RetryStats:
             "success_rate": self.get_success_rate(),
             "total_retry_time": self.total_retry_time,
             "average_retry_time": self.get_average_retry_time(),
+            "p95_retry_time": self.get_retry_time_percentile(95),
+            "recent_error_rate": self.get_recent_error_rate(),
             "total_duration": self.get_total_duration(),
             "error_types": self.error_types,
-            "most_common_error": self.get_most_common_error()
+            "most_common_error": self.get_most_common_error(),
+            "budget_exhausted": self.budget_exhausted
         }
 
     def __str__(self) -> str:
@@ -223,6 +300,11 @@ class CircuitBreakerState:
     after a certain number of consecutive failures, then allowing a test request
     after a timeout to see if the service has recovered.
 
+    State transitions are made under a lock, so one breaker can be shared by many
+    threads. While the circuit is half-open, at most `half_open_max_calls` test
+    requests are let through; the others are rejected until a test request
+    succeeds (closing the circuit) or fails (opening it again).
+
     Attributes:
         failure_threshold: Number of consecutive failures before opening the circuit.
         reset_timeout: Time in seconds before the circuit fully resets.
@@ -231,6 +313,10 @@ class CircuitBreakerState:
         error_threshold_percentage: Percentage of errors that will trigger the circuit breaker.
         min_request_threshold: Minimum number of requests before error rate is considered.
         adaptive: Whether to use adaptive thresholds based on error patterns.
+        window_seconds: If set, the error rate covers the requests of the last window_seconds
+            seconds instead of the last window_size requests.
+        half_open_max_calls: Number of test requests allowed at the same time while half-open.
+        name: Name used in log messages (e.g. the endpoint template the breaker guards).
     """
     # Configuration
     failure_threshold: int = 5       # Number of consecutive failures before opening the circuit
@@ -240,102 +326,146 @@ class CircuitBreakerState:
     error_threshold_percentage: float = 50.0  # Percentage of errors that will trigger the circuit breaker
     min_request_threshold: int = 5   # Minimum number of requests before error rate is considered
     adaptive: bool = True            # Whether to use adaptive thresholds based on error patterns
+    half_open_max_calls: int = 1     # Test requests allowed at the same time while half-open
+    name: str = ""                   # Name used in log messages
+    window_seconds: Optional[float] = None  # Use the requests of the last N seconds instead of window_size
 
     # State
     failures: int = 0
     last_failure_time: float = 0.0
     is_open: bool = False
-    request_history: List[bool] = field(default_factory=list)  # True for success, False for failure
     total_requests: int = 0
     total_failures: int = 0
+    _history: Any = field(init=False, repr=False, compare=False)
+    _probes: List[float] = field(default_factory=list, init=False, repr=False, compare=False)
+    _lock: Any = field(default_factory=threading.RLock, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Create the window the error rate is computed over."""
+        self._history = (TimeWindow(self.window_seconds) if self.window_seconds
+                         else CountWindow(self.window_size))
+
+    @property
+    def request_history(self) -> List[bool]:
+        """The outcomes in the error rate window: True for success, False for failure."""
+        with self._lock:
+            return self._history.outcomes()
+
+    def _label(self) -> str:
+        """Describe the breaker in log messages."""
+        return f"Circuit breaker for {self.name}" if self.name else "Circuit breaker"
 
     def record_failure(self) -> None:
         """Record a failure and potentially open the circuit."""
-        self.failures += 1
-        self.total_failures += 1
-        self.total_requests += 1
-        self.last_failure_time = time.time()
-
-        # Update request history
-        self.request_history.append(False)
-        if len(self.request_history) > self.window_size:
-            self.request_history.pop(0)
-
-        # Check if we should open the circuit based on consecutive failures
-        if self.failures >= self.failure_threshold:
-            self.is_open = True
-            logger.warning(
-                f"Circuit breaker opened after {self.failures} consecutive failures. "
-                f"Will reset after {self.reset_timeout} seconds."
-            )
-            return
-
-        # Check if we should open the circuit based on error rate
-        if self.adaptive and len(self.request_history) >= self.min_request_threshold:
-            error_rate = self.request_history.count(False) / len(self.request_history) * 100.0
-            if error_rate >= self.error_threshold_percentage:
+        with self._lock:
+            self._probes.clear()
+            self.failures += 1
+            self.total_failures += 1
+            self.total_requests += 1
+            self.last_failure_time = time.time()
+
+            # Update request history
+            self._history.record(failed=True)
+
+            # Check if we should open the circuit based on consecutive failures
+            if self.failures >= self.failure_threshold:
+                if not self.is_open:
+                    logger.warning(
+                        f"{self._label()} opened after {self.failures} consecutive failures. "
+                        f"Will reset after {self.reset_timeout} seconds."
+                    )
                 self.is_open = True
-                logger.warning(
-                    f"Circuit breaker opened due to high error rate: {error_rate:.1f}%. "
-                    f"Will reset after {self.reset_timeout} seconds."
-                )
+                return
+
+            # Check if we should open the circuit based on error rate
+            if self.adaptive and self._history.count >= self.min_request_threshold:
+                error_rate = self._history.error_rate()
+                if error_rate >= self.error_threshold_percentage:
+                    if not self.is_open:
+                        logger.warning(
+                            f"{self._label()} opened due to high error rate: {error_rate:.1f}%. "
+                            f"Will reset after {self.reset_timeout} seconds."
+                        )
+                    self.is_open = True
 
     def record_success(self) -> None:
         """Record a success and reset the failure count."""
-        self.failures = 0
-        self.is_open = False
-        self.total_requests += 1
+        with self._lock:
+            self._probes.clear()
+            self.failures = 0
+            self.is_open = False
+            self.total_requests += 1
 
-        # Update request history
-        self.request_history.append(True)
-        if len(self.request_history) > self.window_size:
-            self.request_history.pop(0)
+            # Update request history
+            self._history.record()
 
     def can_attempt(self) -> bool:
-        """Check if a request can be attempted."""
-        if not self.is_open:
-            return True
+        """
+        Check if a request can be attempted.
 
-        # Check if the reset timeout has elapsed
-        elapsed = time.time() - self.last_failure_time
-        if elapsed >= self.reset_timeout:
-            logger.info(
-                f"Circuit breaker reset after {elapsed:.2f} seconds. "
-                f"Allowing new requests."
-            )
-            self.is_open = False
-            self.failures = 0
-            # Clear half of the request history to give a fresh start
-            if self.request_history:
-                self.request_history = self.request_history[len(self.request_history) // 2:]
-            return True
+        While half-open, a True result reserves one of the test request slots
+        until the outcome is recorded. A test request that never reports back
+        gives up its slot after half_open_timeout.
+        """
+        with self._lock:
+            if not self.is_open:
+                return True
 
-        # Check if we should allow a half-open test
-        if elapsed >= self.half_open_timeout:
-            logger.info(
-                f"Circuit breaker in half-open state after {elapsed:.2f} seconds. "
-                f"Allowing a test request."
-            )
-            return True
+            # Check if the reset timeout has elapsed
+            now = time.time()
+            elapsed = now - self.last_failure_time
+            if elapsed >= self.reset_timeout:
+                logger.info(
+                    f"{self._label()} reset after {elapsed:.2f} seconds. "
+                    f"Allowing new requests."
+                )
+                self.is_open = False
+                self.failures = 0
+                self._probes.clear()
+                # Clear half of the request history to give a fresh start
+                self._history.halve()
+                return True
 
-        return False
+            # Check if we should allow a half-open test
+            if elapsed >= self.half_open_timeout:
+                self._probes[:] = [started for started in self._probes if now - started < self.half_open_timeout]
+                if len(self._probes) < self.half_open_max_calls:
+                    self._probes.append(now)
+                    logger.info(
+                        f"{self._label()} in half-open state after {elapsed:.2f} seconds. "
+                        f"Allowing a test request."
+                    )
+                    return True
+
+            return False
+
+    @property
+    def state(self) -> str:
+        """The circuit state: "closed", "open" or "half_open"."""
+        with self._lock:
+            if not self.is_open:
+                return "closed"
+            elapsed = time.time() - self.last_failure_time
+            return "half_open" if self.half_open_timeout <= elapsed < self.reset_timeout else "open"
 
     def get_error_rate(self) -> float:
         """Get the current error rate as a percentage."""
-        if not self.request_history:
-            return 0.0
-        return self.request_history.count(False) / len(self.request_history) * 100
+        with self._lock:
+            return self._history.error_rate()
 
     def get_status(self) -> Dict[str, Any]:
         """Get the current status of the circuit breaker."""
-        return {
-            "is_open": self.is_open,
-            "consecutive_failures": self.failures,
-            "total_requests": self.total_requests,
-            "total_failures": self.total_failures,
-            "error_rate": self.get_error_rate(),
-            "time_since_last_failure": time.time() - self.last_failure_time if self.last_failure_time > 0 else None
-        }
+        with self._lock:
+            return {
+                "state": self.state,
+                "is_open": self.is_open,
+                "consecutive_failures": self.failures,
+                "total_requests": self.total_requests,
+                "total_failures": self.total_failures,
+                "error_rate": self.get_error_rate(),
+                "time_since_last_failure": (time.time() - self.last_failure_time
+                                            if self.last_failure_time > 0 else None)
+            }
 
     def __str__(self) -> str:
         """Return a string representation of the circuit breaker state."""
@@ -343,10 +473,190 @@ class CircuitBreakerState:
         error_rate = self.get_error_rate()
         return (
             f"CircuitBreaker({state}, failures={self.failures}/{self.failure_threshold}, "
-            f"error_rate={error_rate:.1f}%, requests={len(self.request_history)}/{self.window_size})"
+            f"error_rate={error_rate:.1f}%, requests={self._history.count}/{self.window_size})"
         )
 
 
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers keyed by endpoint, so that one failing route does not stop the others.
+
+    Breakers are created on first use by `factory` and keyed with `key_func`,
+    which defaults to the endpoint template: `GET blueprints/a/entities/x` and
+    `GET blueprints/b/entities/y` share the breaker for
+    `blueprints/{id}/entities/{id}`, while `entities/aggregate` has its own.
+    Use `key_func=lambda method, endpoint: resource_family(endpoint)` for one
+    breaker per top-level resource instead.
+
+    Examples:
+        >>> registry = CircuitBreakerRegistry(lambda: CircuitBreakerState(failure_threshold=3))
+        >>> breaker = registry.get("GET", "blueprints/service/entities/api")
+        >>> registry.get_status()["blueprints/{id}/entities/{id}"]["state"]
+        'closed'
+    """
+
+    def __init__(self, factory: Callable[[], CircuitBreakerState] = CircuitBreakerState,
+                 key_func: Optional[Callable[[str, str], str]] = None):
+        """
+        Initialize the CircuitBreakerRegistry.
+
+        Args:
+            factory: Creates the breaker for a new key (default: CircuitBreakerState with default settings).
+            key_func: Maps (method, endpoint) to a breaker key (default: the endpoint template).
+        """
+        self.factory = factory
+        self.key_func = key_func or (lambda method, endpoint: endpoint_template(endpoint))
+        self._breakers: Dict[str, CircuitBreakerState] = {}
+        self._lock = threading.Lock()
+
+    def get(self, method: str, endpoint: str) -> CircuitBreakerState:
+        """
+        Get the breaker guarding a request, creating it if needed.
+
+        Args:
+            method: The HTTP method of the request.
+            endpoint: The API endpoint of the request.
+
+        Returns:
+            The circuit breaker for the request's key.
+        """
+        key = self.key_func(method, endpoint)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = self.factory()
+                    breaker.name = breaker.name or key
+                    self._breakers[key] = breaker
+        return breaker
+
+    def breakers(self) -> Dict[str, CircuitBreakerState]:
+        """
+        Get the breakers created so far.
+
+        Returns:
+            A dictionary mapping keys to circuit breakers.
+        """
+        with self._lock:
+            return dict(self._breakers)
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the status of every breaker.
+
+        Returns:
+            A dictionary mapping keys to `CircuitBreakerState.get_status()` results.
+        """
+        return {key: breaker.get_status() for key, breaker in self.breakers().items()}
+
+    def open_circuits(self) -> List[str]:
+        """
+        Get the keys whose circuit is not closed.
+
+        Returns:
+            The keys of open and half-open breakers.
+        """
+        return [key for key, breaker in self.breakers().items() if breaker.is_open]
+
+    def reset(self) -> None:
+        """Forget all breakers, closing every circuit."""
+        with self._lock:
+            self._breakers.clear()
+
+
+class RetryBudget:
+    """
+    A limit on the retries of a whole client, relative to its recent successful requests.
+
+    Per-request retry limits multiply the load on a degraded API: with
+    max_retries=3, every failing request is sent four times. A retry budget
+    allows retries only while the retries of the last `window_seconds` seconds
+    stay below `ratio` times the successful requests of that window, plus
+    `min_retries_per_second` so that a quiet client can still retry. Beyond
+    that, failures are raised without retrying until successes earn new budget.
+
+    The budget is shared by every request that uses it, across threads.
+
+    Attributes:
+        ratio: Retries allowed per recent successful request.
+        min_retries_per_second: Retries allowed per second regardless of successes.
+        window_seconds: Length of the window successes and retries are counted in.
+        exhausted: Number of retries refused.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries_per_second: float = 1.0, window_seconds: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the RetryBudget.
+
+        Args:
+            ratio: Retries allowed per recent successful request (default: 0.2, at most 20% extra load).
+            min_retries_per_second: Retries allowed per second regardless of successes (default: 1.0).
+            window_seconds: Length in seconds of the window successes and retries are counted in (default: 10).
+            clock: Time source (default: time.monotonic).
+        """
+        if ratio < 0 or min_retries_per_second < 0:
+            raise ValueError("ratio and min_retries_per_second must not be negative")
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window_seconds = window_seconds
+        self.exhausted = 0
+        self._lock = threading.Lock()
+        self._successes = TimeWindow(window_seconds, clock=clock)
+        self._retries = TimeWindow(window_seconds, clock=clock)
+
+    def record_success(self) -> None:
+        """Record a successful request, which earns `ratio` retries."""
+        with self._lock:
+            self._successes.record()
+
+    def _available(self) -> float:
+        """Get the number of retries left in the window. Called with the lock held."""
+        allowed = self.ratio * self._successes.count + self.min_retries_per_second * self.window_seconds
+        return allowed - self._retries.count
+
+    def try_spend(self) -> bool:
+        """
+        Take one retry from the budget.
+
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted.
+        """
+        with self._lock:
+            if self._available() < 1:
+                self.exhausted += 1
+                return False
+            self._retries.record()
+            return True
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the current state of the budget.
+
+        Returns:
+            The configuration, the successes and retries in the window, the retries
+            still available and the number of retries refused.
+        """
+        with self._lock:
+            return {
+                "ratio": self.ratio,
+                "min_retries_per_second": self.min_retries_per_second,
+                "window_seconds": self.window_seconds,
+                "recent_successes": self._successes.count,
+                "recent_retries": self._retries.count,
+                "available": max(0.0, self._available()),
+                "exhausted": self.exhausted
+            }
+
+    def reset(self) -> None:
+        """Forget the recorded successes and retries."""
+        with self._lock:
+            self._successes.clear()
+            self._retries.clear()
+            self.exhausted = 0
+
+
 class RetryConfig:
     """
     Configuration for retry behavior.
@@ -365,7 +675,12 @@ class RetryConfig:
         retry_status_codes: HTTP status codes that should trigger retries.
         idempotent_methods: HTTP methods that are safe to retry.
         circuit_breaker: Circuit breaker state to prevent cascading failures.
+        circuit_breakers: Optional registry of per-endpoint circuit breakers, used instead of
+            circuit_breaker for requests whose endpoint is known.
         retry_hook: Function to call before each retry attempt.
+        retry_budget: Optional budget limiting retries across every request sharing it.
+        retry_keyed_writes: Whether requests with a non-idempotent method are retried when
+            they carry an idempotency key.
         stats: Statistics about retry attempts.
 
     Examples:
@@ -405,7 +720,10 @@ class RetryConfig:
         retry_status_codes: Optional[Set[int]] = None,
         idempotent_methods: Optional[Set[str]] = None,
         circuit_breaker: Optional[CircuitBreakerState] = None,
-        retry_hook: Optional[Callable[[Exception, int, float], None]] = None
+        retry_hook: Optional[Callable[[Exception, int, float], None]] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        retry_keyed_writes: bool = False
     ):
         """
         Initialize retry configuration.
@@ -422,6 +740,10 @@ class RetryConfig:
             idempotent_methods: HTTP methods that are idempotent and safe to retry.
             circuit_breaker: Circuit breaker state to use.
             retry_hook: Function to call before each retry.
+            circuit_breakers: Registry of per-endpoint circuit breakers (see get_circuit_breaker).
+            retry_budget: Budget limiting retries to a fraction of recent successful requests.
+            retry_keyed_writes: Whether to also retry requests with a non-idempotent method
+                (e.g. POST) that carry an Idempotency-Key header.
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
@@ -434,13 +756,18 @@ class RetryConfig:
         self.retry_on = retry_on
         self.retry_status_codes = retry_status_codes or {429, 500, 502, 503, 504}
         self.idempotent_methods = idempotent_methods or {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+        self.retry_keyed_writes = retry_keyed_writes
 
         # Set up circuit breaker
         self.circuit_breaker = circuit_breaker or CircuitBreakerState()
+        self.circuit_breakers = circuit_breakers
 
         # Set up hooks
         self.retry_hook = retry_hook
 
+        # Client-wide limit on retries
+        self.retry_budget = retry_budget
+
         # Statistics
         self.stats = RetryStats()
 
@@ -460,34 +787,107 @@ class RetryConfig:
                 "jitter": self.jitter,
                 "jitter_factor": self.jitter_factor,
                 "retry_status_codes": list(self.retry_status_codes),
-                "idempotent_methods": list(self.idempotent_methods)
+                "idempotent_methods": list(self.idempotent_methods),
+                "retry_keyed_writes": self.retry_keyed_writes
             },
             "circuit_breaker": (self.circuit_breaker.get_status()
                                 if hasattr(self.circuit_breaker, 'get_status') else str(self.circuit_breaker)),
+            "circuit_breakers": self.circuit_breakers.get_status() if self.circuit_breakers is not None else {},
+            "retry_budget": self.retry_budget.get_status() if self.retry_budget is not None else None,
             "stats": self.stats.get_status()
         }
 
-    def should_retry(self, exception: Exception, method: str) -> bool:
+    def get_circuit_breaker(self, method: str, endpoint: str) -> CircuitBreakerState:
+        """
+        Get the circuit breaker guarding a request.
+
+        Args:
+            method: The HTTP method of the request.
+            endpoint: The API endpoint of the request.
+
+        Returns:
+            The endpoint's breaker from circuit_breakers, or the shared circuit_breaker
+            if no registry is configured.
+        """
+        if self.circuit_breakers is None:
+            return self.circuit_breaker
+        return self.circuit_breakers.get(method, endpoint)
+
+    def is_idempotent(self, method: str, endpoint: Optional[str] = None) -> bool:
+        """
+        Check whether a request is safe to send more than once.
+
+        Args:
+            method: The HTTP method of the request.
+            endpoint: The API endpoint of the request, if known.
+
+        Returns:
+            True if the method is in idempotent_methods or the endpoint is a read-only
+            POST route (see pyport.client.endpoints.SAFE_READ_ROUTES).
+        """
+        return method.upper() in self.idempotent_methods or is_safe_read(method, endpoint)
+
+    def should_retry(self, exception: Exception, method: str,
+                     circuit_breaker: Optional[CircuitBreakerState] = None,
+                     idempotency_key: Optional[str] = None,
+                     endpoint: Optional[str] = None,
+                     delay: Optional[float] = None) -> bool:
         """
         Determine if a request should be retried based on the exception and method.
 
         Args:
             exception: The exception that occurred.
             method: The HTTP method used for the request.
+            circuit_breaker: The breaker guarding the request (default: self.circuit_breaker).
+            idempotency_key: The request's idempotency key, if it carries one. Requests with a
+                non-idempotent method are retried only with a key and retry_keyed_writes set.
+            endpoint: The API endpoint of the request, if known (see is_idempotent).
+            delay: The backoff delay before the retry, if known. A retry that could not
+                start before the active deadline is refused without spending from the budget.
 
         Returns:
             True if the request should be retried, False otherwise.
         """
-        # Check if the method is idempotent
-        if method.upper() not in self.idempotent_methods:
-            logger.warning(f"Method {method} is not idempotent. Not retrying.")
-            return False
+        # Check if the request is idempotent, or made safe to repeat by an idempotency key
+        if not self.is_idempotent(method, endpoint):
+            if not (self.retry_keyed_writes and idempotency_key):
+                logger.warning(f"Method {method} is not idempotent. Not retrying.")
+                return False
 
         # Check if the circuit breaker allows attempts
-        if not self.circuit_breaker.can_attempt():
+        if not (circuit_breaker or self.circuit_breaker).can_attempt():
             logger.warning("Circuit breaker is open. Not retrying.")
             return False
 
+        if not self._is_retryable_error(exception):
+            return False
+
+        # Give up early if the retry could not start before the deadline
+        if delay is not None and not _fits_deadline(delay):
+            _log_deadline_skip(exception, delay)
+            return False
+
+        # Spend from the client-wide retry budget last, so only actual retries use it
+        if self.retry_budget is not None and not self.retry_budget.try_spend():
+            logger.warning("Retry budget exhausted. Not retrying.")
+            self.stats.record_budget_exhausted()
+            return False
+        return True
+
+    def _is_retryable_error(self, exception: Exception) -> bool:
+        """
+        Determine if an exception is transient and worth retrying.
+
+        Args:
+            exception: The exception that occurred.
+
+        Returns:
+            True if the error is retryable, False otherwise.
+        """
+        # A spent deadline is a timeout, but no retry can finish within it
+        if isinstance(exception, PortDeadlineExceededError):
+            return False
+
         # Always retry network-related errors
         if isinstance(exception, (PortNetworkError, PortTimeoutError)):
             logger.info(f"Retrying due to network error: {exception.__class__.__name__}")
@@ -612,6 +1012,9 @@ class RetryConfig:
 def with_retry(
     func: RetryableFunc[T],
     config: Optional[RetryConfig] = None,
+    circuit_breaker: Optional[CircuitBreakerState] = None,
+    on_event: Optional[Callable[[str], None]] = None,
+    endpoint: Optional[str] = None,
     **retry_kwargs
 ) -> RetryableFunc[T]:
     """
@@ -650,13 +1053,25 @@ def with_retry(
 
     For HTTP requests, the function should accept a 'method' parameter that
     indicates the HTTP method being used. This is used to determine if the
-    request is idempotent and safe to retry.
+    request is idempotent and safe to retry. An Idempotency-Key in its 'headers'
+    parameter makes a non-idempotent request retryable if the configuration
+    allows it (see RetryConfig.retry_keyed_writes).
+
+    When a deadline is active (see `pyport.deadline`), a retry whose delay
+    would end after the deadline is skipped and the last error is raised.
 
     Args:
         func: The function to retry. This function will be called repeatedly
             until it succeeds or the retry conditions are exhausted.
         config: Retry configuration to use. If None, a new configuration will
             be created using the retry_kwargs.
+        circuit_breaker: The circuit breaker guarding the calls. If None, the
+            configuration's circuit_breaker is used.
+        on_event: Optional callback for metrics, called with "retry" before each
+            retry, "circuit_open" when the circuit breaker rejects the call and
+            "circuit_trip" when a failure opens the circuit.
+        endpoint: The API endpoint called, if any. Read-only POST routes are
+            retried like GET requests (see RetryConfig.is_idempotent).
         **retry_kwargs: Additional keyword arguments to pass to RetryConfig
             if config is None. These can include max_retries, retry_delay,
             strategy, etc.
@@ -691,21 +1106,25 @@ def with_retry(
     """
     # Create a retry configuration if one wasn't provided
     if config is None:
-        config = RetryConfig(**retry_kwargs)
+        config = RetryConfig(circuit_breaker=circuit_breaker, **retry_kwargs)
 
     def wrapper(*args, **kwargs) -> T:
         method = kwargs.get('method', 'GET')  # Default to GET if not specified
+        idempotency_key = _idempotency_key(kwargs.get('headers'))
+        breaker = circuit_breaker or config.circuit_breaker
 
         # Check if the circuit breaker is open before making any attempts
-        if not config.circuit_breaker.can_attempt():
-            logger.warning("Circuit breaker is open. Not attempting the request.")
+        if not breaker.can_attempt():
+            logger.warning(f"{breaker._label()} is open. Not attempting the request.")
+            if on_event is not None:
+                on_event("circuit_open")
             # Create a dummy exception to raise
             if 'exception' in kwargs:
                 # If an exception was provided in kwargs, use it
                 exception = kwargs['exception']
             else:
                 # Otherwise create a generic PortApiError
-                exception = PortApiError("Request not attempted due to open circuit breaker")
+                exception = _open_circuit_error(breaker)
             raise exception
 
         for attempt in range(config.max_retries + 1):
@@ -714,8 +1133,10 @@ def with_retry(
                 result = func(*args, **kwargs)
 
                 # Record success in circuit breaker and stats
-                config.circuit_breaker.record_success()
+                breaker.record_success()
                 config.stats.record_attempt(success=True)
+                if config.retry_budget is not None:
+                    config.retry_budget.record_success()
 
                 return result
 
@@ -723,14 +1144,15 @@ def with_retry(
                 # Record the attempt in stats
                 config.stats.record_attempt(success=False, error=e)
 
-                # Check if we should retry
-                if attempt < config.max_retries and config.should_retry(e, method):
-                    # Calculate delay
-                    delay = config.get_retry_delay(attempt, e)
-
+                # Check if we should retry; the delay is needed first to check it against the deadline
+                delay = config.get_retry_delay(attempt, e) if attempt < config.max_retries else 0.0
+                if attempt < config.max_retries and config.should_retry(e, method, breaker, idempotency_key,
+                                                                        endpoint, delay=delay):
                     # Call retry hook if provided
                     if config.retry_hook:
                         config.retry_hook(e, attempt, delay)
+                    if on_event is not None:
+                        on_event("retry")
 
                     # Get function name safely (handles mocks in tests)
                     func_name = getattr(func, '__name__', str(func))
@@ -747,17 +1169,17 @@ def with_retry(
                         f"Retry details: function={func_name}, "
                         f"attempt={attempt + 1}/{config.max_retries}, "
                         f"delay={delay:.2f}s, error_type={e.__class__.__name__}, "
-                        f"circuit_breaker_status={config.circuit_breaker}"
+                        f"circuit_breaker_status={breaker}"
                     )
 
                     # Wait before retrying
                     time.sleep(delay)
 
                     # Record the retry time in stats
-                    config.stats.retry_times[-1] = delay
+                    config.stats.record_retry_delay(delay)
                 else:
                     # Record failure in circuit breaker
-                    config.circuit_breaker.record_failure()
+                    _record_breaker_failure(breaker, on_event)
 
                     # Get function name safely (handles mocks in tests)
                     func_name = getattr(func, '__name__', str(func))
@@ -765,14 +1187,14 @@ def with_retry(
                     # If we're out of retries or shouldn't retry, re-raise the exception
                     logger.error(
                         f"All {attempt + 1} attempts failed for {func_name}. "
-                        f"Total retry time: {sum(config.stats.retry_times):.2f}s. "
+                        f"Total retry time: {config.stats.total_retry_time:.2f}s. "
                         f"Last error: {e.__class__.__name__}: {str(e)[:150]}"
                     )
 
                     # Log detailed statistics at debug level
                     logger.debug(
                         f"Retry statistics: function={func_name}, attempts={attempt + 1}, "
-                        f"total_time={sum(config.stats.retry_times):.2f}s, "
+                        f"total_time={config.stats.total_retry_time:.2f}s, "
                         f"error_types={[type(err).__name__ for err in config.stats.errors]}"
                     )
                     raise
@@ -780,6 +1202,152 @@ def with_retry(
     return wrapper
 
 
+def with_async_retry(
+    func: Callable[..., Awaitable[T]],
+    config: Optional[RetryConfig] = None,
+    circuit_breaker: Optional[CircuitBreakerState] = None,
+    on_event: Optional[Callable[[str], None]] = None,
+    endpoint: Optional[str] = None,
+    **retry_kwargs
+) -> Callable[..., Awaitable[T]]:
+    """
+    Add retry logic to a coroutine function.
+
+    This is the asyncio counterpart of `with_retry`. Retry decisions, delays,
+    circuit breaker bookkeeping and statistics are shared with the synchronous
+    implementation through the `RetryConfig`; the only difference is that the
+    wrapper awaits `asyncio.sleep` between attempts instead of blocking the
+    calling thread with `time.sleep`. Active deadlines are honoured the same way.
+
+    Args:
+        func: The coroutine function to retry.
+        config: Retry configuration to use. If None, a new configuration will
+            be created using the retry_kwargs.
+        circuit_breaker: The circuit breaker guarding the calls. If None, the
+            configuration's circuit_breaker is used.
+        on_event: Optional callback for metrics, called with "retry" before each
+            retry, "circuit_open" when the circuit breaker rejects the call and
+            "circuit_trip" when a failure opens the circuit.
+        endpoint: The API endpoint called, if any (see `with_retry`).
+        **retry_kwargs: Additional keyword arguments to pass to RetryConfig
+            if config is None.
+
+    Returns:
+        A coroutine function that will retry on failure according to the
+        specified configuration.
+
+    Examples:
+        >>> async def fetch_data(url, method="GET"):
+        ...     ...
+        >>>
+        >>> retry_fetch = with_async_retry(fetch_data, max_retries=3)
+        >>> data = await retry_fetch("https://api.example.com/data", method="GET")
+    """
+    # Imported here so that synchronous users do not pay for loading asyncio
+    import asyncio
+
+    if config is None:
+        config = RetryConfig(circuit_breaker=circuit_breaker, **retry_kwargs)
+
+    async def wrapper(*args, **kwargs) -> T:
+        method = kwargs.get('method', 'GET')
+        idempotency_key = _idempotency_key(kwargs.get('headers'))
+        breaker = circuit_breaker or config.circuit_breaker
+
+        if not breaker.can_attempt():
+            logger.warning(f"{breaker._label()} is open. Not attempting the request.")
+            if on_event is not None:
+                on_event("circuit_open")
+            raise _open_circuit_error(breaker)
+
+        for attempt in range(config.max_retries + 1):
+            try:
+                result = await func(*args, **kwargs)
+
+                breaker.record_success()
+                config.stats.record_attempt(success=True)
+                if config.retry_budget is not None:
+                    config.retry_budget.record_success()
+
+                return result
+
+            except Exception as e:
+                config.stats.record_attempt(success=False, error=e)
+
+                delay = config.get_retry_delay(attempt, e) if attempt < config.max_retries else 0.0
+                if attempt < config.max_retries and config.should_retry(e, method, breaker, idempotency_key,
+                                                                        endpoint, delay=delay):
+                    if config.retry_hook:
+                        config.retry_hook(e, attempt, delay)
+                    if on_event is not None:
+                        on_event("retry")
+
+                    logger.warning(
+                        f"Attempt {attempt + 1}/{config.max_retries} failed with "
+                        f"{e.__class__.__name__}: {str(e)[:100]}. "
+                        f"Retrying in {delay:.2f} seconds."
+                    )
+
+                    await asyncio.sleep(delay)
+
+                    config.stats.record_retry_delay(delay)
+                else:
+                    _record_breaker_failure(breaker, on_event)
+
+                    func_name = getattr(func, '__name__', str(func))
+                    logger.error(
+                        f"All {attempt + 1} attempts failed for {func_name}. "
+                        f"Last error: {e.__class__.__name__}: {str(e)[:150]}"
+                    )
+                    raise
+
+    return wrapper
+
+
+def _record_breaker_failure(breaker: CircuitBreakerState, on_event: Optional[Callable[[str], None]]) -> None:
+    """Record a failed call in a circuit breaker, reporting a trip if the failure opened the circuit."""
+    was_open = breaker.state == "open"
+    breaker.record_failure()
+    if on_event is not None and not was_open and breaker.state == "open":
+        on_event("circuit_trip")
+
+
+def _idempotency_key(headers: Optional[Dict[str, str]]) -> Optional[str]:
+    """Get the Idempotency-Key header of a request, matched case-insensitively."""
+    for name, value in (headers or {}).items():
+        if name.lower() == IDEMPOTENCY_KEY_HEADER.lower():
+            return value
+    return None
+
+
+def _open_circuit_error(breaker: CircuitBreakerState) -> PortApiError:
+    """Create the error raised for a request rejected by an open circuit breaker."""
+    suffix = f" for {breaker.name}" if breaker.name else ""
+    return PortApiError(f"Request not attempted due to open circuit breaker{suffix}")
+
+
+def _fits_deadline(delay: float) -> bool:
+    """
+    Check whether a retry after a delay can start before the active deadline.
+
+    Args:
+        delay: The backoff delay in seconds.
+
+    Returns:
+        True if no deadline is active or the retry would start before it expires.
+    """
+    deadline = current_deadline()
+    return deadline is None or delay < deadline.remaining()
+
+
+def _log_deadline_skip(error: Exception, delay: float) -> None:
+    """Log that a retry was skipped because it would start after the deadline."""
+    logger.warning(
+        f"Not retrying {error.__class__.__name__}: a {delay:.2f}s delay would pass the deadline "
+        f"({current_deadline()})."
+    )
+
+
 def is_idempotent_method(method: str) -> bool:
     """
     Check if an HTTP method is idempotent.
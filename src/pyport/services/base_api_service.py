@@ -5,14 +5,22 @@ This module provides a base class for all API service classes in the PyPort libr
 It implements common functionality and patterns used across all API services.
 """
 
-from typing import Any, Dict, List, Optional, cast, Union
+import math
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, cast, Union
 
+from ..client.batch import run_map
 from ..models.api_category import BaseResource as BaseResourceModel, ApiClient
 from ..types import JsonDict
 
 # Import specific types for better type hints
 from ..types import PaginationParams
 
+#: Default number of items requested per page by iter_all and fetch_all
+DEFAULT_PAGE_SIZE = 100
+
+#: Response fields that may carry the total number of items of a paginated list
+TOTAL_KEYS = ("total", "totalCount", "total_count")
+
 
 class BaseAPIService(BaseResourceModel):
     """Base class for all API service classes.
@@ -25,6 +33,10 @@ class BaseAPIService(BaseResourceModel):
     from BaseResource to ensure consistent behavior and reduce code duplication.
     """
 
+    #: Public methods that need a client taking requests from several threads, and are
+    #: therefore left off the AsyncPortClient version of the service
+    SYNC_ONLY_METHODS: FrozenSet[str] = frozenset()
+
     def __init__(self, client: ApiClient, resource_name: Optional[str] = None,
                  response_key: Optional[str] = None):
         """
@@ -133,6 +145,8 @@ class BaseAPIService(BaseResourceModel):
         Get all resources with pagination support.
 
         This method retrieves a list of all resources, with optional pagination.
+        Only the requested page is returned; use iter_all or fetch_all to walk
+        every page.
 
         Args:
             page: The page number to retrieve (default: None).
@@ -154,6 +168,123 @@ class BaseAPIService(BaseResourceModel):
         # Use the base class list method
         return cast(List[Dict[str, Any]], self.list(params=all_params, **kwargs))
 
+    def iter_all(self, endpoint: Optional[str] = None, items_key: Optional[str] = None,
+                 per_page: int = DEFAULT_PAGE_SIZE, params: Optional[Dict[str, Any]] = None) -> Iterator[JsonDict]:
+        """
+        Iterate over every item of a page/per_page list endpoint.
+
+        Pages are numbered from 1 and requested lazily, one when the previous one
+        has been consumed. The iteration stops after a page with fewer than
+        `per_page` items, or once the total reported by the API has been reached.
+
+        Args:
+            endpoint: The list endpoint. Defaults to the service's resource path.
+            items_key: The response field holding the items of a page. Defaults to the
+                resource name, or to the only list field of the response.
+            per_page: The number of items to request per page (default: 100).
+            params: Additional query parameters sent with every page.
+
+        Returns:
+            An iterator over the items of all pages.
+
+        Raises:
+            ValueError: If per_page is smaller than 1.
+            PortApiError: If a page request fails.
+
+        Examples:
+            >>> for log in client.audit.iter_all(per_page=500):
+            ...     print(log["identifier"])
+        """
+        if per_page < 1:
+            raise ValueError("per_page must be at least 1")
+        return self._iter_pages(endpoint or self._get_resource_path(), items_key, per_page, params)
+
+    def fetch_all(self, endpoint: Optional[str] = None, items_key: Optional[str] = None,
+                  per_page: int = DEFAULT_PAGE_SIZE, params: Optional[Dict[str, Any]] = None,
+                  concurrency: int = 4) -> List[JsonDict]:
+        """
+        Fetch every item of a page/per_page list endpoint.
+
+        When the first page reports the total number of items (see TOTAL_KEYS), the
+        remaining pages are known and fetched concurrently. Otherwise the pages are
+        walked one after the other as with iter_all.
+
+        Args:
+            endpoint: The list endpoint. Defaults to the service's resource path.
+            items_key: The response field holding the items of a page. Defaults to the
+                resource name, or to the only list field of the response.
+            per_page: The number of items to request per page (default: 100).
+            params: Additional query parameters sent with every page.
+            concurrency: Maximum number of pages fetched at the same time (default: 4).
+
+        Returns:
+            A list of the items of all pages, in page order.
+
+        Raises:
+            ValueError: If per_page is smaller than 1.
+            PortApiError: If a page request fails.
+        """
+        if per_page < 1:
+            raise ValueError("per_page must be at least 1")
+        endpoint = endpoint or self._get_resource_path()
+        items, total = self._fetch_page(endpoint, items_key, 1, per_page, params)
+        if len(items) < per_page or (total is not None and total <= per_page):
+            return items
+        if total is None:
+            return items + list(self._iter_pages(endpoint, items_key, per_page, params, first_page=2))
+
+        pages = range(2, math.ceil(total / per_page) + 1)
+        if concurrency <= 1:
+            found = [self._fetch_page(endpoint, items_key, page, per_page, params)[0] for page in pages]
+        else:
+            def fetch_page(page: int) -> List[JsonDict]:
+                return self._fetch_page(endpoint, items_key, page, per_page, params)[0]
+
+            found = [result.unwrap() for result in run_map(fetch_page, pages, max_concurrency=concurrency)]
+        for page_items in found:
+            items.extend(page_items)
+        return items
+
+    def _iter_pages(self, endpoint: str, items_key: Optional[str], per_page: int,
+                    params: Optional[Dict[str, Any]], first_page: int = 1) -> Iterator[JsonDict]:
+        """Yield the items of consecutive pages until the last one."""
+        page = first_page
+        while True:
+            items, total = self._fetch_page(endpoint, items_key, page, per_page, params)
+            yield from items
+            if len(items) < per_page or (total is not None and page * per_page >= total):
+                return
+            page += 1
+
+    def _fetch_page(self, endpoint: str, items_key: Optional[str], page: int, per_page: int,
+                    params: Optional[Dict[str, Any]]) -> Tuple[List[JsonDict], Optional[int]]:
+        """Fetch one page and return its items and the total reported by the API, if any."""
+        page_params: Dict[str, Any] = dict(params or {})
+        page_params.update(self._handle_pagination_params(page, per_page))
+        response = self._make_request_with_params('GET', endpoint, params=page_params)
+        if isinstance(response, list):
+            return response, None
+        return self._page_items(response, items_key), self._page_total(response)
+
+    def _page_items(self, response: JsonDict, items_key: Optional[str]) -> List[JsonDict]:
+        """Extract the items of a page from a list response."""
+        key = items_key or self._resource_name
+        if key and isinstance(response.get(key), list):
+            return response[key]
+        if items_key:
+            return []
+        lists = [value for value in response.values() if isinstance(value, list)]
+        return lists[0] if len(lists) == 1 else []
+
+    @staticmethod
+    def _page_total(response: JsonDict) -> Optional[int]:
+        """Return the total number of items reported by a list response, if any."""
+        for key in TOTAL_KEYS:
+            value = response.get(key)
+            if isinstance(value, int) and not isinstance(value, bool):
+                return value
+        return None
+
     def get_by_id(self, resource_id: str, params: Optional[Dict[str, Any]] = None,
                   response_key: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """
@@ -1,6 +1,6 @@
 """Type stub file for the BaseAPIService class."""
 
-from typing import Any, Dict, List, Optional, Union, TypeVar, overload
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union, TypeVar, overload
 
 from ..models.api_category import BaseResource as BaseResourceModel, ApiClient
 from ..types import JsonDict, PaginationParams
@@ -8,9 +8,13 @@ from ..types import JsonDict, PaginationParams
 T = TypeVar('T')  # Generic type for resource items
 R = TypeVar('R')  # Generic type for response objects
 
+DEFAULT_PAGE_SIZE: int
+TOTAL_KEYS: Tuple[str, ...]
+
 class BaseAPIService(BaseResourceModel):
     """Base class for all API service classes."""
     
+    SYNC_ONLY_METHODS: FrozenSet[str]
     _response_key: Optional[str]
     
     def __init__(
@@ -49,6 +53,23 @@ class BaseAPIService(BaseResourceModel):
         params: Optional[Dict[str, Any]] = None
     ) -> List[JsonDict]: ...
     
+    def iter_all(
+        self,
+        endpoint: Optional[str] = None,
+        items_key: Optional[str] = None,
+        per_page: int = ...,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[JsonDict]: ...
+    
+    def fetch_all(
+        self,
+        endpoint: Optional[str] = None,
+        items_key: Optional[str] = None,
+        per_page: int = ...,
+        params: Optional[Dict[str, Any]] = None,
+        concurrency: int = 4
+    ) -> List[JsonDict]: ...
+    
     def get_by_id(
         self,
         resource_id: str,
@@ -0,0 +1,256 @@
+"""
+Incremental parsing of large JSON list responses.
+
+Endpoints such as `blueprints/{id}/entities` return every entity of a
+blueprint in one document (`{"ok": true, "entities": [...]}`). Parsing that
+document with `response.json()` holds the whole body and every parsed entity
+in memory at once. The helpers in this module read the body in fixed-size
+pieces and decode the items of one array as they arrive, so memory use is
+bounded by the size of a single item (or chunk of items), not the response.
+
+Example usage:
+
+```python
+for entity in client.entities.stream_all_entities("service"):
+    print(entity["identifier"])
+
+for chunk in client.blueprints.stream_blueprint_entities("service", chunk_size=500):
+    index(chunk)
+```
+
+Items are decoded with the standard library scanner (`json.JSONDecoder.raw_decode`),
+which can resume at any offset of a partially received buffer.
+"""
+import codecs
+import json
+from typing import Any, Iterable, Iterator, List, Optional
+
+from .exceptions import PortApiError
+
+#: Number of bytes read from the response at a time
+DEFAULT_READ_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class _Buffer:
+    """
+    Decoded text received so far, refilled from an iterable of byte chunks.
+
+    Consumed text is dropped in large steps, so the buffer only holds the
+    item being decoded and the data read after it.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        """
+        Initialize the _Buffer.
+
+        Args:
+            chunks: The byte chunks of the JSON document.
+        """
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """
+        Append the next chunk to the buffer.
+
+        Returns:
+            False if the document has been read completely.
+        """
+        if self.eof:
+            return False
+        if self.pos > DEFAULT_READ_SIZE:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self.text += self._decoder.decode(chunk)
+                return True
+        self.text += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and return the next character without consuming it.
+
+        Returns:
+            The next character, or "" at the end of the document.
+        """
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text) or not self.fill():
+                return self.text[self.pos:self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        """
+        Consume the next non-whitespace character, which must be `char`.
+
+        Args:
+            char: The expected character.
+
+        Raises:
+            ValueError: If a different character (or the end of the document) is found.
+        """
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, found {found or 'end of document'!r}")
+        self.pos += 1
+
+    def value(self, decoder: json.JSONDecoder) -> Any:
+        """
+        Decode the next JSON value, reading more data until it is complete.
+
+        Args:
+            decoder: The decoder whose `raw_decode` parses the value.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            ValueError: If the document is invalid or ends inside the value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+            except ValueError:
+                if self._grow():
+                    continue
+                raise
+            # A number (or literal) ending at the buffer edge may continue in the next chunk
+            if end == len(self.text) and not isinstance(value, (dict, list, str)) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def _grow(self) -> bool:
+        """
+        Read until the unconsumed text has doubled, so a large value is re-scanned a bounded number of times.
+
+        Returns:
+            False if nothing more could be read.
+        """
+        target = 2 * (len(self.text) - self.pos)
+        if not self.fill():
+            return False
+        while len(self.text) - self.pos < target and self.fill():
+            pass
+        return True
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Yield the items of one array in a JSON object, decoding them as the data arrives.
+
+    Other members of the object are decoded and discarded. Parsing stops after
+    the array, so trailing members are not read.
+
+    Args:
+        chunks: The byte chunks of a JSON document whose top level is an object.
+        key: The object member holding the array (e.g. "entities").
+
+    Yields:
+        The decoded array items, in order.
+
+    Raises:
+        ValueError: If the document is not valid JSON, or the member is missing or not an array.
+    """
+    buffer = _Buffer(chunks)
+    decoder = json.JSONDecoder()
+
+    buffer.expect("{")
+    if buffer.peek() == "}":
+        raise ValueError(f"Response has no {key!r} member")
+    while True:
+        name = buffer.value(decoder)
+        buffer.expect(":")
+        if name == key:
+            break
+        buffer.value(decoder)
+        if buffer.peek() != ",":
+            raise ValueError(f"Response has no {key!r} member")
+        buffer.expect(",")
+
+    buffer.expect("[")
+    if buffer.peek() == "]":
+        return
+    while True:
+        yield buffer.value(decoder)
+        if buffer.peek() == "]":
+            return
+        buffer.expect(",")
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Group items into lists of a fixed size; the last list may be shorter.
+
+    Args:
+        items: The items to group.
+        size: The number of items per list.
+
+    Yields:
+        Lists of at most `size` items.
+
+    Raises:
+        ValueError: If size is less than 1.
+    """
+    if size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    chunk: List[Any] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def stream_json_array(response, key: str, chunk_size: Optional[int] = None,
+                      read_size: int = DEFAULT_READ_SIZE) -> Iterator[Any]:
+    """
+    Yield the items of an array member of a streamed response.
+
+    The response should have been requested with `stream=True`. It is closed,
+    returning its connection to the pool, once the items are exhausted or the
+    generator is closed.
+
+    Args:
+        response: A requests.Response opened with stream=True.
+        key: The object member holding the array (e.g. "entities").
+        chunk_size: If set, yield lists of this many items instead of single items.
+        read_size: Number of bytes read from the connection at a time.
+
+    Yields:
+        The array items, or lists of up to chunk_size items.
+
+    Raises:
+        PortApiError: If the body is not a JSON object containing the array.
+        ValueError: If chunk_size is less than 1.
+    """
+    try:
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        iter_content = getattr(response, "iter_content", None)
+        if iter_content is not None:
+            chunks = iter_content(chunk_size=read_size)
+        else:  # httpx responses, already read by AsyncPortClient
+            chunks = response.iter_bytes(read_size)
+        items = iter_json_array(chunks, key)
+        if chunk_size is not None:
+            items = chunked(items, chunk_size)
+        try:
+            yield from items
+        except ValueError as e:
+            raise PortApiError(f"Invalid JSON in streamed response: {e}",
+                               status_code=getattr(response, "status_code", None)) from e
+    finally:
+        if not getattr(response, "is_closed", False):
+            response.close()
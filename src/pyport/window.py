@@ -0,0 +1,443 @@
+"""
+Sliding-window counters for the PyPort client library.
+
+Circuit breakers, retry statistics and metrics need the error rate, mean or
+percentiles of recent observations. The structures in this module keep those
+with constant-time updates and bounded memory, however long the client runs:
+
+- `CountWindow`: the last N observations, in a ring buffer with running sums.
+- `TimeWindow`: the observations of the last T seconds, in a fixed ring of
+  time buckets.
+- `Histogram`: log-scaled buckets (HDR-style) for percentile reads; values are
+  reported with a relative error of about 5% at the default precision.
+- `History`: a bounded deque that compares equal to a list, for keeping the
+  most recent items (errors, delays) of a statistic that used to be a list.
+
+Example usage:
+
+```python
+from pyport.window import TimeWindow
+
+window = TimeWindow(seconds=30, percentiles=True)
+window.record(0.120)
+window.record(2.5, failed=True)
+print(window.error_rate(), window.percentile(99))
+```
+
+None of these classes are thread-safe on their own; callers hold a lock.
+"""
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Iterable, List, Optional
+
+
+class History(deque):
+    """
+    A deque that keeps the most recent items and compares equal to a list with the same items.
+
+    Appending to a full history drops the oldest item in constant time.
+    """
+
+    def __init__(self, iterable: Iterable[Any] = (), maxlen: Optional[int] = None):
+        super().__init__(iterable, maxlen)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, list):
+            return list(self) == other
+        return super().__eq__(other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class Histogram:
+    """
+    Counts of values in log-scaled buckets, for percentile reads in constant time.
+
+    Each power of two between min_value and max_value is split into `precision`
+    buckets, so memory is fixed and a percentile is the midpoint of a bucket.
+    Values at or below min_value are reported as 0, and values above max_value
+    are counted in the last bucket.
+
+    Attributes:
+        count: Number of recorded values.
+        total: Sum of recorded values.
+    """
+
+    def __init__(self, min_value: float = 1e-4, max_value: float = 1e4, precision: int = 8):
+        """
+        Initialize the Histogram.
+
+        Args:
+            min_value: Smallest value resolved (default: 0.1 ms when recording seconds).
+            max_value: Largest value resolved (default: 10,000).
+            precision: Buckets per power of two (default: 8, about 5% relative error).
+        """
+        if not 0 < min_value < max_value:
+            raise ValueError("min_value must be positive and smaller than max_value")
+        self.min_value = min_value
+        self.max_value = max_value
+        self.precision = precision
+        self._scale = precision / math.log(2)
+        self._counts = [0] * (self._index(max_value) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def _index(self, value: float) -> int:
+        """Get the bucket of a value."""
+        if value <= self.min_value:
+            return 0
+        return int(math.log(value / self.min_value) * self._scale) + 1
+
+    def _value(self, index: int) -> float:
+        """Get the value reported for a bucket: the geometric midpoint of its bounds."""
+        if index == 0:
+            return 0.0
+        return self.min_value * math.exp((index - 0.5) / self._scale)
+
+    def record(self, value: float, count: int = 1) -> None:
+        """
+        Record a value.
+
+        Args:
+            value: The value.
+            count: Number of times to record it.
+        """
+        index = min(self._index(value), len(self._counts) - 1)
+        self._counts[index] += count
+        self.count += count
+        self.total += value * count
+
+    def remove(self, value: float) -> None:
+        """
+        Remove a previously recorded value.
+
+        Args:
+            value: The value, as it was recorded.
+        """
+        index = min(self._index(value), len(self._counts) - 1)
+        if self._counts[index]:
+            self._counts[index] -= 1
+            self.count -= 1
+            self.total -= value
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Add the counts of a histogram with the same range and precision.
+
+        Args:
+            other: The histogram to add.
+        """
+        for index, bucket_count in enumerate(other._counts):
+            self._counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Get a percentile of the recorded values.
+
+        Args:
+            percentile: The percentile, between 0 and 100.
+
+        Returns:
+            The percentile, or 0.0 if no values were recorded.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self._value(index), self.max_value)
+        return self.max_value
+
+    def buckets(self) -> List[tuple]:
+        """
+        Get the non-empty buckets.
+
+        Returns:
+            (upper_bound, count) pairs in increasing order.
+        """
+        return [(self.min_value * math.exp(index / self._scale), bucket_count)
+                for index, bucket_count in enumerate(self._counts) if bucket_count]
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.total = 0.0
+
+
+class CountWindow:
+    """
+    The last `size` observations, each a value and whether it failed.
+
+    Recording, the error rate and the mean take constant time; percentiles
+    (with percentiles=True) take time proportional to the fixed number of
+    histogram buckets.
+    """
+
+    def __init__(self, size: int, percentiles: bool = False):
+        """
+        Initialize the CountWindow.
+
+        Args:
+            size: Number of observations kept.
+            percentiles: Whether to keep a histogram for percentile reads.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self._values = [0.0] * size
+        self._failed = [False] * size
+        self._start = 0
+        self._length = 0
+        self._failures = 0
+        self._total = 0.0
+        self._histogram = Histogram() if percentiles else None
+
+    def record(self, value: float = 0.0, failed: bool = False) -> None:
+        """
+        Record an observation, dropping the oldest one if the window is full.
+
+        Args:
+            value: The observed value (e.g. a latency in seconds).
+            failed: Whether the observation is a failure.
+        """
+        if self._length == self.size:
+            self._evict()
+        slot = (self._start + self._length) % self.size
+        self._values[slot] = value
+        self._failed[slot] = failed
+        self._length += 1
+        self._failures += failed
+        self._total += value
+        if self._histogram is not None:
+            self._histogram.record(value)
+
+    def replace_last(self, value: float) -> None:
+        """
+        Change the value of the most recent observation.
+
+        Args:
+            value: The new value.
+        """
+        if not self._length:
+            return
+        slot = (self._start + self._length - 1) % self.size
+        if self._histogram is not None:
+            self._histogram.remove(self._values[slot])
+            self._histogram.record(value)
+        self._total += value - self._values[slot]
+        self._values[slot] = value
+
+    def _evict(self) -> None:
+        """Drop the oldest observation."""
+        slot = self._start
+        self._failures -= self._failed[slot]
+        self._total -= self._values[slot]
+        if self._histogram is not None:
+            self._histogram.remove(self._values[slot])
+        self._start = (self._start + 1) % self.size
+        self._length -= 1
+
+    def halve(self) -> None:
+        """Drop the older half of the observations."""
+        for _ in range(self._length // 2):
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop all observations."""
+        self._start = self._length = self._failures = 0
+        self._total = 0.0
+        if self._histogram is not None:
+            self._histogram.clear()
+
+    @property
+    def count(self) -> int:
+        """Number of observations in the window."""
+        return self._length
+
+    @property
+    def failures(self) -> int:
+        """Number of failed observations in the window."""
+        return self._failures
+
+    @property
+    def total(self) -> float:
+        """Sum of the values in the window."""
+        return self._total
+
+    def error_rate(self) -> float:
+        """Get the percentage of failed observations, or 0.0 for an empty window."""
+        return self._failures / self._length * 100.0 if self._length else 0.0
+
+    def mean(self) -> float:
+        """Get the mean value, or 0.0 for an empty window."""
+        return self._total / self._length if self._length else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Get a percentile of the values in the window.
+
+        Args:
+            percentile: The percentile, between 0 and 100.
+
+        Returns:
+            The percentile, or 0.0 for an empty window.
+
+        Raises:
+            ValueError: If the window was created without percentiles=True.
+        """
+        if self._histogram is None:
+            raise ValueError("window was created without percentiles=True")
+        return self._histogram.percentile(percentile)
+
+    def outcomes(self) -> List[bool]:
+        """
+        Get the observations as booleans, oldest first.
+
+        Returns:
+            True for each success and False for each failure.
+        """
+        return [not self._failed[(self._start + i) % self.size] for i in range(self._length)]
+
+
+class TimeWindow:
+    """
+    The observations of the last `seconds` seconds, each a value and whether it failed.
+
+    Observations are counted in `buckets` time buckets, reused in a ring as
+    time passes, so memory does not depend on the request rate. Reads combine
+    the buckets still inside the window; the window moves one bucket width at
+    a time.
+    """
+
+    def __init__(self, seconds: float, buckets: int = 10, percentiles: bool = False,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the TimeWindow.
+
+        Args:
+            seconds: Length of the window in seconds.
+            buckets: Number of time buckets (default: 10).
+            percentiles: Whether to keep histograms for percentile reads.
+            clock: Time source (default: time.monotonic).
+        """
+        if seconds <= 0 or buckets < 1:
+            raise ValueError("seconds must be positive and buckets at least 1")
+        self.seconds = seconds
+        self.width = seconds / buckets
+        self._clock = clock
+        self._epochs = [-1] * buckets
+        self._counts = [0] * buckets
+        self._failures = [0] * buckets
+        self._totals = [0.0] * buckets
+        self._histograms = [Histogram() for _ in range(buckets)] if percentiles else None
+
+    def _current(self) -> int:
+        """Get the slot of the current bucket, resetting it if it belongs to an older period."""
+        epoch = int(self._clock() / self.width)
+        slot = epoch % len(self._epochs)
+        if self._epochs[slot] != epoch:
+            self._epochs[slot] = epoch
+            self._counts[slot] = self._failures[slot] = 0
+            self._totals[slot] = 0.0
+            if self._histograms is not None:
+                self._histograms[slot].clear()
+        return slot
+
+    def _live(self) -> List[int]:
+        """Get the slots of the buckets inside the window."""
+        oldest = int(self._clock() / self.width) - len(self._epochs) + 1
+        return [slot for slot, epoch in enumerate(self._epochs) if epoch >= oldest]
+
+    def record(self, value: float = 0.0, failed: bool = False) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: The observed value (e.g. a latency in seconds).
+            failed: Whether the observation is a failure.
+        """
+        slot = self._current()
+        self._counts[slot] += 1
+        self._failures[slot] += failed
+        self._totals[slot] += value
+        if self._histograms is not None:
+            self._histograms[slot].record(value)
+
+    def halve(self) -> None:
+        """Drop the older half of the buckets inside the window."""
+        live = sorted(self._live(), key=lambda slot: self._epochs[slot])
+        for slot in live[:len(live) // 2]:
+            self._epochs[slot] = -1
+
+    def clear(self) -> None:
+        """Drop all observations."""
+        self._epochs = [-1] * len(self._epochs)
+
+    @property
+    def count(self) -> int:
+        """Number of observations in the window."""
+        return sum(self._counts[slot] for slot in self._live())
+
+    @property
+    def failures(self) -> int:
+        """Number of failed observations in the window."""
+        return sum(self._failures[slot] for slot in self._live())
+
+    @property
+    def total(self) -> float:
+        """Sum of the values in the window."""
+        return sum(self._totals[slot] for slot in self._live())
+
+    def error_rate(self) -> float:
+        """Get the percentage of failed observations, or 0.0 for an empty window."""
+        live = self._live()
+        count = sum(self._counts[slot] for slot in live)
+        return sum(self._failures[slot] for slot in live) / count * 100.0 if count else 0.0
+
+    def mean(self) -> float:
+        """Get the mean value, or 0.0 for an empty window."""
+        live = self._live()
+        count = sum(self._counts[slot] for slot in live)
+        return sum(self._totals[slot] for slot in live) / count if count else 0.0
+
+    def outcomes(self) -> List[bool]:
+        """
+        Get the observations as booleans; their order is not kept within the window.
+
+        Returns:
+            True for each success and False for each failure.
+        """
+        failures = self.failures
+        return [True] * (self.count - failures) + [False] * failures
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Get a percentile of the values in the window.
+
+        Args:
+            percentile: The percentile, between 0 and 100.
+
+        Returns:
+            The percentile, or 0.0 for an empty window.
+
+        Raises:
+            ValueError: If the window was created without percentiles=True.
+        """
+        if self._histograms is None:
+            raise ValueError("window was created without percentiles=True")
+        merged = Histogram()
+        for slot in self._live():
+            merged.merge(self._histograms[slot])
+        return merged.percentile(percentile)
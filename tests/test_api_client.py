@@ -38,7 +38,7 @@ class TestPortClient(unittest.TestCase):
         self.assertIn("Environment variables PORT_CLIENT_ID or PORT_CLIENT_SECRET are not set", str(context.exception))
     '''
 
-    @patch('src.pyport.client.auth.requests.post')
+    @patch('src.pyport.client.auth.requests.Session.post')
     def test_get_access_token_success(self, mock_post):
         """Test that _get_access_token returns the token on a successful API call."""
         expected_token = "real_dummy_token"
@@ -67,7 +67,7 @@ class TestPortClient(unittest.TestCase):
 
         client = PortClient(client_secret="dummy_secret", client_id="dummy_id", us_region=True, skip_auth=True)
         response = client.make_request('GET', 'test-endpoint')
-        mock_request.assert_called_once_with('GET', f"{client.api_url}/test-endpoint")
+        mock_request.assert_called_once_with('GET', f"{client.api_url}/test-endpoint", timeout=(10.0, 30.0))
         self.assertEqual(response.json(), expected_json)
 
     @patch('src.pyport.client.request.requests.Session.request')
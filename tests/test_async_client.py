@@ -0,0 +1,268 @@
+"""
+Tests for the asyncio client.
+
+Note: These tests require the optional `httpx` dependency and are skipped otherwise.
+"""
+import asyncio
+import base64
+import json
+import time
+import unittest
+from unittest.mock import patch
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from pyport import AsyncPortClient
+from pyport.exceptions import PortResourceNotFoundError
+
+
+def _make_client(handler, **kwargs):
+    """Create an AsyncPortClient whose requests are served by handler."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncPortClient(client_id="id", client_secret="secret", http_client=http_client,
+                           retry_delay=0.01, retry_jitter=False, **kwargs)
+
+
+@unittest.skipIf(not HTTPX_AVAILABLE, "httpx not installed")
+class TestAsyncPortClient(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AsyncPortClient class."""
+
+    async def test_service_method_returns_parsed_result(self):
+        """Test that service methods are exposed as coroutines with the sync return value."""
+        def handler(request):
+            if request.url.path.endswith("auth/access_token"):
+                return httpx.Response(200, json={"accessToken": "token-1"})
+            self.assertEqual(request.headers["Authorization"], "Bearer token-1")
+            self.assertEqual(request.url.path, "/v1/blueprints/service/entities/api")
+            return httpx.Response(200, json={"entity": {"identifier": "api"}})
+
+        async with _make_client(handler) as client:
+            entity = await client.entities.get_entity("service", "api")
+
+        self.assertEqual(entity, {"identifier": "api"})
+
+    async def test_token_is_fetched_once_for_concurrent_requests(self):
+        """Test that concurrent requests share a single token fetch."""
+        auth_calls = []
+
+        def handler(request):
+            if request.url.path.endswith("auth/access_token"):
+                auth_calls.append(json.loads(request.content))
+                return httpx.Response(200, json={"accessToken": "token-1"})
+            return httpx.Response(200, json={"blueprint": {"identifier": "service"}})
+
+        async with _make_client(handler) as client:
+            results = await asyncio.gather(*(client.blueprints.get_blueprint("service") for _ in range(20)))
+
+        self.assertEqual(len(auth_calls), 1)
+        self.assertEqual(auth_calls[0], {"clientId": "id", "clientSecret": "secret"})
+        self.assertEqual(results, [{"identifier": "service"}] * 20)
+
+    async def test_rejected_token_is_refreshed_and_the_request_replayed(self):
+        """Test that a 401 refreshes the token once for concurrent requests and replays each request."""
+        tokens = iter(["token-1", "token-2"])
+        auth_calls = []
+
+        def handler(request):
+            if request.url.path.endswith("auth/access_token"):
+                auth_calls.append(request)
+                return httpx.Response(200, json={"accessToken": next(tokens)})
+            if request.headers["Authorization"] == "Bearer token-1":
+                return httpx.Response(401, json={"message": "expired"})
+            return httpx.Response(200, json={"blueprint": {"identifier": "service"}})
+
+        async with _make_client(handler) as client:
+            results = await asyncio.gather(*(client.blueprints.get_blueprint("service") for _ in range(5)))
+
+        self.assertEqual(results, [{"identifier": "service"}] * 5)
+        self.assertEqual(len(auth_calls), 2)
+        self.assertEqual(client.token, "token-2")
+
+    async def test_token_is_refreshed_before_its_jwt_expiry(self):
+        """Test that a token is replaced once it is within refresh_margin of its exp claim."""
+        def make_jwt(exp):
+            payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+            return f"header.{payload}.signature"
+
+        tokens = [make_jwt(time.time() + 30), make_jwt(time.time() + 3600)]
+        auth_calls = []
+
+        def handler(request):
+            if request.url.path.endswith("auth/access_token"):
+                auth_calls.append(request)
+                return httpx.Response(200, json={"accessToken": tokens[len(auth_calls) - 1]})
+            return httpx.Response(200, json={"blueprint": {"identifier": "service"}})
+
+        async with _make_client(handler, refresh_margin=60) as client:
+            await client.blueprints.get_blueprint("service")
+            await client.blueprints.get_blueprint("service")
+            await client.blueprints.get_blueprint("service")
+
+        self.assertEqual(len(auth_calls), 2)
+        self.assertEqual(client.token, tokens[1])
+
+    async def test_errors_are_raised_from_service_methods(self):
+        """Test that API errors propagate as Port exceptions."""
+        def handler(request):
+            return httpx.Response(404, json={"message": "not found"})
+
+        async with _make_client(handler, skip_auth=True) as client:
+            with self.assertRaises(PortResourceNotFoundError):
+                await client.entities.get_entity("service", "missing")
+
+    async def test_transient_errors_are_retried(self):
+        """Test that idempotent requests are retried with async backoff."""
+        responses = [httpx.Response(503, json={}), httpx.Response(200, json={"entities": [{"identifier": "a"}]})]
+
+        def handler(request):
+            return responses.pop(0)
+
+        async with _make_client(handler, skip_auth=True) as client:
+            entities = await client.entities.get_entities("service")
+
+        self.assertEqual(entities, [{"identifier": "a"}])
+        self.assertEqual(client.retry_config.stats.attempts, 2)
+
+    async def test_delete_returns_status_based_result(self):
+        """Test that methods inspecting the response object work unchanged."""
+        def handler(request):
+            self.assertEqual(request.method, "DELETE")
+            return httpx.Response(204)
+
+        async with _make_client(handler, skip_auth=True) as client:
+            self.assertTrue(await client.entities.delete_entity("service", "api"))
+
+    async def test_fetch_all_walks_every_page(self):
+        """Test that paginated fetches return the items of every page."""
+        def handler(request):
+            page, per_page = int(request.url.params["page"]), int(request.url.params["per_page"])
+            teams = [{"name": f"team-{i}"} for i in range((page - 1) * per_page, min(page * per_page, 25))]
+            return httpx.Response(200, json={"teams": teams, "total": 25})
+
+        async with _make_client(handler, skip_auth=True) as client:
+            teams = await client.teams.fetch_all(per_page=10)
+
+        self.assertEqual([team["name"] for team in teams], [f"team-{i}" for i in range(25)])
+
+    async def test_multi_request_methods_send_each_request_once(self):
+        """Test that a method making several requests does not repeat any of them."""
+        bodies = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            bodies.append(body)
+            identifiers = body["query"]["rules"][0]["value"]
+            return httpx.Response(200, json={"entities": [{"identifier": i} for i in identifiers]})
+
+        async with _make_client(handler, skip_auth=True) as client:
+            result = await client.entities.get_entities_by_ids("service", [f"svc-{i}" for i in range(5)],
+                                                               chunk_size=2)
+
+        self.assertEqual(sorted(result["entities"]), [f"svc-{i}" for i in range(5)])
+        self.assertEqual(len(bodies), 3)
+
+    async def test_concurrent_pages_are_fetched_on_the_event_loop(self):
+        """Test that the pages of a map are requested together, without a worker thread."""
+        in_flight, peak = [0], [0]
+
+        async def handler(request):
+            page, per_page = int(request.url.params["page"]), int(request.url.params["per_page"])
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            teams = [{"name": f"team-{i}"} for i in range((page - 1) * per_page, min(page * per_page, 55))]
+            return httpx.Response(200, json={"teams": teams, "total": 55})
+
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "run_in_executor", side_effect=AssertionError("ran on a worker thread")):
+            async with _make_client(handler, skip_auth=True) as client:
+                teams = await client.teams.fetch_all(per_page=10, concurrency=3)
+
+        self.assertEqual([team["name"] for team in teams], [f"team-{i}" for i in range(55)])
+        self.assertEqual(peak[0], 3)
+
+    async def test_iter_all_is_an_async_iterator(self):
+        """Test that paginated iterators are exposed as async iterators."""
+        pages = []
+
+        def handler(request):
+            page, per_page = int(request.url.params["page"]), int(request.url.params["per_page"])
+            pages.append(page)
+            teams = [{"name": f"team-{i}"} for i in range((page - 1) * per_page, min(page * per_page, 25))]
+            return httpx.Response(200, json={"teams": teams})
+
+        async with _make_client(handler, skip_auth=True) as client:
+            teams = [team["name"] async for team in client.teams.iter_all(per_page=10)]
+
+        self.assertEqual(teams, [f"team-{i}" for i in range(25)])
+        self.assertEqual(pages, [1, 2, 3])
+
+    async def test_iter_search_blueprint_entities(self):
+        """Test that cursor-paginated searches are iterated page by page."""
+        def handler(request):
+            start = int(json.loads(request.content).get("from") or 0)
+            response = {"entities": [{"identifier": f"svc-{i}"} for i in range(start, min(start + 10, 25))]}
+            if start + 10 < 25:
+                response["next"] = str(start + 10)
+            return httpx.Response(200, json=response)
+
+        async with _make_client(handler, skip_auth=True) as client:
+            chunks = [chunk async for chunk in client.entities.iter_search_blueprint_entities(
+                "service", {"combinator": "and", "rules": []}, page_size=10, as_chunks=True)]
+
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+
+    async def test_stream_all_entities_reads_the_body_incrementally(self):
+        """Test that streamed lists are decoded from an httpx stream and closed early on break."""
+        entities = [{"identifier": f"svc-{i}", "description": "x" * 200} for i in range(2000)]
+        body = json.dumps({"ok": True, "entities": entities}).encode()
+        sent = []
+
+        class Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for start in range(0, len(body), 16384):
+                    sent.append(start)
+                    yield body[start:start + 16384]
+
+        def handler(request):
+            return httpx.Response(200, stream=Body())
+
+        async with _make_client(handler, skip_auth=True) as client:
+            entities = [entity async for entity in client.entities.stream_all_entities("service")]
+            self.assertEqual([entity["identifier"] for entity in entities], [f"svc-{i}" for i in range(2000)])
+
+            sent.clear()
+            stream = client.entities.stream_all_entities("service")
+            async for _ in stream:
+                break
+            await stream.aclose()
+            self.assertLess(len(sent), len(body) // 16384 // 2)
+
+    async def test_iterator_errors_are_raised(self):
+        """Test that a failing request is raised from the async iterator as a Port exception."""
+        async with _make_client(lambda request: httpx.Response(404, json={"message": "not found"}),
+                                skip_auth=True) as client:
+            with self.assertRaises(PortResourceNotFoundError):
+                async for _ in client.entities.stream_all_entities("missing"):
+                    pass
+
+    async def test_unknown_service_method_raises_attribute_error(self):
+        """Test that only methods of the wrapped service are exposed."""
+        async with _make_client(lambda request: httpx.Response(200), skip_auth=True) as client:
+            with self.assertRaises(AttributeError):
+                client.entities.not_a_method
+
+    async def test_sync_only_methods_are_not_exposed(self):
+        """Test that methods needing a thread pool client are left off the async services."""
+        async with _make_client(lambda request: httpx.Response(200), skip_auth=True) as client:
+            self.assertFalse(hasattr(client.entities, "bulk_upsert"))
+            self.assertTrue(hasattr(client.entities, "create_entity"))
+
+
+if __name__ == '__main__':
+    unittest.main()
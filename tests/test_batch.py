@@ -0,0 +1,100 @@
+"""
+Tests for concurrent request execution (PortClient.map / PortClient.batch).
+"""
+import threading
+import time
+import unittest
+
+from pyport.client import BatchExecutor
+from pyport.client.batch import run_map
+from pyport.client.client import PortClient
+from pyport.exceptions import PortResourceNotFoundError
+
+
+class TestRunMap(unittest.TestCase):
+    """Tests for the run_map function."""
+
+    def test_results_keep_input_order(self):
+        """Test that results are returned in input order even when calls finish out of order."""
+        def slow_identity(value, delay):
+            time.sleep(delay)
+            return value
+
+        items = [(i, 0.01 * (5 - i)) for i in range(5)]
+        results = run_map(slow_identity, items, max_concurrency=5)
+
+        self.assertEqual([result.value for result in results], [0, 1, 2, 3, 4])
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3, 4])
+
+    def test_failures_are_reported_per_item(self):
+        """Test that a failing call does not abort the other calls."""
+        def get(identifier):
+            if identifier == "missing":
+                raise PortResourceNotFoundError("not found", status_code=404)
+            return identifier.upper()
+
+        results = run_map(get, ["a", "missing", "b"], max_concurrency=2)
+
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertIsInstance(results[1].error, PortResourceNotFoundError)
+        self.assertEqual(results[1].args, ("missing",))
+        self.assertEqual(results[2].unwrap(), "B")
+        with self.assertRaises(PortResourceNotFoundError):
+            results[1].unwrap()
+
+    def test_dict_items_are_passed_as_kwargs(self):
+        """Test that dict items are passed as keyword arguments."""
+        results = run_map(lambda a, b: a - b, [{"a": 3, "b": 1}], max_concurrency=1)
+        self.assertEqual(results[0].value, 2)
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency calls run at once."""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def work(_):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.005)
+            with lock:
+                state["running"] -= 1
+
+        run_map(work, (i for i in range(40)), max_concurrency=3)
+        self.assertLessEqual(state["peak"], 3)
+
+
+class TestBatchExecutor(unittest.TestCase):
+    """Tests for the BatchExecutor class."""
+
+    def test_submit_returns_futures(self):
+        """Test that submit returns futures and results() reports every call."""
+        with BatchExecutor(max_concurrency=2) as batch:
+            futures = [batch.submit(pow, 2, n) for n in range(4)]
+            results = batch.results()
+
+        self.assertEqual([future.result() for future in futures], [1, 2, 4, 8])
+        self.assertEqual([result.value for result in results], [1, 2, 4, 8])
+
+    def test_invalid_concurrency_is_rejected(self):
+        """Test that max_concurrency must be positive."""
+        with self.assertRaises(ValueError):
+            BatchExecutor(max_concurrency=0)
+
+
+class TestPortClientMap(unittest.TestCase):
+    """Tests for PortClient.map and PortClient.batch."""
+
+    def setUp(self):
+        """Set up a client without authentication."""
+        self.client = PortClient(client_id="id", client_secret="secret", skip_auth=True, pool_maxsize=4)
+
+    def test_map_defaults_to_pool_size(self):
+        """Test that map and batch default their concurrency to the pool size."""
+        self.assertEqual(self.client.batch().max_concurrency, 4)
+        results = self.client.map(lambda bp, entity: f"{bp}/{entity}", [("service", "api"), ("service", "web")])
+        self.assertEqual([result.value for result in results], ["service/api", "service/web"])
+
+
+if __name__ == '__main__':
+    unittest.main()
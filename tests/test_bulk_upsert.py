@@ -0,0 +1,182 @@
+"""
+Tests for the entity bulk upsert pipeline.
+"""
+import threading
+import time
+import unittest
+
+from pyport.client.client import PortClient
+from pyport.client.transport import InProcessTransport
+from pyport.entities import BulkUpsertProgress
+from pyport.entities.bulk import BulkUpsert
+
+
+def make_client(handler):
+    """Create a client answering requests with an in-process handler."""
+    return PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                      transport=InProcessTransport(handler), max_retries=0, retry_delay=0.001)
+
+
+def entities(count):
+    """Generate `count` entities."""
+    for i in range(count):
+        yield {"identifier": f"svc-{i}", "properties": {}}
+
+
+class TestBulkUpsert(unittest.TestCase):
+    """Tests for Entities.bulk_upsert."""
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def handler(self, reject=(), flaky=(), fail_requests=0):
+        """
+        Create a bulk endpoint handler.
+
+        Entities in `reject` fail with a 422, entities in `flaky` fail with a 503 the
+        first time they are sent, and the first `fail_requests` requests fail as a whole.
+        """
+        seen = set()
+
+        def handler(request):
+            batch = request.json()["entities"]
+            with self.lock:
+                self.requests.append(request)
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                number = len(self.requests)
+            self.release.wait(5)
+            with self.lock:
+                self.in_flight -= 1
+            if number <= fail_requests:
+                return 503, {"ok": False, "error": "unavailable"}
+            errors = []
+            for index, entity in enumerate(batch):
+                identifier = entity["identifier"]
+                if identifier in reject:
+                    errors.append({"identifier": identifier, "index": index, "statusCode": 422,
+                                   "error": "invalid_properties", "message": "bad property"})
+                elif identifier in flaky and identifier not in seen:
+                    seen.add(identifier)
+                    errors.append({"identifier": identifier, "index": index, "statusCode": 503,
+                                   "error": "unavailable", "message": "try again"})
+            created = [{"identifier": entity["identifier"], "created": True} for entity in batch]
+            return 207, {"ok": True, "entities": created, "errors": errors}
+
+        return handler
+
+    def test_chunks_and_upsert_params(self):
+        """Test that a generator is sent in chunks as upserts and every entity is counted."""
+        client = make_client(self.handler())
+        result = client.entities.bulk_upsert("service", entities(45), chunk_size=20, merge=True)
+
+        self.assertEqual((result["succeeded"], result["failed"], result["requests"]), (45, [], 3))
+        self.assertEqual(sorted(len(request.json()["entities"]) for request in self.requests), [5, 20, 20])
+        self.assertEqual(self.requests[0].path, self.requests[1].path)
+        self.assertTrue(self.requests[0].path.endswith("blueprints/service/entities/bulk"))
+        self.assertEqual(self.requests[0].params, {"upsert": "true", "merge": "true"})
+
+    def test_only_transient_failures_are_resubmitted(self):
+        """Test that rejected entities are reported and transiently failed ones are sent again alone."""
+        client = make_client(self.handler(reject={"svc-3"}, flaky={"svc-7", "svc-12"}))
+        result = client.entities.bulk_upsert("service", entities(20), chunk_size=10)
+
+        self.assertEqual(result["succeeded"], 19)
+        self.assertEqual([(error["identifier"], error["statusCode"]) for error in result["failed"]],
+                         [("svc-3", 422)])
+        self.assertEqual(result["failed"][0]["entity"], {"identifier": "svc-3", "properties": {}})
+        self.assertEqual(sorted(entity["identifier"] for request in self.requests[2:]
+                                for entity in request.json()["entities"]), ["svc-12", "svc-7"])
+
+    def test_failed_requests_are_resubmitted_up_to_the_limit(self):
+        """Test that entities of failed requests are sent again, then reported once resubmits run out."""
+        client = make_client(self.handler(fail_requests=1))
+        result = client.entities.bulk_upsert("service", entities(5), max_resubmits=1)
+        self.assertEqual((result["succeeded"], result["requests"]), (5, 2))
+
+        client = make_client(self.handler(fail_requests=10))
+        result = client.entities.bulk_upsert("service", entities(5), max_resubmits=2)
+        self.assertEqual((result["succeeded"], len(result["failed"]), result["requests"]), (0, 5, 3))
+        self.assertEqual(result["failed"][0]["error"], "PortServerError")
+
+    def test_resubmits_join_the_next_chunk(self):
+        """Test that transiently failed entities are sent with the next chunk, not after the whole input."""
+        client = make_client(self.handler(flaky={"svc-1"}))
+        result = client.entities.bulk_upsert("service", entities(20), chunk_size=5, concurrency=1,
+                                             resubmit_delay=0)
+
+        self.assertEqual((result["succeeded"], result["failed"], result["requests"]), (20, [], 5))
+        sent = [[entity["identifier"] for entity in request.json()["entities"]] for request in self.requests]
+        # The second chunk is already queued when the first one completes
+        self.assertEqual(sent[2], ["svc-1", "svc-10", "svc-11", "svc-12", "svc-13"])
+        self.assertEqual(sent[-1], ["svc-19"])
+
+    def test_unexpected_errors_fail_only_their_chunk(self):
+        """Test that an error other than a PortApiError fails the entities of its request and the run goes on."""
+        def send(chunk):
+            if chunk[0]["identifier"] == "svc-5":
+                raise ValueError("malformed response body")
+            return {"ok": True, "entities": chunk, "errors": []}
+
+        result = BulkUpsert(send, chunk_size=5, concurrency=2, max_resubmits=2).run(entities(20))
+
+        self.assertEqual((result["succeeded"], result["requests"]), (15, 4))
+        self.assertEqual(sorted(error["identifier"] for error in result["failed"]), [f"svc-{i}" for i in range(5, 10)])
+        self.assertEqual({error["error"] for error in result["failed"]}, {"ValueError"})
+
+    def test_backpressure_and_progress(self):
+        """Test that the input is read only as requests complete and progress is reported."""
+        self.release.clear()
+        read = []
+
+        def source():
+            for entity in entities(100):
+                read.append(entity)
+                yield entity
+
+        reports = []
+        results = []
+
+        def on_progress(progress):
+            self.assertIsInstance(progress, BulkUpsertProgress)
+            self.assertGreaterEqual(progress.items_per_second, 0)
+            reports.append((progress.submitted, progress.succeeded, progress.requests))
+
+        client = make_client(self.handler())
+        worker = threading.Thread(target=lambda: results.append(client.entities.bulk_upsert(
+            "service", source(), chunk_size=5, concurrency=2, on_progress=on_progress)))
+        worker.start()
+        try:
+            for _ in range(500):
+                if self.in_flight == 2:
+                    break
+                time.sleep(0.01)
+            time.sleep(0.05)
+            # Two requests running, two queued and the chunk waiting to be submitted
+            self.assertLessEqual(len(read), 5 * 5)
+        finally:
+            self.release.set()
+            worker.join(5)
+
+        self.assertEqual(self.max_in_flight, 2)
+        self.assertEqual(results[0]["succeeded"], 100)
+        self.assertEqual(len(reports), 21)
+        self.assertEqual(reports[-1], (100, 100, 20))
+
+    def test_arguments_are_validated(self):
+        """Test that invalid chunk sizes and concurrency are rejected before any request."""
+        client = make_client(self.handler())
+        with self.assertRaises(ValueError):
+            client.entities.bulk_upsert("service", entities(1), chunk_size=21)
+        with self.assertRaises(ValueError):
+            client.entities.bulk_upsert("service", entities(1), concurrency=0)
+        self.assertEqual(self.requests, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
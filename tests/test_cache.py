@@ -0,0 +1,173 @@
+"""
+Tests for the HTTP response cache.
+"""
+import json
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from pyport.cache import ResponseCache
+from pyport.client.client import PortClient
+
+
+def make_response(status_code=200, body=None, headers=None, url="https://api.getport.io/v1/blueprints/service"):
+    """Build a requests.Response for the tests."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers.update(headers or {})
+    response._content = json.dumps(body).encode() if body is not None else b""
+    return response
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for the ResponseCache class."""
+
+    def test_ttl_patterns(self):
+        """Test that the first matching pattern decides the TTL."""
+        cache = ResponseCache(default_ttl=0, ttls={"blueprints/*/entities*": 0, "blueprints*": 300})
+        self.assertEqual(cache.ttl_for("blueprints/service"), 300)
+        self.assertEqual(cache.ttl_for("blueprints/service/entities/api"), 0)
+        self.assertFalse(cache.is_cacheable("GET", "teams"))
+        self.assertFalse(cache.is_cacheable("POST", "blueprints"))
+
+    def test_keys_ignore_parameter_order(self):
+        """Test that query parameters are part of the key regardless of order."""
+        self.assertEqual(ResponseCache.make_key("u", {"a": 1, "b": [2, 3]}),
+                         ResponseCache.make_key("u", [("b", 2), ("b", 3), ("a", 1)]))
+        self.assertNotEqual(ResponseCache.make_key("u", {"a": 1}), ResponseCache.make_key("u"))
+
+    def test_search_queries_are_keyed_by_body(self):
+        """Test that read-only POST routes are cacheable and keyed on a canonical hash of their body."""
+        cache = ResponseCache()
+        self.assertTrue(cache.is_cacheable("POST", "blueprints/service/entities/search"))
+        self.assertEqual(ResponseCache.make_key("u", json_body={"a": 1, "b": 2}),
+                         ResponseCache.make_key("u", json_body={"b": 2, "a": 1}))
+        self.assertNotEqual(ResponseCache.make_key("u", json_body={"a": 1}), ResponseCache.make_key("u"))
+
+    def test_lru_eviction_by_size(self):
+        """Test that the least recently used entries are evicted to stay within max_bytes."""
+        cache = ResponseCache(max_bytes=40)
+        for name in ("a", "b", "c"):
+            cache.store(("u", (("n", name),)), "blueprints", make_response(body={"x": "0123"}))
+        cache.get(("u", (("n", "a"),)))
+        cache.store(("u", (("n", "d"),)), "blueprints", make_response(body={"x": "0123"}))
+
+        self.assertIsNotNone(cache.get(("u", (("n", "a"),))))
+        self.assertIsNone(cache.get(("u", (("n", "b"),))))
+        self.assertLessEqual(cache.get_stats()["size_bytes"], 40)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_no_store_is_respected(self):
+        """Test that responses marked no-store are not cached."""
+        cache = ResponseCache()
+        self.assertIsNone(cache.store(("u", ()), "blueprints", make_response(body={}, headers={
+            "Cache-Control": "no-store"})))
+
+    def test_writes_invalidate_related_paths(self):
+        """Test that a write drops the written path, its children and its collection listing only."""
+        cache = ResponseCache()
+        for endpoint in ("blueprints", "blueprints/service", "blueprints/service/entities/api", "blueprints/team"):
+            cache.store((endpoint, ()), endpoint, make_response(body={}))
+
+        self.assertEqual(cache.invalidate("POST", "blueprints/service/entities/search"), 0)
+        self.assertEqual(cache.invalidate("PUT", "blueprints/service"), 3)
+        self.assertIsNotNone(cache.get(("blueprints/team", ())))
+
+    def test_parent_resources_survive_child_writes(self):
+        """Test that a write to an entity keeps its blueprint cached but drops the entity listing."""
+        cache = ResponseCache()
+        for endpoint in ("blueprints", "blueprints/service", "blueprints/service/entities",
+                         "blueprints/service/entities/api"):
+            cache.store((endpoint, ()), endpoint, make_response(body={}))
+
+        self.assertEqual(cache.invalidate("PATCH", "blueprints/service/entities/api"), 2)
+        self.assertIsNotNone(cache.get(("blueprints", ())))
+        self.assertIsNotNone(cache.get(("blueprints/service", ())))
+        self.assertIsNone(cache.get(("blueprints/service/entities", ())))
+
+    def test_creates_keep_the_parent_resource(self):
+        """Test that creating an entity drops the entity listing but keeps the blueprint."""
+        cache = ResponseCache()
+        for endpoint in ("blueprints/service", "blueprints/service/entities"):
+            cache.store((endpoint, ()), endpoint, make_response(body={}))
+
+        self.assertEqual(cache.invalidate("POST", "blueprints/service/entities"), 1)
+        self.assertIsNotNone(cache.get(("blueprints/service", ())))
+        self.assertIsNone(cache.get(("blueprints/service/entities", ())))
+
+    def test_writes_invalidate_query_results(self):
+        """Test that any write drops cached searches, which may cover the written entity."""
+        cache = ResponseCache()
+        cache.store(("search", ()), "entities/search", make_response(body={}))
+        cache.store(("team", ()), "teams/platform", make_response(body={}))
+        self.assertEqual(cache.invalidate("POST", "blueprints/service/entities"), 1)
+        self.assertIsNotNone(cache.get(("team", ())))
+
+
+class TestPortClientResponseCache(unittest.TestCase):
+    """Tests for response caching in PortClient."""
+
+    def setUp(self):
+        """Set up a client with a response cache."""
+        self.cache = ResponseCache(ttls={"blueprints*": 300})
+        self.client = PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                                 response_cache=self.cache)
+
+    def test_fresh_entries_are_served_without_a_request(self):
+        """Test that a second GET is served from the cache with a readable body."""
+        response = make_response(body={"identifier": "service"}, headers={"ETag": '"v1"'})
+        with patch.object(self.client._session, "request", return_value=response) as mock_request:
+            first = self.client.make_request("GET", "blueprints/service")
+            second = self.client.make_request("GET", "blueprints/service")
+
+        mock_request.assert_called_once()
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(self.client.response_cache.get_stats()["hits"], 1)
+
+    def test_expired_entries_are_revalidated(self):
+        """Test that an expired entry is revalidated and reused on 304."""
+        self.cache.ttls = {"blueprints*": 1e-9}
+        responses = [make_response(body={"identifier": "service"}, headers={"ETag": '"v1"'}),
+                     make_response(status_code=304)]
+        with patch.object(self.client._session, "request", side_effect=responses) as mock_request:
+            self.client.make_request("GET", "blueprints/service")
+            revalidated = self.client.make_request("GET", "blueprints/service")
+
+        self.assertEqual(mock_request.call_args[1]["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(revalidated.status_code, 200)
+        self.assertEqual(revalidated.json(), {"identifier": "service"})
+        self.assertEqual(self.cache.get_stats()["revalidations"], 1)
+
+    def test_writes_through_the_client_invalidate(self):
+        """Test that a write through the client forces the next GET to the API."""
+        responses = [make_response(body={"title": "old"}), make_response(body={}),
+                     make_response(body={"title": "new"})]
+        with patch.object(self.client._session, "request", side_effect=responses):
+            self.client.make_request("GET", "blueprints/service")
+            self.client.make_request("PATCH", "blueprints/service", json={"title": "new"})
+            updated = self.client.make_request("GET", "blueprints/service")
+
+        self.assertEqual(updated.json(), {"title": "new"})
+
+    def test_searches_are_cached(self):
+        """Test that repeated searches are served from the cache until a write."""
+        self.cache.ttls = {"*": 300}
+        query = {"combinator": "and", "rules": []}
+        responses = [make_response(body={"ok": True, "entities": [1]}),
+                     make_response(body={"ok": True, "entities": [2]}),
+                     make_response(body={}),
+                     make_response(body={"ok": True, "entities": [3]})]
+        with patch.object(self.client._session, "request", side_effect=responses) as mock_request:
+            first = self.client.entities.search_entities(query)
+            self.assertEqual(self.client.entities.search_entities(dict(reversed(query.items()))), first)
+            self.assertEqual(self.client.entities.search_entities({**query, "rules": [{}]}), [2])
+            self.client.entities.create_entity("service", {"identifier": "api"})
+            self.assertEqual(self.client.entities.search_entities(query), [3])
+
+        self.assertEqual(mock_request.call_count, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Tests for per-endpoint circuit breakers.
+"""
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pyport.client.client import PortClient
+from pyport.client.endpoints import endpoint_template, resource_family
+from pyport.client.transport import InProcessTransport
+from pyport.exceptions import PortApiError, PortServerError
+from pyport.retry import CircuitBreakerRegistry, CircuitBreakerState
+
+
+class TestEndpointTemplate(unittest.TestCase):
+    """Tests for endpoint_template and resource_family."""
+
+    def test_identifiers_are_replaced(self):
+        """Test that identifier segments become placeholders and route segments are kept."""
+        self.assertEqual(endpoint_template("blueprints/service/entities/api"), "blueprints/{id}/entities/{id}")
+        self.assertEqual(endpoint_template("/blueprints/service/entities/search?x=1"),
+                         "blueprints/{id}/entities/search")
+        self.assertEqual(endpoint_template("entities/aggregate"), "entities/aggregate")
+        self.assertEqual(endpoint_template("actions/runs/r_123/logs"), "actions/runs/{id}/logs")
+        self.assertEqual(resource_family("blueprints/service/entities"), "blueprints")
+
+
+class TestHalfOpenCircuit(unittest.TestCase):
+    """Tests for thread-safe circuit breaker transitions."""
+
+    def open_breaker(self):
+        """Create a breaker that is open and past its half-open timeout."""
+        breaker = CircuitBreakerState(failure_threshold=1, half_open_timeout=0.01, reset_timeout=60)
+        breaker.record_failure()
+        time.sleep(0.02)
+        self.assertEqual(breaker.state, "half_open")
+        return breaker
+
+    def test_one_probe_is_admitted(self):
+        """Test that concurrent callers get exactly one test request while half-open."""
+        breaker = self.open_breaker()
+        barrier = threading.Barrier(16)
+
+        def attempt():
+            barrier.wait()
+            return breaker.can_attempt()
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            admitted = list(executor.map(lambda _: attempt(), range(16)))
+        self.assertEqual(admitted.count(True), 1)
+
+    def test_probe_outcome_closes_or_reopens(self):
+        """Test that a successful probe closes the circuit and a failed one opens it again."""
+        breaker = self.open_breaker()
+        self.assertTrue(breaker.can_attempt())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+
+        time.sleep(0.02)
+        self.assertTrue(breaker.can_attempt())
+        self.assertFalse(breaker.can_attempt())
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+        self.assertTrue(breaker.can_attempt())
+
+    def test_concurrent_updates_are_not_lost(self):
+        """Test that counters stay exact when many threads record outcomes."""
+        breaker = CircuitBreakerState(failure_threshold=10 ** 6, adaptive=False)
+
+        def record(i):
+            record_outcome = breaker.record_failure if i % 2 else breaker.record_success
+            for _ in range(500):
+                record_outcome()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(record, range(8)))
+        self.assertEqual(breaker.total_requests, 4000)
+        self.assertEqual(breaker.total_failures, 2000)
+
+
+class TestCircuitBreakerRegistry(unittest.TestCase):
+    """Tests for the CircuitBreakerRegistry class."""
+
+    def test_breakers_are_keyed_by_template(self):
+        """Test that requests to the same route share a breaker and other routes do not."""
+        registry = CircuitBreakerRegistry(lambda: CircuitBreakerState(failure_threshold=1))
+        first = registry.get("GET", "blueprints/a/entities/x")
+        self.assertIs(first, registry.get("GET", "blueprints/b/entities/y"))
+        self.assertIsNot(first, registry.get("POST", "entities/aggregate"))
+        self.assertEqual(first.name, "blueprints/{id}/entities/{id}")
+
+        registry.get("POST", "entities/aggregate").record_failure()
+        self.assertEqual(registry.open_circuits(), ["entities/aggregate"])
+        self.assertEqual(registry.get_status()["blueprints/{id}/entities/{id}"]["state"], "closed")
+
+    def test_custom_keys(self):
+        """Test keying breakers by resource family."""
+        registry = CircuitBreakerRegistry(key_func=lambda method, endpoint: resource_family(endpoint))
+        self.assertIs(registry.get("GET", "blueprints/a"), registry.get("DELETE", "blueprints/b/entities/c"))
+
+
+class TestClientCircuitBreakers(unittest.TestCase):
+    """Tests for circuit breakers in PortClient requests."""
+
+    def test_failing_route_does_not_block_others(self):
+        """Test that an open circuit on one route leaves other routes available."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.path)
+            if request.path.endswith("/entities/aggregate"):
+                return 500, {"ok": False, "error": "internal_error"}
+            return 200, {"ok": True, "blueprint": {"identifier": "service"}}
+
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                            transport=InProcessTransport(handler))
+        for _ in range(5):
+            with self.assertRaises(PortServerError):
+                client.make_request("POST", "entities/aggregate", json={}, retries=0)
+
+        with self.assertRaisesRegex(PortApiError, "open circuit breaker for entities/aggregate"):
+            client.make_request("POST", "entities/aggregate", json={}, retries=0)
+        self.assertEqual(len(calls), 5)
+
+        self.assertEqual(client.blueprints.get_blueprint("service"), {"identifier": "service"})
+        self.assertEqual(client.circuit_breakers.open_circuits(), ["entities/aggregate"])
+        self.assertIn("blueprints/{id}", client.retry_config.get_stats()["circuit_breakers"])
+
+
+if __name__ == '__main__':
+    unittest.main()
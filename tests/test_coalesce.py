@@ -0,0 +1,182 @@
+"""
+Tests for request coalescing.
+"""
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pyport.client.client import PortClient
+from pyport.client.transport import InProcessTransport
+from pyport.coalesce import RequestCoalescer
+from pyport.deadline import deadline
+from pyport.exceptions import PortDeadlineExceededError, PortResourceNotFoundError
+
+BLUEPRINT = {"identifier": "service", "title": "Service"}
+
+
+class GatedHandler:
+    """In-process handler that holds requests until released."""
+
+    def __init__(self, status_code=200, body=None):
+        self.status_code = status_code
+        self.body = body if body is not None else {"ok": True, "blueprint": BLUEPRINT}
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.paths = []
+
+    def __call__(self, request):
+        self.paths.append((request.method, request.path, tuple(sorted(request.params.items()))))
+        self.started.set()
+        self.release.wait(5)
+        return self.status_code, self.body
+
+
+class TestRequestCoalescer(unittest.TestCase):
+    """Tests for the RequestCoalescer class."""
+
+    def test_keys(self):
+        """Test that keys ignore parameter order and include the auth header."""
+        make_key = RequestCoalescer.make_key
+        self.assertEqual(make_key("get", "u", {"a": 1, "b": 2}), make_key("GET", "u", {"b": 2, "a": 1}))
+        self.assertNotEqual(make_key("GET", "u", authorization="Bearer a"),
+                            make_key("GET", "u", authorization="Bearer b"))
+        self.assertNotEqual(make_key("GET", "u", {"a": 1}), make_key("GET", "u", {"a": 2}))
+
+    def test_only_reads_without_body_are_coalescable(self):
+        """Test which requests may be coalesced."""
+        self.assertTrue(RequestCoalescer.is_coalescable("GET", {"params": {"a": 1}}))
+        self.assertTrue(RequestCoalescer.is_coalescable("head", {}))
+        self.assertFalse(RequestCoalescer.is_coalescable("POST", {}))
+        self.assertFalse(RequestCoalescer.is_coalescable("DELETE", {}))
+        self.assertFalse(RequestCoalescer.is_coalescable("GET", {"json": {}}))
+        self.assertFalse(RequestCoalescer.is_coalescable("GET", {"stream": True}))
+        self.assertTrue(RequestCoalescer.is_coalescable("POST", {"json": {}}, "blueprints/a/entities/search"))
+        self.assertFalse(RequestCoalescer.is_coalescable("POST", {"json": {}}, "blueprints/a/entities"))
+        self.assertFalse(RequestCoalescer.is_coalescable("POST", {"data": "{}"}, "entities/search"))
+
+    def test_followers_share_the_leaders_error(self):
+        """Test that waiting callers have the leader's exception raised."""
+        coalescer = RequestCoalescer()
+        started, release = threading.Event(), threading.Event()
+
+        def fail():
+            started.set()
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(coalescer.execute, "key", fail)
+            started.wait(5)
+            follower = executor.submit(coalescer.execute, "key", lambda: "not called")
+            while coalescer.get_stats()["coalesced"] < 1:
+                threading.Event().wait(0.001)
+            release.set()
+            for future in (leader, follower):
+                with self.assertRaises(ValueError):
+                    future.result()
+        self.assertEqual(coalescer.get_stats()["in_flight"], 0)
+
+    def test_follower_stops_waiting_at_its_timeout(self):
+        """Test that a waiter gives up when its timeout passes."""
+        coalescer = RequestCoalescer()
+        started, release = threading.Event(), threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(coalescer.execute, ("GET", "url"), slow)
+            started.wait(5)
+            with self.assertRaises(PortDeadlineExceededError):
+                coalescer.execute(("GET", "url"), slow, timeout=0.05)
+            release.set()
+            self.assertEqual(leader.result(), "done")
+
+
+class TestClientCoalescing(unittest.TestCase):
+    """Tests for coalescing in PortClient requests."""
+
+    def make_client(self, handler, coalescer=None):
+        """Create a client answering requests with an in-process handler."""
+        self.coalescer = coalescer or RequestCoalescer()
+        return PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                          transport=InProcessTransport(handler), request_coalescer=self.coalescer)
+
+    def run_concurrently(self, handler, calls):
+        """Start the calls together, hold the first request until all callers wait, then release it."""
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            handler.started.wait(5)
+            while self.coalescer.get_stats()["calls"] < len(calls):
+                threading.Event().wait(0.001)
+            handler.release.set()
+            return [future.exception() or future.result() for future in futures]
+
+    def test_identical_reads_share_one_request(self):
+        """Test that concurrent identical GETs send one request and share its parsed body."""
+        handler = GatedHandler()
+        client = self.make_client(handler)
+        results = self.run_concurrently(handler, [lambda: client.blueprints.get_blueprint("service")] * 8)
+
+        self.assertEqual(len(handler.paths), 1)
+        self.assertTrue(all(result == BLUEPRINT for result in results))
+        self.assertTrue(all(result is results[0] for result in results))
+        stats = self.coalescer.get_stats()
+        self.assertEqual(stats["coalesced"], 7)
+        self.assertEqual(stats["hot_keys"], {"GET https://api.getport.io/v1/blueprints/service": 7})
+
+    def test_identical_searches_share_one_request(self):
+        """Test that concurrent searches with the same body share one request."""
+        handler = GatedHandler(body={"ok": True, "entities": []})
+        client = self.make_client(handler)
+        query = {"combinator": "and", "rules": [{"property": "$blueprint", "operator": "=", "value": "service"}]}
+        reordered = {"rules": query["rules"], "combinator": "and"}
+        results = self.run_concurrently(handler, [lambda: client.entities.search_entities(query),
+                                                  lambda: client.entities.search_entities(reordered)] * 2)
+
+        self.assertEqual(len(handler.paths), 1)
+        self.assertEqual(results, [[]] * 4)
+        self.assertEqual(self.coalescer.get_stats()["coalesced"], 3)
+
+    def test_different_requests_are_not_shared(self):
+        """Test that requests with different params or methods are sent separately."""
+        handler = GatedHandler()
+        handler.release.set()
+        client = self.make_client(handler)
+        client.make_request("GET", "blueprints", params={"page": 1})
+        client.make_request("GET", "blueprints", params={"page": 2})
+        client.make_request("POST", "blueprints", json={"identifier": "x"})
+        self.assertEqual(len(handler.paths), 3)
+        self.assertEqual(self.coalescer.get_stats()["coalesced"], 0)
+
+    def test_errors_reach_every_caller(self):
+        """Test that an error response is raised in each coalesced caller."""
+        handler = GatedHandler(status_code=404, body={"ok": False, "error": "not_found"})
+        client = self.make_client(handler)
+        results = self.run_concurrently(handler, [lambda: client.make_request("GET", "blueprints/x", retries=0)] * 4)
+
+        self.assertEqual(len(handler.paths), 1)
+        self.assertTrue(all(isinstance(result, PortResourceNotFoundError) for result in results))
+
+    def test_waiters_respect_their_deadline(self):
+        """Test that a caller with a short deadline stops waiting for a slow identical request."""
+        handler = GatedHandler()
+        client = self.make_client(handler)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(client.blueprints.get_blueprint, "service")
+            handler.started.wait(5)
+            with deadline(0.05), self.assertRaises(PortDeadlineExceededError):
+                client.blueprints.get_blueprint("service")
+            handler.release.set()
+            self.assertEqual(leader.result(), BLUEPRINT)
+
+    def test_disabled_by_default(self):
+        """Test that clients do not coalesce unless configured to."""
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True)
+        self.assertIsNone(client.request_coalescer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests for the pluggable JSON codec.
+"""
+import json
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from pyport.client.client import PortClient
+from pyport.codec import CODECS, JsonCodec, get_codec, install_json_decoder
+
+
+def available_codecs():
+    """Instantiate every codec whose backend is installed."""
+    codecs = []
+    for factory in CODECS.values():
+        try:
+            codecs.append(factory())
+        except ImportError:
+            continue
+    return codecs
+
+
+class TestCodecs(unittest.TestCase):
+    """Tests for the codec implementations."""
+
+    def test_round_trip(self):
+        """Test that every installed codec round-trips the same document."""
+        document = {"identifier": "service", "properties": {"tier": 1, "tags": ["a", "ü"], "on": True, "x": None}}
+        for codec in available_codecs():
+            with self.subTest(codec=codec.name):
+                encoded = codec.dumps(document)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(json.loads(encoded), document)
+                self.assertEqual(codec.loads(encoded), document)
+
+    def test_invalid_documents_raise_value_error(self):
+        """Test that every installed codec reports invalid JSON as ValueError."""
+        for codec in available_codecs():
+            with self.subTest(codec=codec.name):
+                with self.assertRaises(ValueError):
+                    codec.loads(b"{not json")
+
+    def test_get_codec(self):
+        """Test codec resolution by name, instance and auto-detection."""
+        codec = JsonCodec()
+        self.assertIs(get_codec(codec), codec)
+        self.assertEqual(get_codec("json").name, "json")
+        self.assertIn(get_codec().name, CODECS)
+        with self.assertRaises(ValueError):
+            get_codec("simplejson")
+
+
+class TestInstallJsonDecoder(unittest.TestCase):
+    """Tests for the codec-backed response.json()."""
+
+    def make_response(self, content):
+        """Build a requests.Response with the given body."""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = content
+        return response
+
+    def test_body_is_parsed_once(self):
+        """Test that repeated json() calls share a single parse."""
+        codec = JsonCodec()
+        response = install_json_decoder(self.make_response(b'{"a": 1}'), codec)
+        with patch.object(codec, "loads", wraps=codec.loads) as mock_loads:
+            self.assertEqual(response.json(), {"a": 1})
+            self.assertIs(response.json(), response.json())
+        mock_loads.assert_called_once()
+
+    def test_invalid_body_raises_requests_error(self):
+        """Test that invalid bodies raise the same exception as requests."""
+        response = install_json_decoder(self.make_response(b"<html>"), get_codec())
+        with self.assertRaises(requests.exceptions.JSONDecodeError):
+            response.json()
+
+
+class TestPortClientCodec(unittest.TestCase):
+    """Tests for codec wiring in PortClient."""
+
+    def test_json_bodies_are_encoded_with_the_codec(self):
+        """Test that json= bodies are sent as codec-encoded data and responses parsed with it."""
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True, json_codec="json")
+        self.assertEqual(client.json_codec.name, "json")
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"ok": true}'
+        with patch.object(client._session, "request", return_value=response) as mock_request:
+            result = client.make_request("POST", "blueprints", json={"identifier": "service"})
+
+        kwargs = mock_request.call_args[1]
+        self.assertNotIn("json", kwargs)
+        self.assertEqual(kwargs["data"], b'{"identifier":"service"}')
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+        self.assertEqual(result.json(), {"ok": True})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Tests for the connection pool shared by PortClient sessions.
+"""
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pyport.client import ConnectionPool
+from pyport.client.auth import AuthManager
+from pyport.client.client import PortClient
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Tests for the ConnectionPool class."""
+
+    def test_adapter_uses_configured_pool_settings(self):
+        """Test that the pool settings are applied to the adapter."""
+        pool = ConnectionPool(pool_connections=4, pool_maxsize=32, pool_block=True)
+        self.assertEqual(pool.adapter._pool_connections, 4)
+        self.assertEqual(pool.adapter._pool_maxsize, 32)
+        self.assertTrue(pool.adapter._pool_block)
+
+    def test_sessions_share_the_adapter(self):
+        """Test that every session created from a pool mounts the same adapter."""
+        pool = ConnectionPool()
+        first = pool.create_session({"Authorization": "Bearer a"})
+        second = pool.create_session({"Authorization": "Bearer b"})
+        self.assertIs(first.get_adapter("https://api.getport.io"), pool.adapter)
+        self.assertIs(second.get_adapter("https://api.getport.io"), pool.adapter)
+        self.assertNotEqual(first.headers["Authorization"], second.headers["Authorization"])
+
+    def test_keep_alive_disabled_sets_connection_header(self):
+        """Test that disabling keep-alive asks the server to close connections."""
+        session = ConnectionPool(keep_alive=False).create_session()
+        self.assertEqual(session.headers["Connection"], "close")
+
+    def test_invalid_sizes_are_rejected(self):
+        """Test that pool sizes must be positive."""
+        with self.assertRaises(ValueError):
+            ConnectionPool(pool_maxsize=0)
+
+
+class TestPortClientConnectionPool(unittest.TestCase):
+    """Tests for connection pool wiring in PortClient."""
+
+    def test_clients_can_share_a_pool(self):
+        """Test that several clients can share one pool without sharing headers."""
+        pool = ConnectionPool(pool_maxsize=16)
+        first = PortClient(client_id="a", client_secret="a", skip_auth=True, connection_pool=pool)
+        second = PortClient(client_id="b", client_secret="b", skip_auth=True, connection_pool=pool)
+
+        self.assertIs(first.connection_pool, pool)
+        self.assertIs(first._session.get_adapter(first.api_url), second._session.get_adapter(second.api_url))
+        self.assertIsNot(first._session, second._session)
+
+        with patch.object(pool, "close") as mock_close:
+            first.close()
+        mock_close.assert_not_called()
+
+    def test_client_creates_its_own_pool(self):
+        """Test that pool arguments are used when no pool is shared."""
+        client = PortClient(client_id="a", client_secret="a", skip_auth=True, pool_maxsize=48)
+        self.assertEqual(client.connection_pool.pool_maxsize, 48)
+
+        with patch.object(client.connection_pool, "close") as mock_close:
+            client.close()
+        mock_close.assert_called_once()
+
+    def test_auth_requests_use_the_pooled_session(self):
+        """Test that token requests go through the pooled auth session."""
+        session = MagicMock()
+        session.post.return_value.status_code = 200
+        session.post.return_value.json.return_value = {"accessToken": "token"}
+
+        manager = AuthManager("id", "secret", "https://api.getport.io/v1", auto_refresh=False, session=session)
+
+        self.assertEqual(manager.token, "token")
+        session.post.assert_called_once()
+        self.assertEqual(session.post.call_args[0][0], "https://api.getport.io/v1/auth/access_token")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Tests for deadlines, timeout budgets and default timeouts.
+"""
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pyport.client.client import PortClient
+from pyport.deadline import Deadline, current_deadline, deadline
+from pyport.exceptions import PortDeadlineExceededError, PortServerError
+
+
+class TestDeadline(unittest.TestCase):
+    """Tests for the Deadline class and the deadline context manager."""
+
+    def test_cap_timeout(self):
+        """Test that timeouts of every shape are capped by the remaining time."""
+        bound = Deadline.after(5.0)
+        self.assertLessEqual(bound.cap_timeout(None), 5.0)
+        self.assertEqual(bound.cap_timeout(1.0), 1.0)
+        connect, read = bound.cap_timeout((2.0, 30.0))
+        self.assertEqual(connect, 2.0)
+        self.assertLessEqual(read, 5.0)
+        self.assertTrue(Deadline.after(-1.0).expired())
+
+    def test_nested_blocks_only_shorten_the_deadline(self):
+        """Test that an inner block cannot extend the enclosing deadline."""
+        self.assertIsNone(current_deadline())
+        with deadline(1.0) as outer:
+            with deadline(60.0) as inner:
+                self.assertIs(inner, outer)
+            with deadline(0.5) as inner:
+                self.assertLess(inner.expires_at, outer.expires_at)
+                self.assertIs(current_deadline(), inner)
+            self.assertIs(current_deadline(), outer)
+        self.assertIsNone(current_deadline())
+
+
+class TestRequestDeadlines(unittest.TestCase):
+    """Tests for deadlines applied by the request manager."""
+
+    def make_client(self, **kwargs):
+        """Create a client that does not authenticate or sleep between retries for long."""
+        return PortClient(client_id="id", client_secret="secret", skip_auth=True, **kwargs)
+
+    def test_default_timeout_is_sent(self):
+        """Test that requests get the client's default timeout unless the call sets one."""
+        client = self.make_client()
+        response = MagicMock(status_code=200, headers={})
+        with patch.object(client._session, "request", return_value=response) as mock_request:
+            client.make_request("GET", "blueprints")
+            client.make_request("GET", "blueprints", timeout=3)
+
+        self.assertEqual(mock_request.call_args_list[0].kwargs["timeout"], (10.0, 30.0))
+        self.assertEqual(mock_request.call_args_list[1].kwargs["timeout"], 3)
+
+    def test_timeout_is_capped_by_the_budget(self):
+        """Test that each attempt's connect and read timeouts fit in the remaining budget."""
+        client = self.make_client(timeout_budget=2.0)
+        response = MagicMock(status_code=200, headers={})
+        with patch.object(client._session, "request", return_value=response) as mock_request:
+            client.make_request("GET", "blueprints")
+
+        connect, read = mock_request.call_args.kwargs["timeout"]
+        self.assertLessEqual(connect, 2.0)
+        self.assertLessEqual(read, 2.0)
+
+    def test_retry_that_cannot_finish_in_time_is_skipped(self):
+        """Test that the last error is raised instead of sleeping past the deadline."""
+        client = self.make_client(retry_delay=5.0, retry_jitter=False)
+        response = MagicMock(status_code=503, headers={})
+        with patch.object(client._session, "request", return_value=response) as mock_request:
+            start = time.monotonic()
+            with self.assertRaises(PortServerError):
+                client.make_request("GET", "blueprints", timeout_budget=1.0)
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(mock_request.call_count, 1)
+
+    def test_expired_deadline_sends_nothing(self):
+        """Test that no request is sent once the deadline has passed."""
+        client = self.make_client()
+        with patch.object(client._session, "request") as mock_request:
+            with self.assertRaises(PortDeadlineExceededError):
+                client.make_request("GET", "blueprints", deadline=Deadline.after(-1.0))
+
+        mock_request.assert_not_called()
+
+    def test_deadline_carries_into_batch_threads(self):
+        """Test that calls fanned out with map share the enclosing deadline."""
+        client = self.make_client()
+        response = MagicMock(status_code=200, headers={})
+        with patch.object(client._session, "request", return_value=response) as mock_request:
+            with deadline(2.0):
+                results = client.map(lambda name: client.make_request("GET", f"blueprints/{name}"),
+                                     ["a", "b", "c"])
+
+        self.assertTrue(all(result.ok for result in results))
+        for call in mock_request.call_args_list:
+            self.assertLessEqual(call.kwargs["timeout"][1], 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
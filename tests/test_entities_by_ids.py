@@ -0,0 +1,113 @@
+"""
+Tests for fetching entities by identifier in batches.
+"""
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from pyport import AsyncPortClient
+from pyport.client.client import PortClient
+from pyport.client.transport import InProcessTransport
+from pyport.exceptions import PortResourceNotFoundError
+
+EXISTING = {f"svc-{i}" for i in range(0, 250, 2)}
+
+
+def search(body):
+    """Answer an identifier `in` search over EXISTING, one page of `limit` entities at a time."""
+    rule = body["query"]["rules"][0]
+    assert rule["property"] == "$identifier" and rule["operator"] == "in"
+    matches = [identifier for identifier in rule["value"] if identifier in EXISTING]
+    start = int(body.get("from") or 0)
+    page = matches[start:start + body["limit"]]
+    response = {"ok": True, "entities": [{"identifier": identifier} for identifier in page]}
+    if start + body["limit"] < len(matches):
+        response["next"] = str(start + body["limit"])
+    return response
+
+
+class TestGetEntitiesByIds(unittest.TestCase):
+    """Tests for Entities.get_entities_by_ids."""
+
+    def setUp(self):
+        """Create a client whose blueprint entity searches are answered in-process."""
+        self.bodies = []
+        self.lock = threading.Lock()
+
+        def handler(request):
+            if not request.path.endswith("/blueprints/service/entities/search"):
+                return 404, {"ok": False, "error": "not_found"}
+            with self.lock:
+                self.bodies.append(request.json())
+            return 200, search(request.json())
+
+        self.client = PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                                 transport=InProcessTransport(handler))
+
+    def test_chunks_are_searched_and_keyed_by_identifier(self):
+        """Test that identifiers are fetched in chunks and missing ones are reported in order."""
+        ids = [f"svc-{i}" for i in range(250)]
+        result = self.client.entities.get_entities_by_ids("service", ids, chunk_size=100)
+
+        self.assertEqual(len(self.bodies), 3)
+        self.assertEqual(sorted(len(body["query"]["rules"][0]["value"]) for body in self.bodies), [50, 100, 100])
+        self.assertEqual(set(result["entities"]), EXISTING)
+        self.assertEqual(result["entities"]["svc-4"], {"identifier": "svc-4"})
+        self.assertEqual(result["missing"], [f"svc-{i}" for i in range(1, 250, 2)])
+
+    def test_duplicates_and_empty_input(self):
+        """Test that duplicate identifiers are searched once and no IDs make no requests."""
+        result = self.client.entities.get_entities_by_ids("service", ["svc-0", "svc-1", "svc-0"])
+        self.assertEqual(self.bodies[0]["query"]["rules"][0]["value"], ["svc-0", "svc-1"])
+        self.assertEqual(result["missing"], ["svc-1"])
+
+        self.assertEqual(self.client.entities.get_entities_by_ids("service", []), {"entities": {}, "missing": []})
+        self.assertEqual(len(self.bodies), 1)
+
+    def test_pagination_is_followed(self):
+        """Test that a chunk whose results span several pages is read completely."""
+        ids = sorted(EXISTING)[:10]
+        with patch("pyport.entities.entities_api_svc.Entities.search_blueprint_entities",
+                   autospec=True) as search_mock:
+            search_mock.side_effect = lambda service, blueprint, body: search({**body, "limit": 4})
+            result = self.client.entities.get_entities_by_ids("service", ids)
+        self.assertEqual(search_mock.call_count, 3)
+        self.assertEqual(set(result["entities"]), set(ids))
+
+    def test_errors_and_invalid_chunk_size(self):
+        """Test that API errors are raised and chunk sizes beyond the search limit are rejected."""
+        with self.assertRaises(PortResourceNotFoundError):
+            self.client.entities.get_entities_by_ids("missing", [f"b{i}" for i in range(200)])
+        with self.assertRaises(ValueError):
+            self.client.entities.get_entities_by_ids("service", ["a"], chunk_size=1001)
+
+
+@unittest.skipIf(not HTTPX_AVAILABLE, "httpx not installed")
+class TestAsyncGetEntitiesByIds(unittest.IsolatedAsyncioTestCase):
+    """Tests for get_entities_by_ids on the AsyncPortClient."""
+
+    async def test_chunks_are_fetched(self):
+        """Test that the async client fetches every chunk."""
+        def handler(request):
+            if request.url.path.endswith("auth/access_token"):
+                return httpx.Response(200, json={"accessToken": "token-1"})
+            return httpx.Response(200, json=search(json.loads(request.content)))
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPortClient(client_id="id", client_secret="secret", http_client=http_client) as client:
+            result = await client.entities.get_entities_by_ids("service", [f"svc-{i}" for i in range(6)],
+                                                               chunk_size=2)
+
+        self.assertEqual(set(result["entities"]), {"svc-0", "svc-2", "svc-4"})
+        self.assertEqual(result["missing"], ["svc-1", "svc-3", "svc-5"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Tests for hedged requests.
+"""
+import itertools
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pyport.client.client import PortClient
+from pyport.hedging import HedgePolicy
+
+
+class SlowThenFast:
+    """Attempt whose first call is slow and later calls answer immediately."""
+
+    def __init__(self, slow_seconds=0.5):
+        self.slow_seconds = slow_seconds
+        self.responses = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            call = next(self._counter)
+        if call == 0:
+            time.sleep(self.slow_seconds)
+        response = MagicMock(status_code=200, headers={}, name=f"response-{call}")
+        self.responses.append(response)
+        return response
+
+
+class TestHedgePolicy(unittest.TestCase):
+    """Tests for the HedgePolicy class."""
+
+    def test_delay_follows_the_latency_percentile(self):
+        """Test that the hedge delay is the configured percentile, clamped."""
+        policy = HedgePolicy(percentile=90, min_delay=0.01, max_delay=0.5, initial_delay=0.2, min_samples=10)
+        self.assertEqual(policy.hedge_delay(), 0.2)
+
+        for latency in range(1, 101):
+            policy.record_latency(latency / 1000)
+        # Read from a histogram with about 5% relative error
+        self.assertAlmostEqual(policy.hedge_delay(), 0.09, delta=0.005)
+
+        for _ in range(1000):
+            policy.record_latency(5.0)
+        self.assertEqual(policy.hedge_delay(), 0.5)
+
+    def test_slow_attempt_is_hedged_and_the_loser_closed(self):
+        """Test that a hedge answering first wins and the slow response is closed."""
+        policy = HedgePolicy(initial_delay=0.05)
+        attempt = SlowThenFast()
+
+        start = time.monotonic()
+        result = policy.execute(attempt)
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertIs(result, attempt.responses[0])
+
+        time.sleep(0.6)
+        attempt.responses[1].close.assert_called_once()
+        self.assertEqual(policy.get_stats()["hedge_wins"], 1)
+
+    def test_hedge_is_used_when_the_slow_attempt_fails(self):
+        """Test that the hedge's response is used when the first attempt times out."""
+        policy = HedgePolicy(initial_delay=0.05)
+        calls = itertools.count()
+
+        def attempt():
+            if next(calls) == 0:
+                time.sleep(0.2)
+                raise TimeoutError("read timed out")
+            return "hedged"
+
+        self.assertEqual(policy.execute(attempt), "hedged")
+        self.assertEqual(policy.get_stats()["hedge_wins"], 1)
+
+    def test_attempts_are_not_queued_behind_the_thread_pool(self):
+        """Test that first attempts run on the calling thread when every worker is busy."""
+        policy = HedgePolicy(initial_delay=1.0, max_workers=1)
+        running = []
+        lock = threading.Lock()
+        all_running = threading.Event()
+
+        def attempt():
+            with lock:
+                running.append(threading.current_thread())
+                if len(running) == 4:
+                    all_running.set()
+            return all_running.wait(1)
+
+        threads = [threading.Thread(target=policy.execute, args=(attempt,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(2)
+
+        self.assertTrue(all_running.is_set())
+        self.assertEqual(len(set(running) & set(threads)), 3)
+        self.assertEqual(policy.get_stats()["hedges"], 0)
+        policy.shutdown()
+
+    def test_fast_attempt_is_not_hedged(self):
+        """Test that no hedge is sent when the first attempt answers in time."""
+        policy = HedgePolicy(initial_delay=0.5)
+        self.assertEqual(policy.execute(lambda: "ok"), "ok")
+        self.assertEqual(policy.get_stats()["hedges"], 0)
+
+    def test_budget_limits_hedges(self):
+        """Test that hedges stop once the budget is spent."""
+        policy = HedgePolicy(initial_delay=0.01, budget=0.0, max_tokens=1)
+        for _ in range(3):
+            policy.execute(lambda: time.sleep(0.05))
+
+        stats = policy.get_stats()
+        self.assertEqual(stats["hedges"], 1)
+        self.assertEqual(stats["denied"], 2)
+
+    def test_error_is_raised_when_every_attempt_fails(self):
+        """Test that an error is raised if both attempts fail."""
+        policy = HedgePolicy(initial_delay=0.01)
+
+        def fail():
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            policy.execute(fail)
+        self.assertEqual(policy.get_stats()["hedges"], 1)
+
+
+class TestClientHedging(unittest.TestCase):
+    """Tests for hedging in the request manager."""
+
+    def test_only_idempotent_methods_are_hedged(self):
+        """Test that GETs are hedged and POSTs are not."""
+        policy = HedgePolicy(initial_delay=0.05)
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True, hedge_policy=policy)
+        self.assertIs(client.hedge_policy, policy)
+
+        with patch.object(client._session, "request", side_effect=SlowThenFast(0.3)) as mock_request:
+            start = time.monotonic()
+            client.make_request("GET", "blueprints/service")
+            self.assertLess(time.monotonic() - start, 0.25)
+        self.assertEqual(mock_request.call_count, 2)
+
+        with patch.object(client._session, "request", side_effect=SlowThenFast(0.1)) as mock_request:
+            client.make_request("POST", "blueprints", json={"identifier": "service"})
+        self.assertEqual(mock_request.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
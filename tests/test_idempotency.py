@@ -0,0 +1,141 @@
+"""
+Tests for idempotency keys and the create conflict policies.
+"""
+import unittest
+
+from pyport.client.client import PortClient
+from pyport.client.transport import InProcessTransport
+from pyport.constants import IDEMPOTENCY_KEY_HEADER
+from pyport.exceptions import PortConflictError, PortServerError
+from pyport.retry import RetryConfig
+
+
+def make_client(handler, **kwargs):
+    """Create a client answering requests with an in-process handler."""
+    return PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                      transport=InProcessTransport(handler), retry_delay=0.001, max_delay=0.001, **kwargs)
+
+
+class TestIdempotencyKeys(unittest.TestCase):
+    """Tests for the Idempotency-Key header of non-idempotent requests."""
+
+    def setUp(self):
+        self.requests = []
+
+    def flaky(self, failures):
+        """Create a handler failing the first `failures` requests with a 502."""
+        def handler(request):
+            self.requests.append(request)
+            if len(self.requests) <= failures:
+                return 502, {"ok": False, "error": "bad_gateway"}
+            return 201, {"ok": True, "run": {"id": "r_1"}}
+        return handler
+
+    def test_writes_are_keyed_but_not_retried_by_default(self):
+        """Test that POSTs carry a key, GETs do not, and POSTs are not retried without opting in."""
+        client = make_client(self.flaky(1))
+        with self.assertRaises(PortServerError):
+            client.actions.execute_action("deploy", {"properties": {}})
+        client.make_request("GET", "blueprints")
+        self.assertEqual(len(self.requests), 2)
+        self.assertIn(IDEMPOTENCY_KEY_HEADER, self.requests[0].headers)
+        self.assertNotIn(IDEMPOTENCY_KEY_HEADER, self.requests[1].headers)
+
+    def test_keyed_writes_retry_with_the_same_key(self):
+        """Test that retries of a keyed write send the key of the first attempt."""
+        client = make_client(self.flaky(2), retry_keyed_writes=True)
+        client.actions.execute_action("deploy", {"properties": {}})
+        client.actions.execute_action("deploy", {"properties": {}})
+
+        keys = [request.headers[IDEMPOTENCY_KEY_HEADER] for request in self.requests]
+        self.assertEqual(len(keys), 4)
+        self.assertEqual(len(set(keys[:3])), 1)
+        self.assertNotEqual(keys[2], keys[3])
+
+    def test_caller_key_is_kept(self):
+        """Test that a key passed by the caller is sent as is."""
+        client = make_client(self.flaky(0))
+        client.make_request("POST", "actions/deploy/runs", json={}, headers={"idempotency-key": "run-42"})
+        self.assertEqual(self.requests[0].headers["idempotency-key"], "run-42")
+        self.assertNotIn(IDEMPOTENCY_KEY_HEADER, self.requests[0].headers)
+
+    def test_keys_can_be_disabled(self):
+        """Test that idempotency_keys=False sends no key, so writes are never retried."""
+        client = make_client(self.flaky(1), idempotency_keys=False, retry_keyed_writes=True)
+        with self.assertRaises(PortServerError):
+            client.make_request("POST", "actions/deploy/runs", json={})
+        self.assertNotIn(IDEMPOTENCY_KEY_HEADER, self.requests[0].headers)
+
+    def test_should_retry_requires_a_key(self):
+        """Test the RetryConfig decision for non-idempotent methods."""
+        error = PortServerError("unavailable", status_code=503)
+        self.assertFalse(RetryConfig(retry_keyed_writes=True).should_retry(error, "POST"))
+        self.assertFalse(RetryConfig().should_retry(error, "POST", idempotency_key="k"))
+        self.assertTrue(RetryConfig(retry_keyed_writes=True).should_retry(error, "POST", idempotency_key="k"))
+
+
+class TestCreateConflicts(unittest.TestCase):
+    """Tests for the on_conflict policies of entity creates."""
+
+    def setUp(self):
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            if request.params.get("upsert") != "true":
+                return 409, {"ok": False, "error": "identifier_taken"}
+            return 200, {"ok": True, "entity": {"identifier": "svc"}}
+
+        self.client = make_client(handler)
+
+    def test_conflicts_raise_by_default(self):
+        """Test that an existing entity raises PortConflictError."""
+        with self.assertRaises(PortConflictError):
+            self.client.entities.create_entity("service", {"identifier": "svc"})
+        self.assertEqual(len(self.requests), 1)
+
+    def test_upsert_and_merge_fallbacks(self):
+        """Test that conflicting creates are repeated as upserts."""
+        self.client.entities.create_entity("service", {"identifier": "svc"}, on_conflict="upsert")
+        self.assertEqual((self.requests[1].params["upsert"], self.requests[1].params["merge"]), ("true", "false"))
+
+        self.client.entities.create_entities_bulk("service", [{"identifier": "svc"}], on_conflict="merge")
+        self.assertEqual(self.requests[3].path, self.requests[2].path)
+        self.assertEqual(self.requests[3].params, {"upsert": "true", "merge": "true"})
+
+        with self.assertRaises(ValueError):
+            self.client.entities.create_entity("service", {"identifier": "svc"}, on_conflict="ignore")
+
+    def test_upsert_fallback_keeps_the_callers_merge(self):
+        """Test that on_conflict="upsert" repeats the request with the merge the caller asked for."""
+        self.client.entities.create_entity("service", {"identifier": "svc"}, merge=True, on_conflict="upsert")
+        self.assertEqual((self.requests[1].params["upsert"], self.requests[1].params["merge"]), ("true", "true"))
+
+    def test_bulk_per_entity_conflicts_are_upserted(self):
+        """Test that entities reported with a 409 in a bulk response are sent again as upserts."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            batch = request.json()["entities"]
+            if request.params.get("upsert") == "true":
+                return 207, {"ok": True, "entities": [{"identifier": batch[0]["identifier"], "created": True}],
+                             "errors": [{"identifier": batch[1]["identifier"], "index": 1, "statusCode": 422,
+                                         "error": "invalid"}]}
+            return 207, {"ok": True, "entities": [{"identifier": "new", "created": True}],
+                         "errors": [{"identifier": "taken", "index": 1, "statusCode": 409, "error": "taken"},
+                                    {"identifier": "bad", "statusCode": 409, "error": "taken"}]}
+
+        client = make_client(handler)
+        entities = [{"identifier": "new"}, {"identifier": "taken"}, {"identifier": "bad"}]
+        result = client.entities.create_entities_bulk("service", entities, on_conflict="merge")
+
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[1].params, {"upsert": "true", "merge": "true"})
+        self.assertEqual(requests[1].json()["entities"], [{"identifier": "taken"}, {"identifier": "bad"}])
+        self.assertEqual([entity["identifier"] for entity in result["entities"]], ["new", "taken"])
+        self.assertEqual(result["errors"], [{"identifier": "bad", "index": 2, "statusCode": 422, "error": "invalid"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
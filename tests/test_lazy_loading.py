@@ -0,0 +1,85 @@
+"""
+Tests for lazy service construction, lazy imports and lazy authentication.
+"""
+import json
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pyport.client.client import PortClient
+from pyport.client.services import SERVICES, load_service_class
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Measures `import pyport` in a fresh interpreter and reports what it loaded
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import pyport
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    """Import-time benchmark guarding against eager imports creeping back in."""
+
+    def test_import_does_not_load_services_or_asyncio(self):
+        """Test that importing pyport does not import service modules, optional features, asyncio or httpx."""
+        env = dict(os.environ, PYTHONPATH=SRC_DIR)
+        output = subprocess.run([sys.executable, "-c", IMPORT_PROBE], env=env, check=True,
+                                capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+
+        optional = ("pyport.cache", "pyport.coalesce", "pyport.hedging", "pyport.metrics", "pyport.profiling",
+                    "pyport.rate_limit")
+        eager = [name for name in result["modules"]
+                 if name.endswith("_api_svc") or name in ("asyncio", "httpx", "pyport.client.async_client")
+                 or name in optional]
+        self.assertEqual(eager, [], f"import pyport took {result['seconds']:.3f}s and loaded {eager}")
+
+
+class TestLazyServices(unittest.TestCase):
+    """Tests for services created on first access."""
+
+    def test_registry_names_match_client_properties(self):
+        """Test that every registered service is exposed by PortClient and importable."""
+        for name, (_, class_name) in SERVICES.items():
+            with self.subTest(service=name):
+                self.assertIsInstance(PortClient.__dict__[name], property)
+                self.assertEqual(load_service_class(name).__name__, class_name)
+
+    def test_services_are_created_on_first_access(self):
+        """Test that services are created once, when first used."""
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True)
+        self.assertEqual(client._services.loaded(), ())
+
+        blueprints = client.blueprints
+        self.assertIs(client.blueprints, blueprints)
+        self.assertEqual(client._services.loaded(), ("blueprints",))
+
+
+class TestLazyAuth(unittest.TestCase):
+    """Tests for deferring the token fetch to the first request."""
+
+    @patch('pyport.client.auth.AuthManager._get_access_token', return_value="lazy-token")
+    def test_token_is_fetched_on_first_request(self, mock_get_token):
+        """Test that lazy_auth makes no network call until a request is made."""
+        client = PortClient(client_id="id", client_secret="secret", lazy_auth=True, auto_refresh=False)
+        mock_get_token.assert_not_called()
+        self.assertNotIn("Authorization", client._session.headers)
+
+        response = MagicMock(status_code=200, headers={})
+        with patch.object(client._session, "request", return_value=response):
+            client.make_request("GET", "blueprints")
+            client.make_request("GET", "blueprints")
+
+        mock_get_token.assert_called_once()
+        self.assertEqual(client._session.headers["Authorization"], "Bearer lazy-token")
+        self.assertEqual(client.token, "lazy-token")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests for request metrics.
+"""
+import unittest
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from pyport import AsyncPortClient
+from pyport.client.client import PortClient
+from pyport.client.transport import InProcessTransport
+from pyport.exceptions import PortApiError, PortServerError
+from pyport.metrics import RequestMetrics
+from pyport.retry import CircuitBreakerRegistry, CircuitBreakerState
+
+
+class TestRequestMetrics(unittest.TestCase):
+    """Tests for the RequestMetrics class."""
+
+    def test_requests_are_grouped_by_template(self):
+        """Test that requests to the same route are aggregated with their percentiles."""
+        metrics = RequestMetrics()
+        for i in range(1, 101):
+            metrics.record_response("get", f"blueprints/bp-{i}", 200, i / 1000, response_bytes=1000)
+        metrics.record_response("GET", "blueprints/x", 404, 0.001)
+        metrics.record_error("GET", "blueprints/y", 0.5)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(list(snapshot), ["GET blueprints/{id}"])
+        endpoint = snapshot["GET blueprints/{id}"]
+        self.assertEqual(endpoint["requests"], 102)
+        self.assertEqual(endpoint["status_codes"], {"200": 100, "404": 1, "error": 1})
+        self.assertAlmostEqual(endpoint["latency"]["p50"], 0.05, delta=0.0025)
+        self.assertAlmostEqual(endpoint["latency"]["p90"], 0.09, delta=0.0045)
+        self.assertAlmostEqual(endpoint["response_bytes"]["p99"], 1000, delta=50)
+
+    def test_endpoints_are_bounded(self):
+        """Test that endpoints beyond max_endpoints share the "{other}" template."""
+        metrics = RequestMetrics(max_endpoints=2)
+        for endpoint in ("blueprints", "entities/aggregate", "audit-log", "teams"):
+            metrics.record_response("GET", endpoint, 200, 0.01)
+        self.assertEqual(metrics.snapshot()["GET {other}"]["requests"], 2)
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_prometheus_export(self):
+        """Test the Prometheus text format."""
+        metrics = RequestMetrics()
+        metrics.record_response("POST", "blueprints/a/entities/search", 200, 0.25, request_bytes=64)
+        metrics.record_event("POST", "blueprints/a/entities/search", "retry")
+        text = metrics.to_prometheus()
+
+        labels = 'method="POST",endpoint="blueprints/{id}/entities/search"'
+        self.assertIn("# TYPE pyport_requests_total counter", text)
+        self.assertIn(f'pyport_requests_total{{{labels},status="200"}} 1', text)
+        self.assertIn(f'pyport_request_duration_seconds{{{labels},quantile="0.99"}}', text)
+        self.assertIn(f"pyport_request_size_bytes_sum{{{labels}}} 64.0", text)
+        self.assertIn(f"pyport_request_retries_total{{{labels}}} 1", text)
+        self.assertTrue(text.endswith("\n"))
+
+
+class TestClientMetrics(unittest.TestCase):
+    """Tests for metrics recorded by PortClient requests."""
+
+    def test_responses_retries_and_trips_are_recorded(self):
+        """Test that sizes, status codes, retries and circuit breaker events are recorded."""
+        def handler(request):
+            if request.path.endswith("/entities/aggregate"):
+                return 503, {"ok": False, "error": "unavailable"}
+            return 200, {"ok": True, "blueprint": {"identifier": "service"}}
+
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                            transport=InProcessTransport(handler), retry_delay=0.001, max_delay=0.001)
+        client.retry_config.circuit_breakers = CircuitBreakerRegistry(
+            lambda: CircuitBreakerState(failure_threshold=1))
+        client.blueprints.get_blueprint("service")
+        with self.assertRaises(PortServerError):
+            client.make_request("PUT", "entities/aggregate", json={"a": 1}, retries=2)
+        with self.assertRaises(PortApiError):
+            client.make_request("PUT", "entities/aggregate", json={"a": 1})
+
+        metrics = client.metrics()
+        read = metrics["GET blueprints/{id}"]
+        self.assertEqual(read["status_codes"], {"200": 1})
+        self.assertGreater(read["response_bytes"]["p50"], 0)
+        write = metrics["PUT entities/aggregate"]
+        self.assertEqual(write["status_codes"], {"503": 3})
+        self.assertEqual(write["retries"], 2)
+        self.assertEqual(write["circuit_trips"], 1)
+        self.assertEqual(write["circuit_rejections"], 1)
+        self.assertEqual(read["request_bytes"]["p50"], 0.0)
+        self.assertAlmostEqual(write["request_bytes"]["p50"], 7.5, delta=1)
+        self.assertIn("pyport_circuit_breaker_trips_total", client.request_metrics.to_prometheus())
+
+    def test_shared_registry(self):
+        """Test that clients can record into one registry."""
+        registry = RequestMetrics()
+        transport = InProcessTransport(lambda request: (200, {"ok": True, "blueprints": []}))
+        for _ in range(2):
+            client = PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                                transport=transport, request_metrics=registry)
+            client.blueprints.get_blueprints()
+        self.assertEqual(registry.snapshot()["GET blueprints"]["requests"], 2)
+
+
+@unittest.skipIf(not HTTPX_AVAILABLE, "httpx not installed")
+class TestAsyncClientMetrics(unittest.IsolatedAsyncioTestCase):
+    """Tests for metrics recorded by AsyncPortClient requests."""
+
+    async def test_requests_are_recorded(self):
+        """Test that the async client records its requests."""
+        def handler(request):
+            if request.url.path.endswith("auth/access_token"):
+                return httpx.Response(200, json={"accessToken": "token-1"})
+            return httpx.Response(200, json={"ok": True, "blueprint": {"identifier": "service"}})
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncPortClient(client_id="id", client_secret="secret", http_client=http_client) as client:
+            await client.blueprints.get_blueprint("service")
+
+        self.assertEqual(client.metrics()["GET blueprints/{id}"]["status_codes"], {"200": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for walking page/per_page list endpoints with BaseAPIService.
+"""
+import threading
+import unittest
+
+from pyport.client.client import PortClient
+from pyport.client.transport import InProcessTransport
+from pyport.exceptions import PortServerError
+
+
+class TestPagination(unittest.TestCase):
+    """Tests for BaseAPIService.iter_all and fetch_all."""
+
+    def make_client(self, total=25, report_total=True, fail_page=None):
+        """Create a client answering audit log pages over `total` entries."""
+        self.pages = []
+        self.lock = threading.Lock()
+
+        def handler(request):
+            page, per_page = int(request.params["page"]), int(request.params["per_page"])
+            with self.lock:
+                self.pages.append(page)
+            if page == fail_page:
+                return 500, {"ok": False, "error": "internal_error"}
+            start = (page - 1) * per_page
+            logs = [{"identifier": f"log-{i}"} for i in range(start, min(start + per_page, total))]
+            response = {"ok": True, "audits": logs}
+            if report_total:
+                response["total"] = total
+            return 200, response
+
+        return PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                          transport=InProcessTransport(handler), max_retries=0)
+
+    def test_iter_all_is_lazy_and_stops_at_the_end(self):
+        """Test that pages are requested as they are consumed and no page past the total is requested."""
+        client = self.make_client(total=20)
+        logs = client.audit.iter_all(per_page=10)
+        self.assertEqual(next(logs)["identifier"], "log-0")
+        self.assertEqual(self.pages, [1])
+        self.assertEqual(len(list(logs)), 19)
+        self.assertEqual(self.pages, [1, 2])
+
+    def test_iter_all_without_total_stops_on_a_short_page(self):
+        """Test that an endpoint without a total is walked until a page is not full."""
+        client = self.make_client(total=20, report_total=False)
+        self.assertEqual(len(list(client.audit.iter_all(per_page=10))), 20)
+        self.assertEqual(self.pages, [1, 2, 3])
+
+    def test_fetch_all_fetches_known_pages_concurrently(self):
+        """Test that all pages are fetched once the total is known, with items in page order."""
+        client = self.make_client(total=95)
+        logs = client.audit.fetch_all(per_page=10, concurrency=4, params={"identifier": "x"})
+        self.assertEqual([log["identifier"] for log in logs], [f"log-{i}" for i in range(95)])
+        self.assertEqual(sorted(self.pages), list(range(1, 11)))
+
+    def test_fetch_all_without_total(self):
+        """Test that fetch_all falls back to walking the pages in order."""
+        client = self.make_client(total=25, report_total=False)
+        self.assertEqual(len(client.audit.fetch_all(per_page=10)), 25)
+        self.assertEqual(self.pages, [1, 2, 3])
+
+    def test_errors_are_raised(self):
+        """Test that a failing page fails the whole fetch."""
+        client = self.make_client(total=50, fail_page=3)
+        with self.assertRaises(PortServerError):
+            client.audit.fetch_all(per_page=10)
+        with self.assertRaises(PortServerError):
+            list(client.audit.iter_all(per_page=10))
+
+    def test_per_page_is_validated(self):
+        """Test that an invalid page size is rejected before any request."""
+        client = self.make_client()
+        with self.assertRaises(ValueError):
+            client.audit.iter_all(per_page=0)
+        self.assertEqual(self.pages, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Tests for per-request timing breakdowns.
+"""
+import threading
+import time
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+
+from pyport.client.client import PortClient
+from pyport.client.transport import InProcessTransport, build_response
+from pyport.exceptions import PortResourceNotFoundError
+from pyport.profiling import PHASES, RequestProfiler, RequestTimings
+from pyport.rate_limit import RateLimiter
+
+
+class TestRequestTimings(unittest.TestCase):
+    """Tests for the RequestTimings class."""
+
+    def test_other_is_the_unattributed_time(self):
+        """Test that `other` is the part of the total not covered by a phase."""
+        timings = RequestTimings("GET", "blueprints", queue=0.1, ttfb=0.5, download=0.2, log=0.05, total=1.0)
+        self.assertAlmostEqual(timings.other, 0.15)
+        self.assertEqual(list(timings.as_dict()),
+                         ["method", "endpoint", "status_code", *PHASES, "other", "total"])
+
+
+class TestRequestProfiler(unittest.TestCase):
+    """Tests for the RequestProfiler class."""
+
+    def test_sampling(self):
+        """Test that the sample rate bounds the profiled requests."""
+        self.assertIsNone(RequestProfiler(sample_rate=0.0).start("GET", "blueprints"))
+        self.assertIsNotNone(RequestProfiler().start("GET", "blueprints"))
+        profiler = RequestProfiler(sample_rate=0.25)
+        sampled = sum(profiler.start("GET", "blueprints") is not None for _ in range(4000))
+        self.assertTrue(800 < sampled < 1200, sampled)
+        with self.assertRaises(ValueError):
+            RequestProfiler(sample_rate=1.5)
+
+    def test_callback_errors_are_ignored(self):
+        """Test that a failing callback does not break the request."""
+        def callback(timings):
+            raise RuntimeError("boom")
+
+        profiler = RequestProfiler(callback=callback)
+        with self.assertLogs("pyport", level="WARNING"):
+            profiler.finish(profiler.start("GET", "blueprints"))
+        self.assertEqual(profiler.get_stats()["samples"], 1)
+
+
+class TestClientProfiling(unittest.TestCase):
+    """Tests for timings recorded by PortClient requests."""
+
+    def make_client(self, handler, **kwargs):
+        """Create a profiled client answering requests with an in-process handler."""
+        self.reported = []
+        self.profiler = RequestProfiler(callback=self.reported.append)
+        return PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                          transport=InProcessTransport(handler), request_profiler=self.profiler, **kwargs)
+
+    def test_phases_are_recorded(self):
+        """Test that queue, TTFB, download, parse and log times are attributed."""
+        def handler(request):
+            response = build_response(200, b'{"ok": true, "blueprints": []}', {}, request.url)
+            response.elapsed = timedelta(seconds=0.01)
+            time.sleep(0.03)
+            return response
+
+        limiter = RateLimiter()
+        client = self.make_client(handler, rate_limiter=limiter)
+        with patch.object(limiter, "acquire", side_effect=lambda *args: time.sleep(0.02)):
+            response = client.make_request("GET", "blueprints")
+
+        timings = response.timings
+        self.assertEqual(self.reported, [timings])
+        self.assertEqual(timings.status_code, 200)
+        self.assertGreaterEqual(timings.queue, 0.02)
+        self.assertAlmostEqual(timings.ttfb, 0.01)
+        self.assertGreaterEqual(timings.download, 0.015)
+        self.assertIsNotNone(timings.parse)
+        self.assertIsNone(timings.connect)
+        self.assertGreater(timings.log, 0)
+        self.assertGreaterEqual(timings.total, timings.queue + timings.ttfb + timings.download)
+        self.assertEqual(response.json(), {"ok": True, "blueprints": []})
+        self.assertEqual(self.profiler.get_stats()["queue"]["count"], 1)
+
+    def test_errors_are_profiled(self):
+        """Test that failed requests report their timings too."""
+        client = self.make_client(lambda request: (404, {"ok": False, "error": "not_found"}))
+        with self.assertRaises(PortResourceNotFoundError):
+            client.make_request("GET", "blueprints/missing", retries=0)
+        self.assertEqual(self.reported[0].status_code, 404)
+
+    def test_unsampled_requests_have_no_timings(self):
+        """Test that requests outside the sample carry no timings."""
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                            transport=InProcessTransport(lambda request: (200, {"ok": True})),
+                            request_profiler=RequestProfiler(sample_rate=0.0))
+        self.assertFalse(hasattr(client.make_request("GET", "blueprints"), "timings"))
+
+    def test_concurrent_requests(self):
+        """Test that each concurrent request gets its own timings."""
+        client = self.make_client(lambda request: (200, {"ok": True, "path": request.path}))
+        threads = [threading.Thread(target=client.make_request, args=("GET", f"blueprints/{i}"))
+                   for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(t.endpoint for t in self.reported), [f"blueprints/{i}" for i in range(8)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Tests for the client-side rate limiter.
+"""
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pyport.client.client import PortClient
+from pyport.client.endpoints import READ, SEARCH, WRITE, body_digest, endpoint_class, is_safe_read
+from pyport.rate_limit import RateLimiter, TokenBucket
+
+
+class TestEndpointClass(unittest.TestCase):
+    """Tests for endpoint classification."""
+
+    def test_classification(self):
+        """Test that requests are classified by method and route."""
+        self.assertEqual(endpoint_class("GET", "blueprints/service/entities"), READ)
+        self.assertEqual(endpoint_class("POST", "blueprints/service/entities"), WRITE)
+        self.assertEqual(endpoint_class("DELETE", "blueprints/service"), WRITE)
+        self.assertEqual(endpoint_class("POST", "blueprints/service/entities/search"), SEARCH)
+        self.assertEqual(endpoint_class("POST", "entities/aggregate"), SEARCH)
+        self.assertEqual(endpoint_class("GET", "search?q=x"), SEARCH)
+
+
+class TestSafeReads(unittest.TestCase):
+    """Tests for the read-only POST route table."""
+
+    def test_safe_read_routes(self):
+        """Test that only the search and aggregation POST routes are safe reads."""
+        self.assertTrue(is_safe_read("post", "entities/search"))
+        self.assertTrue(is_safe_read("POST", "entities/properties-history"))
+        self.assertTrue(is_safe_read("GET", "blueprints"))
+        self.assertFalse(is_safe_read("PUT", "entities/search"))
+        self.assertFalse(is_safe_read("POST", "actions/deploy/runs"))
+        self.assertFalse(is_safe_read("POST", None))
+
+    def test_body_digest_is_canonical(self):
+        """Test that equal JSON bodies hash the same whatever their key order."""
+        self.assertEqual(body_digest({"a": 1, "b": {"c": 2, "d": 3}}), body_digest({"b": {"d": 3, "c": 2}, "a": 1}))
+        self.assertNotEqual(body_digest({"a": 1}), body_digest({"a": 2}))
+        self.assertIsNone(body_digest())
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for the TokenBucket class."""
+
+    def test_burst_is_free_then_paced(self):
+        """Test that the burst is served immediately and later callers wait their turn."""
+        with patch("pyport.rate_limit.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate=10, capacity=2)
+            self.assertEqual(bucket.reserve(), 0.0)
+            self.assertEqual(bucket.reserve(), 0.0)
+            self.assertAlmostEqual(bucket.reserve(), 0.1)
+            self.assertAlmostEqual(bucket.reserve(), 0.2)
+
+    def test_tighten_and_loosen(self):
+        """Test that the rate drops multiplicatively and recovers up to the configured rate."""
+        bucket = TokenBucket(rate=10, min_rate=2)
+        bucket.tighten(0.5)
+        self.assertEqual(bucket.rate, 5)
+        bucket.tighten(0.1)
+        self.assertEqual(bucket.rate, 2)
+        for _ in range(20):
+            bucket.loosen(1)
+        self.assertEqual(bucket.rate, 10)
+
+    def test_invalid_rate_is_rejected(self):
+        """Test that the rate must be positive."""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for the RateLimiter class."""
+
+    def test_429_tightens_only_its_class(self):
+        """Test that a 429 slows down and pauses the bucket it belongs to."""
+        limiter = RateLimiter(read_rate=20, write_rate=10, search_rate=10)
+        limiter.record_response("POST", "blueprints/service/entities", 429, {"Retry-After": "2"})
+
+        stats = limiter.get_stats()
+        self.assertEqual(stats[WRITE]["rate"], 5)
+        self.assertEqual(stats[WRITE]["throttled"], 1)
+        self.assertEqual(stats[READ]["rate"], 20)
+        self.assertGreaterEqual(limiter.buckets[WRITE].reserve(), 2.0)
+
+    def test_rate_limit_headers_cap_the_rate(self):
+        """Test that X-RateLimit headers spread the remaining budget over the window."""
+        limiter = RateLimiter(read_rate=20)
+        limiter.record_response("GET", "blueprints", 200,
+                                {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "5"})
+        self.assertAlmostEqual(limiter.buckets[READ].rate, 2.0)
+
+    def test_successes_do_not_loosen_past_the_advertised_rate(self):
+        """Test that successful responses only recover the rate up to what the headers allow."""
+        limiter = RateLimiter(read_rate=20)
+        limiter.record_response("GET", "blueprints", 429, {"Retry-After": "0"})
+        for _ in range(50):
+            limiter.record_response("GET", "blueprints", 200,
+                                    {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "5"})
+        self.assertAlmostEqual(limiter.buckets[READ].rate, 2.0)
+
+        # A larger budget lets the rate recover again, one step at a time
+        limiter.record_response("GET", "blueprints", 200,
+                                {"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "5"})
+        self.assertAlmostEqual(limiter.buckets[READ].rate, 2.0 + 20 * limiter.recovery_step)
+
+    def test_reset_as_unix_time(self):
+        """Test that X-RateLimit-Reset is accepted as seconds left or as a Unix timestamp."""
+        for reset in ("5", str(time.time() + 5), str(int((time.time() + 5) * 1000))):
+            limiter = RateLimiter(read_rate=20)
+            limiter.record_response("GET", "blueprints", 200,
+                                    {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": reset})
+            self.assertAlmostEqual(limiter.buckets[READ].rate, 2.0, delta=0.1)
+
+        # A window that has already reset leaves the rate alone
+        limiter = RateLimiter(read_rate=20)
+        limiter.record_response("GET", "blueprints", 200,
+                                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() - 5)})
+        self.assertEqual(limiter.buckets[READ].rate, 20)
+
+    def test_malformed_headers_are_ignored(self):
+        """Test that non-numeric headers do not break response handling."""
+        limiter = RateLimiter(read_rate=20)
+        limiter.record_response("GET", "blueprints", 429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        limiter.record_response("GET", "blueprints", 200, {"X-RateLimit-Remaining": "n/a"})
+        self.assertEqual(limiter.buckets[READ].rate, 10 + 20 * limiter.recovery_step)
+
+
+class TestPortClientRateLimiting(unittest.TestCase):
+    """Tests for rate limiter wiring in PortClient."""
+
+    def test_requests_go_through_the_limiter(self):
+        """Test that every request acquires a token and reports its response."""
+        limiter = MagicMock(spec=RateLimiter)
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True, rate_limiter=limiter)
+        self.assertIs(client.rate_limiter, limiter)
+
+        response = MagicMock(status_code=200, headers={})
+        with patch.object(client._session, "request", return_value=response):
+            client.make_request("GET", "blueprints")
+
+        limiter.acquire.assert_called_once_with("GET", "blueprints")
+        limiter.record_response.assert_called_once_with("GET", "blueprints", 200, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
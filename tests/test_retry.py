@@ -89,6 +89,14 @@ class TestRetryConfig(unittest.TestCase):
         error = PortServerError("Server error", status_code=500)
         self.assertFalse(config.should_retry(error, "POST"))
 
+    def test_should_retry_read_only_post_routes(self):
+        """Test that searches and aggregations sent as POST are retried like reads."""
+        config = RetryConfig()
+        error = PortServerError("Server error", status_code=500)
+        self.assertTrue(config.should_retry(error, "POST", endpoint="blueprints/service/entities/search"))
+        self.assertTrue(config.should_retry(error, "POST", endpoint="entities/aggregate-over-time"))
+        self.assertFalse(config.should_retry(error, "POST", endpoint="blueprints/service/entities"))
+
     def test_should_retry_with_custom_retry_on(self):
         """Test should_retry with a custom retry_on condition."""
         # Create a custom retry condition function
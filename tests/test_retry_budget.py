@@ -0,0 +1,130 @@
+"""
+Tests for client-wide retry budgets.
+"""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pyport.client.client import PortClient
+from pyport.client.transport import InProcessTransport
+from pyport.deadline import deadline
+from pyport.exceptions import PortDeadlineExceededError, PortServerError
+from pyport.retry import CircuitBreakerRegistry, CircuitBreakerState, RetryBudget, RetryConfig
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def server_error():
+    """Create a retryable error."""
+    return PortServerError("unavailable", status_code=503)
+
+
+class TestRetryBudget(unittest.TestCase):
+    """Tests for the RetryBudget class."""
+
+    def test_minimum_rate_without_successes(self):
+        """Test that a client without successes gets min_retries_per_second * window_seconds retries."""
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0.5, window_seconds=10, clock=FakeClock())
+        self.assertEqual(sum(budget.try_spend() for _ in range(20)), 5)
+        self.assertEqual(budget.exhausted, 15)
+
+    def test_successes_earn_retries(self):
+        """Test that each success earns `ratio` retries."""
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, window_seconds=10, clock=FakeClock())
+        for _ in range(10):
+            budget.record_success()
+        self.assertEqual(sum(budget.try_spend() for _ in range(10)), 5)
+        status = budget.get_status()
+        self.assertEqual((status["recent_successes"], status["recent_retries"]), (10, 5))
+        self.assertEqual(status["available"], 0.0)
+
+    def test_budget_recovers_as_the_window_moves(self):
+        """Test that retries and successes leave the budget after window_seconds."""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0, min_retries_per_second=0.1, window_seconds=10, clock=clock)
+        self.assertTrue(budget.try_spend())
+        self.assertFalse(budget.try_spend())
+        clock.now += 11
+        self.assertTrue(budget.try_spend())
+
+    def test_should_retry_spends_only_on_retryable_errors(self):
+        """Test the integration with RetryConfig.should_retry."""
+        budget = RetryBudget(ratio=0, min_retries_per_second=0.1, window_seconds=10, clock=FakeClock())
+        config = RetryConfig(retry_budget=budget)
+        self.assertFalse(config.should_retry(PortServerError("bad", status_code=501), "GET"))
+        self.assertFalse(config.should_retry(server_error(), "POST"))
+        self.assertTrue(config.should_retry(server_error(), "GET"))
+        self.assertFalse(config.should_retry(server_error(), "GET"))
+        self.assertEqual(config.stats.budget_exhausted, 1)
+        self.assertEqual(config.get_stats()["retry_budget"]["exhausted"], 1)
+        self.assertIsNone(RetryConfig().get_stats()["retry_budget"])
+
+    def test_retries_skipped_by_the_deadline_spend_nothing(self):
+        """Test that the deadline is checked before spending, and spent deadlines are never retried."""
+        budget = RetryBudget(ratio=0, min_retries_per_second=0.5, window_seconds=10, clock=FakeClock())
+        config = RetryConfig(retry_budget=budget)
+        with deadline(1.0):
+            for _ in range(6):
+                self.assertFalse(config.should_retry(server_error(), "GET", delay=5.0))
+        self.assertFalse(config.should_retry(PortDeadlineExceededError("too late"), "GET"))
+
+        status = budget.get_status()
+        self.assertEqual((status["recent_retries"], status["exhausted"]), (0, 0))
+
+
+class TestClientRetryBudget(unittest.TestCase):
+    """Tests for retry budgets in PortClient requests."""
+
+    def test_budget_caps_retries_across_threads(self):
+        """Test that many failing callers share one budget instead of each retrying max_retries times."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.path)
+            return 503, {"ok": False, "error": "unavailable"}
+
+        budget = RetryBudget(ratio=0.2, min_retries_per_second=0.5, window_seconds=10)
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                            transport=InProcessTransport(handler), retry_delay=0.001, max_delay=0.001,
+                            retry_budget=budget)
+        client.retry_config.circuit_breakers = CircuitBreakerRegistry(
+            lambda: CircuitBreakerState(failure_threshold=1000, adaptive=False))
+
+        def call(_):
+            with self.assertRaises(PortServerError):
+                client.make_request("GET", "blueprints", retries=3)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(call, range(16)))
+
+        self.assertEqual(len(calls), 16 + 5)
+        self.assertEqual(budget.get_status()["recent_retries"], 5)
+        self.assertGreater(client.retry_config.get_stats()["retry_budget"]["exhausted"], 0)
+        self.assertIs(client.retry_config.retry_budget, budget)
+
+    def test_deadline_is_checked_before_the_budget(self):
+        """Test that requests whose retries cannot fit the deadline leave the budget untouched."""
+        budget = RetryBudget(ratio=0, min_retries_per_second=0.5, window_seconds=10)
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True, retry_jitter=False,
+                            transport=InProcessTransport(lambda request: (503, {"ok": False})),
+                            retry_delay=5, retry_budget=budget)
+        client.retry_config.circuit_breakers = CircuitBreakerRegistry(
+            lambda: CircuitBreakerState(failure_threshold=1000, adaptive=False))
+        with deadline(1.0):
+            for _ in range(6):
+                with self.assertRaises(PortServerError):
+                    client.make_request("GET", "blueprints")
+
+        status = budget.get_status()
+        self.assertEqual((status["recent_retries"], status["exhausted"]), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
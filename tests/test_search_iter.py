@@ -0,0 +1,109 @@
+"""
+Tests for iterating over blueprint entity searches.
+"""
+import threading
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+
+from pyport.client.client import PortClient
+from pyport.client.transport import InProcessTransport
+from pyport.exceptions import PortServerError
+
+QUERY = {"combinator": "and", "rules": []}
+
+
+class TestIterSearchBlueprintEntities(unittest.TestCase):
+    """Tests for Entities.iter_search_blueprint_entities."""
+
+    def make_client(self, total=25, fail_from=None):
+        """Create a client answering searches over `total` entities, page by page."""
+        self.bodies = []
+        self.requested = threading.Condition()
+
+        def handler(request):
+            body = request.json()
+            start = int(body.get("from") or 0)
+            with self.requested:
+                self.bodies.append(body)
+                self.requested.notify_all()
+            if fail_from is not None and start >= fail_from:
+                return 500, {"ok": False, "error": "internal_error"}
+            page = [{"identifier": f"svc-{i}"} for i in range(start, min(start + body["limit"], total))]
+            response = {"ok": True, "entities": page}
+            if start + body["limit"] < total:
+                response["next"] = str(start + body["limit"])
+            return 200, response
+
+        return PortClient(client_id="id", client_secret="secret", skip_auth=True,
+                          transport=InProcessTransport(handler), max_retries=0)
+
+    def test_follows_the_cursor(self):
+        """Test that every page is fetched and entities are yielded in order."""
+        client = self.make_client()
+        entities = list(client.entities.iter_search_blueprint_entities("service", QUERY, page_size=10,
+                                                                       include=["$identifier"]))
+
+        self.assertEqual([entity["identifier"] for entity in entities], [f"svc-{i}" for i in range(25)])
+        self.assertEqual([body.get("from") for body in self.bodies], [None, "10", "20"])
+        self.assertEqual(self.bodies[0], {"query": QUERY, "limit": 10, "include": ["$identifier"]})
+
+    def test_as_chunks(self):
+        """Test that pages are yielded as lists and empty pages are skipped."""
+        client = self.make_client(total=20)
+        chunks = list(client.entities.iter_search_blueprint_entities("service", QUERY, page_size=10,
+                                                                     as_chunks=True))
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10])
+
+    def test_next_page_is_fetched_while_the_current_one_is_consumed(self):
+        """Test that the second page is requested before the first one has been processed."""
+        client = self.make_client()
+        pages = client.entities.iter_search_blueprint_entities("service", QUERY, page_size=10, as_chunks=True)
+        first = next(pages)
+        with self.requested:
+            self.assertTrue(self.requested.wait_for(lambda: len(self.bodies) == 2, timeout=5))
+        self.assertEqual(len(first), 10)
+        self.assertEqual(len(list(pages)), 2)
+
+    def test_without_prefetch(self):
+        """Test that prefetch=False requests a page only when the previous one is consumed."""
+        client = self.make_client()
+        pages = client.entities.iter_search_blueprint_entities("service", QUERY, page_size=10, as_chunks=True,
+                                                               prefetch=False)
+        next(pages)
+        self.assertEqual(len(self.bodies), 1)
+        self.assertEqual(len(list(pages)), 2)
+
+    def test_prefetch_is_cancelled_on_early_break(self):
+        """Test that leaving the loop early cancels the pending prefetch and requests no further page."""
+        client = self.make_client()
+        cancel = Future.cancel
+        with patch.object(Future, "cancel", autospec=True, side_effect=cancel) as mock_cancel:
+            pages = client.entities.iter_search_blueprint_entities("service", QUERY, page_size=10, as_chunks=True)
+            for _ in pages:
+                break
+            pages.close()
+
+        mock_cancel.assert_called_once()
+        self.assertLessEqual(len(self.bodies), 2)
+
+    def test_errors_are_raised_to_the_caller(self):
+        """Test that a failing page is raised when the iteration reaches it."""
+        client = self.make_client(fail_from=10)
+        entities = client.entities.iter_search_blueprint_entities("service", QUERY, page_size=10)
+        received = []
+        with self.assertRaises(PortServerError):
+            for entity in entities:
+                received.append(entity)
+        self.assertEqual(len(received), 10)
+
+    def test_page_size_is_validated(self):
+        """Test that an invalid page size is rejected before any request."""
+        client = self.make_client()
+        with self.assertRaises(ValueError):
+            client.entities.iter_search_blueprint_entities("service", QUERY, page_size=1001)
+        self.assertEqual(self.bodies, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
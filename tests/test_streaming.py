@@ -0,0 +1,127 @@
+"""
+Tests for incremental decoding of large JSON list responses.
+"""
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from pyport.client.client import PortClient
+from pyport.exceptions import PortApiError
+from pyport.streaming import chunked, iter_json_array
+
+DOCUMENT = {
+    "ok": True,
+    "count": 1234567,
+    "meta": {"nested": [1, 2, {"entities": "decoy"}]},
+    "entities": [
+        {"identifier": f"svc-{i}", "title": "Café ☕ \"quoted\"", "score": i * 1.5, "tags": [None, False]}
+        for i in range(50)
+    ],
+    "trailing": "ignored"
+}
+
+
+def split(data, size):
+    """Split bytes into chunks of the given size."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def make_response(body):
+    """Build a streamed requests.Response over an in-memory body."""
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    return response
+
+
+class TestIterJsonArray(unittest.TestCase):
+    """Tests for the iter_json_array function."""
+
+    def test_items_match_a_full_parse_for_any_chunking(self):
+        """Test that items are decoded correctly wherever the chunks are split."""
+        body = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode("utf-8")
+        for size in (1, 2, 7, 64, 4096, len(body)):
+            with self.subTest(chunk_size=size):
+                self.assertEqual(list(iter_json_array(split(body, size), "entities")), DOCUMENT["entities"])
+
+    def test_numbers_split_across_chunks(self):
+        """Test that a number at the end of a chunk is not cut short."""
+        chunks = [b'{"count": 12', b'34, "entities": [10', b'0, 2', b'00]}']
+        self.assertEqual(list(iter_json_array(chunks, "entities")), [100, 200])
+
+    def test_items_are_decoded_as_data_arrives(self):
+        """Test that the first item is yielded before the rest of the body is read."""
+        body = json.dumps(DOCUMENT).encode("utf-8")
+        chunks = split(body, 256)
+        read = []
+
+        def source():
+            for chunk in chunks:
+                read.append(chunk)
+                yield chunk
+
+        items = iter_json_array(source(), "entities")
+        next(items)
+        self.assertLess(len(read), len(chunks) // 2)
+
+    def test_invalid_documents(self):
+        """Test that missing members, wrong types and truncated bodies are reported."""
+        for body in (b'{"ok": true}', b'{}', b'[1, 2]', b'{"entities": {}}', b'{"entities": [{"a": 1}, {"b"'):
+            with self.subTest(body=body):
+                with self.assertRaises(ValueError):
+                    list(iter_json_array([body], "entities"))
+
+    def test_empty_array(self):
+        """Test that an empty array yields nothing."""
+        self.assertEqual(list(iter_json_array([b'{"entities": [ ]}'], "entities")), [])
+
+    def test_chunked(self):
+        """Test grouping items into fixed-size lists."""
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+        with self.assertRaises(ValueError):
+            list(chunked(range(5), 0))
+
+
+class TestStreamingServices(unittest.TestCase):
+    """Tests for the streaming service methods."""
+
+    def setUp(self):
+        """Create a client that does not authenticate."""
+        self.client = PortClient(client_id="id", client_secret="secret", skip_auth=True)
+        self.body = json.dumps(DOCUMENT).encode("utf-8")
+
+    def test_stream_all_entities(self):
+        """Test that entities are streamed one by one and the response is closed."""
+        response = make_response(self.body)
+        with patch.object(self.client._session, "request", return_value=response) as mock_request:
+            entities = self.client.entities.stream_all_entities("service")
+
+        self.assertTrue(mock_request.call_args.kwargs["stream"])
+        self.assertIs(response._content, False)
+        with patch.object(response, "close") as mock_close:
+            self.assertEqual(list(entities), DOCUMENT["entities"])
+        mock_close.assert_called_once()
+
+    def test_stream_blueprint_entities_in_chunks(self):
+        """Test that chunk_size groups the streamed entities."""
+        response = make_response(self.body)
+        with patch.object(self.client._session, "request", return_value=response) as mock_request:
+            chunks = list(self.client.blueprints.stream_blueprint_entities("service", compact=True, chunk_size=20))
+
+        self.assertEqual(mock_request.call_args.kwargs["params"], {"compact": True})
+        self.assertEqual([len(chunk) for chunk in chunks], [20, 20, 10])
+        self.assertEqual([entity for chunk in chunks for entity in chunk], DOCUMENT["entities"])
+
+    def test_invalid_body_raises_port_api_error(self):
+        """Test that a malformed streamed body is reported as a PortApiError."""
+        response = make_response(b'{"entities": [{"identifier": ')
+        with patch.object(self.client._session, "request", return_value=response):
+            with self.assertRaises(PortApiError):
+                list(self.client.entities.stream_all_entities("service"))
+
+
+if __name__ == '__main__':
+    unittest.main()
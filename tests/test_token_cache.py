@@ -0,0 +1,119 @@
+"""
+Tests for the token caches shared between clients and processes.
+"""
+import multiprocessing
+import os
+import stat
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from pyport.client.auth import AuthManager
+from pyport.client.token_cache import FileTokenCache, MemoryTokenCache, token_cache_key
+
+API_URL = "https://api.getport.io/v1"
+
+
+def _hold_lock_and_write(path, started, token):
+    """Child process: take the cache lock, signal, then write a token after a delay."""
+    cache = FileTokenCache(path)
+    with cache.lock("key"):
+        started.set()
+        time.sleep(0.3)
+        cache.set("key", token, time.time() + 3600)
+
+
+class TestFileTokenCache(unittest.TestCase):
+    """Tests for the FileTokenCache class."""
+
+    def setUp(self):
+        """Create a temporary cache directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "nested", "tokens.json")
+
+    def tearDown(self):
+        """Remove the temporary cache directory."""
+        self.directory.cleanup()
+
+    def test_round_trip_and_permissions(self):
+        """Test that tokens are stored per key in a file only the owner can read."""
+        cache = FileTokenCache(self.path)
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", "token-a", 100.0)
+        cache.set("b", "token-b", 200.0)
+
+        self.assertEqual(FileTokenCache(self.path).get("a"), ("token-a", 100.0))
+        self.assertEqual(cache.get("b"), ("token-b", 200.0))
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_corrupt_file_is_treated_as_empty(self):
+        """Test that an unreadable cache file does not break authentication."""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as handle:
+            handle.write("{not json")
+        self.assertIsNone(FileTokenCache(self.path).get("a"))
+
+    def test_lock_is_exclusive_across_processes(self):
+        """Test that a process waiting for the lock sees the token written by the holder."""
+        context = multiprocessing.get_context("fork" if hasattr(os, "fork") else "spawn")
+        started = context.Event()
+        child = context.Process(target=_hold_lock_and_write, args=(self.path, started, "from-child"))
+        child.start()
+        try:
+            self.assertTrue(started.wait(5))
+            cache = FileTokenCache(self.path)
+            with cache.lock("key"):
+                self.assertEqual(cache.get("key")[0], "from-child")
+        finally:
+            child.join(5)
+
+
+class TestAuthManagerTokenCache(unittest.TestCase):
+    """Tests for token cache use in AuthManager."""
+
+    def make_manager(self, cache):
+        """Create an AuthManager using the given cache."""
+        return AuthManager("id", "secret", API_URL, auto_refresh=False, token_cache=cache)
+
+    @patch('pyport.client.auth.AuthManager._get_access_token', return_value="fetched")
+    def test_valid_cached_token_is_reused(self, mock_get_token):
+        """Test that clients sharing a cache authenticate once."""
+        cache = MemoryTokenCache()
+        first = self.make_manager(cache)
+        second = self.make_manager(cache)
+
+        self.assertEqual(first.token, "fetched")
+        self.assertEqual(second.token, "fetched")
+        mock_get_token.assert_called_once()
+
+    @patch('pyport.client.auth.AuthManager._get_access_token', return_value="fetched")
+    def test_expiring_or_rejected_tokens_are_not_reused(self, mock_get_token):
+        """Test that tokens close to expiry, or rejected by the API, are refreshed."""
+        cache = MemoryTokenCache()
+        key = token_cache_key("id", API_URL)
+
+        cache.set(key, "expiring", time.time() + 30)
+        self.assertEqual(self.make_manager(cache).token, "fetched")
+
+        cache.set(key, "rejected", time.time() + 3600)
+        manager = self.make_manager(cache)
+        self.assertEqual(manager.token, "rejected")
+        self.assertEqual(manager.refresh_if_current("rejected"), "fetched")
+        self.assertEqual(cache.get(key)[0], "fetched")
+        self.assertEqual(mock_get_token.call_count, 2)
+
+    @patch('pyport.client.auth.AuthManager._get_access_token', return_value="fetched")
+    def test_unusable_cache_file_falls_back_to_fetching(self, mock_get_token):
+        """Test that a cache whose lock file cannot be created does not prevent authentication."""
+        cache = FileTokenCache("/proc/nonexistent/tokens.json")
+        with self.assertLogs("pyport", level="WARNING") as logs:
+            manager = self.make_manager(cache)
+
+        self.assertEqual(manager.token, "fetched")
+        self.assertTrue(any("Could not lock the token cache" in line for line in logs.output))
+        mock_get_token.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Tests for JWT-expiry-aware token refresh and 401 replay.
+"""
+import base64
+import json
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pyport.client.auth import AuthManager, token_expiry
+from pyport.client.client import PortClient
+from pyport.exceptions import PortAuthenticationError
+
+
+def make_jwt(exp):
+    """Build an unsigned JWT with the given expiry."""
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+    return f"{encode({'alg': 'none'})}.{encode({'exp': exp})}.signature"
+
+
+class TestTokenExpiry(unittest.TestCase):
+    """Tests for reading the JWT expiry."""
+
+    def test_token_expiry(self):
+        """Test that exp is read from JWTs and missing for anything else."""
+        self.assertEqual(token_expiry(make_jwt(1700000000)), 1700000000.0)
+        self.assertIsNone(token_expiry("opaque-token"))
+        self.assertIsNone(token_expiry(None))
+
+    def test_refresh_is_scheduled_before_expiry(self):
+        """Test that the refresh delay is the time to expiry minus the margin."""
+        manager = AuthManager("id", "secret", "https://api.getport.io/v1", skip_auth=True,
+                              refresh_interval=900, refresh_margin=60)
+        manager.token = make_jwt(time.time() + 3600)
+        self.assertAlmostEqual(manager._next_refresh_delay(), 3540, delta=5)
+
+        manager.token = make_jwt(time.time() - 10)
+        self.assertEqual(manager._next_refresh_delay(), 1.0)
+
+        manager.token = "opaque-token"
+        self.assertEqual(manager._next_refresh_delay(), 900)
+
+    def test_failed_refreshes_back_off(self):
+        """Test that failed refreshes are retried with growing delays capped at the token expiry."""
+        manager = AuthManager("id", "secret", "https://api.getport.io/v1", skip_auth=True,
+                              refresh_interval=900, refresh_margin=60)
+        manager.token = make_jwt(time.time() + 3600)
+        delays = []
+        with patch.object(manager, "_obtain_token", side_effect=PortAuthenticationError("denied")):
+            for _ in range(4):
+                manager._refresh_token()
+                delays.append(manager._next_refresh_delay())
+        for delay, expected in zip(delays, (1, 2, 4, 8)):
+            self.assertAlmostEqual(delay, expected, delta=expected * 0.1)
+
+        manager.token = make_jwt(time.time() + 3)
+        self.assertLessEqual(manager._next_refresh_delay(), 3)
+
+        with patch.object(manager, "_obtain_token", return_value=make_jwt(time.time() + 3600)):
+            manager._refresh_token()
+        self.assertAlmostEqual(manager._next_refresh_delay(), 3540, delta=5)
+
+
+class TestRefreshIfCurrent(unittest.TestCase):
+    """Tests for the single-flight refresh after a 401."""
+
+    @patch('pyport.client.auth.AuthManager._get_access_token')
+    def test_concurrent_callers_share_one_refresh(self, mock_get_token):
+        """Test that threads rejected with the same token trigger a single fetch."""
+        mock_get_token.return_value = "old"
+        manager = AuthManager("id", "secret", "https://api.getport.io/v1", auto_refresh=False)
+
+        def slow_fetch():
+            time.sleep(0.05)
+            return "new"
+
+        mock_get_token.side_effect = slow_fetch
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(manager.refresh_if_current("old")))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["new"] * 8)
+        self.assertEqual(mock_get_token.call_count, 2)
+
+
+    @patch('pyport.client.auth.AuthManager._get_access_token')
+    def test_scheduled_refresh_and_401_refresh_share_one_fetch(self, mock_get_token):
+        """Test that a scheduled refresh and a 401 refresh of the same token fetch only once."""
+        mock_get_token.return_value = "old"
+        manager = AuthManager("id", "secret", "https://api.getport.io/v1", auto_refresh=False)
+
+        def slow_fetch():
+            time.sleep(0.05)
+            return "new"
+
+        mock_get_token.side_effect = slow_fetch
+        scheduled = threading.Thread(target=manager._refresh_token, kwargs={"stale_token": "old"})
+        scheduled.start()
+        time.sleep(0.01)
+        self.assertEqual(manager.refresh_if_current("old"), "new")
+        scheduled.join()
+        self.assertEqual(mock_get_token.call_count, 2)
+
+        # A scheduled refresh of a token that was already replaced fetches nothing
+        manager._refresh_token(stale_token="old")
+        self.assertEqual(mock_get_token.call_count, 2)
+        self.assertEqual(manager.token, "new")
+
+
+class TestUnauthorizedReplay(unittest.TestCase):
+    """Tests for replaying requests after a 401."""
+
+    def make_response(self, status_code):
+        """Build a response mock with the given status code."""
+        return MagicMock(status_code=status_code, headers={})
+
+    @patch('pyport.client.auth.AuthManager._get_access_token', side_effect=["old-token", "new-token"])
+    def test_request_is_replayed_with_a_new_token(self, mock_get_token):
+        """Test that a 401 refreshes the token and the request succeeds on replay."""
+        client = PortClient(client_id="id", client_secret="secret", auto_refresh=False)
+        sent_headers = []
+
+        def request(method, url, **kwargs):
+            sent_headers.append(client._session.headers["Authorization"])
+            return self.make_response(401 if len(sent_headers) == 1 else 200)
+
+        with patch.object(client._session, "request", side_effect=request):
+            response = client.make_request("GET", "blueprints")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sent_headers, ["Bearer old-token", "Bearer new-token"])
+        self.assertEqual(client.token, "new-token")
+
+    @patch('pyport.client.auth.AuthManager._get_access_token', side_effect=["old-token", "new-token"])
+    def test_request_is_replayed_only_once(self, mock_get_token):
+        """Test that a second 401 is raised instead of refreshing again."""
+        client = PortClient(client_id="id", client_secret="secret", auto_refresh=False, max_retries=0)
+
+        with patch.object(client._session, "request", return_value=self.make_response(401)) as mock_request:
+            with self.assertRaises(PortAuthenticationError):
+                client.make_request("GET", "blueprints")
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_get_token.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
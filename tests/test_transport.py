@@ -0,0 +1,131 @@
+"""
+Tests for the pluggable HTTP transports.
+
+Note: The HttpxTransport tests require the optional `httpx` dependency and are skipped otherwise.
+"""
+import json
+import unittest
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from pyport.client.client import PortClient
+from pyport.client.transport import HttpxTransport, InProcessTransport, RequestsTransport, build_response
+from pyport.exceptions import PortResourceNotFoundError, PortTimeoutError
+
+BLUEPRINT = {"identifier": "service", "title": "Service"}
+
+
+class TestInProcessTransport(unittest.TestCase):
+    """Tests for the InProcessTransport class."""
+
+    def setUp(self):
+        """Create a client answering requests with an in-process handler."""
+        self.seen = []
+
+        def handler(request):
+            self.seen.append(request)
+            if request.method == "GET" and request.path.endswith("/blueprints/service"):
+                return 200, {"ok": True, "blueprint": BLUEPRINT}, {"ETag": '"v1"'}
+            if request.method == "POST" and request.path.endswith("/blueprints"):
+                return 200, {"ok": True, "blueprint": request.json()}
+            if request.path.endswith("/raw"):
+                return build_response(204, b"", {}, request.url)
+            return 404, {"ok": False, "error": "not_found", "message": "Not found"}
+
+        self.transport = InProcessTransport(handler)
+        self.client = PortClient(client_id="id", client_secret="secret", skip_auth=True, transport=self.transport)
+
+    def test_default_transport_uses_the_session(self):
+        """Test that clients without a transport send requests on their session."""
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True)
+        self.assertIsInstance(client.transport, RequestsTransport)
+        self.assertIs(client.transport.session, client._session)
+
+    def test_requests_reach_the_handler(self):
+        """Test that service calls are answered by the handler with the session's headers."""
+        self.client._update_session_token("token-1")
+        self.assertEqual(self.client.blueprints.get_blueprint("service"), BLUEPRINT)
+
+        request = self.seen[-1]
+        self.assertEqual(request.headers["Authorization"], "Bearer token-1")
+        self.assertEqual(self.client.make_request("GET", "raw").status_code, 204)
+        self.assertEqual(self.transport.requests_handled, 2)
+
+    def test_request_bodies_and_errors(self):
+        """Test that JSON bodies are encoded for the handler and error statuses are raised."""
+        created = self.client.blueprints.create_blueprint({"identifier": "team"})
+        self.assertEqual(created, {"identifier": "team"})
+        self.assertEqual(self.seen[-1].headers["Content-Type"], "application/json")
+
+        with self.assertRaises(PortResourceNotFoundError):
+            self.client.make_request("GET", "blueprints/missing", retries=0)
+
+    def test_streamed_responses(self):
+        """Test that streamed responses can be read incrementally."""
+        transport = InProcessTransport(lambda request: (200, {"entities": [{"identifier": "a"}, {"identifier": "b"}]}))
+        client = PortClient(client_id="id", client_secret="secret", skip_auth=True, transport=transport)
+        entities = list(client.entities.stream_all_entities("service"))
+        self.assertEqual([entity["identifier"] for entity in entities], ["a", "b"])
+
+
+@unittest.skipIf(not HTTPX_AVAILABLE, "httpx not installed")
+class TestHttpxTransport(unittest.TestCase):
+    """Tests for the HttpxTransport class."""
+
+    def make_client(self, handler):
+        """Create a PortClient sending requests through httpx to a mock handler."""
+        transport = HttpxTransport(client=httpx.Client(transport=httpx.MockTransport(handler)))
+        return PortClient(client_id="id", client_secret="secret", skip_auth=True, transport=transport)
+
+    def test_responses_are_converted(self):
+        """Test that httpx responses are returned as requests responses with the session headers sent."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"ok": True, "blueprint": BLUEPRINT})
+
+        client = self.make_client(handler)
+        client._update_session_token("token-1")
+        self.assertEqual(client.blueprints.create_blueprint(BLUEPRINT), BLUEPRINT)
+        self.assertEqual(seen[0].headers["Authorization"], "Bearer token-1")
+        self.assertEqual(json.loads(seen[0].content), BLUEPRINT)
+
+    def test_timeouts_are_mapped(self):
+        """Test that httpx timeouts are raised as PortTimeoutError."""
+        def handler(request):
+            raise httpx.ReadTimeout("slow", request=request)
+
+        client = self.make_client(handler)
+        with self.assertRaises(PortTimeoutError):
+            client.make_request("GET", "blueprints", retries=0)
+
+    def test_streamed_responses_are_read_incrementally(self):
+        """Test that stream=True bodies are pulled from httpx as they are consumed, not read up front."""
+        entities = [{"identifier": f"svc-{i}", "description": "x" * 200} for i in range(2000)]
+        body = json.dumps({"ok": True, "entities": entities}).encode()
+        sent = []
+
+        class Body(httpx.SyncByteStream):
+            def __iter__(self):
+                for start in range(0, len(body), 16384):
+                    sent.append(start)
+                    yield body[start:start + 16384]
+
+        client = self.make_client(lambda request: httpx.Response(200, stream=Body()))
+        streamed = [entity["identifier"] for entity in client.entities.stream_all_entities("service")]
+        self.assertEqual(streamed, [f"svc-{i}" for i in range(2000)])
+
+        sent.clear()
+        stream = client.entities.stream_all_entities("service")
+        next(stream)
+        self.assertLess(len(sent), len(body) // 16384 // 2)
+        stream.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
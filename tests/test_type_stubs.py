@@ -64,12 +64,12 @@ class TestTypeStubs(unittest.TestCase):
         self.assertIsInstance(client.entities, Entities)
 
         # Check the property annotations in the class definition
-        # This is a bit of a hack, but it works for testing
+        # Service modules are imported on first access, so the annotations are forward references
         property_obj = PortClient.__dict__['blueprints']
-        self.assertEqual(property_obj.fget.__annotations__['return'], Blueprints)
+        self.assertEqual(property_obj.fget.__annotations__['return'], Blueprints.__name__)
 
         property_obj = PortClient.__dict__['entities']
-        self.assertEqual(property_obj.fget.__annotations__['return'], Entities)
+        self.assertEqual(property_obj.fget.__annotations__['return'], Entities.__name__)
 
     def test_base_api_service_method_types(self):
         """Test that the BaseAPIService methods have correct type annotations."""
@@ -0,0 +1,153 @@
+"""
+Tests for the sliding-window counters.
+"""
+import unittest
+
+from pyport.retry import CircuitBreakerState, RetryStats
+from pyport.window import CountWindow, Histogram, History, TimeWindow
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHistogram(unittest.TestCase):
+    """Tests for the Histogram class."""
+
+    def test_percentiles_are_within_bucket_precision(self):
+        """Test that percentiles are reported within about 5% of the exact values."""
+        histogram = Histogram()
+        for i in range(1, 1001):
+            histogram.record(i / 1000)
+        for percentile, exact in ((50, 0.5), (90, 0.9), (99, 0.99)):
+            self.assertAlmostEqual(histogram.percentile(percentile), exact, delta=exact * 0.05)
+        self.assertEqual(histogram.count, 1000)
+        self.assertAlmostEqual(histogram.total, 500.5)
+
+    def test_remove_and_out_of_range_values(self):
+        """Test that removed values no longer count and tiny values are reported as 0."""
+        histogram = Histogram()
+        histogram.record(0.0, count=3)
+        histogram.record(5.0)
+        histogram.remove(5.0)
+        self.assertEqual(histogram.percentile(100), 0.0)
+        histogram.record(1e9)
+        self.assertAlmostEqual(histogram.percentile(100), histogram.max_value, delta=histogram.max_value * 0.05)
+
+
+class TestCountWindow(unittest.TestCase):
+    """Tests for the CountWindow class."""
+
+    def test_oldest_observations_are_evicted(self):
+        """Test that the window keeps only the last `size` observations."""
+        window = CountWindow(4, percentiles=True)
+        for i in range(10):
+            window.record(float(i), failed=i % 2 == 0)
+        self.assertEqual(window.count, 4)
+        self.assertEqual(window.outcomes(), [False, True, False, True])
+        self.assertEqual(window.error_rate(), 50.0)
+        self.assertEqual(window.mean(), 7.5)
+        self.assertAlmostEqual(window.percentile(100), 9.0, delta=0.5)
+
+    def test_replace_last_and_halve(self):
+        """Test replacing the newest value and dropping the older half."""
+        window = CountWindow(10)
+        for value in (1.0, 2.0, 3.0):
+            window.record(value)
+        window.replace_last(9.0)
+        self.assertEqual(window.total, 12.0)
+        window.halve()
+        self.assertEqual(window.count, 2)
+        self.assertEqual(window.total, 11.0)
+        with self.assertRaises(ValueError):
+            window.percentile(50)
+
+    def test_empty_window(self):
+        """Test that reads on an empty window return zero."""
+        window = CountWindow(3)
+        self.assertEqual((window.error_rate(), window.mean()), (0.0, 0.0))
+        with self.assertRaises(ValueError):
+            CountWindow(0)
+
+
+class TestTimeWindow(unittest.TestCase):
+    """Tests for the TimeWindow class."""
+
+    def test_observations_expire(self):
+        """Test that observations leave the window once it has moved past them."""
+        clock = FakeClock()
+        window = TimeWindow(10, buckets=10, percentiles=True, clock=clock)
+        window.record(1.0, failed=True)
+        clock.now += 5
+        window.record(3.0)
+        self.assertEqual(window.count, 2)
+        self.assertEqual(window.error_rate(), 50.0)
+        self.assertEqual(window.mean(), 2.0)
+
+        clock.now += 6
+        self.assertEqual(window.count, 1)
+        self.assertEqual(window.error_rate(), 0.0)
+        self.assertAlmostEqual(window.percentile(50), 3.0, delta=0.15)
+
+        clock.now += 100
+        self.assertEqual(window.count, 0)
+        window.record(2.0)
+        self.assertEqual(window.outcomes(), [True])
+
+    def test_halve(self):
+        """Test that halving drops the older buckets."""
+        clock = FakeClock()
+        window = TimeWindow(4, buckets=4, clock=clock)
+        for _ in range(4):
+            window.record(failed=True)
+            clock.now += 1
+        clock.now -= 1
+        window.halve()
+        self.assertEqual(window.count, 2)
+
+
+class TestBoundedStatistics(unittest.TestCase):
+    """Tests for the windows used by RetryStats and CircuitBreakerState."""
+
+    def test_retry_stats_history_is_bounded(self):
+        """Test that RetryStats keeps a bounded history and exact counters."""
+        stats = RetryStats(history_size=5)
+        for i in range(50):
+            stats.record_attempt(False, error=ValueError(str(i)))
+            stats.record_retry_delay(0.1)
+        self.assertIsInstance(stats.errors, History)
+        self.assertEqual([str(error) for error in stats.errors], ["45", "46", "47", "48", "49"])
+        self.assertEqual(len(stats.retry_times), 5)
+        self.assertEqual(stats.failures, 50)
+        self.assertAlmostEqual(stats.total_retry_time, 5.0)
+        self.assertAlmostEqual(stats.get_average_retry_time(), 0.1)
+        self.assertAlmostEqual(stats.get_retry_time_percentile(95), 0.1, delta=0.005)
+        self.assertEqual(stats.get_recent_error_rate(), 100.0)
+
+    def test_breaker_error_rate_over_time_window(self):
+        """Test that a breaker with window_seconds uses a time window."""
+        breaker = CircuitBreakerState(failure_threshold=100, window_seconds=30, min_request_threshold=4)
+        self.assertIsInstance(breaker._history, TimeWindow)
+        for _ in range(3):
+            breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.get_error_rate(), 25.0)
+        self.assertEqual(sorted(breaker.request_history), [False, True, True, True])
+
+    def test_breaker_count_window_is_bounded(self):
+        """Test that a breaker's history never exceeds window_size."""
+        breaker = CircuitBreakerState(window_size=20, adaptive=False)
+        for _ in range(1000):
+            breaker.record_success()
+        self.assertEqual(len(breaker.request_history), 20)
+        self.assertEqual(breaker.total_requests, 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()